@@ -4,6 +4,7 @@ import { TooltipProvider } from "@/components/ui/tooltip";
 import { Route, Switch } from "wouter";
 import ErrorBoundary from "./components/ErrorBoundary";
 import { ThemeProvider } from "./contexts/ThemeContext";
+import { RouteTranslations } from "./contexts/LanguageContext";
 import ScrollToTop from "./components/ScrollToTop";
 import MobileBottomNav from "./components/MobileBottomNav";
 import { SeoHead } from "./components/SeoHead";
@@ -51,6 +52,9 @@ const VerifyEmailPage = lazy(() =>
 // Lazy load - admin pages (rarely used)
 const AdminLayout = lazy(() => import("@/pages/admin/index"));
 
+// Lazy load - development-only i18n re-render benchmark
+const I18nProfiler = lazy(() => import("@/pages/I18nProfiler"));
+
 // Loading fallback component
 function PageLoader() {
   return (
@@ -96,6 +100,7 @@ function Router() {
   const CommunityRoute = featureFlags.community_enabled
     ? CommunityCharacters
     : NotFound;
+  const I18nProfilerRoute = import.meta.env.DEV ? I18nProfiler : NotFound;
 
   // Show maintenance page for non-admin users when maintenance mode is enabled
   if (isMaintenanceMode && !isAdmin && !authLoading) {
@@ -112,39 +117,44 @@ function Router() {
 
   return (
     <Suspense fallback={<PageLoader />}>
-      <Switch>
-        <Route path={"/login"} component={LoginPage} />
-        <Route path={"/register"} component={RegisterRoute} />
-        <Route path={"/verify-email"} component={VerifyEmailPage} />
-        <Route path={"/user-profile"} component={UserProfilePage} />
-        <Route path={"/"} component={Home} />
-        <Route path={"/generate"} component={GenerateRoute} />
-        <Route path={"/gallery"} component={GalleryRoute} />
-        <Route path={"/profile"} component={Profile} />
-        <Route path={"/packages"} component={Packages} />
-        <Route path={"/ai-influencer"} component={AiInfluencerRoute} />
-        <Route path={"/community-characters"} component={CommunityRoute} />
-        <Route path={"/video-generate"} component={VideoGenerateRoute} />
-        <Route path={"/motion-control"} component={MotionControlRoute} />
-        <Route path={"/apps"} component={Apps} />
-        <Route path={"/audio-generate"} component={AudioGenerateRoute} />
-        <Route path={"/music-generate"} component={MusicGenerateRoute} />
-        <Route path={"/upscale"} component={UpscaleRoute} />
-        <Route path={"/blog"} component={BlogRoute} />
-        <Route path={"/blog/:slug"} component={BlogDetailRoute} />
-        <Route path={"/multi-angle"} component={MultiAngle} />
-        <Route path={"/product-promo"} component={ProductPromo} />
-        <Route path={"/ugc-ad"} component={UgcAd} />
-        <Route path={"/skin-enhancement"} component={SkinEnhancement} />
-        <Route path={"/logo-generator"} component={LogoGenerator} />
-        <Route path={"/prompt-compiler"} component={PromptCompiler} />
-        {/* Admin Panel */}
-        <Route path={"/admin/:rest*"} component={AdminLayout} />
-        <Route path={"/admin"} component={AdminLayout} />
-        <Route path={"/404"} component={NotFound} />
-        {/* Final fallback route */}
-        <Route component={NotFound} />
-      </Switch>
+      <RouteTranslations>
+        <Switch>
+          <Route path={"/login"} component={LoginPage} />
+          <Route path={"/register"} component={RegisterRoute} />
+          <Route path={"/verify-email"} component={VerifyEmailPage} />
+          <Route path={"/user-profile"} component={UserProfilePage} />
+          <Route path={"/"} component={Home} />
+          <Route path={"/generate"} component={GenerateRoute} />
+          <Route path={"/gallery"} component={GalleryRoute} />
+          <Route path={"/profile"} component={Profile} />
+          <Route path={"/packages"} component={Packages} />
+          <Route path={"/ai-influencer"} component={AiInfluencerRoute} />
+          <Route path={"/community-characters"} component={CommunityRoute} />
+          <Route path={"/video-generate"} component={VideoGenerateRoute} />
+          <Route path={"/motion-control"} component={MotionControlRoute} />
+          <Route path={"/apps"} component={Apps} />
+          <Route path={"/audio-generate"} component={AudioGenerateRoute} />
+          <Route path={"/music-generate"} component={MusicGenerateRoute} />
+          <Route path={"/upscale"} component={UpscaleRoute} />
+          <Route path={"/blog"} component={BlogRoute} />
+          <Route path={"/blog/:slug"} component={BlogDetailRoute} />
+          <Route path={"/multi-angle"} component={MultiAngle} />
+          <Route path={"/product-promo"} component={ProductPromo} />
+          <Route path={"/ugc-ad"} component={UgcAd} />
+          <Route path={"/skin-enhancement"} component={SkinEnhancement} />
+          <Route path={"/logo-generator"} component={LogoGenerator} />
+          <Route path={"/prompt-compiler"} component={PromptCompiler} />
+          {/* Admin Panel */}
+          <Route path={"/admin/:rest*"} component={AdminLayout} />
+          <Route path={"/admin"} component={AdminLayout} />
+          {/* Development only */}
+          <Route path={"/__profile/i18n/:run*"} component={I18nProfilerRoute} />
+          <Route path={"/__profile/i18n"} component={I18nProfilerRoute} />
+          <Route path={"/404"} component={NotFound} />
+          {/* Final fallback route */}
+          <Route component={NotFound} />
+        </Switch>
+      </RouteTranslations>
     </Suspense>
   );
 }
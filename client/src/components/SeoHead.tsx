@@ -1,6 +1,7 @@
 import { useEffect, useMemo } from "react";
 import { trpc } from "@/lib/trpc";
 import { useLocation } from "wouter";
+import { useLanguage } from "@/contexts/LanguageContext";
 import { getSeoOverrideForSlug, parseWebUiConfig } from "@/lib/webUiConfig";
 
 interface SeoHeadProps {
@@ -9,16 +10,27 @@ interface SeoHeadProps {
 
 export function SeoHead({ pageSlug }: SeoHeadProps) {
   const [location] = useLocation();
+  const { language } = useLanguage();
 
   // Determine current page slug from location if not provided
   const currentSlug = pageSlug || location.replace(/^\//, "") || "home";
 
   // Fetch page-specific SEO settings
-  const { data: pageSeo } = trpc.seo.getPage.useQuery(
+  const { data: pageSettings } = trpc.seo.getPage.useQuery(
     { pageSlug: currentSlug },
     { enabled: !!currentSlug }
   );
 
+  // Blog articles have no seoSettings row; use their precomputed meta bundle
+  const blogSlug = currentSlug.startsWith("blog/")
+    ? currentSlug.slice("blog/".length)
+    : "";
+  const { data: blogSeo } = trpc.seo.getBlogMeta.useQuery(
+    { slug: blogSlug, language },
+    { enabled: !!blogSlug && !pageSettings }
+  );
+  const pageSeo = pageSettings || blogSeo;
+
   // Fetch global SEO settings
   const { data: globalSeo } = trpc.seo.getGlobalConfig.useQuery();
 
@@ -117,7 +129,7 @@ export function SeoHead({ pageSlug }: SeoHeadProps) {
       setLinkTag("apple-touch-icon", faviconUrl);
     }
     // Open Graph (Facebook)
-    setMetaTag("og:type", "website", true);
+    setMetaTag("og:type", pageSeo?.ogType || "website", true);
     setMetaTag("og:site_name", globalSeo?.siteName || "Lumiohan", true);
     setMetaTag(
       "og:title",
@@ -140,7 +152,8 @@ export function SeoHead({ pageSlug }: SeoHeadProps) {
     setMetaTag("og:url", pageSeo?.canonicalUrl || window.location.href, true);
     setMetaTag(
       "og:locale",
-      globalSeo?.defaultLanguage === "tr" ? "tr_TR" : "en_US",
+      pageSeo?.ogLocale ||
+        (globalSeo?.defaultLanguage === "tr" ? "tr_TR" : "en_US"),
       true
     );
 
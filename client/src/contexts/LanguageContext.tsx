@@ -1,13 +1,23 @@
 import {
   createContext,
+  use,
+  useCallback,
   useContext,
+  useMemo,
   useState,
   useEffect,
   ReactNode,
 } from "react";
-import { translations } from "../i18n/translations";
+import { useLocation } from "wouter";
+import { interpolate } from "../i18n/interpolate";
+import {
+  fallbackNamespaces,
+  routeNamespaces,
+  shellNamespaces,
+} from "../i18n/chunks/manifest";
 
 type Language = "tr" | "en";
+type Messages = Record<string, string>;
 
 interface LanguageContextType {
   language: Language;
@@ -15,12 +25,94 @@ interface LanguageContextType {
   t: (key: string, params?: Record<string, string | number>) => string;
 }
 
-const LanguageContext = createContext<LanguageContextType | undefined>(
-  undefined
+export const LanguageContext = createContext<
+  LanguageContextType | undefined
+>(undefined);
+
+// translations.ts is split into one chunk per language and namespace by
+// scripts/build_translation_chunks.py; Vite emits each as a lazy file.
+const chunkLoaders = import.meta.glob<Messages>("../i18n/chunks/*/*.json", {
+  import: "default",
+});
+
+const messages: Record<Language, Messages> = { tr: {}, en: {} };
+// Results of parameterless t() calls per language, including the fallback for
+// missing keys (so each one is reported once). Cleared when a chunk loads.
+const results: Record<Language, Map<string, string>> = {
+  tr: new Map(),
+  en: new Map(),
+};
+const loadedChunks = new Set<string>();
+const chunkRequests = new Map<string, Promise<void>>();
+const pendingLoads = new Map<string, Promise<void>>();
+
+function loadChunk(language: Language, namespace: string): Promise<void> {
+  const id = `${language}/${namespace}`;
+  let request = chunkRequests.get(id);
+  if (!request) {
+    const loader = chunkLoaders[`../i18n/chunks/${id}.json`];
+    request = (loader ? loader() : Promise.resolve({})).then(chunk => {
+      Object.assign(messages[language], chunk);
+      results[language].clear();
+      loadedChunks.add(id);
+    });
+    // Forget failed requests so the next render can retry them
+    request.catch(() => chunkRequests.delete(id));
+    chunkRequests.set(id, request);
+  }
+  return request;
+}
+
+/**
+ * Start loading the given namespaces for a language. Returns null when they
+ * are all loaded, otherwise a promise that is reused until it settles (so it
+ * can be passed to use()).
+ */
+function ensureNamespaces(
+  language: Language,
+  namespaces: string[]
+): Promise<void> | null {
+  const missing = namespaces.filter(
+    namespace => !loadedChunks.has(`${language}/${namespace}`)
+  );
+  if (missing.length === 0) {
+    return null;
+  }
+  const key = `${language}:${missing.join(",")}`;
+  let pending = pendingLoads.get(key);
+  if (!pending) {
+    pending = Promise.all(
+      missing.map(namespace => loadChunk(language, namespace))
+    ).then(() => undefined);
+    const settle = () => {
+      pendingLoads.delete(key);
+    };
+    pending.then(settle, settle);
+    pendingLoads.set(key, pending);
+  }
+  return pending;
+}
+
+function compileRoute(pattern: string): RegExp {
+  // wouter patterns: "/blog/:slug", "/admin/:rest*"
+  const source = pattern
+    .replace(/[.+?^${}()|[\]\\]/g, "\\$&")
+    .replace(/\/:\w+\*/g, "(?:/.*)?")
+    .replace(/:\w+/g, "[^/]+");
+  return new RegExp(`^${source}/?$`, "i");
+}
+
+const compiledRoutes = routeNamespaces.map(
+  ([pattern, namespaces]) => [compileRoute(pattern), namespaces] as const
 );
 
+function namespacesForPath(path: string): string[] {
+  const route = compiledRoutes.find(([pattern]) => pattern.test(path));
+  return route ? route[1] : fallbackNamespaces;
+}
+
 export function LanguageProvider({ children }: { children: ReactNode }) {
-  const [language, setLanguage] = useState<Language>(() => {
+  const [language, setLanguageState] = useState<Language>(() => {
     // URL'den dil kontrolü
     if (typeof window !== "undefined") {
       const path = window.location.pathname;
@@ -36,37 +128,111 @@ export function LanguageProvider({ children }: { children: ReactNode }) {
     // Varsayılan olarak Türkçe
     return "tr";
   });
+  const [location] = useLocation();
+  const [shellReady, setShellReady] = useState(
+    () => ensureNamespaces(language, shellNamespaces) === null
+  );
+
+  useEffect(() => {
+    if (shellReady) return;
+    let active = true;
+    // Route chunks load in parallel; RouteTranslations waits for them
+    ensureNamespaces(language, namespacesForPath(location));
+    const pending = ensureNamespaces(language, shellNamespaces);
+    const done = () => {
+      if (active) setShellReady(true);
+    };
+    if (!pending) {
+      done();
+    } else {
+      pending.then(done, error => {
+        console.error("Failed to load translations:", error);
+        done();
+      });
+    }
+    return () => {
+      active = false;
+    };
+  }, [shellReady, language, location]);
 
   useEffect(() => {
     localStorage.setItem("language", language);
     document.documentElement.lang = language;
   }, [language]);
 
-  const t = (key: string, params?: Record<string, string | number>): string => {
-    const translation = translations[key];
-    if (!translation) {
-      console.warn(`Translation missing for key: ${key}`);
-      return key;
+  // Switch only once the new language's chunks for this page are loaded,
+  // so the UI never flashes raw keys. Reads the path at call time so the
+  // function (and the context value) stays stable across navigations.
+  const setLanguage = useCallback((lang: Language) => {
+    const pending = ensureNamespaces(lang, [
+      ...shellNamespaces,
+      ...namespacesForPath(window.location.pathname),
+    ]);
+    if (!pending) {
+      setLanguageState(lang);
+      return;
     }
-    let text = translation[language];
+    pending.then(
+      () => setLanguageState(lang),
+      error => console.error("Failed to load translations:", error)
+    );
+  }, []);
 
-    // Replace parameters if provided
-    if (params) {
-      Object.entries(params).forEach(([key, value]) => {
-        text = text.replace(`{${key}}`, String(value));
-      });
-    }
+  // One t per language: consumers only re-render when the language changes.
+  const t = useCallback(
+    (key: string, params?: Record<string, string | number>): string => {
+      if (!params) {
+        const cached = results[language].get(key);
+        if (cached !== undefined) {
+          return cached;
+        }
+      }
+      const template: string | undefined = messages[language][key];
+      if (template === undefined) {
+        console.warn(`Translation missing for key: ${key}`);
+        if (!params) {
+          results[language].set(key, key);
+        }
+        return key;
+      }
+      if (!params) {
+        results[language].set(key, template);
+        return template;
+      }
+
+      // Replace parameters
+      return interpolate(template, params);
+    },
+    [language]
+  );
 
-    return text;
-  };
+  const value = useMemo(
+    () => ({ language, setLanguage, t }),
+    [language, setLanguage, t]
+  );
 
   return (
-    <LanguageContext.Provider value={{ language, setLanguage, t }}>
-      {children}
+    <LanguageContext.Provider value={value}>
+      {shellReady ? children : null}
     </LanguageContext.Provider>
   );
 }
 
+/**
+ * Suspends until the active language's chunks for the current route are
+ * loaded. Render it inside the router's <Suspense> so navigating to a page
+ * shows the page loader instead of untranslated keys.
+ */
+export function RouteTranslations({ children }: { children: ReactNode }) {
+  const { language } = useLanguage();
+  const [location] = useLocation();
+  const pending = ensureNamespaces(language, namespacesForPath(location));
+  if (pending) {
+    use(pending);
+  }
+  return <>{children}</>;
+}
+
 export function useLanguage() {
   const context = useContext(LanguageContext);
   if (context === undefined) {
@@ -0,0 +1,44 @@
+// Generated by scripts/build_translation_chunks.py from translations.ts and
+// the <Route> table in App.tsx. Do not edit by hand.
+
+export const chunkLanguages = ["tr", "en"] as const;
+
+/** Namespaces every page needs (loaded before the first render). */
+export const shellNamespaces: string[] = ["category", "home", "maintenance", "modal", "nav"];
+
+/** Extra namespaces per wouter route pattern, in <Switch> order. */
+export const routeNamespaces: Array<[string, string[]]> = [
+  ["/login", ["auth"]],
+  ["/register", ["auth", "notFound"]],
+  ["/verify-email", ["verifyEmail"]],
+  ["/user-profile", []],
+  ["/", ["common", "footer"]],
+  ["/generate", ["common", "generate", "notFound"]],
+  ["/gallery", ["common", "errors", "gallery", "notFound"]],
+  ["/profile", ["common", "profile", "success"]],
+  ["/packages", ["common", "packages"]],
+  ["/ai-influencer", ["aiInfluencer", "common", "notFound"]],
+  ["/community-characters", ["common", "communityCharacters", "notFound"]],
+  ["/video-generate", ["common", "generate", "notFound", "video"]],
+  ["/motion-control", ["common", "motion", "notFound"]],
+  ["/apps", ["apps", "common"]],
+  ["/audio-generate", ["common", "notFound"]],
+  ["/music-generate", ["common", "notFound"]],
+  ["/upscale", ["common", "notFound", "upscale"]],
+  ["/blog", ["blog", "common", "notFound"]],
+  ["/blog/:slug", ["blogDetail", "common", "notFound"]],
+  ["/multi-angle", ["common", "multiAngle"]],
+  ["/product-promo", ["common", "productPromo"]],
+  ["/ugc-ad", ["common", "ugcAd"]],
+  ["/skin-enhancement", ["common", "skinEnhancement"]],
+  ["/logo-generator", ["common"]],
+  ["/prompt-compiler", ["promptCompiler"]],
+  ["/admin/:rest*", []],
+  ["/admin", []],
+  ["/__profile/i18n/:run*", ["common", "errors", "footer", "gallery", "notFound"]],
+  ["/__profile/i18n", ["common", "errors", "footer", "gallery", "notFound"]],
+  ["/404", ["notFound"]],
+];
+
+/** Namespaces of the catch-all (not found) route. */
+export const fallbackNamespaces: string[] = ["notFound"];
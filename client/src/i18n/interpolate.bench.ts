@@ -0,0 +1,41 @@
+import { bench, describe } from "vitest";
+import { interpolate } from "./interpolate";
+
+// The replace loop LanguageContext's t() used before templates were compiled.
+function replaceLoop(
+  text: string,
+  params: Record<string, string | number>
+): string {
+  Object.entries(params).forEach(([key, value]) => {
+    text = text.replace(`{${key}}`, String(value));
+  });
+  return text;
+}
+
+const templates = [
+  "{bonus}% Bonus",
+  "Video resolution too low! Must be at least 720x720. Current: {width}x{height}",
+  "Video uploaded: {width}x{height}, {duration}s",
+  "{count} images selected",
+  "Generate logo ({creditsNeeded} credits)",
+];
+const params = { bonus: 10, width: 640, height: 480, duration: 5, count: 3 };
+const creditsParams = { creditsNeeded: 8 };
+
+describe("t() with params (one render of a parameterised page)", () => {
+  bench("String.replace loop", () => {
+    for (let i = 0; i < 200; i++) {
+      for (const text of templates) {
+        replaceLoop(text, text.includes("credits") ? creditsParams : params);
+      }
+    }
+  });
+
+  bench("compiled templates", () => {
+    for (let i = 0; i < 200; i++) {
+      for (const text of templates) {
+        interpolate(text, text.includes("credits") ? creditsParams : params);
+      }
+    }
+  });
+});
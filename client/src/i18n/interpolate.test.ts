@@ -0,0 +1,36 @@
+import { describe, it, expect } from "vitest";
+import { compileTemplate, interpolate, renderTemplate } from "./interpolate";
+
+describe("interpolate", () => {
+  it("splits templates into literal and placeholder segments", () => {
+    expect(compileTemplate("Hi {name}!")).toEqual(["Hi ", "name", "!"]);
+    expect(compileTemplate("{a}{b}")).toEqual(["", "a", "", "b", ""]);
+    expect(compileTemplate("no placeholders")).toEqual(["no placeholders"]);
+  });
+
+  it("replaces every occurrence of a placeholder", () => {
+    expect(interpolate("{n} / {n}", { n: 3 })).toBe("3 / 3");
+  });
+
+  it("replaces several placeholders", () => {
+    expect(
+      interpolate("Current: {width}x{height}", { width: 640, height: 480 })
+    ).toBe("Current: 640x480");
+  });
+
+  it("keeps placeholders that have no param", () => {
+    expect(interpolate("{bonus}% Bonus {extra}", { bonus: 10 })).toBe(
+      "10% Bonus {extra}"
+    );
+  });
+
+  it("does not expand placeholders inside param values", () => {
+    expect(interpolate("{a} {b}", { a: "{b}", b: "x" })).toBe("{b} x");
+  });
+
+  it("renders precompiled segments", () => {
+    const segments = compileTemplate("{count} kredi");
+    expect(renderTemplate(segments, { count: 0 })).toBe("0 kredi");
+    expect(renderTemplate(segments, { count: 12 })).toBe("12 kredi");
+  });
+});
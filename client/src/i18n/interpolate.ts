@@ -0,0 +1,53 @@
+/**
+ * Placeholder interpolation for translation strings ("{count} kredi").
+ *
+ * A string is parsed once into segments - literal text at even indexes,
+ * placeholder names at odd ones ("Hi {name}!" -> ["Hi ", "name", "!"]) - and
+ * cached, so rendering it again is a single pass that concatenates segments.
+ * Every occurrence of a placeholder is replaced; placeholders without a
+ * matching param are left as written.
+ */
+
+export type CompiledTemplate = readonly string[];
+
+const PLACEHOLDER = /\{(\w+)\}/g;
+
+const compiledTemplates = new Map<string, CompiledTemplate>();
+
+export function compileTemplate(text: string): CompiledTemplate {
+  const segments: string[] = [];
+  let last = 0;
+  for (const match of text.matchAll(PLACEHOLDER)) {
+    const start = match.index ?? 0;
+    segments.push(text.slice(last, start), match[1]);
+    last = start + match[0].length;
+  }
+  segments.push(text.slice(last));
+  return segments;
+}
+
+export function renderTemplate(
+  segments: CompiledTemplate,
+  params: Record<string, string | number>
+): string {
+  let result = segments[0];
+  for (let i = 1; i < segments.length; i += 2) {
+    const name = segments[i];
+    const value = params[name];
+    result +=
+      (value === undefined ? `{${name}}` : String(value)) + segments[i + 1];
+  }
+  return result;
+}
+
+export function interpolate(
+  text: string,
+  params: Record<string, string | number>
+): string {
+  let segments = compiledTemplates.get(text);
+  if (segments === undefined) {
+    segments = compileTemplate(text);
+    compiledTemplates.set(text, segments);
+  }
+  return renderTemplate(segments, params);
+}
@@ -1041,6 +1041,193 @@ export const translations: Translations = {
     en: "Authorization required",
   },
 
+  // Provider (Kie.ai) errors, translated on the server (server/utils/errorTranslations.ts)
+  "apiErrors.recordNotFound": {
+    tr: "API görev bilgisi alınamadı. Bu teknik bir hatadır, lütfen tekrar deneyin.",
+    en: "Could not retrieve the task from the API. This is a technical error, please try again.",
+  },
+  "apiErrors.modelMaintenance": {
+    tr: "Seçili model şu anda bakımda. Lütfen farklı bir model seçin.",
+    en: "The selected model is under maintenance. Please choose a different model.",
+  },
+  "apiErrors.aspectRatioUnsupported": {
+    tr: "Seçili en-boy oranı bu model için desteklenmiyor. Lütfen farklı bir oran seçin.",
+    en: "The selected aspect ratio is not supported by this model. Please choose a different ratio.",
+  },
+  "apiErrors.resolutionUnsupported": {
+    tr: "Seçili çözünürlük bu model için desteklenmiyor. Lütfen farklı bir kalite seçin.",
+    en: "The selected resolution is not supported by this model. Please choose a different quality.",
+  },
+  "apiErrors.durationUnsupported": {
+    tr: "Seçili video süresi desteklenmiyor. Lütfen farklı bir süre seçin.",
+    en: "The selected video duration is not supported. Please choose a different duration.",
+  },
+  "apiErrors.qualityUnsupported": {
+    tr: "Seçili kalite seviyesi desteklenmiyor. Lütfen farklı bir kalite seçin.",
+    en: "The selected quality level is not supported. Please choose a different quality.",
+  },
+  "apiErrors.referenceImageRequired": {
+    tr: "Bu mod için referans görsel yüklemeniz gerekiyor.",
+    en: "This mode requires a reference image.",
+  },
+  "apiErrors.modelBusy": {
+    tr: "Model şu anda yoğun. Lütfen birkaç dakika bekleyip tekrar deneyin.",
+    en: "The model is busy right now. Please wait a few minutes and try again.",
+  },
+  "apiErrors.nsfw": {
+    tr: "⛔ İçerik Politikası İhlali: NSFW (Uygunsuz İçerik) tespit edildi. Lütfen promptunuzu değiştirin.",
+    en: "⛔ Content Policy Violation: NSFW (inappropriate content) detected. Please change your prompt.",
+  },
+  "apiErrors.violence": {
+    tr: "⛔ İçerik Politikası İhlali: Şiddet içeriği tespit edildi. Lütfen promptunuzu değiştirin.",
+    en: "⛔ Content Policy Violation: violent content detected. Please change your prompt.",
+  },
+  "apiErrors.contentPolicy": {
+    tr: "⛔ İçerik Politikası İhlali: Bu içerik topluluk kurallarına aykırı. Lütfen farklı bir prompt deneyin.",
+    en: "⛔ Content Policy Violation: this content breaks the community guidelines. Please try a different prompt.",
+  },
+  "apiErrors.unsafePrompt": {
+    tr: "⚠️ Promptunuz güvenli olmayan içerik tespit edildi. Lütfen daha uygun bir açıklama kullanın.",
+    en: "⚠️ Unsafe content was detected in your prompt. Please use a more appropriate description.",
+  },
+  "apiErrors.timeout": {
+    tr: "⏱️ İşlem zaman aşımına uğradı. Servis yoğun olabilir, lütfen tekrar deneyin.",
+    en: "⏱️ The operation timed out. The service may be busy, please try again.",
+  },
+  "apiErrors.generationTimeout": {
+    tr: "⏱️ Üretim süreci çok uzun sürdü. Lütfen daha basit bir prompt ile tekrar deneyin.",
+    en: "⏱️ Generation took too long. Please try again with a simpler prompt.",
+  },
+  "apiErrors.rateLimit": {
+    tr: "🚫 API limiti aşıldı. Lütfen 2-3 dakika bekleyip tekrar deneyin.",
+    en: "🚫 API limit exceeded. Please wait 2-3 minutes and try again.",
+  },
+  "apiErrors.usageLimit": {
+    tr: "📊 Günlük kullanım limitinize ulaştınız. Yarın tekrar deneyin veya premium'a geçin.",
+    en: "📊 You have reached your daily usage limit. Try again tomorrow or upgrade to premium.",
+  },
+  "apiErrors.fileTooLarge": {
+    tr: "📦 Dosya boyutu çok büyük! Maksimum {size}MB olmalıdır.",
+    en: "📦 The file is too large! The maximum is {size}MB.",
+  },
+  "apiErrors.unsupportedFormat": {
+    tr: "📄 Desteklenmeyen dosya formatı! Lütfen JPEG, PNG, WebP (görsel) veya MP4, MOV (video) kullanın.",
+    en: "📄 Unsupported file format! Please use JPEG, PNG, WebP (image) or MP4, MOV (video).",
+  },
+  "apiErrors.imageUnavailable": {
+    tr: "🖼️ Görsele erişilemiyor. URL geçersiz olabilir veya görsel silinmiş olabilir.",
+    en: "🖼️ The image cannot be accessed. The URL may be invalid or the image may have been deleted.",
+  },
+  "apiErrors.corruptedFile": {
+    tr: "💔 Dosya bozuk veya okunamıyor. Lütfen farklı bir dosya yükleyin.",
+    en: "💔 The file is corrupted or cannot be read. Please upload a different file.",
+  },
+  "apiErrors.resolutionTooLow": {
+    tr: "📐 Görsel çözünürlüğü çok düşük! Minimum 512x512 piksel gereklidir.",
+    en: "📐 Image resolution is too low! At least 512x512 pixels are required.",
+  },
+  "apiErrors.resolutionTooHigh": {
+    tr: "📏 Görsel çözünürlüğü çok yüksek! Lütfen daha küçük bir görsel kullanın.",
+    en: "📏 Image resolution is too high! Please use a smaller image.",
+  },
+  "apiErrors.authFailed": {
+    tr: "🔑 API kimlik doğrulama hatası! Bu bir sistem sorunudur, lütfen yöneticiye bildirin.",
+    en: "🔑 API authentication error! This is a system problem, please notify an administrator.",
+  },
+  "apiErrors.accessDenied": {
+    tr: "🚷 Erişim reddedildi. Bu özelliği kullanma yetkiniz olmayabilir.",
+    en: "🚷 Access denied. You may not have permission to use this feature.",
+  },
+  "apiErrors.serverError": {
+    tr: "🔧 Sunucu hatası{code}! Lütfen birkaç dakika bekleyip tekrar deneyin.",
+    en: "🔧 Server error{code}! Please wait a few minutes and try again.",
+  },
+  "apiErrors.serviceUnavailable": {
+    tr: "⚙️ Servis geçici olarak kullanılamıyor (bakım modu). Lütfen daha sonra tekrar deneyin.",
+    en: "⚙️ The service is temporarily unavailable (maintenance mode). Please try again later.",
+  },
+  "apiErrors.networkError": {
+    tr: "🌐 Ağ bağlantı hatası! İnternet bağlantınızı kontrol edin.",
+    en: "🌐 Network connection error! Please check your internet connection.",
+  },
+  "apiErrors.taskStartFailed": {
+    tr: "❌ İşlem başlatılamadı! Lütfen ayarlarınızı kontrol edip tekrar deneyin.",
+    en: "❌ The task could not be started! Please check your settings and try again.",
+  },
+  "apiErrors.taskFailed": {
+    tr: "⚠️ İşlem başarısız oldu! Lütfen farklı ayarlarla veya farklı bir prompt ile tekrar deneyin.",
+    en: "⚠️ The task failed! Please try again with different settings or a different prompt.",
+  },
+  "apiErrors.taskCancelled": {
+    tr: "🚫 İşlem iptal edildi veya zaman aşımına uğradı.",
+    en: "🚫 The task was cancelled or timed out.",
+  },
+  "apiErrors.promptTooLong": {
+    tr: "📝 Prompt çok uzun! Maksimum {limit} karakter olmalıdır.",
+    en: "📝 The prompt is too long! The maximum is {limit} characters.",
+  },
+  "apiErrors.promptEmpty": {
+    tr: "✍️ Prompt boş olamaz! Lütfen ne istediğinizi açıklayın.",
+    en: "✍️ The prompt cannot be empty! Please describe what you want.",
+  },
+  "apiErrors.promptInvalid": {
+    tr: "❓ Geçersiz prompt formatı! Lütfen düzgün bir açıklama girin.",
+    en: "❓ Invalid prompt format! Please enter a proper description.",
+  },
+  "apiErrors.videoTooLong": {
+    tr: "⏰ Video süresi çok uzun! Maksimum {duration} saniye olmalıdır.",
+    en: "⏰ The video is too long! The maximum is {duration} seconds.",
+  },
+  "apiErrors.videoResolutionLow": {
+    tr: "📹 Video çözünürlüğü çok düşük! Minimum 720x720 piksel gereklidir.",
+    en: "📹 Video resolution is too low! At least 720x720 pixels are required.",
+  },
+  "apiErrors.videoFormatUnsupported": {
+    tr: "🎬 Video formatı desteklenmiyor! Lütfen MP4, MOV veya WebM kullanın.",
+    en: "🎬 Video format not supported! Please use MP4, MOV or WebM.",
+  },
+  "apiErrors.audioUnsupported": {
+    tr: "🔊 Ses formatı desteklenmiyor veya ses işlenemedi.",
+    en: "🔊 The audio format is not supported or the audio could not be processed.",
+  },
+  "apiErrors.frameRateInvalid": {
+    tr: "🎞️ Geçersiz kare hızı! Video 24-60 FPS arasında olmalıdır.",
+    en: "🎞️ Invalid frame rate! The video must be between 24 and 60 FPS.",
+  },
+  "apiErrors.insufficientCredits": {
+    tr: "💳 Yetersiz kredi! Lütfen kredi paketlerine göz atın.",
+    en: "💳 Insufficient credits! Please take a look at the credit packages.",
+  },
+  "apiErrors.paymentRequired": {
+    tr: "💰 Bu özellik için ödeme gereklidir. Lütfen premium'a geçin.",
+    en: "💰 This feature requires payment. Please upgrade to premium.",
+  },
+  "apiErrors.fluxUnavailable": {
+    tr: "⚡ Flux modeli şu anda kullanılamıyor. Lütfen farklı bir model seçin.",
+    en: "⚡ The Flux model is currently unavailable. Please choose a different model.",
+  },
+  "apiErrors.seedreamUnavailable": {
+    tr: "🌱 Seedream modeli şu anda kullanılamıyor. Lütfen farklı bir model seçin.",
+    en: "🌱 The Seedream model is currently unavailable. Please choose a different model.",
+  },
+  "apiErrors.klingUnavailable": {
+    tr: "🎥 Kling modeli şu anda kullanılamıyor. Lütfen farklı bir model seçin.",
+    en: "🎥 The Kling model is currently unavailable. Please choose a different model.",
+  },
+  "apiErrors.veoUnavailable": {
+    tr: "🎬 Veo modeli şu anda kullanılamıyor. Lütfen farklı bir model seçin.",
+    en: "🎬 The Veo model is currently unavailable. Please choose a different model.",
+  },
+  "apiErrors.passthrough": { tr: "⚠️ {message}", en: "⚠️ {message}" },
+  "apiErrors.generic": {
+    tr: "❌ Bir hata oluştu. Lütfen tekrar deneyin veya destek ekibiyle iletişime geçin.",
+    en: "❌ An error occurred. Please try again or contact support.",
+  },
+  "apiErrors.unknown": {
+    tr: "Bilinmeyen bir hata oluştu.",
+    en: "An unknown error occurred.",
+  },
+
   // Success
   "success.imageCreated": {
     tr: "Görsel başarıyla oluşturuldu!",
@@ -111,8 +111,12 @@ const trpcClient = trpc.createClient({
       url: "/api/trpc",
       transformer: superjson,
       fetch(input, init) {
+        const headers = new Headers(init?.headers);
+        // Sunucu API hata mesajlarını bu dilde döner
+        headers.set("X-Language", document.documentElement.lang || "tr");
         return globalThis.fetch(input, {
           ...(init ?? {}),
+          headers,
           credentials: "include",
           signal: AbortSignal.timeout(1500000), // 25 minutes timeout for long-running AI operations
         });
@@ -25,7 +25,6 @@ interface BlogPost {
   title: string;
   slug: string;
   description: string;
-  content: string;
   coverImage: string | null;
   category: string;
   author: string;
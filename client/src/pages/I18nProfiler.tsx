@@ -0,0 +1,137 @@
+import {
+  Profiler,
+  Suspense,
+  lazy,
+  memo,
+  useRef,
+  useState,
+  type ProfilerOnRenderCallback,
+  type ReactNode,
+} from "react";
+import { useLocation } from "wouter";
+import { navigate } from "wouter/use-browser-location";
+import { LanguageContext, useLanguage } from "@/contexts/LanguageContext";
+
+/**
+ * Development-only benchmark for LanguageProvider re-renders.
+ *
+ * Mounts Home or Gallery inside a React <Profiler>, then navigates through
+ * /__profile/i18n/1..N. Each navigation re-renders LanguageProvider without
+ * changing the language; the report shows how many commits reached the page
+ * and how long they took. With ?mode=legacy the page gets a fresh context
+ * value and t() on every provider render, as LanguageProvider did before the
+ * value was memoized:
+ *
+ *   /__profile/i18n?page=home
+ *   /__profile/i18n?page=gallery&mode=legacy
+ */
+
+const Home = lazy(() => import("./Home"));
+const Gallery = lazy(() => import("./Gallery"));
+
+const NAVIGATIONS = 50;
+
+interface Stats {
+  commits: number;
+  duration: number;
+}
+
+function LegacyLanguageValue({ children }: { children: ReactNode }) {
+  // Re-render on every navigation, like the provider itself
+  useLocation();
+  const context = useLanguage();
+  return (
+    <LanguageContext.Provider
+      value={{ ...context, t: (key, params) => context.t(key, params) }}
+    >
+      {children}
+    </LanguageContext.Provider>
+  );
+}
+
+// Memoized so the Route re-rendering this page with new params on every
+// navigation does not re-render the profiled page by itself.
+const ProfiledPage = memo(function ProfiledPage({
+  page,
+  legacy,
+  onRender,
+}: {
+  page: "home" | "gallery";
+  legacy: boolean;
+  onRender: ProfilerOnRenderCallback;
+}) {
+  const Page = page === "gallery" ? Gallery : Home;
+  const content = (
+    <Profiler id={page} onRender={onRender}>
+      <Suspense fallback={null}>
+        <Page />
+      </Suspense>
+    </Profiler>
+  );
+  return legacy ? (
+    <LegacyLanguageValue>{content}</LegacyLanguageValue>
+  ) : (
+    content
+  );
+});
+
+function nextFrame() {
+  return new Promise<void>(resolve =>
+    requestAnimationFrame(() => setTimeout(resolve, 0))
+  );
+}
+
+export default function I18nProfiler() {
+  const [options] = useState(() => {
+    const search = new URLSearchParams(window.location.search);
+    return {
+      page: search.get("page") === "gallery" ? "gallery" : "home",
+      legacy: search.get("mode") === "legacy",
+    } as const;
+  });
+  const stats = useRef<Stats>({ commits: 0, duration: 0 });
+  const [onRender] = useState<ProfilerOnRenderCallback>(
+    () => (_id, _phase, actualDuration) => {
+      stats.current.commits += 1;
+      stats.current.duration += actualDuration;
+    }
+  );
+  const [report, setReport] = useState<string | null>(null);
+
+  const run = async () => {
+    stats.current = { commits: 0, duration: 0 };
+    for (let i = 1; i <= NAVIGATIONS; i++) {
+      navigate(`/__profile/i18n/${i}${window.location.search}`, {
+        replace: true,
+      });
+      await nextFrame();
+    }
+    const { commits, duration } = stats.current;
+    const mode = options.legacy ? "legacy" : "memoized";
+    const line =
+      `${options.page} (${mode}): ${NAVIGATIONS} provider re-renders -> ` +
+      `${commits} page commits, ${duration.toFixed(1)} ms render time`;
+    console.log(`[I18nProfiler] ${line}`);
+    setReport(line);
+  };
+
+  return (
+    <div>
+      <div className="fixed bottom-4 right-4 z-[9999] rounded-lg bg-black/80 p-3 text-sm text-white">
+        <button
+          type="button"
+          className="rounded bg-[#7C3AED] px-3 py-1"
+          onClick={run}
+        >
+          Run ({NAVIGATIONS} navigations)
+        </button>
+        {report && <p className="mt-2 max-w-sm">{report}</p>}
+      </div>
+      <ProfiledPage
+        page={options.page}
+        legacy={options.legacy}
+        onRender={onRender}
+      />
+    </div>
+  );
+}
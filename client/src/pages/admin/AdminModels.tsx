@@ -274,6 +274,9 @@ export default function AdminModels() {
     0
   );
 
+  const formatRenderTime = (ms: number | null) =>
+    ms ? `${(ms / 1000).toFixed(1)}s` : "-";
+
   const renderModelCard = (model: any) => (
     <motion.div
       key={model.id}
@@ -347,12 +350,22 @@ export default function AdminModels() {
           </p>
         </div>
         <div>
-          <p className="text-xs text-zinc-500 mb-1">Ort. Süre</p>
-          <p className="font-medium">
-            {model.avgRenderTimeMs
-              ? `${(model.avgRenderTimeMs / 1000).toFixed(1)}s`
-              : "-"}
-          </p>
+          {model.p50RenderTimeMs ? (
+            <>
+              <p className="text-xs text-zinc-500 mb-1">Süre p50 / p95</p>
+              <p className="font-medium">
+                {formatRenderTime(model.p50RenderTimeMs)} /{" "}
+                {formatRenderTime(model.p95RenderTimeMs)}
+              </p>
+            </>
+          ) : (
+            <>
+              <p className="text-xs text-zinc-500 mb-1">Ort. Süre</p>
+              <p className="font-medium">
+                {formatRenderTime(model.avgRenderTimeMs)}
+              </p>
+            </>
+          )}
         </div>
         <div>
           <p className="text-xs text-zinc-500 mb-1">Maliyet</p>
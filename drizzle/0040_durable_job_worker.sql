@@ -0,0 +1,5 @@
+ALTER TABLE `jobQueue` ADD `heartbeatAt` timestamp;--> statement-breakpoint
+CREATE INDEX `job_queue_claim_idx` ON `jobQueue` (`status`,`jobType`,`priority`,`queuedAt`);--> statement-breakpoint
+CREATE INDEX `job_queue_status_heartbeat_idx` ON `jobQueue` (`status`,`heartbeatAt`);--> statement-breakpoint
+CREATE INDEX `job_queue_type_related_idx` ON `jobQueue` (`jobType`,`relatedId`);--> statement-breakpoint
+CREATE INDEX `job_queue_queued_idx` ON `jobQueue` (`queuedAt`);
\ No newline at end of file
@@ -0,0 +1,7 @@
+CREATE TABLE `aiModelRenderTimeBuckets` (
+	`modelKey` varchar(100) NOT NULL,
+	`bucket` int NOT NULL,
+	`sampleCount` int NOT NULL DEFAULT 0,
+	`updatedAt` timestamp NOT NULL DEFAULT (now()) ON UPDATE CURRENT_TIMESTAMP,
+	CONSTRAINT `aiModelRenderTimeBuckets_modelKey_bucket_pk` PRIMARY KEY(`modelKey`,`bucket`)
+);
@@ -192,6 +192,27 @@ export const aiModelConfig = mysqlTable(
   ]
 );
 
+// Render süresi histogramı: her satır bir modelin logaritmik bir süre
+// aralığındaki başarılı üretim sayısı. p50/p95 bu sayımlardan hesaplanır.
+export const aiModelRenderTimeBuckets = mysqlTable(
+  "aiModelRenderTimeBuckets",
+  {
+    modelKey: varchar({ length: 100 }).notNull(),
+    bucket: int().notNull(),
+    sampleCount: int().default(0).notNull(),
+    updatedAt: timestamp({ mode: "string" })
+      .default(sql`(now())`)
+      .onUpdateNow()
+      .notNull(),
+  },
+  table => [
+    primaryKey({
+      columns: [table.modelKey, table.bucket],
+      name: "aiModelRenderTimeBuckets_modelKey_bucket_pk",
+    }),
+  ]
+);
+
 export const announcements = mysqlTable(
   "announcements",
   {
@@ -704,6 +725,7 @@ export const jobQueue = mysqlTable(
     startedAt: timestamp({ mode: "string" }),
     completedAt: timestamp({ mode: "string" }),
     workerId: varchar({ length: 100 }),
+    heartbeatAt: timestamp({ mode: "string" }),
     attempts: int().default(0).notNull(),
     maxAttempts: int().default(3).notNull(),
     lastError: text(),
@@ -714,7 +736,21 @@ export const jobQueue = mysqlTable(
       .default(sql`(now())`)
       .notNull(),
   },
-  table => [primaryKey({ columns: [table.id], name: "jobQueue_id" })]
+  table => [
+    primaryKey({ columns: [table.id], name: "jobQueue_id" }),
+    index("job_queue_claim_idx").on(
+      table.status,
+      table.jobType,
+      table.priority,
+      table.queuedAt
+    ),
+    index("job_queue_status_heartbeat_idx").on(
+      table.status,
+      table.heartbeatAt
+    ),
+    index("job_queue_type_related_idx").on(table.jobType, table.relatedId),
+    index("job_queue_queued_idx").on(table.queuedAt),
+  ]
 );
 
 export const modalCards = mysqlTable(
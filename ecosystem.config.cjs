@@ -9,6 +9,7 @@ module.exports = {
       autorestart: true,
       watch: false,
       max_memory_restart: "8G",
+      kill_timeout: 30000,
       log_date_format: "DD-MM-YYYY HH:mm:ss",
       env: {
         NODE_ENV: "development",
@@ -25,6 +26,28 @@ module.exports = {
         NODEPUSH: true,
         NODEID: "main",
         MAINNODE: "main",
+        // Kuyruktaki üretim işlerini lumiohan-worker süreçleri alır
+        JOB_WORKER_ENABLED: "false",
+      },
+    },
+    {
+      name: "lumiohan-worker",
+      // dist/worker.js yukarıdaki build ile üretilir
+      script: "dist/worker.js",
+      instances: 2,
+      exec_mode: "cluster",
+      autorestart: true,
+      watch: false,
+      max_memory_restart: "2G",
+      // Kapanışta çalışan işlerin bitmesi beklenir (jobWorker STOP_TIMEOUT)
+      kill_timeout: 30000,
+      log_date_format: "DD-MM-YYYY HH:mm:ss",
+      env: {
+        NODE_ENV: "development",
+      },
+      env_production: {
+        NODE_ENV: "production",
+        TZ: "Europe/Istanbul",
       },
     },
   ],
@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""
+Replay provider error messages against server/utils/errorTranslations.ts
+
+translateApiError() tries its { pattern, key } rules in order and the first
+match wins, so a rule can be dead (an earlier, broader rule always catches
+its messages) and the order decides how many regexes an error costs. This
+harness extracts the rule table from the TypeScript source (tsx_lexer),
+compiles the JS regex literals with Python's re, and replays a corpus of raw
+error strings through it the way translateApiError() does, type prefix
+stripping included. The report lists:
+
+    hits        first-match count per rule, plus how often it also matched
+                a message an earlier rule had already taken, and its cost
+                in microseconds per message (Python re, as a relative guide)
+    shadowing   (winner, loser) rule pairs seen on the same message
+    static      alternatives that can never fire: every string they match
+                also matches an earlier rule (checked on the literal pieces
+                of "a.*b" patterns, without a corpus)
+    order       a hit-frequency order that keeps every first match the
+                corpus produced, and the average number of patterns tried
+                per message now and with that order
+
+The corpus is one message per line, or JSON / JSON Lines (strings, or
+objects with an errorMessage, failMsg, error or message field). Repeated
+messages are replayed once and weighted by their count. To replay the
+errorLogs table:
+
+    mysql --batch --skip-column-names \\
+        -e "SELECT errorMessage FROM errorLogs" > errors.tsv
+
+Usage:
+    python3 scripts/analyze_error_patterns.py errors.tsv --unescape
+    python3 scripts/analyze_error_patterns.py failures.jsonl other.log
+    python3 scripts/analyze_error_patterns.py --static-only
+    python3 scripts/analyze_error_patterns.py errors.tsv --unescape --json > report.json
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from collections import Counter, namedtuple
+
+from codemod_io import REPO_ROOT, read_page
+from tsx_lexer import LineIndex, tokenize
+
+ERROR_TRANSLATIONS = os.path.join(REPO_ROOT, "server", "utils", "errorTranslations.ts")
+MESSAGE_FIELDS = ("errorMessage", "failMsg", "error", "message")
+EXAMPLES = 2
+
+Rule = namedtuple("Rule", "index key group literal regex line")
+
+_JS_FLAGS = {"i": re.IGNORECASE, "m": re.MULTILINE, "s": re.DOTALL}
+_META = re.compile(r"[\\()\[\]{}?+*^$|.]")
+_MYSQL_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "0": "\0", "\\": "\\"}
+
+
+def compile_js_regex(literal):
+    """Compile a /source/flags literal with the Python equivalent flags."""
+    source, _, flags = literal[1:].rpartition("/")
+    source = re.sub(r"\(\?<(?![=!])", "(?P<", source)
+    value = 0
+    for flag in flags:
+        value |= _JS_FLAGS.get(flag, 0)
+    return re.compile(source, value)
+
+
+def load_rules(path=ERROR_TRANSLATIONS):
+    """(rules, prefix regex) from errorTranslations.ts.
+
+    A rule is a `pattern: /.../` property followed by `key: "..."` in the
+    same object; group is the // comment above it ("Timeout Errors"). The
+    prefix regex is the one passed to errorMessage.replace().
+    """
+    source = read_page(path)
+    lines = LineIndex(source)
+    rules = []
+    prefix = None
+    group = None
+    pending = None
+    recent = []
+    for tok in tokenize(source):
+        if tok.kind == "comment":
+            if tok.value.startswith("//"):
+                group = tok.value[2:].strip()
+            continue
+        previous = [t.value for t in recent[-3:]]
+        if tok.kind == "regex":
+            if previous[-2:] == ["pattern", ":"]:
+                pending = (tok.value, lines.line(tok.start), group)
+            elif previous[-2:] == ["replace", "("]:
+                prefix = compile_js_regex(tok.value)
+        elif tok.kind == "string" and pending and previous[-2:] == ["key", ":"]:
+            literal, line, rule_group = pending
+            rules.append(Rule(len(rules), tok.value, rule_group, literal, compile_js_regex(literal), line))
+            pending = None
+        recent.append(tok)
+        del recent[:-3]
+    if not rules:
+        raise ValueError(f"No {{ pattern, key }} rules found in {path}")
+    return rules, prefix
+
+
+def _unescape(line):
+    return re.sub(r"\\(.)", lambda m: _MYSQL_ESCAPES.get(m.group(1), m.group(1)), line)
+
+
+def _message(value):
+    if isinstance(value, str):
+        return value
+    if isinstance(value, dict):
+        for field in MESSAGE_FIELDS:
+            if isinstance(value.get(field), str):
+                return value[field]
+    return None
+
+
+def read_corpus(paths, unescape=False):
+    """Counter of raw messages from text, JSON or JSON Lines files ("-" is stdin)."""
+    corpus = Counter()
+    for path in paths:
+        if path == "-":
+            text = sys.stdin.read()
+        else:
+            text = read_page(path)
+        if path.endswith(".json"):
+            data = json.loads(text)
+            values = data if isinstance(data, list) else [data]
+        elif path.endswith(".jsonl"):
+            values = [json.loads(line) for line in text.splitlines() if line.strip()]
+        else:
+            values = [_unescape(line) if unescape else line for line in text.split("\n") if line.strip()]
+        for value in values:
+            message = _message(value)
+            if message:
+                corpus[message] += 1
+    return corpus
+
+
+# -- static analysis ------------------------------------------------------
+
+
+def _pieces(alternative, loose):
+    """Lowercase literal pieces of an "a.*b.*c" alternative, or None.
+
+    With loose, a single "." also separates pieces: that only widens the
+    alternative, which is safe for the rule being tested but not for the
+    rule it is tested against.
+    """
+    parts = re.split(r"\.\*|\." if loose else r"\.\*", alternative)
+    if any(_META.search(part) for part in parts):
+        return None
+    parts = tuple(part.lower() for part in parts if part)
+    return parts or None
+
+
+def _alternatives(rule, loose):
+    if not rule.regex.flags & re.IGNORECASE:
+        return [None]
+    return [(alt, _pieces(alt, loose)) for alt in rule.regex.pattern.split("|")]
+
+
+def _covers(inner, outer):
+    """Whether every text matching the pieces outer also matches inner."""
+    k = 0
+    offset = 0
+    for piece in inner:
+        while k < len(outer):
+            found = outer[k].find(piece, offset)
+            if found != -1:
+                offset = found + len(piece)
+                break
+            k += 1
+            offset = 0
+        else:
+            return False
+    return True
+
+
+def static_shadowing(rules):
+    """[(rule, alternative, earlier rule, its alternative)] for dead alternatives."""
+    strict = [_alternatives(rule, loose=False) for rule in rules]
+    found = []
+    for rule in rules:
+        for entry in _alternatives(rule, loose=True):
+            if entry is None or entry[1] is None:
+                continue
+            alternative, pieces = entry
+            for earlier in rules[: rule.index]:
+                cover = next(
+                    (alt for alt, outer in filter(None, strict[earlier.index]) if outer and _covers(outer, pieces)),
+                    None,
+                )
+                if cover is not None:
+                    found.append((rule, alternative, earlier, cover))
+                    break
+    return found
+
+
+# -- replay -----------------------------------------------------------------
+
+
+class Replay:
+    """First-match results of every distinct corpus message."""
+
+    def __init__(self, rules, prefix, corpus):
+        self.rules = rules
+        self.corpus = corpus
+        self.total = sum(corpus.values())
+        self.hits = [0] * len(rules)
+        self.also = [0] * len(rules)
+        self.seconds = [0.0] * len(rules)
+        self.unmatched = 0
+        self.shadowing = Counter()  # (winner, loser) -> messages
+        self.examples = {}  # (winner, loser) -> [message, ...]
+        self.winners = {}  # message -> rule index or None
+        self.matched = {}  # message -> [rule index, ...]
+        clock = time.perf_counter
+        for message, count in corpus.items():
+            clean = prefix.sub("", message, count=1) if prefix else message
+            matched = []
+            for rule in rules:
+                started = clock()
+                hit = rule.regex.search(clean)
+                self.seconds[rule.index] += clock() - started
+                if hit:
+                    matched.append(rule.index)
+            self.matched[message] = matched
+            if not matched:
+                self.winners[message] = None
+                self.unmatched += count
+                continue
+            winner = matched[0]
+            self.winners[message] = winner
+            self.hits[winner] += count
+            for loser in matched[1:]:
+                self.also[loser] += count
+                self.shadowing[winner, loser] += count
+                examples = self.examples.setdefault((winner, loser), [])
+                if len(examples) < EXAMPLES:
+                    examples.append(message)
+
+    def microseconds(self, index):
+        return self.seconds[index] / max(len(self.corpus), 1) * 1e6
+
+    def average_tried(self, order):
+        """Mean patterns tried per message when rules run in order."""
+        if not self.total:
+            return 0.0
+        position = {index: i + 1 for i, index in enumerate(order)}
+        tried = 0
+        for message, count in self.corpus.items():
+            winner = self.winners[message]
+            tried += count * (len(order) if winner is None else position[winner])
+        return tried / self.total
+
+    def suggest_order(self, static):
+        """Most-hit-first order that keeps each observed winner ahead of the
+        rules it beat, and every rule behind the earlier rules that cover
+        one of its alternatives. Greedy, so not guaranteed optimal."""
+        after = {rule.index: set() for rule in self.rules}
+        for winner, loser in self.shadowing:
+            after[loser].add(winner)
+        for rule, _, earlier, _ in static:
+            after[rule.index].add(earlier.index)
+        order = []
+        placed = set()
+        while len(order) < len(self.rules):
+            ready = [i for i in after if i not in placed and after[i] <= placed]
+            best = max(ready, key=lambda i: (self.hits[i], -i))
+            order.append(best)
+            placed.add(best)
+        for message, matched in self.matched.items():
+            if matched:
+                first = min(matched, key=order.index)
+                assert first == self.winners[message], message
+        return order
+
+
+# -- report -----------------------------------------------------------------
+
+
+def _rule_info(rule):
+    return {"index": rule.index + 1, "key": rule.key, "pattern": rule.literal, "line": rule.line}
+
+
+def build_report(rules, static, replay=None):
+    location = os.path.relpath(ERROR_TRANSLATIONS, REPO_ROOT)
+    report = {
+        "source": location,
+        "static": [
+            {
+                "rule": _rule_info(rule),
+                "alternative": alternative,
+                "caught_by": _rule_info(earlier),
+                "by_alternative": cover,
+                "unreachable": all(
+                    any(r is rule and a == alt for r, a, _, _ in static)
+                    for alt in rule.regex.pattern.split("|")
+                ),
+            }
+            for rule, alternative, earlier, cover in static
+        ],
+    }
+    if replay is None:
+        return report
+    order = replay.suggest_order(static)
+    current = list(range(len(rules)))
+    report.update(
+        {
+            "messages": replay.total,
+            "distinct": len(replay.corpus),
+            "unmatched": replay.unmatched,
+            "rules": [
+                dict(
+                    _rule_info(rule),
+                    hits=replay.hits[rule.index],
+                    also_matched=replay.also[rule.index],
+                    us_per_message=round(replay.microseconds(rule.index), 3),
+                )
+                for rule in rules
+            ],
+            "shadowing": [
+                {
+                    "winner": _rule_info(rules[winner]),
+                    "loser": _rule_info(rules[loser]),
+                    "messages": count,
+                    "examples": replay.examples[winner, loser],
+                }
+                for (winner, loser), count in replay.shadowing.most_common()
+            ],
+            "average_tried": round(replay.average_tried(current), 3),
+            "suggested_average_tried": round(replay.average_tried(order), 3),
+            "suggested_order": [rules[i].key for i in order],
+        }
+    )
+    return report
+
+
+def print_report(report):
+    print(f"Rules: {report['source']}")
+    if "rules" in report:
+        total = report["messages"]
+        print(f"Replayed {total} messages ({report['distinct']} distinct)\n")
+        print("   #    hits   share    also   µs/msg  key")
+        for rule in report["rules"]:
+            share = rule["hits"] / total * 100 if total else 0.0
+            print(
+                f"  {rule['index']:>2}  {rule['hits']:>6}  {share:>5.1f}%  {rule['also_matched']:>6}"
+                f"  {rule['us_per_message']:>7.2f}  {rule['key']}"
+            )
+        share = report["unmatched"] / total * 100 if total else 0.0
+        print(f"      {report['unmatched']:>6}  {share:>5.1f}%                   (no rule: fallback message)")
+
+        print(f"\nShadowing in the corpus: {len(report['shadowing'])} rule pairs")
+        for pair in report["shadowing"]:
+            winner, loser = pair["winner"], pair["loser"]
+            print(
+                f"  #{winner['index']} {winner['key']} took {pair['messages']} messages "
+                f"#{loser['index']} {loser['key']} also matches"
+            )
+            for example in pair["examples"]:
+                print(f"      {json.dumps(example[:120], ensure_ascii=False)}")
+
+    print(f"\nStatically dead alternatives: {len(report['static'])}")
+    for entry in report["static"]:
+        rule, earlier = entry["rule"], entry["caught_by"]
+        status = "  (whole rule unreachable)" if entry["unreachable"] else ""
+        print(
+            f"  #{rule['index']} {rule['key']}: {entry['alternative']!r} is always caught by "
+            f"#{earlier['index']} {earlier['key']} {entry['by_alternative']!r}{status}"
+        )
+
+    if "rules" in report:
+        print(
+            f"\nPatterns tried per message: {report['average_tried']:.2f} in the current order, "
+            f"{report['suggested_average_tried']:.2f} in the suggested one"
+        )
+        print("Suggested order (every first match in the corpus is unchanged):")
+        for i, key in enumerate(report["suggested_order"], 1):
+            print(f"  {i:>2}. {key}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay provider errors against errorTranslations.ts")
+    parser.add_argument("corpus", nargs="*", help="message files (text, .json, .jsonl; - for stdin)")
+    parser.add_argument("--unescape", action="store_true", help="decode mysql --batch escapes (\\n, \\t, \\\\)")
+    parser.add_argument("--static-only", action="store_true", help="only report statically dead alternatives")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+    if not args.corpus and not args.static_only:
+        parser.error("give corpus files, or --static-only")
+
+    rules, prefix = load_rules()
+    static = static_shadowing(rules)
+    replay = None
+    if not args.static_only:
+        corpus = read_corpus(args.corpus, unescape=args.unescape)
+        if not corpus:
+            print("❌ No messages in the corpus", file=sys.stderr)
+            return 1
+        replay = Replay(rules, prefix, corpus)
+    report = build_report(rules, static, replay)
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print_report(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,452 @@
+#!/usr/bin/env python3
+"""
+Cross-check t("...") call sites in client/src against translations.ts
+
+Every .ts/.tsx file under client/src and server/ (which translates provider
+errors from the same table) is tokenized (in parallel) and its translation
+references collected:
+
+    t("home.title")            direct use of a key
+    t(`blog.category.${id}`)   dynamic use: every key under "blog.category."
+                               counts as used
+    labelKey: "nav.home"       any other string literal equal to a defined key
+                               counts as an indirect use (keys stored in
+                               arrays/objects and passed to t() later)
+
+These are joined with the translations.ts index (translations_index.py) into
+a bidirectional key <-> call site index, and the report lists:
+
+    missing       keys passed to t() that translations.ts does not define
+    unused        defined keys nothing references
+    untranslated  keys with an empty or missing tr/en value
+    duplicates    keys defined more than once (the last definition wins)
+    placeholders  {name} placeholders that differ between a key's tr and en
+                  strings, or between the strings and the params object of a
+                  t("key", { ... }) call (LanguageContext would leave an
+                  unfilled {name} in the UI)
+
+with file:line locations. Call params are collected in the same tokenizer
+pass as the keys. With --incremental, per-file scan results are kept
+in .codemod_cache/ and only files whose mtime or size changed are re-scanned,
+which makes a run after saving one file take a fraction of a second.
+
+Exits with status 1 when keys are missing or placeholders do not match.
+
+Usage:
+    python3 scripts/audit_translations.py
+    python3 scripts/audit_translations.py --incremental
+    python3 scripts/audit_translations.py --only missing,untranslated
+    python3 scripts/audit_translations.py --json > coverage.json
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import pickle
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from codemod_io import REPO_ROOT, read_page, write_page
+from codemod_tables import CACHE_DIR
+from translations_index import TRANSLATIONS_FILE, load_index
+from tsx_lexer import LineIndex, tokenize
+
+CLIENT_SRC = os.path.join(REPO_ROOT, "client", "src")
+SERVER_SRC = os.path.join(REPO_ROOT, "server")
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+SOURCE_PATTERNS = ("*.tsx", "*.ts")
+KEY_LIKE = re.compile(r"[A-Za-z][\w-]*(?:\.[\w-]+)+")
+# Same syntax as client/src/i18n/interpolate.ts
+PLACEHOLDER = re.compile(r"\{(\w+)\}")
+SECTIONS = ("missing", "unused", "untranslated", "duplicates", "placeholders")
+# Files smaller in number than this are scanned inline: starting a process
+# pool costs more than tokenizing a handful of files.
+POOL_THRESHOLD = 8
+
+CALL, DYNAMIC, STRING = "call", "dynamic", "string"
+
+
+def _object_names(tokens, i):
+    """Property names of the object literal opening at tokens[i].
+
+    None when they cannot be known statically (spread, computed keys).
+    """
+    names = set()
+    depth = 0
+    expect_name = True
+    for tok in tokens[i:]:
+        value = tok.value if tok.kind == "punct" else None
+        if value in ("(", "[", "{", "${"):
+            if depth == 1 and expect_name and value == "[":
+                return None
+            depth += 1
+            continue
+        if value in (")", "]", "}"):
+            depth -= 1
+            if depth == 0:
+                return frozenset(names)
+            continue
+        if depth != 1:
+            continue
+        if expect_name:
+            if value == "...":
+                return None
+            if tok.kind in ("name", "string", "number"):
+                names.add(tok.value)
+            expect_name = False
+        elif value == ",":
+            expect_name = True
+    return None
+
+
+def _call_params(tokens, i):
+    """Params passed after the key argument ending before tokens[i].
+
+    An empty set for t("key"), the object's property names for
+    t("key", { ... }), None when the params are not an object literal.
+    """
+    if i >= len(tokens) or tokens[i].value == ")":
+        return frozenset()
+    if tokens[i].value == "," and i + 1 < len(tokens):
+        if tokens[i + 1].value == ")":
+            return frozenset()
+        if tokens[i + 1].kind == "punct" and tokens[i + 1].value == "{":
+            return _object_names(tokens, i + 1)
+    return None
+
+
+def scan_source(source, params=None):
+    """Translation references in one file as (kind, key_or_prefix, line).
+
+    When params is a list, (key, line, names) is appended to it for every
+    t() call with a literal key: names is the set of params the call passes
+    (see _call_params), collected in the same pass.
+    """
+    lines = LineIndex(source)
+    refs = []
+    recent = []  # last three significant tokens
+    template = None  # [start_token, text] while reading t(`...`)
+    tokens = [tok for tok in tokenize(source) if tok.kind != "comment"]
+    for i, tok in enumerate(tokens):
+        kind = tok.kind
+        if template is not None:
+            if kind == "template" and template[1] is None:
+                template[1] = tok.value
+                continue
+            text = template[1] or ""
+            line = lines.line(template[0].start)
+            if tok.value == "`":
+                refs.append((CALL, text, line))
+                if params is not None:
+                    params.append((text, line, _call_params(tokens, i + 1)))
+            elif tok.value == "${":
+                refs.append((DYNAMIC, text, line))
+            template = None
+        is_call = (
+            len(recent) >= 2
+            and recent[-1].value == "("
+            and recent[-2].kind == "name"
+            and recent[-2].value == "t"
+            and (len(recent) < 3 or recent[-3].value not in (".", "?."))
+        )
+        if kind == "string":
+            if is_call:
+                line = lines.line(tok.start)
+                refs.append((CALL, tok.value, line))
+                if params is not None:
+                    params.append((tok.value, line, _call_params(tokens, i + 1)))
+            elif KEY_LIKE.fullmatch(tok.value):
+                refs.append((STRING, tok.value, lines.line(tok.start)))
+        elif kind == "punct" and tok.value == "`" and is_call:
+            template = [tok, None]
+        if kind in ("name", "punct", "string", "number", "regex"):
+            recent.append(tok)
+            if len(recent) > 3:
+                del recent[0]
+    return refs
+
+
+def scan_file(path):
+    stat = os.stat(path)
+    params = []
+    refs = scan_source(read_page(path), params)
+    return path, (stat.st_mtime_ns, stat.st_size), refs, params
+
+
+def discover_sources(roots=(CLIENT_SRC, SERVER_SRC)):
+    files = set()
+    for root in roots:
+        for pattern in SOURCE_PATTERNS:
+            files.update(glob.glob(os.path.join(root, "**", pattern), recursive=True))
+    translations = os.path.realpath(TRANSLATIONS_FILE)
+    return sorted(f for f in files if os.path.realpath(f) != translations)
+
+
+def _tool_digest():
+    digest = hashlib.sha256()
+    for name in ("audit_translations.py", "tsx_lexer.py"):
+        with open(os.path.join(SCRIPTS_DIR, name), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _cache_path(roots):
+    joined = os.pathsep.join(os.path.realpath(root) for root in roots)
+    key = hashlib.sha256(joined.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(CACHE_DIR, f"audit-{key}.pickle")
+
+
+def scan_all(files, jobs=None, cache=None):
+    """
+    Scan files, reusing cache entries ({path: (stamp, refs, params)}) whose
+    stamp still matches. Returns the new {path: (stamp, refs, params)} and the
+    rescan count.
+    """
+    cache = cache or {}
+    results = {}
+    stale = []
+    for path in files:
+        entry = cache.get(path)
+        if entry is not None:
+            stat = os.stat(path)
+            if entry[0] == (stat.st_mtime_ns, stat.st_size):
+                results[path] = entry
+                continue
+        stale.append(path)
+
+    if len(stale) < POOL_THRESHOLD:
+        for path, *scan in map(scan_file, stale):
+            results[path] = tuple(scan)
+    else:
+        workers = jobs or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunksize = max(1, len(stale) // (4 * workers))
+            for path, *scan in pool.map(scan_file, stale, chunksize=chunksize):
+                results[path] = tuple(scan)
+    return results, len(stale)
+
+
+class CoverageIndex:
+    """Bidirectional index between translation keys and their call sites."""
+
+    def __init__(self, index, scans):
+        self.index = index
+        self.uses = {}  # key -> [(path, line, kind)]
+        self.file_keys = {}  # path -> {key}
+        self.prefixes = {}  # dynamic prefix -> [(path, line)]
+        self.params = []  # (key, path, line, names passed or None)
+        for path, (_, refs, params) in scans.items():
+            self.params.extend((key, path, line, names) for key, line, names in params)
+            keys = self.file_keys.setdefault(path, set())
+            for kind, key, line in refs:
+                if kind == DYNAMIC:
+                    self.prefixes.setdefault(key, []).append((path, line))
+                elif kind == CALL or key in index:
+                    self.uses.setdefault(key, []).append((path, line, kind))
+                    keys.add(key)
+
+    def missing(self):
+        """{key: [(path, line)]} for t() keys with no definition."""
+        missing = {}
+        for key, sites in self.uses.items():
+            if key not in self.index:
+                calls = [(path, line) for path, line, kind in sites if kind == CALL]
+                if calls:
+                    missing[key] = calls
+        return missing
+
+    def unused(self):
+        """Definitions that no call site, key string or dynamic prefix reaches."""
+        used = []
+        for prefix in self.prefixes:
+            if prefix:
+                used.extend(entry.key for entry in self.index.prefix(prefix))
+        used = set(used)
+        return [
+            entry
+            for entry in self.index
+            if entry.key not in self.uses and entry.key not in used
+        ]
+
+    def untranslated(self):
+        """(entry, [languages]) for definitions with empty values."""
+        result = []
+        for entry in self.index:
+            languages = [lang for lang in ("tr", "en") if not (getattr(entry, lang) or "").strip()]
+            if languages:
+                result.append((entry, languages))
+        return result
+
+    def placeholders(self):
+        """
+        Placeholder mismatches as (definitions, calls):
+
+            definitions  [(entry, tr_names, en_names)] where the two differ
+            calls        [(key, path, line, missing, unused)] for t() calls
+                         that do not pass exactly the placeholders of the
+                         key's strings (calls whose params are not an object
+                         literal are skipped)
+        """
+        definitions = []
+        expected = {}
+        for entry in self.index:
+            tr, en = placeholders(entry.tr), placeholders(entry.en)
+            expected[entry.key] = tr | en
+            if tr != en:
+                definitions.append((entry, tr, en))
+        calls = []
+        for key, path, line, names in self.params:
+            if names is None or key not in expected:
+                continue
+            missing = expected[key] - names
+            unused = names - expected[key]
+            if missing or unused:
+                calls.append((key, path, line, sorted(missing), sorted(unused)))
+        calls.sort(key=lambda call: (call[1], call[2]))
+        return definitions, calls
+
+
+def placeholders(text):
+    return frozenset(PLACEHOLDER.findall(text or ""))
+
+
+def _rel(path):
+    return os.path.relpath(path, REPO_ROOT).replace(os.sep, "/")
+
+
+def build_report(coverage, sections):
+    translations = _rel(TRANSLATIONS_FILE)
+    report = {}
+    if "missing" in sections:
+        report["missing"] = {
+            key: [f"{_rel(path)}:{line}" for path, line in sites]
+            for key, sites in sorted(coverage.missing().items())
+        }
+    if "unused" in sections:
+        report["unused"] = {entry.key: f"{translations}:{entry.line}" for entry in coverage.unused()}
+    if "untranslated" in sections:
+        report["untranslated"] = {
+            entry.key: {"location": f"{translations}:{entry.line}", "languages": languages}
+            for entry, languages in coverage.untranslated()
+        }
+    if "duplicates" in sections:
+        report["duplicates"] = {
+            key: [f"{translations}:{line}" for line in lines]
+            for key, lines in sorted(coverage.index.duplicates.items())
+        }
+    if "placeholders" in sections:
+        definitions, calls = coverage.placeholders()
+        report["placeholders"] = {
+            "definitions": {
+                entry.key: {"location": f"{translations}:{entry.line}", "tr": sorted(tr), "en": sorted(en)}
+                for entry, tr, en in definitions
+            },
+            "calls": [
+                {"key": key, "location": f"{_rel(path)}:{line}", "missing": missing, "unused": unused}
+                for key, path, line, missing, unused in calls
+            ],
+        }
+    return report
+
+
+def print_report(report):
+    if "missing" in report:
+        print(f"Missing keys (used in t() but not defined): {len(report['missing'])}")
+        for key, sites in report["missing"].items():
+            print(f"  {key}")
+            for site in sites:
+                print(f"    {site}")
+    if "unused" in report:
+        print(f"\nUnused keys (defined but never referenced): {len(report['unused'])}")
+        for key, location in report["unused"].items():
+            print(f"  {location}  {key}")
+    if "untranslated" in report:
+        print(f"\nUntranslated keys (empty or missing value): {len(report['untranslated'])}")
+        for key, info in report["untranslated"].items():
+            print(f"  {info['location']}  {key} ({', '.join(info['languages'])})")
+    if "duplicates" in report:
+        print(f"\nDuplicate definitions: {len(report['duplicates'])}")
+        for key, locations in report["duplicates"].items():
+            print(f"  {key}: {', '.join(locations)}")
+    if "placeholders" in report:
+        definitions = report["placeholders"]["definitions"]
+        calls = report["placeholders"]["calls"]
+        print(f"\nPlaceholder mismatches: {len(definitions)} between tr and en, {len(calls)} at t() calls")
+        for key, info in definitions.items():
+            tr = ", ".join(info["tr"]) or "-"
+            en = ", ".join(info["en"]) or "-"
+            print(f"  {info['location']}  {key}: tr {{{tr}}}, en {{{en}}}")
+        for call in calls:
+            problems = []
+            if call["missing"]:
+                problems.append("not passed: " + ", ".join(call["missing"]))
+            if call["unused"]:
+                problems.append("not in the strings: " + ", ".join(call["unused"]))
+            print(f"  {call['location']}  {call['key']} ({'; '.join(problems)})")
+
+
+def load_scan_cache(roots):
+    try:
+        with open(_cache_path(roots), "rb") as f:
+            cached = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        return {}
+    if cached.get("tool") != _tool_digest():
+        return {}
+    return cached.get("files", {})
+
+
+def save_scan_cache(roots, scans):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    data = {"tool": _tool_digest(), "files": scans}
+    write_page(_cache_path(roots), pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Audit translation key coverage in client/src")
+    parser.add_argument(
+        "--root",
+        action="append",
+        help="source tree to scan, repeatable (default: client/src and server)",
+    )
+    parser.add_argument("--incremental", action="store_true", help="only re-scan files changed since the last run")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--only", help="comma-separated sections: " + ",".join(SECTIONS))
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    sections = SECTIONS
+    if args.only:
+        sections = tuple(s.strip() for s in args.only.split(","))
+        unknown = set(sections) - set(SECTIONS)
+        if unknown:
+            parser.error(f"unknown section(s): {', '.join(sorted(unknown))}")
+
+    started = time.perf_counter()
+    index = load_index()
+    roots = args.root or [CLIENT_SRC, SERVER_SRC]
+    cache = load_scan_cache(roots) if args.incremental else {}
+    scans, rescanned = scan_all(discover_sources(roots), jobs=args.jobs, cache=cache)
+    save_scan_cache(roots, scans)
+    coverage = CoverageIndex(index, scans)
+    report = build_report(coverage, sections)
+    elapsed = time.perf_counter() - started
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print_report(report)
+        print(
+            f"\n{len(index)} keys defined, {len(coverage.uses)} referenced across "
+            f"{len(scans)} files ({rescanned} scanned) in {elapsed:.2f}s"
+        )
+    mismatches = report.get("placeholders", {})
+    return 1 if report.get("missing") or mismatches.get("definitions") or mismatches.get("calls") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
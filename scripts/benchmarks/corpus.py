@@ -0,0 +1,133 @@
+"""
+Synthetic TSX pages and replacement tables for the codemod benchmarks.
+
+generate_page() writes a page shaped like client/src/pages/*.tsx (imports,
+state hooks, a toast-heavy handler section and repeated JSX cards) whose UI
+strings are Turkish phrases drawn from a fixed pool, so pages of any size
+contain realistic, repeating literals. generate_table() builds a rule list in
+the codemod_tables style from that pool: quoted literals become t() calls and
+bare JSX text becomes {t()}, with a share of rules that match nothing, as in
+the real tables.
+
+Both are deterministic for a given seed.
+"""
+
+import random
+
+ADJECTIVES = [
+    "Yeni", "Kayıtlı", "Seçili", "Tüm", "Önerilen", "Popüler", "Son", "Özel",
+    "Ücretsiz", "Gelişmiş", "Hızlı", "Yüksek Kaliteli", "Paylaşılan", "Favori",
+]
+NOUNS = [
+    "görsel", "video", "karakter", "logo", "prompt", "şablon", "paket", "kredi",
+    "galeri", "müzik", "ses kaydı", "profil", "proje", "sahne", "stil", "renk paleti",
+]
+PHRASES = [
+    "oluşturuldu", "yükleniyor...", "silinemedi", "başarıyla kaydedildi",
+    "indirilemedi, lütfen tekrar deneyin", "seçin", "paylaşıldı",
+    "bulunamadı", "için yeterli krediniz yok", "değiştirildi", "hazırlanıyor",
+    "yüklemek için tıklayın", "işleniyor, lütfen bekleyin", "önizlemesi",
+]
+
+HEADER = '''import { useState, useEffect } from "react";
+import { useLocation } from "wouter";
+import { trpc } from "@/lib/trpc";
+import { useLanguage } from "@/contexts/LanguageContext";
+import { Button } from "@/components/ui/button";
+import { Input } from "@/components/ui/input";
+import { toast } from "sonner";
+
+export default function BenchmarkPage() {
+  const [, navigate] = useLocation();
+  const { t } = useLanguage();
+  const [value, setValue] = useState("");
+  const [items, setItems] = useState<string[]>([]);
+
+'''
+
+HANDLER = '''  const handle{n} = async () => {{
+    try {{
+      await trpc.generation.create.mutate({{ value, index: {n} }});
+      toast.success("{a}");
+    }} catch (error) {{
+      toast.error("{b}");
+    }}
+  }};
+
+'''
+
+CARD = '''        <div className="flex items-center gap-2 rounded-xl border p-4">
+          <h2 className="text-lg font-semibold">{a}</h2>
+          <p className="text-sm text-gray-400">
+            {b}
+          </p>
+          <Input placeholder="{c}" value={{value}} onChange={{e => setValue(e.target.value)}} />
+          <Button onClick={{handle{n}}}>{d}</Button>
+        </div>
+'''
+
+FOOTER = '''      </div>
+    </div>
+  );
+}
+'''
+
+
+def phrase_pool(size, seed=0):
+    """size distinct Turkish UI strings."""
+    rng = random.Random(seed)
+    pool = []
+    seen = set()
+    while len(pool) < size:
+        text = f"{rng.choice(ADJECTIVES)} {rng.choice(NOUNS)} {rng.choice(PHRASES)}"
+        if text in seen:
+            text = f"{text} ({len(pool)})"
+        seen.add(text)
+        pool.append(text)
+    return pool
+
+
+def generate_page(lines, pool, seed=0):
+    """A TSX page of about `lines` lines using strings from pool."""
+    rng = random.Random(seed)
+    parts = [HEADER]
+    count = HEADER.count("\n")
+    handlers = max(1, lines // 40)
+    for n in range(handlers):
+        parts.append(HANDLER.format(n=n, a=rng.choice(pool), b=rng.choice(pool)))
+        count += 10
+    parts.append("  return (\n    <div className=\"min-h-screen\">\n      <div className=\"container\">\n")
+    count += 3
+    n = 0
+    while count < lines - 4:
+        parts.append(
+            CARD.format(
+                n=n % handlers,
+                a=rng.choice(pool),
+                b=rng.choice(pool),
+                c=rng.choice(pool),
+                d=rng.choice(pool),
+            )
+        )
+        count += 8
+        n += 1
+    parts.append(FOOTER)
+    return "".join(parts)
+
+
+def generate_table(rules, pool, seed=0, miss_ratio=0.1):
+    """rules [old, new] pairs in codemod_tables style over the phrase pool."""
+    rng = random.Random(seed)
+    table = []
+    for i in range(rules):
+        text = pool[i % len(pool)]
+        if rng.random() < miss_ratio:
+            text += " (eski sürüm)"
+        key = f"bench.key{i}"
+        if i % 3 == 0:
+            table.append((f'"{text}"', f't("{key}")'))
+        elif i % 3 == 1:
+            table.append((f">{text}<", f">{{t(\"{key}\")}}<"))
+        else:
+            table.append((f"  {text}\n", f"  {{t(\"{key}\")}}\n"))
+    return table
@@ -0,0 +1,97 @@
+"""
+Throughput and peak memory of the codemod replacement strategies.
+
+Synthetic pages of 1k-100k lines (corpus.py) are rewritten with tables of
+10-5,000 rules by
+
+    sequential   the original scripts' loop of content.replace(old, new)
+    engine       codemod_engine.ReplacementEngine, compiled once
+    compile      compiling the ReplacementEngine for a table
+
+Every case checks that the engine output equals the sequential output, and
+records the peak traced memory of one run in the benchmark's extra_info
+("peak_kib"); the engine must also stay within MEMORY_BUDGET bytes per page
+character. Combinations of more than SLOW_WORK lines x rules need --run-slow.
+
+Usage (needs pytest-benchmark: pip install pytest pytest-benchmark):
+    python3 -m pytest scripts/benchmarks
+    python3 -m pytest scripts/benchmarks --run-slow --benchmark-autosave
+    python3 -m pytest scripts/benchmarks --benchmark-compare --benchmark-compare-fail=mean:10%
+"""
+
+import tracemalloc
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from codemod_engine import ReplacementEngine  # noqa: E402
+from corpus import generate_page, generate_table, phrase_pool  # noqa: E402
+
+PAGE_LINES = [1_000, 10_000, 100_000]
+TABLE_RULES = [10, 500, 5_000]
+SLOW_WORK = 10_000 * 5_000
+# Peak bytes per page character the engine may allocate on top of its input
+MEMORY_BUDGET = 16
+
+_corpus = {}
+
+
+def corpus(lines, rules):
+    key = (lines, rules)
+    if key not in _corpus:
+        pool = phrase_pool(max(rules, 200))
+        _corpus[key] = (generate_page(lines, pool), generate_table(rules, pool))
+    return _corpus[key]
+
+
+def sequential(content, rules):
+    for old, new in rules:
+        content = content.replace(old, new)
+    return content
+
+
+def peak_memory(function, *args):
+    """Peak traced allocation (bytes) of one call."""
+    tracemalloc.start()
+    try:
+        function(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def cases():
+    for lines in PAGE_LINES:
+        for rules in TABLE_RULES:
+            marks = [pytest.mark.slow] if lines * rules > SLOW_WORK else []
+            yield pytest.param(lines, rules, marks=marks, id=f"{lines}lines-{rules}rules")
+
+
+@pytest.mark.parametrize("lines,rules", list(cases()))
+def test_sequential(benchmark, lines, rules):
+    page, table = corpus(lines, rules)
+    benchmark.group = f"{lines} lines x {rules} rules"
+    benchmark.extra_info["peak_kib"] = peak_memory(sequential, page, table) // 1024
+    benchmark(sequential, page, table)
+
+
+@pytest.mark.parametrize("lines,rules", list(cases()))
+def test_engine(benchmark, lines, rules):
+    page, table = corpus(lines, rules)
+    engine = ReplacementEngine(table)
+    benchmark.group = f"{lines} lines x {rules} rules"
+    assert engine.apply(page)[0] == sequential(page, table)
+
+    peak = peak_memory(engine.apply, page)
+    benchmark.extra_info["peak_kib"] = peak // 1024
+    assert peak <= MEMORY_BUDGET * len(page), f"peak {peak // 1024} KiB over budget"
+    benchmark(engine.apply, page)
+
+
+@pytest.mark.parametrize("rules", TABLE_RULES)
+def test_compile(benchmark, rules):
+    _, table = corpus(PAGE_LINES[0], rules)
+    benchmark.group = "compile"
+    benchmark.extra_info["peak_kib"] = peak_memory(ReplacementEngine, table) // 1024
+    benchmark(ReplacementEngine, table)
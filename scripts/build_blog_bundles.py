@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Split blog-articles.json into a compact index, per-slug bodies and SEO bundles
+
+blog-articles.json holds every seeded article in full (title, excerpt, tags and
+the whole markdown content). This generator reads it as a stream, one article
+at a time, and writes
+
+    content/blog/index.json             [{slug, title, excerpt, category, tags,
+                                          readingMinutes, wordCount}, ...]
+    content/blog/articles/<slug>.json   {slug, content}
+    content/blog/seo/<lang>.json        {slug: {metaTitle, metaDescription,
+                                          ogType, ogLocale, canonicalUrl,
+                                          structuredData, ...}}
+
+so nothing that only lists articles or renders their meta tags has to load the
+bodies. The SEO bundles use the seoSettings column names and limits (70
+characters for titles, 160 for descriptions) and the "blog.title" string of
+each language from translations.ts. scripts/seed-blog-articles.mjs seeds from
+the index and reads a body only for the articles it inserts; the seo router
+serves the bundles to SeoHead for /blog/<slug>.
+
+Files are only rewritten when their content changes. Run by `npm run build`;
+use --check in CI to verify the committed bundles are current.
+
+Usage:
+    python3 scripts/build_blog_bundles.py
+    python3 scripts/build_blog_bundles.py --check
+"""
+
+import argparse
+import json
+import math
+import os
+import re
+import sys
+
+from codemod_io import REPO_ROOT, read_chunks, read_page, write_page
+from translations_index import load_index
+
+ARTICLES_FILE = os.path.join(REPO_ROOT, "blog-articles.json")
+BUNDLES_DIR = os.path.join(REPO_ROOT, "content", "blog")
+BASE_URL = "https://nanoinf.com"
+SITE_NAME = "NanoInf"
+LANGUAGES = ("tr", "en")
+OG_LOCALES = {"tr": "tr_TR", "en": "en_US"}
+CONTENT_LANGUAGE = "tr"
+DEFAULT_CATEGORY = "Genel"
+WORDS_PER_MINUTE = 200
+TITLE_LIMIT = 70
+DESCRIPTION_LIMIT = 160
+
+
+def iter_array(chunks):
+    """Yield the elements of a top-level JSON array arriving in text chunks.
+
+    Only the element being decoded (and the unread rest of its chunk) is kept
+    in memory, not the whole document.
+    """
+    decoder = json.JSONDecoder()
+    chunks = iter(chunks)
+    buffer = ""
+    pos = 0
+    opened = False
+    while True:
+        while pos < len(buffer) and (buffer[pos].isspace() or (opened and buffer[pos] == ",")):
+            pos += 1
+        if pos < len(buffer):
+            if not opened:
+                if buffer[pos] != "[":
+                    raise ValueError("expected a JSON array")
+                opened = True
+                pos += 1
+                continue
+            if buffer[pos] == "]":
+                return
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                end = len(buffer)
+            # An element is only complete once something follows it
+            if end < len(buffer):
+                yield value
+                buffer = buffer[end:]
+                pos = 0
+                continue
+        chunk = next(chunks, None)
+        if chunk is None:
+            raise ValueError("unexpected end of JSON array")
+        buffer = buffer[pos:] + chunk
+        pos = 0
+
+
+def word_count(content):
+    """Words as seed-blog-articles.mjs counted them: content.split(/\\s+/).length."""
+    return len(re.split(r"\s+", content))
+
+
+def clip(text, limit):
+    """text cut to at most limit characters at a word boundary, with an ellipsis."""
+    text = " ".join(text.split())
+    if len(text) <= limit:
+        return text
+    cut = text[: limit - 1].rsplit(" ", 1)[0].rstrip(" ,.;:-–")
+    return cut + "…"
+
+
+def index_entry(article):
+    content = article["content"]
+    words = word_count(content)
+    return {
+        "slug": article["slug"],
+        "title": article["title"],
+        "excerpt": article["excerpt"],
+        "category": article.get("category") or DEFAULT_CATEGORY,
+        "tags": article.get("tags") or [],
+        "readingMinutes": math.ceil(words / WORDS_PER_MINUTE),
+        "wordCount": words,
+    }
+
+
+def seo_entry(entry, language, blog_title):
+    """Meta tags for one article in one language (seoSettings field names)."""
+    url = f"{BASE_URL}/blog/{entry['slug']}"
+    title = next(
+        (
+            candidate
+            for candidate in (f"{entry['title']} | {blog_title}", f"{entry['title']} | {SITE_NAME}")
+            if len(candidate) <= TITLE_LIMIT
+        ),
+        clip(entry["title"], TITLE_LIMIT),
+    )
+    description = clip(entry["excerpt"], DESCRIPTION_LIMIT)
+    structured = {
+        "@context": "https://schema.org",
+        "@type": "BlogPosting",
+        "headline": entry["title"],
+        "description": entry["excerpt"],
+        "inLanguage": CONTENT_LANGUAGE,
+        "articleSection": entry["category"],
+        "keywords": ", ".join(entry["tags"]),
+        "wordCount": entry["wordCount"],
+        "timeRequired": f"PT{entry['readingMinutes']}M",
+        "url": url,
+        "publisher": {"@type": "Organization", "name": SITE_NAME},
+    }
+    return {
+        "metaTitle": title,
+        "metaDescription": description,
+        "metaKeywords": ", ".join(entry["tags"]) or None,
+        "canonicalUrl": url,
+        "ogTitle": title,
+        "ogDescription": description,
+        "ogType": "article",
+        "ogLocale": OG_LOCALES[language],
+        "robotsIndex": True,
+        "robotsFollow": True,
+        "structuredData": json.dumps(structured, ensure_ascii=False, separators=(",", ":")),
+    }
+
+
+def dump(value):
+    return json.dumps(value, ensure_ascii=False, indent=2) + "\n"
+
+
+def existing_files():
+    found = set()
+    for directory, _, names in os.walk(BUNDLES_DIR):
+        for name in names:
+            if name.endswith(".json"):
+                found.add(os.path.relpath(os.path.join(directory, name), BUNDLES_DIR))
+    return found
+
+
+def generate(emit):
+    """Stream the articles, passing each (relative path, content) to emit."""
+    titles = {}
+    for entry in load_index():
+        if entry.key == "blog.title":
+            titles = {language: getattr(entry, language) for language in LANGUAGES}
+    missing = [language for language in LANGUAGES if not titles.get(language)]
+    if missing:
+        raise ValueError(f'"blog.title" has no {", ".join(missing)} translation')
+
+    index = []
+    seen = set()
+    for article in iter_array(read_chunks(ARTICLES_FILE)):
+        slug = article["slug"]
+        if slug in seen:
+            raise ValueError(f"duplicate slug: {slug}")
+        seen.add(slug)
+        index.append(index_entry(article))
+        emit(os.path.join("articles", f"{slug}.json"), dump({"slug": slug, "content": article["content"]}))
+    emit("index.json", dump(index))
+    for language in LANGUAGES:
+        bundle = {entry["slug"]: seo_entry(entry, language, titles[language]) for entry in index}
+        emit(os.path.join("seo", f"{language}.json"), dump(bundle))
+    return len(index)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate the blog index, article bodies and SEO bundles")
+    parser.add_argument("--check", action="store_true", help="exit 1 if the bundles are out of date")
+    args = parser.parse_args(argv)
+
+    written = set()
+    changed = []
+
+    def emit(rel, content):
+        written.add(rel)
+        path = os.path.join(BUNDLES_DIR, rel)
+        try:
+            current = read_page(path)
+        except FileNotFoundError:
+            current = None
+        if current == content:
+            return
+        changed.append(rel)
+        if not args.check:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            write_page(path, content)
+
+    try:
+        count = generate(emit)
+    except (OSError, ValueError, KeyError) as exc:
+        print(f"❌ {exc}", file=sys.stderr)
+        return 1
+    stale = sorted(existing_files() - written)
+
+    if args.check:
+        for rel in changed:
+            print(f"out of date: {rel}")
+        for rel in stale:
+            print(f"stale: {rel}")
+        return 1 if changed or stale else 0
+
+    for rel in stale:
+        os.unlink(os.path.join(BUNDLES_DIR, rel))
+    print(
+        f"{count} articles in {os.path.relpath(BUNDLES_DIR, REPO_ROOT)}: "
+        f"{len(changed)} files updated, {len(stale)} removed"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Split client/src/i18n/translations.ts into per-language, per-namespace chunks
+
+translations.ts stays the single source of truth; this generator writes
+
+    client/src/i18n/chunks/<lang>/<namespace>.json   {"home.title": "...", ...}
+    client/src/i18n/chunks/manifest.ts               which namespaces the app
+                                                     shell and each route need
+
+LanguageContext loads the chunks with import.meta.glob, so Vite emits each
+one as its own lazily fetched file and a visitor only downloads the active
+language's strings for the shell and the page they are on.
+
+The manifest is derived from the code: App.tsx is parsed for its <Route>
+table (following `const XRoute = flag ? X : NotFound` and lazy() imports),
+every route's page module is followed through its local imports, and the
+namespaces of all t() keys found on the way (see audit_translations.py) are
+recorded. Modules App.tsx imports statically that are not routes
+(MobileBottomNav, MaintenancePage, ...) make up the shell, which is loaded
+before the first render.
+
+Files are only rewritten when their content changes. Run by `npm run build`;
+use --check in CI to verify the committed chunks are current.
+
+Usage:
+    python3 scripts/build_translation_chunks.py
+    python3 scripts/build_translation_chunks.py --check
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+
+from audit_translations import CALL, DYNAMIC, scan_source
+from codemod_io import REPO_ROOT, read_page, write_page
+from translations_index import TRANSLATIONS_FILE, load_index, namespace_of
+
+CLIENT_SRC = os.path.join(REPO_ROOT, "client", "src")
+APP_FILE = os.path.join(CLIENT_SRC, "App.tsx")
+CHUNKS_DIR = os.path.join(CLIENT_SRC, "i18n", "chunks")
+LANGUAGES = ("tr", "en")
+
+STATIC_IMPORT = re.compile(r"""^\s*(?:import|export)\b[^;]*?\bfrom\s*["']([^"']+)["']|^\s*import\s*["']([^"']+)["']""", re.M)
+DYNAMIC_IMPORT = re.compile(r"""\bimport\(\s*["']([^"']+)["']\s*\)""")
+DEFAULT_IMPORT = re.compile(r"""^\s*import\s+(\w+)\s*(?:,\s*\{[^}]*\})?\s*from\s*["']([^"']+)["']""", re.M)
+NAMED_IMPORT = re.compile(r"""^\s*import\s+(?:\w+\s*,\s*)?\{([^}]*)\}\s*from\s*["']([^"']+)["']""", re.M)
+LAZY_IMPORT = re.compile(r"""\bconst\s+(\w+)\s*=\s*lazy\(\s*\(\)\s*=>\s*import\(\s*["']([^"']+)["']""")
+CONDITIONAL = re.compile(r"""\bconst\s+(\w+)\s*=\s*[^;?]+\?\s*(\w+)\s*:\s*(\w+)\s*;""")
+ROUTE = re.compile(r"""<Route\s+(?:path=\{?["']([^"']+)["']\}?\s+)?component=\{(\w+)\}""")
+RESOLVE_SUFFIXES = ("", ".tsx", ".ts", "/index.tsx", "/index.ts")
+
+MANIFEST_HEADER = """\
+// Generated by scripts/build_translation_chunks.py from translations.ts and
+// the <Route> table in App.tsx. Do not edit by hand.
+
+"""
+
+
+def resolve_import(spec, from_file):
+    """Absolute path of a client/src module, or None for packages."""
+    if spec.startswith("@/"):
+        base = os.path.join(CLIENT_SRC, spec[2:])
+    elif spec.startswith("."):
+        base = os.path.normpath(os.path.join(os.path.dirname(from_file), spec))
+    else:
+        return None
+    for suffix in RESOLVE_SUFFIXES:
+        path = base + suffix
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def local_imports(path, source, dynamic=True):
+    specs = [a or b for a, b in STATIC_IMPORT.findall(source)]
+    if dynamic:
+        specs.extend(DYNAMIC_IMPORT.findall(source))
+    resolved = (resolve_import(spec, path) for spec in specs)
+    # Only client modules ship; server/ is reached through type imports (tRPC)
+    client = CLIENT_SRC + os.sep
+    return [p for p in resolved if p and p.endswith((".ts", ".tsx")) and p.startswith(client)]
+
+
+class ModuleGraph:
+    """Translation namespaces reachable from a module through local imports."""
+
+    def __init__(self, index):
+        self.index = index
+        self._sources = {}
+        self._namespaces = {}
+
+    def source(self, path):
+        if path not in self._sources:
+            self._sources[path] = read_page(path)
+        return self._sources[path]
+
+    def own_namespaces(self, path):
+        if path not in self._namespaces:
+            found = set()
+            for kind, key, _ in scan_source(self.source(path)):
+                if kind == DYNAMIC:
+                    if "." in key:
+                        found.add(namespace_of(key))
+                elif kind == CALL or key in self.index:
+                    found.add(namespace_of(key))
+            self._namespaces[path] = found
+        return self._namespaces[path]
+
+    def namespaces(self, roots, stop=(), dynamic=True):
+        """Namespaces used by roots and everything they import, not entering stop."""
+        seen = set()
+        pending = list(roots)
+        found = set()
+        while pending:
+            path = pending.pop()
+            if path in seen:
+                continue
+            seen.add(path)
+            found |= self.own_namespaces(path)
+            for dep in local_imports(path, self.source(path), dynamic):
+                # translations.ts defines every key; it is not a use of any.
+                if dep not in seen and dep not in stop and dep != TRANSLATIONS_FILE:
+                    pending.append(dep)
+        return found
+
+
+def parse_routes(app_file=APP_FILE):
+    """
+    Return ([(path_or_None, [module, ...]), ...], {route modules}) from App.tsx.
+    A None path is the catch-all route.
+    """
+    source = read_page(app_file)
+    modules = {}
+    for name, spec in DEFAULT_IMPORT.findall(source):
+        modules[name] = resolve_import(spec, app_file)
+    for names, spec in NAMED_IMPORT.findall(source):
+        for name in names.split(","):
+            name = name.split(" as ")[-1].strip()
+            if name:
+                modules[name] = resolve_import(spec, app_file)
+    for name, spec in LAZY_IMPORT.findall(source):
+        modules[name] = resolve_import(spec, app_file)
+    aliases = {name: (a, b) for name, a, b in CONDITIONAL.findall(source)}
+
+    def components(name):
+        if name in aliases:
+            return [c for alias in aliases[name] for c in components(alias)]
+        return [name]
+
+    routes = []
+    route_modules = set()
+    for path, component in ROUTE.findall(source):
+        targets = [modules.get(c) for c in components(component)]
+        targets = sorted({t for t in targets if t})
+        route_modules.update(targets)
+        routes.append((path or None, targets))
+    return routes, route_modules
+
+
+def build_manifest(index, app_file=APP_FILE):
+    graph = ModuleGraph(index)
+    routes, route_modules = parse_routes(app_file)
+    available = {namespace_of(entry.key) for entry in index}
+    # The shell: App.tsx and whatever it imports statically that is not a route.
+    shell = graph.namespaces([app_file], stop=route_modules, dynamic=False) & available
+    table = []
+    for path, targets in routes:
+        needed = graph.namespaces(targets) & available
+        table.append((path, sorted(needed - shell)))
+    return sorted(shell), table
+
+
+def render_manifest(shell, routes):
+    route_lines = []
+    fallback = []
+    for path, namespaces in routes:
+        if path is None:
+            fallback = namespaces
+            continue
+        route_lines.append(f"  [{json.dumps(path)}, {json.dumps(namespaces)}],")
+    return (
+        MANIFEST_HEADER
+        + f"export const chunkLanguages = {json.dumps(list(LANGUAGES))} as const;\n\n"
+        + "/** Namespaces every page needs (loaded before the first render). */\n"
+        + f"export const shellNamespaces: string[] = {json.dumps(shell)};\n\n"
+        + "/** Extra namespaces per wouter route pattern, in <Switch> order. */\n"
+        + "export const routeNamespaces: Array<[string, string[]]> = [\n"
+        + "\n".join(route_lines)
+        + "\n];\n\n"
+        + "/** Namespaces of the catch-all (not found) route. */\n"
+        + f"export const fallbackNamespaces: string[] = {json.dumps(fallback)};\n"
+    )
+
+
+def render_chunks(index):
+    """{relative path: JSON text} for every language/namespace chunk."""
+    chunks = {}
+    for language in LANGUAGES:
+        by_namespace = {}
+        for entry in index:
+            value = getattr(entry, language)
+            if value is not None:
+                by_namespace.setdefault(namespace_of(entry.key), {})[entry.key] = value
+        for namespace, messages in by_namespace.items():
+            text = json.dumps(messages, ensure_ascii=False, indent=2, sort_keys=True) + "\n"
+            chunks[os.path.join(language, namespace + ".json")] = text
+    return chunks
+
+
+def generate(index=None):
+    """All generated files as {path under CHUNKS_DIR: content}."""
+    index = index or load_index()
+    files = render_chunks(index)
+    shell, routes = build_manifest(index)
+    files["manifest.ts"] = render_manifest(shell, routes)
+    return files
+
+
+def existing_files():
+    found = set()
+    for path in glob.glob(os.path.join(CHUNKS_DIR, "*", "*.json")):
+        found.add(os.path.relpath(path, CHUNKS_DIR))
+    if os.path.exists(os.path.join(CHUNKS_DIR, "manifest.ts")):
+        found.add("manifest.ts")
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate per-language translation chunks")
+    parser.add_argument("--check", action="store_true", help="exit 1 if the chunks are out of date")
+    args = parser.parse_args(argv)
+
+    files = generate()
+    stale = sorted(existing_files() - set(files))
+    changed = []
+    for rel, content in sorted(files.items()):
+        path = os.path.join(CHUNKS_DIR, rel)
+        try:
+            current = read_page(path)
+        except FileNotFoundError:
+            current = None
+        if current != content:
+            changed.append(rel)
+
+    if args.check:
+        for rel in changed:
+            print(f"out of date: {rel}")
+        for rel in stale:
+            print(f"stale: {rel}")
+        return 1 if changed or stale else 0
+
+    for rel in changed:
+        path = os.path.join(CHUNKS_DIR, rel)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        write_page(path, files[rel])
+    for rel in stale:
+        os.unlink(os.path.join(CHUNKS_DIR, rel))
+    print(
+        f"{len(files) - 1} chunks + manifest.ts in {os.path.relpath(CHUNKS_DIR, REPO_ROOT)}: "
+        f"{len(changed)} updated, {len(stale)} removed"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
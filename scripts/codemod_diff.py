@@ -0,0 +1,328 @@
+"""
+Edit tracking and streaming unified diffs for codemod dry runs.
+
+The replacement engine and tsx_spans.PatchSet already know exactly which
+spans of a page they rewrite. While an EditLog is active they report those
+spans to it, and the log composes them into a list of edits against the
+original page: (start, end, text) meaning "original[start:end] became text".
+The diff is rendered from those edits and the lines around them only, so its
+cost depends on what changed rather than on re-diffing whole files.
+
+Scripts that still edit with plain str.replace() between two recorded steps
+are picked up when the next step (or the end of the run) sees text the log
+did not produce: the untracked change is narrowed to the region between the
+common prefix and suffix and recorded as one more edit.
+
+Usage:
+    with track_edits(original) as log:
+        content = transform(original)
+    for line in unified_diff(page, original, log.finish(content)):
+        sys.stdout.write(line)
+"""
+
+import contextlib
+from collections import Counter
+
+_active = []
+
+
+@contextlib.contextmanager
+def track_edits(original):
+    """Record every span edit made to a page while the block runs."""
+    log = EditLog(original)
+    _active.append(log)
+    try:
+        yield log
+    finally:
+        _active.pop()
+
+
+def record(before, spans, after):
+    """Report sorted, non-overlapping (start, end, text) spans that turned before into after."""
+    if _active:
+        _active[-1].record(before, spans, after)
+
+
+def record_misses(label, patterns):
+    """Report replacement patterns that matched nothing."""
+    if _active:
+        _active[-1].misses.extend((label, pattern) for pattern in patterns)
+
+
+def common_prefix(a, b):
+    """Length of the common prefix of two strings (binary search on slices)."""
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[low:mid] == b[low:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def common_suffix(a, b, limit):
+    """Length of the common suffix of two strings, at most limit."""
+    low, high = 0, limit
+    la, lb = len(a), len(b)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[la - mid : la - low] == b[lb - mid : lb - low]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def _length(segment):
+    return segment[2] - segment[1] if segment[0] == "o" else len(segment[1])
+
+
+def _split(segment, cut):
+    if segment[0] == "o":
+        return ("o", segment[1], segment[1] + cut), ("o", segment[1] + cut, segment[2])
+    return ("n", segment[1][:cut]), ("n", segment[1][cut:])
+
+
+class EditLog:
+    """The current page as a sequence of original slices and inserted text.
+
+    Segments are ("o", start, end) for untouched original text and
+    ("n", text) for text that edits put in; applying spans splits and drops
+    segments without copying the page.
+    """
+
+    def __init__(self, original):
+        self.original = original
+        self.current = original
+        self.segments = [("o", 0, len(original))] if original else []
+        self.misses = []
+
+    def _apply(self, spans):
+        segments = self.segments
+        out = []
+        i = 0
+        offset = 0
+        for start, end, text in spans:
+            while i < len(segments) and offset + _length(segments[i]) <= start:
+                offset += _length(segments[i])
+                out.append(segments[i])
+                i += 1
+            if i < len(segments) and offset < start:
+                head, segments[i] = _split(segments[i], start - offset)
+                out.append(head)
+                offset = start
+            while i < len(segments) and offset + _length(segments[i]) <= end:
+                offset += _length(segments[i])
+                i += 1
+            if i < len(segments) and offset < end:
+                _, segments[i] = _split(segments[i], end - offset)
+                offset = end
+            if text:
+                out.append(("n", text))
+        out.extend(segments[i:])
+        self.segments = out
+
+    def _sync(self, text):
+        """Account for changes made to the page without recording them."""
+        if text is self.current or text == self.current:
+            self.current = text
+            return
+        prefix = common_prefix(self.current, text)
+        suffix = common_suffix(
+            self.current, text, min(len(self.current), len(text)) - prefix
+        )
+        self._apply([(prefix, len(self.current) - suffix, text[prefix : len(text) - suffix])])
+        self.current = text
+
+    def record(self, before, spans, after):
+        if before is not self.current:
+            self._sync(before)
+        if spans:
+            self._apply(spans)
+        self.current = after
+
+    def finish(self, result):
+        """Edits against the original page, as sorted (start, end, text)."""
+        if result is not self.current:
+            self._sync(result)
+        edits = []
+        pos = 0
+        inserted = []
+        for segment in self.segments:
+            if segment[0] == "n":
+                inserted.append(segment[1])
+                continue
+            if segment[1] != pos or inserted:
+                edits.append((pos, segment[1], "".join(inserted)))
+                inserted = []
+            pos = segment[2]
+        if pos != len(self.original) or inserted:
+            edits.append((pos, len(self.original), "".join(inserted)))
+        return edits
+
+
+def _line_bounds(text, start, end):
+    """Expand [start, end) to whole lines."""
+    first = text.rfind("\n", 0, start) + 1
+    if end > start and text[end - 1] == "\n":
+        return first, end
+    newline = text.find("\n", end)
+    return first, len(text) if newline == -1 else newline + 1
+
+
+def _split_lines(text):
+    """Lines with their "\n" (unlike splitlines(), which also breaks on \r and U+2028)."""
+    lines = text.split("\n")
+    result = [line + "\n" for line in lines[:-1]]
+    if lines[-1]:
+        result.append(lines[-1])
+    return result
+
+
+def _changes(original, edits):
+    """Yield (line, old_lines, new_lines) per block of changed lines (0-based line)."""
+    groups = []
+    for start, end, text in edits:
+        first, last = _line_bounds(original, start, end)
+        if groups and first < groups[-1][1]:
+            group = groups[-1]
+            group[1] = max(group[1], last)
+            group[2].append((start, end, text))
+        else:
+            groups.append([first, last, [(start, end, text)]])
+
+    line = 0
+    counted = 0
+    for first, last, group in groups:
+        parts = []
+        pos = first
+        for start, end, text in group:
+            parts.append(original[pos:start])
+            parts.append(text)
+            pos = end
+        parts.append(original[pos:last])
+        old_lines = _split_lines(original[first:last])
+        new_lines = _split_lines("".join(parts))
+
+        line += original.count("\n", counted, first)
+        counted = first
+        head = 0
+        while head < min(len(old_lines), len(new_lines)) and old_lines[head] == new_lines[head]:
+            head += 1
+        tail = 0
+        while (
+            tail < min(len(old_lines), len(new_lines)) - head
+            and old_lines[-1 - tail] == new_lines[-1 - tail]
+        ):
+            tail += 1
+        old_lines = old_lines[head : len(old_lines) - tail]
+        new_lines = new_lines[head : len(new_lines) - tail]
+        if old_lines or new_lines:
+            yield line + head, old_lines, new_lines
+
+
+def _diff_line(prefix, line):
+    if line.endswith("\n"):
+        return prefix + line
+    return prefix + line + "\n\\ No newline at end of file\n"
+
+
+class _LineReader:
+    """Original lines by 0-based number, scanning forward from the last request."""
+
+    def __init__(self, text):
+        self.text = text
+        self.line = 0
+        self.pos = 0
+
+    def seek(self, line):
+        if line < self.line:
+            self.line, self.pos = 0, 0
+        while self.line < line and self.pos < len(self.text):
+            newline = self.text.find("\n", self.pos)
+            self.pos = len(self.text) if newline == -1 else newline + 1
+            self.line += 1
+
+    def lines(self, start, stop):
+        self.seek(start)
+        result = []
+        while self.line < stop and self.pos < len(self.text):
+            newline = self.text.find("\n", self.pos)
+            end = len(self.text) if newline == -1 else newline + 1
+            result.append(self.text[self.pos : end])
+            self.pos = end
+            self.line += 1
+        return result
+
+
+def _hunk_header(old_start, old_count, new_start, new_count):
+    old = old_start + 1 if old_count else old_start
+    new = new_start + 1 if new_count else new_start
+    return f"@@ -{old},{old_count} +{new},{new_count} @@\n"
+
+
+def unified_diff(path, original, edits, context=3):
+    """Yield the lines of a unified diff for edits against original.
+
+    Hunks are produced one at a time as the edits are walked, so the caller
+    can write them out while later hunks are still being built.
+    """
+    reader = _LineReader(original)
+    header_sent = False
+    delta = 0
+    hunk = None  # [old_start, new_start, old_count, new_count, lines, old_end]
+
+    def flush():
+        after = reader.lines(hunk[5], hunk[5] + context)
+        hunk[4].extend(_diff_line(" ", line) for line in after)
+        hunk[2] += len(after)
+        hunk[3] += len(after)
+        return [_hunk_header(hunk[0], hunk[2], hunk[1], hunk[3])] + hunk[4]
+
+    for line, old_lines, new_lines in _changes(original, edits):
+        if not header_sent:
+            yield f"--- a/{path}\n"
+            yield f"+++ b/{path}\n"
+            header_sent = True
+        if hunk is not None and line - hunk[5] <= 2 * context:
+            between = reader.lines(hunk[5], line)
+            hunk[4].extend(_diff_line(" ", text) for text in between)
+            hunk[2] += len(between)
+            hunk[3] += len(between)
+        else:
+            if hunk is not None:
+                yield from flush()
+            start = max(0, line - context)
+            before = reader.lines(start, line)
+            hunk = [start, start + delta, len(before), len(before), [], line]
+            hunk[4].extend(_diff_line(" ", text) for text in before)
+        hunk[4].extend(_diff_line("-", text) for text in old_lines)
+        hunk[4].extend(_diff_line("+", text) for text in new_lines)
+        hunk[2] += len(old_lines)
+        hunk[3] += len(new_lines)
+        hunk[5] = line + len(old_lines)
+        delta += len(new_lines) - len(old_lines)
+
+    if hunk is not None:
+        yield from flush()
+
+
+def write_unified_diff(stream, path, original, edits, context=3):
+    """Stream a page's diff to a file object; returns True if it changed."""
+    changed = False
+    for line in unified_diff(path, original, edits, context):
+        stream.write(line)
+        changed = True
+    return changed
+
+
+def print_miss_summary(misses, stream):
+    """Summarise record_misses() reports per table."""
+    if not misses:
+        print("All replacement patterns matched.", file=stream)
+        return
+    counts = Counter(label for label, _ in misses)
+    print(f"{len(misses)} replacement patterns matched nothing:", file=stream)
+    for label, count in sorted(counts.items()):
+        print(f"  {label}: {count}", file=stream)
@@ -0,0 +1,353 @@
+"""
+Shared multi-pattern replacement engine for the i18n codemod scripts.
+
+The refactor_*.py / fix_*.py scripts used to run dozens of sequential
+content.replace(old, new) calls, rescanning and reallocating the whole page
+for every pair. ReplacementEngine compiles all pairs of a script into one
+Aho-Corasick automaton, finds every occurrence in a single scan and rebuilds
+the page once.
+
+The output is identical to applying str.replace() for each pair in order:
+
+- overlapping patterns are resolved by rule order, exactly like the
+  sequential calls (an earlier rule "consumes" the text a later rule would
+  have matched);
+- when a later pattern could match text produced by an earlier replacement
+  (e.g. a rule that reverts a previous rule), the rules are split into
+  stages and each stage is applied to the output of the previous one.
+
+Large files can be streamed instead of loaded whole: apply_chunks() runs
+every stage as a generator over text chunks (see codemod_io.read_chunks and
+rewrite_streaming), keeping only a pattern-length tail of each chunk back.
+
+Usage:
+    engine = ReplacementEngine(replacements)
+    content, hits = engine.apply(content)
+    print_misses(replacements, hits)
+"""
+
+import re
+from bisect import bisect_left
+from collections import deque
+
+from codemod_diff import record
+
+
+class Automaton:
+    """Aho-Corasick automaton over a list of literal words."""
+
+    def __init__(self, words):
+        self.words = list(words)
+        self.goto = [{}]
+        self.fail = [0]
+        self.out = [()]
+        # Word indices (ascending) whose prefix ends at each node
+        self.through = [[]]
+
+        for index, word in enumerate(self.words):
+            node = 0
+            for ch in word:
+                nxt = self.goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[node][ch] = nxt
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.out.append(())
+                    self.through.append([])
+                node = nxt
+                self.through[node].append(index)
+            self.out[node] = self.out[node] + (index,)
+
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self.goto[node].items():
+                queue.append(child)
+                state = self.fail[node]
+                while state and ch not in self.goto[state]:
+                    state = self.fail[state]
+                target = self.goto[state].get(ch, 0)
+                self.fail[child] = target if target != child else 0
+                self.out[child] = self.out[child] + self.out[self.fail[child]]
+
+        first_chars = "".join(sorted(self.goto[0]))
+        self._first = re.compile("[%s]" % re.escape(first_chars)) if first_chars else None
+
+    def scan(self, text):
+        """Return the final state and every (end_position, word_index) match."""
+        goto, fail, out = self.goto, self.fail, self.out
+        first = self._first
+        matches = []
+        state = 0
+        pos = 0
+        length = len(text)
+        while pos < length:
+            if not state:
+                # Skip straight to the next character that can start a word
+                if first is None:
+                    return 0, matches
+                found = first.search(text, pos)
+                if found is None:
+                    return 0, matches
+                pos = found.start()
+            ch = text[pos]
+            nxt = goto[state].get(ch)
+            while nxt is None and state:
+                state = fail[state]
+                nxt = goto[state].get(ch)
+            state = nxt or 0
+            if out[state]:
+                for index in out[state]:
+                    matches.append((pos, index))
+            pos += 1
+        return state, matches
+
+    def suffix_nodes(self, state):
+        """Nodes for every suffix of the scanned text that is a word prefix."""
+        nodes = []
+        while state:
+            nodes.append(state)
+            state = self.fail[state]
+        return nodes
+
+
+def _last_before(indices, limit):
+    """Largest value in the sorted list `indices` that is < limit, else -1."""
+    pos = bisect_left(indices, limit)
+    return indices[pos - 1] if pos else -1
+
+
+def _plan_stages(patterns, replacements):
+    """
+    Split rules into stages that can each be applied in one pass.
+
+    A rule must start a new stage when its pattern could match text created
+    by an earlier replacement of the current stage: the pattern occurs inside
+    the replacement, the replacement occurs inside the pattern, or the two
+    overlap at either end. Empty replacements join their neighbours, so they
+    always close the stage.
+    """
+    count = len(patterns)
+    blocker = [-1] * count
+
+    # Patterns that occur in, or start at the tail of, an earlier replacement
+    pattern_ac = Automaton(patterns)
+    contained = {}
+    tail_marks = {}
+    for i, replacement in enumerate(replacements):
+        if not replacement:
+            continue
+        state, matches = pattern_ac.scan(replacement)
+        for _, j in matches:
+            contained.setdefault(j, []).append(i)
+        for node in pattern_ac.suffix_nodes(state):
+            tail_marks.setdefault(node, []).append(i)
+
+    for j, pattern in enumerate(patterns):
+        latest = _last_before(contained.get(j, []), j)
+        node = 0
+        for ch in pattern:
+            node = pattern_ac.goto[node][ch]
+            marks = tail_marks.get(node)
+            if marks:
+                latest = max(latest, _last_before(marks, j))
+        blocker[j] = latest
+
+    # Replacements that occur in, or start at the tail of, a later pattern
+    rule_of = [i for i, replacement in enumerate(replacements) if replacement]
+    replacement_ac = Automaton([replacements[i] for i in rule_of])
+    for j, pattern in enumerate(patterns):
+        state, matches = replacement_ac.scan(pattern)
+        latest = blocker[j]
+        for _, k in matches:
+            if rule_of[k] < j:
+                latest = max(latest, rule_of[k])
+        limit = bisect_left(rule_of, j)
+        for node in replacement_ac.suffix_nodes(state):
+            k = _last_before(replacement_ac.through[node], limit)
+            if k != -1:
+                latest = max(latest, rule_of[k])
+        blocker[j] = latest
+
+    stages = []
+    start = 0
+    last_empty = -1
+    for j in range(count):
+        if j > start and (blocker[j] >= start or last_empty >= start):
+            stages.append((start, j))
+            start = j
+        if not replacements[j]:
+            last_empty = j
+    if count:
+        stages.append((start, count))
+    return stages
+
+
+class _Stage:
+    def __init__(self, first, rules):
+        self.first = first
+        self.rules = rules
+        self.automaton = Automaton([old for old, _, _ in rules])
+        self.longest = max(len(old) for old, _, _ in rules)
+
+    def _select(self, content, hits):
+        """Applied (start, end, new, rule) spans and the raw (end, rule) matches."""
+        _, matches = self.automaton.scan(content)
+        if not matches:
+            return [], matches
+
+        starts = [[] for _ in self.rules]
+        for end, index in matches:
+            starts[index].append(end)
+
+        covered = bytearray(len(content))
+        spans = []
+        for index, (old, new, limit) in enumerate(self.rules):
+            ends = starts[index]
+            if limit > 0:
+                # Count-limited rules resume where earlier chunks left off
+                limit -= hits[self.first + index]
+            if not ends or not limit:
+                continue
+            size = len(old)
+            mask = b"\x01" * size
+            last_end = -1
+            applied = 0
+            for end in ends:
+                begin = end - size + 1
+                if begin < last_end:
+                    continue
+                stop = end + 1
+                if covered.find(1, begin, stop) != -1:
+                    continue
+                covered[begin:stop] = mask
+                spans.append((begin, stop, new, index))
+                last_end = stop
+                applied += 1
+                if applied == limit:
+                    break
+        spans.sort()
+        return spans, matches
+
+    def _commit(self, spans, hits):
+        for _, _, _, index in spans:
+            hits[self.first + index] += 1
+        return [(start, end, new) for start, end, new, _ in spans]
+
+    def edits(self, content, hits):
+        """Return the (start, end, new) spans this stage applies to content."""
+        spans, _ = self._select(content, hits)
+        return self._commit(spans, hits)
+
+    def stream(self, chunks, hits):
+        """Apply this stage to text arriving in chunks, yielding output chunks.
+
+        Each chunk is scanned together with the unfinished tail of the
+        previous one. Output is released up to a boundary that no match
+        crosses, at least len(longest pattern) - 1 characters before the end
+        of what has been read; whatever a pattern could still extend into is
+        kept back for the next chunk, so the result equals edits() on the
+        whole text.
+        """
+        pending = ""
+        hold = self.longest - 1
+        for chunk in chunks:
+            text = pending + chunk
+            boundary = len(text) - hold
+            if boundary <= 0:
+                pending = text
+                continue
+            spans, matches = self._select(text, hits)
+            # matches are ordered by end; walk back until none crosses
+            for end, index in reversed(matches):
+                stop = end + 1
+                if stop <= boundary:
+                    break
+                start = stop - len(self.rules[index][0])
+                if start < boundary:
+                    boundary = start
+            released = [span for span in spans if span[1] <= boundary]
+            yield apply_edits(text[:boundary], self._commit(released, hits))
+            pending = text[boundary:]
+        if pending:
+            yield apply_edits(pending, self.edits(pending, hits))
+
+
+def apply_edits(content, spans):
+    """Rebuild content with sorted, non-overlapping (start, end, new) spans."""
+    if not spans:
+        return content
+    parts = []
+    pos = 0
+    for start, end, new in spans:
+        parts.append(content[pos:start])
+        parts.append(new)
+        pos = end
+    parts.append(content[pos:])
+    return "".join(parts)
+
+
+class ReplacementEngine:
+    """
+    Compiled set of ordered (old, new) replacement rules.
+
+    Rules may also be (old, new, count) triples, which behave like
+    str.replace(old, new, count).
+    """
+
+    def __init__(self, replacements):
+        rules = []
+        for rule in replacements:
+            old, new = rule[0], rule[1]
+            limit = rule[2] if len(rule) > 2 else -1
+            if not old:
+                raise ValueError("Replacement pattern must not be empty")
+            rules.append((old, new, limit))
+        self.rules = rules
+        self.stages = [
+            _Stage(start, rules[start:end])
+            for start, end in _plan_stages([r[0] for r in rules], [r[1] for r in rules])
+        ]
+
+    def __len__(self):
+        return len(self.rules)
+
+    def apply(self, content):
+        """Return (new_content, hits) where hits[i] counts matches of rule i."""
+        hits = [0] * len(self.rules)
+        for stage in self.stages:
+            spans = stage.edits(content, hits)
+            rewritten = apply_edits(content, spans)
+            record(content, spans, rewritten)
+            content = rewritten
+        return content, hits
+
+    def apply_chunks(self, chunks, hits):
+        """Stream version of apply(): yields output for an iterable of text chunks.
+
+        hits must be a list of len(self) zeros; it holds the per-rule counts
+        once the output has been consumed. Memory stays proportional to the
+        chunk size (plus the longest pattern), not to the whole text.
+        """
+        for stage in self.stages:
+            chunks = stage.stream(chunks, hits)
+        return chunks
+
+
+def replace_all(content, replacements):
+    """One-shot helper: compile `replacements` and apply them to content."""
+    return ReplacementEngine(replacements).apply(content)
+
+
+def print_misses(replacements, hits, label=""):
+    """Print the rules that did not match anything."""
+    missed = [rule[0] for rule, count in zip(replacements, hits) if not count]
+    applied = len(hits) - len(missed)
+    prefix = f"{label}: " if label else ""
+    print(f"{prefix}{applied}/{len(hits)} patterns applied, {sum(hits)} replacements")
+    for old in missed:
+        preview = old.replace("\n", "\\n")
+        if len(preview) > 70:
+            preview = preview[:67] + "..."
+        print(f"  - no match: {preview}")
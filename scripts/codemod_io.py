@@ -0,0 +1,153 @@
+"""
+Page I/O shared by the codemod scripts and run_codemods.py.
+
+Every refactor_*.py / fix_*.py script exposes CODEMODS, a mapping of page
+path (relative to the repository root) to a function that takes the page
+source and returns the rewritten source. Pages are read once and written
+atomically, so an interrupted run never leaves a half-written .tsx file;
+pages the codemod leaves byte-identical are not written at all.
+
+Files too large to hold in memory several times over (generated JSON such as
+client/public/animations/loading.json, drizzle/meta snapshots) can be
+processed with read_chunks() / rewrite_streaming() instead: the input is
+mmap'd and decoded window by window, and output goes straight to the
+temporary file, so memory stays near the window size.
+
+Any script run with --dry-run writes nothing: it streams a unified diff of
+each page to stdout (see codemod_diff) and its messages to stderr, ending
+with a summary of the replacement patterns that matched nothing.
+"""
+
+import codecs
+import contextlib
+import mmap
+import os
+import sys
+import tempfile
+
+from codemod_diff import print_miss_summary, track_edits, write_unified_diff
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WINDOW = 1 << 20
+
+
+def read_page(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def write_page(path, content):
+    """Write text (or bytes) to path via a temporary file and an atomic rename."""
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(
+        dir=directory, prefix="." + os.path.basename(path) + ".", suffix=".tmp"
+    )
+    try:
+        if isinstance(content, bytes):
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+        else:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+        if os.path.exists(path):
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o777)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def read_chunks(path, window=WINDOW):
+    """Yield the UTF-8 text of a file in pieces of about window bytes, via mmap.
+
+    Unlike read_page(), line endings are passed through unchanged.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            decoder = codecs.getincrementaldecoder("utf-8")()
+            for offset in range(0, len(mapped), window):
+                text = decoder.decode(mapped[offset : offset + window])
+                if text:
+                    yield text
+            text = decoder.decode(b"", final=True)
+            if text:
+                yield text
+
+
+def rewrite_streaming(path, rewrite, window=WINDOW):
+    """Rewrite a file of any size chunk by chunk; returns True if it changed.
+
+    rewrite takes an iterable of text chunks and returns one of output chunks
+    (e.g. ReplacementEngine.apply_chunks). Output is compared with the input
+    as it is written to a temporary file, which replaces path atomically only
+    if some byte differs.
+    """
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(
+        dir=directory, prefix="." + os.path.basename(path) + ".", suffix=".tmp"
+    )
+    changed = False
+    try:
+        with os.fdopen(fd, "wb") as out, open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            written = 0
+            with contextlib.ExitStack() as stack:
+                mapped = (
+                    stack.enter_context(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+                    if size
+                    else b""
+                )
+                for chunk in rewrite(read_chunks(path, window)):
+                    data = chunk.encode("utf-8")
+                    if not changed and mapped[written : written + len(data)] != data:
+                        changed = True
+                    out.write(data)
+                    written += len(data)
+            changed = changed or written != size
+        if changed:
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o777)
+            os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+    return changed
+
+
+def preview_codemods(codemods, root=None, stream=None):
+    """Stream the diff each CODEMODS entry would make, without writing."""
+    root = root or REPO_ROOT
+    stream = stream or sys.stdout
+    misses = []
+    for page, transform in codemods.items():
+        original = read_page(os.path.join(root, page))
+        with contextlib.redirect_stdout(sys.stderr), track_edits(original) as log:
+            content = transform(original)
+        changed = write_unified_diff(stream, page, original, log.finish(content))
+        stream.flush()
+        misses.extend(log.misses)
+        status = "would change" if changed else "already up to date"
+        print(f"{os.path.basename(page)} {status}", file=sys.stderr)
+    print_miss_summary(misses, sys.stderr)
+
+
+def apply_codemods(codemods, root=None, dry_run=None):
+    """Run one script's CODEMODS page by page (standalone script entry point)."""
+    if dry_run is None:
+        dry_run = "--dry-run" in sys.argv[1:]
+    if dry_run:
+        preview_codemods(codemods, root)
+        return
+    root = root or REPO_ROOT
+    for page, transform in codemods.items():
+        path = os.path.join(root, page)
+        original = read_page(path)
+        content = transform(original)
+        if content == original:
+            # Leave the file (and its mtime) alone so dev-server watchers stay quiet.
+            print(f"{os.path.basename(page)} already up to date")
+            continue
+        write_page(path, content)
+        print(f"{os.path.basename(page)} refactored successfully!")
@@ -0,0 +1,120 @@
+"""
+Declarative replacement tables for the codemod scripts.
+
+Replacement pairs live in scripts/codemod_tables/<Page>.json instead of
+Python literals. Each file describes one page and holds one or more named
+rule sets, keyed by the codemod function that applies them:
+
+    {
+      "page": "client/src/pages/Home.tsx",
+      "rulesets": {
+        "refactor_home": [
+          "# Badges",
+          ["badge: \\"YENİ\\",", "badge: t(\\"home.badge.new\\"),"],
+          ["  },\\n];", "  },\\n];\\n...", 1]
+        ]
+      }
+    }
+
+A rule is [old, new] or [old, new, count]; plain strings starting with "#"
+are comments. Compiled ReplacementEngines are pickled to .codemod_cache/,
+keyed by the SHA-256 of the table file, the rule set name and the engine
+source, so re-running the suite skips parsing and compiling unchanged tables.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+
+from codemod_diff import record_misses
+from codemod_engine import ReplacementEngine, print_misses
+from codemod_io import write_page
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+TABLES_DIR = os.path.join(SCRIPTS_DIR, "codemod_tables")
+CACHE_DIR = os.path.join(SCRIPTS_DIR, ".codemod_cache")
+
+_engines = {}
+_engine_digest = None
+
+
+def table_path(name):
+    return os.path.join(TABLES_DIR, name + ".json")
+
+
+def extracted_table_name(rel_path):
+    """Name of the table extract_turkish_strings.py writes for a client/src file."""
+    return "extracted/" + os.path.splitext(rel_path)[0].replace("/", ".")
+
+
+def _engine_source_digest():
+    global _engine_digest
+    if _engine_digest is None:
+        with open(os.path.join(SCRIPTS_DIR, "codemod_engine.py"), "rb") as f:
+            _engine_digest = hashlib.sha256(f.read()).hexdigest()
+    return _engine_digest
+
+
+def ruleset_hash(name, ruleset):
+    """Content hash identifying a compiled rule set."""
+    with open(table_path(name), "rb") as f:
+        raw = f.read()
+    digest = hashlib.sha256(raw)
+    digest.update(b"\0" + ruleset.encode("utf-8"))
+    digest.update(b"\0" + _engine_source_digest().encode("ascii"))
+    return digest.hexdigest()
+
+
+def parse_rules(entries):
+    """Turn a JSON rule list into (old, new) / (old, new, count) tuples."""
+    rules = []
+    for entry in entries:
+        if isinstance(entry, str):
+            if not entry.startswith("#"):
+                raise ValueError(f"Unexpected string in rule table: {entry!r}")
+            continue
+        if len(entry) not in (2, 3):
+            raise ValueError(f"Rule must be [old, new] or [old, new, count]: {entry!r}")
+        rules.append(tuple(entry))
+    return rules
+
+
+def load_rules(name, ruleset):
+    """Parse one rule set from codemod_tables/<name>.json."""
+    with open(table_path(name), "r", encoding="utf-8") as f:
+        table = json.load(f)
+    try:
+        entries = table["rulesets"][ruleset]
+    except KeyError:
+        raise KeyError(f"{name}.json has no rule set {ruleset!r}") from None
+    return parse_rules(entries)
+
+
+def load_engine(name, ruleset):
+    """Return the compiled engine for a rule set, using the pickle cache."""
+    key = ruleset_hash(name, ruleset)
+    engine = _engines.get(key)
+    if engine is not None:
+        return engine
+
+    cache_file = os.path.join(CACHE_DIR, key + ".pickle")
+    try:
+        with open(cache_file, "rb") as f:
+            engine = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        engine = ReplacementEngine(load_rules(name, ruleset))
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        write_page(cache_file, pickle.dumps(engine, protocol=pickle.HIGHEST_PROTOCOL))
+
+    _engines[key] = engine
+    return engine
+
+
+def apply_table(content, name, ruleset):
+    """Apply a rule set to content and report patterns that did not match."""
+    engine = load_engine(name, ruleset)
+    content, hits = engine.apply(content)
+    print_misses(engine.rules, hits, name + ".tsx")
+    record_misses(name, [rule[0] for rule, count in zip(engine.rules, hits) if not count])
+    return content
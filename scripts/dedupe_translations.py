@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Find repeated values in client/src/i18n/translations.ts and compact the table
+
+Many keys carry exactly the same strings ("nav.create" and "nav.generate" are
+both Oluştur / Create). Every entry is hashed once into a value -> keys index
+on its (tr, en) pair, and a second index on the pair normalized for case and
+whitespace ("Kredi " and "kredi") finds near duplicates. The report lists
+
+    exact   keys whose tr and en values are identical; all but the first
+            definition can become aliases of it
+    near    keys that differ only in case or whitespace, worth reviewing
+            before they drift further apart
+
+with translations.ts:line locations and the bytes the duplicates occupy.
+
+--emit writes the compacted table: every distinct string stored once and
+referenced by id, one entry per distinct (tr, en) pair and an alias map for
+the remaining keys, so lookups can resolve a key without any call site
+changing:
+
+    {
+      "version": 1,
+      "strings": ["Oluştur", "Create", ...],
+      "messages": {"nav.create": [0, 1], ...},
+      "aliases": {"nav.generate": "nav.create", ...}
+    }
+
+expand() turns it back into {key: {"tr": ..., "en": ...}}; --emit checks that
+the round trip reproduces translations.ts before writing.
+
+Usage:
+    python3 scripts/dedupe_translations.py
+    python3 scripts/dedupe_translations.py --only exact --json
+    python3 scripts/dedupe_translations.py --emit translations.compact.json
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from codemod_io import REPO_ROOT, write_page
+from translations_index import TRANSLATIONS_FILE, load_index
+
+SECTIONS = ("exact", "near")
+LANGUAGES = ("tr", "en")
+COMPACT_VERSION = 1
+
+
+def normalize(value):
+    """Value with case folded and whitespace runs collapsed (None stays None)."""
+    if value is None:
+        return None
+    return " ".join(value.split()).casefold()
+
+
+def value_index(entries, key=None):
+    """{(tr, en) or key(entry): [entry, ...]} in definition order."""
+    index = {}
+    for entry in sorted(entries, key=lambda e: e.line):
+        value = key(entry) if key else (entry.tr, entry.en)
+        index.setdefault(value, []).append(entry)
+    return index
+
+
+def exact_duplicates(entries):
+    """Groups of entries with identical tr and en values (first defined first)."""
+    return [group for group in value_index(entries).values() if len(group) > 1]
+
+
+def near_duplicates(entries):
+    """Groups whose values only differ in case or whitespace.
+
+    Each group holds the distinct exact values only (their first key), so
+    exact duplicates are not reported twice.
+    """
+    groups = []
+    by_normalized = value_index(entries, lambda e: (normalize(e.tr), normalize(e.en)))
+    for group in by_normalized.values():
+        distinct = list(value_index(group).values())
+        if len(distinct) > 1:
+            groups.append([same[0] for same in distinct])
+    return groups
+
+
+def _size(entry):
+    return sum(len((getattr(entry, lang) or "").encode("utf-8")) for lang in LANGUAGES)
+
+
+def compact(entries):
+    """The compacted table (see the module docstring) for index entries."""
+    strings = []
+    ids = {}
+    messages = {}
+    aliases = {}
+
+    def string_id(value):
+        if value is None:
+            return None
+        if value not in ids:
+            ids[value] = len(strings)
+            strings.append(value)
+        return ids[value]
+
+    for group in value_index(entries).values():
+        canonical = group[0]
+        messages[canonical.key] = [string_id(getattr(canonical, lang)) for lang in LANGUAGES]
+        for entry in group[1:]:
+            aliases[entry.key] = canonical.key
+    return {
+        "version": COMPACT_VERSION,
+        "strings": strings,
+        "messages": dict(sorted(messages.items())),
+        "aliases": dict(sorted(aliases.items())),
+    }
+
+
+def expand(table):
+    """{key: {"tr": ..., "en": ...}} from a compacted table."""
+    strings = table["strings"]
+    result = {}
+    for key, refs in table["messages"].items():
+        result[key] = {
+            lang: None if ref is None else strings[ref] for lang, ref in zip(LANGUAGES, refs)
+        }
+    for key, target in table["aliases"].items():
+        result[key] = dict(result[target])
+    return result
+
+
+def _location(entry):
+    return f"{os.path.relpath(TRANSLATIONS_FILE, REPO_ROOT)}:{entry.line}"
+
+
+def build_report(entries, sections):
+    report = {}
+    if "exact" in sections:
+        report["exact"] = [
+            {
+                "tr": group[0].tr,
+                "en": group[0].en,
+                "keys": {entry.key: _location(entry) for entry in group},
+                "bytes": _size(group[0]) * (len(group) - 1),
+            }
+            for group in exact_duplicates(entries)
+        ]
+    if "near" in sections:
+        report["near"] = [
+            {entry.key: {"tr": entry.tr, "en": entry.en, "location": _location(entry)} for entry in group}
+            for group in near_duplicates(entries)
+        ]
+    return report
+
+
+def print_report(report):
+    if "exact" in report:
+        groups = report["exact"]
+        keys = sum(len(group["keys"]) - 1 for group in groups)
+        size = sum(group["bytes"] for group in groups)
+        print(f"Exact duplicates: {len(groups)} values repeated under {keys} extra keys ({size} bytes)")
+        for group in groups:
+            print(f"  {json.dumps(group['tr'], ensure_ascii=False)} / {json.dumps(group['en'], ensure_ascii=False)}")
+            for key, location in group["keys"].items():
+                print(f"    {location}  {key}")
+    if "near" in report:
+        print(f"\nNear duplicates (case or whitespace only): {len(report['near'])}")
+        for group in report["near"]:
+            for key, info in group.items():
+                values = f"{json.dumps(info['tr'], ensure_ascii=False)} / {json.dumps(info['en'], ensure_ascii=False)}"
+                print(f"    {info['location']}  {key}: {values}")
+            print()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report duplicate translation values and compact the table")
+    parser.add_argument("--only", help="comma-separated sections: " + ",".join(SECTIONS))
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    parser.add_argument("--emit", metavar="PATH", help="write the compacted table (strings, messages, aliases)")
+    args = parser.parse_args(argv)
+
+    sections = SECTIONS
+    if args.only:
+        sections = tuple(s.strip() for s in args.only.split(","))
+        unknown = set(sections) - set(SECTIONS)
+        if unknown:
+            parser.error(f"unknown section(s): {', '.join(sorted(unknown))}")
+
+    index = load_index()
+    entries = list(index)
+    report = build_report(entries, sections)
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print_report(report)
+
+    if args.emit:
+        table = compact(entries)
+        original = {entry.key: {lang: getattr(entry, lang) for lang in LANGUAGES} for entry in entries}
+        if expand(table) != original:
+            print("❌ compacted table does not round-trip; nothing written", file=sys.stderr)
+            return 1
+        text = json.dumps(table, ensure_ascii=False, separators=(",", ":")) + "\n"
+        write_page(args.emit, text)
+        before = len(json.dumps(original, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+        print(
+            f"Wrote {args.emit}: {len(table['strings'])} strings, {len(table['messages'])} messages, "
+            f"{len(table['aliases'])} aliases ({before} -> {len(text.encode('utf-8'))} bytes)",
+            file=sys.stderr,
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,562 @@
+#!/usr/bin/env python3
+"""
+Find hardcoded Turkish UI strings in client/src and propose translation keys
+
+Every .tsx file is tokenized once with tsx_lexer, and string literals, JSX
+attribute values, template literals and JSX text are checked for Turkish
+(Turkish-specific letters, or common Turkish words written without them).
+Each hit gets a namespaced key derived from the file (the namespace its
+existing t() calls already use, e.g. "motion", or the file name) and from
+where the string is used: toast.error / setError / throw new Error(...)
+strings go under "<namespace>.errors.", toast.success under ".success.".
+Strings that already exist as a Turkish value in translations.ts reuse that
+key. JSX text interleaved with simple {expressions} and templates with simple
+${...} substitutions become one key with {placeholders}.
+
+Output, written to scripts/codemod_tables/extracted/ by default:
+
+    <path.under.client.src>.json   codemod table with an "extracted" rule set,
+                                   usable with apply_table() like any other
+    translations.ts                new entries to paste into
+                                   client/src/i18n/translations.ts (en left
+                                   empty for translators)
+
+Strings at module scope (where t() is not available) and files that do not
+call useLanguage() yet are listed as comments in the table for manual work.
+So are strings whose rule, being a plain substring replacement, would also
+rewrite text outside their own spans (another string, a comment, a key
+written by an earlier rule).
+Status comparisons (=== "tamamlandı"), case labels, imports and technical
+attributes (className, href, ...) are ignored.
+
+Usage:
+    python3 scripts/extract_turkish_strings.py                 # whole client
+    python3 scripts/extract_turkish_strings.py client/src/pages/MotionControl.tsx
+    python3 scripts/extract_turkish_strings.py --dry-run       # summary only
+"""
+
+import argparse
+import bisect
+import glob
+import json
+import os
+import re
+import sys
+import time
+from collections import Counter, namedtuple
+
+from codemod_io import REPO_ROOT, read_page, write_page
+from translations_index import load_index
+from tsx_lexer import LineIndex, tokenize
+
+CLIENT_SRC = os.path.join(REPO_ROOT, "client", "src")
+DEFAULT_OUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "codemod_tables", "extracted")
+EXCLUDED_DIRS = ("components/ui/",)
+
+TURKISH_CHARS = re.compile("[çğıöşüÇĞİÖŞÜ]")
+WORD = re.compile(r"[^\W\d_]+(?:'[^\W\d_]+)?")
+# Common Turkish words that are also written without Turkish letters and do
+# not collide with English or code identifiers.
+TURKISH_WORDS = frozenset(
+    """
+    ve bir ile veya ama daha cok yok icin lutfen tamam iptal kaydet sil kapat
+    evet hayir ara gonder yeni tum hepsi giris cikis kayit ayarlar hata
+    basarili basariyla olustur yukle yukleniyor indir paylas geri ileri devam
+    kredi krediler kullanici sifre bekleyin secin sec gorsel resim sayfa
+    hakkinda iletisim fiyat paket islem durum tarih dakika saniye ekle
+    duzenle guncelle goster gizle uyari bilgi basla bitir lutfen henuz
+    olarak olan bu su
+    """.split()
+)
+TRANSLITERATION = str.maketrans("çğıöşüâîûÇĞİÖŞÜÂÎÛ", "cgiosuaiuCGIOSUAIU")
+
+SKIP_ATTRS = frozenset(
+    """
+    className class style key id href src type name variant size htmlFor to
+    rel target role method accept autoComplete inputMode data-testid
+    """.split()
+)
+SKIP_CALLEES = frozenset(
+    "t require import cn clsx classNames navigate setLocation fetch addEventListener".split()
+)
+SKIP_CALLEE_PREFIXES = ("console.", "localStorage.", "sessionStorage.", "document.", "window.")
+ERROR_CALLEES = re.compile(r"(^|\.)(error|setError\w*|Error|alert|reject)$")
+SUCCESS_CALLEES = re.compile(r"(^|\.)success$")
+COMPARISONS = frozenset(("===", "!==", "==", "!="))
+SIMPLE_EXPRESSION = re.compile(r"[A-Za-z_$][\w$]*(?:\??\.[A-Za-z_$][\w$]*)*")
+
+Candidate = namedtuple("Candidate", "start end text params kind context module_scope")
+Proposal = namedtuple("Proposal", "key text old new line module_scope start")
+
+
+def is_turkish(text):
+    if TURKISH_CHARS.search(text):
+        return True
+    return any(word.lower() in TURKISH_WORDS for word in WORD.findall(text))
+
+
+def _camel(words):
+    words = [w.lower() for w in words if w]
+    if not words:
+        return ""
+    return words[0] + "".join(w[:1].upper() + w[1:] for w in words[1:])
+
+
+def slugify(text, max_words=4):
+    """Turn Turkish text into a lowerCamel key segment."""
+    text = re.sub(r"\{[^}]*\}", " ", text).translate(TRANSLITERATION)
+    words = re.findall(r"[A-Za-z0-9]+", text)
+    return _camel(words[:max_words]) or "text"
+
+
+def default_namespace(rel_path):
+    parts = os.path.splitext(rel_path)[0].split("/")
+    stem = parts[-1]
+    if "admin" in parts[:-1]:
+        stem = stem[len("Admin"):] if stem.startswith("Admin") and len(stem) > 5 else stem
+        return "admin" if stem == "index" else "admin." + stem[:1].lower() + stem[1:]
+    return stem[:1].lower() + stem[1:]
+
+
+def file_namespace(rel_path, source):
+    """The prefix most t() calls in the file already use, else one from its path."""
+    prefixes = Counter(re.findall(r"""\bt\(\s*["']([A-Za-z]+)\.""", source))
+    if prefixes:
+        return prefixes.most_common(1)[0][0]
+    return default_namespace(rel_path)
+
+
+class _Run:
+    """JSX text interleaved with simple {expressions}, collected as one string."""
+
+    def __init__(self, token):
+        self.parts = [("text", token.start, token.end)]
+        self.expr_start = None
+        self.expr_depth = None
+
+
+def scan_candidates(source):
+    """Yield Candidate spans of Turkish UI text in one pass over the tokens."""
+    stack = []  # (opener, callee, function_body, extra)
+    function_depth = 0
+    recent = []  # last significant TypeScript tokens, for callee/property lookup
+    pending = None  # candidate waiting for the next token (comparison check)
+    run = None
+    last_attr = None
+    prev = None
+
+    def callee():
+        for opener, name, _, _ in reversed(stack):
+            if opener == "(":
+                return name
+            if opener in ("{", "[", "`", "${", "jsx"):
+                return None
+        return None
+
+    def property_name():
+        if len(recent) >= 2 and recent[-1].value == ":" and recent[-2].kind in ("name", "string"):
+            return recent[-2].value
+        return None
+
+    def call_chain():
+        chain = []
+        i = len(recent) - 1
+        while i >= 0 and recent[i].kind == "name":
+            chain.append(recent[i].value)
+            if i >= 1 and recent[i - 1].value in (".", "?."):
+                i -= 2
+            else:
+                break
+        return ".".join(reversed(chain))
+
+    def finish_run():
+        parts = run.parts
+        while parts and parts[-1][0] == "text" and not source[parts[-1][1]:parts[-1][2]].strip():
+            parts.pop()
+        if not parts:
+            return None
+        texts = [source[s:e] for kind, s, e in parts if kind == "text"]
+        if not is_turkish("".join(texts)):
+            return None
+        first, last = parts[0], parts[-1]
+        raw_first = source[first[1]:first[2]]
+        start = first[1] + len(raw_first) - len(raw_first.lstrip())
+        end = last[2]
+        if last[0] == "text":
+            raw_last = source[last[1]:last[2]]
+            end = last[2] - (len(raw_last) - len(raw_last.rstrip()))
+        pieces, params = [], []
+        for kind, s, e in parts:
+            if kind == "text":
+                pieces.append(source[s:e])
+            else:
+                expr = source[s + 1:e - 1].strip()
+                pieces.append("{" + _add_param(params, expr) + "}")
+        text = re.sub(r"\s+", " ", "".join(pieces)).strip()
+        return Candidate(start, end, text, params, "jsx_text", None, function_depth == 0)
+
+    for tok in tokenize(source):
+        kind, value = tok.kind, tok.value
+        if kind == "comment":
+            continue
+
+        if pending is not None:
+            if not (kind == "punct" and value in COMPARISONS):
+                yield pending
+            pending = None
+
+        # JSX text runs: text ({simpleExpression} text)*
+        if run is not None:
+            if run.expr_start is not None:
+                if kind == "jsx_expr_close" and len(stack) == run.expr_depth:
+                    expr = source[run.expr_start:tok.start].strip()
+                    if SIMPLE_EXPRESSION.fullmatch(expr):
+                        run.parts.append(("expr", run.expr_start - 1, tok.end))
+                        run.expr_start = None
+                    else:
+                        candidate = finish_run()
+                        run = None
+                        if candidate:
+                            yield candidate
+            elif kind == "jsx_text":
+                run.parts.append(("text", tok.start, tok.end))
+            elif kind == "jsx_expr_open" and prev is not None and prev.kind in ("jsx_text", "jsx_expr_close"):
+                run.expr_start = tok.end
+                run.expr_depth = len(stack) + 1
+            else:
+                candidate = finish_run()
+                run = None
+                if candidate:
+                    yield candidate
+        elif kind == "jsx_text" and tok.value.strip():
+            run = _Run(tok)
+
+        # Bracket bookkeeping
+        if kind in ("punct", "jsx_expr_open", "jsx_expr_close"):
+            if value in ("(", "[", "{", "${"):
+                function_body = bool(recent) and (
+                    recent[-1].value == "=>" or (value == "{" and recent[-1].value == ")")
+                )
+                name = call_chain() if value == "(" else None
+                if kind == "jsx_expr_open":
+                    stack.append(("jsx", None, False, None))
+                else:
+                    stack.append((value, name, function_body, None))
+                function_depth += function_body
+            elif value in (")", "]", "}"):
+                if stack:
+                    function_depth -= stack.pop()[2]
+            elif value == "`":
+                if stack and stack[-1][0] == "`":
+                    opener, _, _, template = stack.pop()
+                    template["end"] = tok.end
+                    candidate = _template_candidate(source, template, callee(), property_name(), function_depth == 0)
+                    if candidate:
+                        pending = candidate
+                else:
+                    stack.append(("`", None, False, {"start": tok.start, "parts": []}))
+        if kind == "template":
+            stack[-1][3]["parts"].append(("text", tok.start, tok.end))
+        elif kind == "punct" and value == "${" and len(stack) >= 2 and stack[-2][0] == "`":
+            stack[-2][3]["parts"].append(("expr", tok.end, None))
+        elif kind == "punct" and value == "}" and stack and stack[-1][0] == "`":
+            parts = stack[-1][3]["parts"]
+            if parts and parts[-1][0] == "expr" and parts[-1][2] is None:
+                parts[-1] = ("expr", parts[-1][1], tok.start)
+
+        if kind == "jsx_attr":
+            last_attr = tok
+        elif kind == "jsx_string":
+            if last_attr is not None and last_attr.value not in SKIP_ATTRS and is_turkish(value):
+                yield Candidate(
+                    last_attr.start, tok.end, value, [], "attr", last_attr.value, function_depth == 0
+                )
+        elif kind == "string" and value.strip() and is_turkish(value):
+            name = callee()
+            skip = (
+                name is not None
+                and (name in SKIP_CALLEES or name.startswith(SKIP_CALLEE_PREFIXES))
+            ) or (
+                recent
+                and (recent[-1].value in COMPARISONS or recent[-1].value in ("case", "from", "import"))
+            )
+            if not skip:
+                context = name or property_name()
+                pending = Candidate(tok.start, tok.end, value, [], "string", context, function_depth == 0)
+
+        if kind in ("name", "punct", "string", "number", "regex"):
+            recent.append(tok)
+            if len(recent) > 8:
+                del recent[0]
+        prev = tok
+
+    if pending is not None:
+        yield pending
+    if run is not None:
+        candidate = finish_run()
+        if candidate:
+            yield candidate
+
+
+def _add_param(params, expr):
+    """Register a substitution and return its placeholder name."""
+    base = re.split(r"\??\.", expr)[-1]
+    name = base
+    n = 2
+    while any(p != expr and existing == name for existing, p in params):
+        name = f"{base}{n}"
+        n += 1
+    if (name, expr) not in params:
+        params.append((name, expr))
+    return name
+
+
+def _template_candidate(source, template, callee_name, prop, module_scope):
+    pieces, params = [], []
+    text_only = []
+    for kind, s, e in template["parts"]:
+        if kind == "text":
+            pieces.append(source[s:e])
+            text_only.append(source[s:e])
+        else:
+            expr = source[s:e].strip()
+            if not SIMPLE_EXPRESSION.fullmatch(expr):
+                return None
+            pieces.append("{" + _add_param(params, expr) + "}")
+    text = "".join(pieces)
+    if not is_turkish("".join(text_only)) or "\\" in text:
+        return None
+    return Candidate(template["start"], template["end"], text, params, "template", callee_name or prop, module_scope)
+
+
+def _group(candidate):
+    context = candidate.context or ""
+    if ERROR_CALLEES.search(context) or "error" in context.lower():
+        return "errors"
+    if SUCCESS_CALLEES.search(context):
+        return "success"
+    return None
+
+
+def _call(key, params):
+    if not params:
+        return f't("{key}")'
+    fields = ", ".join(name if name == expr else f"{name}: {expr}" for name, expr in params)
+    return f't("{key}", {{ {fields} }})'
+
+
+class KeyAllocator:
+    """Hand out unique keys, reusing existing ones for identical Turkish text."""
+
+    def __init__(self, index):
+        self.index = index
+        self.by_text = {}  # text -> keys allocated during this run
+        self.new = {}  # key -> text
+
+    def key_for(self, namespace, group, slug, text):
+        existing = self.index.keys_for_text(text) + self.by_text.get(text, [])
+        for key in existing:
+            if key.startswith(namespace + "."):
+                return key
+        if existing:
+            return existing[0]
+        base = ".".join(part for part in (namespace, group, slug) if part)
+        key, n = base, 2
+        while key in self.index or (key in self.new and self.new[key] != text):
+            key = f"{base}{n}"
+            n += 1
+        self.new[key] = text
+        self.by_text.setdefault(text, []).append(key)
+        return key
+
+
+def propose(rel_path, source, allocator, candidates=None):
+    """Key proposals for one file, in source order (candidates: a prior scan_candidates() result)."""
+    namespace = file_namespace(rel_path, source)
+    lines = LineIndex(source)
+    proposals = []
+    if candidates is None:
+        candidates = scan_candidates(source)
+    for candidate in candidates:
+        slug = slugify(candidate.text)
+        if candidate.kind == "attr" and candidate.context == "placeholder":
+            slug += "Placeholder"
+        key = allocator.key_for(namespace, _group(candidate), slug, candidate.text)
+        call = _call(key, candidate.params)
+        old = source[candidate.start:candidate.end]
+        if candidate.kind == "jsx_text":
+            new = "{" + call + "}"
+        elif candidate.kind == "attr":
+            new = f"{candidate.context}={{{call}}}"
+        else:
+            new = call
+        proposals.append(
+            Proposal(
+                key, candidate.text, old, new, lines.line(candidate.start), candidate.module_scope, candidate.start
+            )
+        )
+    return proposals
+
+
+def _occurrences(text, old):
+    """Start offsets str.replace(old, ...) would rewrite (non-overlapping, left to right)."""
+    positions = []
+    pos = text.find(old)
+    while pos != -1:
+        positions.append(pos)
+        pos = text.find(old, pos + len(old))
+    return positions
+
+
+def _unanchored_rules(source, rules):
+    """Rules that would rewrite text outside their own candidate spans.
+
+    Table rules are global substring replacements applied in order (like
+    str.replace), so a rule is only safe if, at its turn, every occurrence of
+    its pattern is one of its candidates. rules are (old, new, starts) tuples
+    in table order; returns {old: reason} for the ones to hand-edit instead.
+    """
+    rejected = {}
+    while True:
+        text = source
+        active = [rule for rule in rules if rule[0] not in rejected]
+        # Candidate offsets in the text as rewritten by the rules so far
+        pending = {old: list(starts) for old, _, starts in active}
+        for old, new, _ in active:
+            positions = _occurrences(text, old)
+            if positions != pending[old]:
+                rejected[old] = f"{len(positions)} matches for {len(pending[old])} strings"
+                continue
+            text = text.replace(old, new)
+            delta = len(new) - len(old)
+            if delta:
+                for offsets in pending.values():
+                    offsets[:] = [q + delta * bisect.bisect_left(positions, q) for q in offsets]
+        # A pattern inside a replacement would be rewritten when the table is
+        # re-applied to already converted lines (watch_i18n --apply)
+        applied = [rule for rule in active if rule[0] not in rejected]
+        clashes = {
+            old: f"occurs in the replacement for {other!r}"
+            for old, _, _ in applied
+            for other, new, _ in applied
+            if old in new
+        }
+        if not clashes:
+            return rejected
+        rejected.update(clashes)
+
+
+def build_table(rel_path, source, proposals):
+    """Codemod table (see codemod_tables.py) for one file's proposals.
+
+    Strings whose rule could not be limited to their own spans are listed as
+    manual comments instead of rules.
+    """
+    rules = []
+    if "useLanguage" not in source:
+        rules.append("# needs: import { useLanguage } from \"@/contexts/LanguageContext\"; const { t } = useLanguage();")
+    uses = {}
+    manual = []
+    for proposal in proposals:
+        if proposal.module_scope:
+            manual.append(f"# manual (module scope, line {proposal.line}): {proposal.old!r} -> {proposal.new}")
+            continue
+        uses.setdefault(proposal.old, []).append(proposal)
+    candidates = []
+    for old, group in uses.items():
+        if len({proposal.new for proposal in group}) > 1:
+            for proposal in group:
+                manual.append(f"# manual (conflicting uses, line {proposal.line}): {old!r} -> {proposal.new}")
+            continue
+        candidates.append((old, group[0].new, [proposal.start for proposal in group]))
+    # Longest first so a rule never rewrites text inside a longer one
+    candidates.sort(key=lambda rule: -len(rule[0]))
+    rejected = _unanchored_rules(source, candidates)
+    for old, group in uses.items():
+        if old in rejected:
+            for proposal in group:
+                manual.append(f"# manual ({rejected[old]}, line {proposal.line}): {old!r} -> {proposal.new}")
+    rules.extend(manual)
+    rules.extend([old, new] for old, new, _ in candidates if old not in rejected)
+    return {"page": "client/src/" + rel_path, "rulesets": {"extracted": rules}}
+
+
+def format_translations(new_entries):
+    """translations.ts entries grouped by source file."""
+    lines = []
+    for rel_path, entries in new_entries:
+        if not entries:
+            continue
+        lines.append(f"  // {rel_path}")
+        for key, text in entries:
+            tr = json.dumps(text, ensure_ascii=False)
+            lines.append(f'  "{key}": {{ tr: {tr}, en: "" }},')
+        lines.append("")
+    return "\n".join(lines)
+
+
+def discover_files(paths):
+    if not paths:
+        paths = [CLIENT_SRC]
+    files = []
+    for path in paths:
+        path = os.path.abspath(path)
+        if os.path.isdir(path):
+            files.extend(sorted(glob.glob(os.path.join(path, "**", "*.tsx"), recursive=True)))
+        else:
+            files.append(path)
+    result = []
+    for path in files:
+        rel_path = os.path.relpath(path, CLIENT_SRC).replace(os.sep, "/")
+        if not rel_path.startswith(EXCLUDED_DIRS):
+            result.append((path, rel_path))
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Extract hardcoded Turkish strings from client/src")
+    parser.add_argument("paths", nargs="*", help="files or directories (default: client/src)")
+    parser.add_argument("--out", default=DEFAULT_OUT, help="output directory for tables and translations")
+    parser.add_argument("--dry-run", action="store_true", help="print a summary without writing anything")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    allocator = KeyAllocator(load_index())
+    tables = {}
+    new_entries = []
+    total = reused = 0
+    for path, rel_path in discover_files(args.paths):
+        source = read_page(path)
+        fresh_before = len(allocator.new)
+        proposals = propose(rel_path, source, allocator)
+        if not proposals:
+            continue
+        total += len(proposals)
+        created = list(allocator.new.items())[fresh_before:]
+        reused += sum(1 for p in proposals if p.key in allocator.index)
+        new_entries.append((rel_path, created))
+        tables[rel_path] = build_table(rel_path, source, proposals)
+        print(f"{rel_path}: {len(proposals)} strings, {len(created)} new keys")
+
+    elapsed = time.perf_counter() - started
+    print(
+        f"\n{total} Turkish strings in {len(tables)} files, "
+        f"{len(allocator.new)} new keys, {reused} reuse existing keys ({elapsed:.2f}s)"
+    )
+    if args.dry_run or not tables:
+        return 0
+
+    os.makedirs(args.out, exist_ok=True)
+    for rel_path, table in tables.items():
+        name = os.path.splitext(rel_path)[0].replace("/", ".")
+        write_page(
+            os.path.join(args.out, name + ".json"),
+            json.dumps(table, ensure_ascii=False, indent=2) + "\n",
+        )
+    write_page(os.path.join(args.out, "translations.ts"), format_translations(new_entries))
+    print(f"Wrote {len(tables)} tables and translations.ts to {os.path.relpath(args.out, REPO_ROOT)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
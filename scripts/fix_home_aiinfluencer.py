@@ -1,29 +1,22 @@
 #!/usr/bin/env python3
 """
 Fix Home.tsx and AiInfluencer.tsx properly
+
+Both pages are tokenized once (tsx_spans.SpanIndex); structural edits are
+span patches applied in a single pass, and steps that are already done are
+skipped.
 """
 
-def fix_home():
-    with open("client/src/pages/Home.tsx", "r", encoding="utf-8") as f:
-        content = f.read()
-    
-    # Replace AI_TOOLS and VIRAL_APPS arrays to use functions
-    # Find AI_TOOLS array and replace
-    ai_tools_start = content.find("// AI Araçları kategorileri\nconst AI_TOOLS = [")
-    ai_tools_end = content.find("];", ai_tools_start) + 2
-    
-    viral_apps_start = content.find("// Viral uygulamalar\nconst VIRAL_APPS = [")
-    viral_apps_end = content.find("];", viral_apps_start) + 2
-    
-    # Get the export default function line
-    export_line = content.find("export default function Home() {")
-    
-    # Extract the component part
-    before_tools = content[:ai_tools_start]
-    after_apps = content[viral_apps_end:]
-    
-    # Create new content with functions inside component
-    new_content = before_tools + """export default function Home() {
+from codemod_tables import apply_table
+from codemod_io import apply_codemods
+from tsx_spans import PatchSet, SpanIndex
+
+LANGUAGE_MODULE = "@/contexts/LanguageContext"
+
+# Replaces everything from the top-level AI_TOOLS array down to the
+# community characters query: the arrays move into the component so they can
+# use t(), and the component's opening hooks are rewritten around them.
+HOME_COMPONENT_HEAD = """export default function Home() {
   const { isAuthenticated, user } = useAuth();
   const [, navigate] = useLocation();
   const { t, language } = useLanguage();
@@ -128,84 +121,67 @@ def fix_home():
   ];
 
 """
-    
-    # Find where the component code resumes (after VIRAL_APPS)
-    # Skip the old export default line and continue from there
-    component_start = after_apps.find("export default function Home() {")
-    if component_start != -1:
-        # Skip to after the opening brace and variable declarations
-        rest_of_component = after_apps[component_start:]
-        # Find where the actual component logic starts (after all the consts)
-        # Look for the trpc query which comes after the basic state
-        trpc_query_pos = rest_of_component.find("// Topluluk AI karakterlerini getir")
-        if trpc_query_pos != -1:
-            new_content += rest_of_component[trpc_query_pos:]
-        else:
+
+
+def fix_home(content):
+    index = SpanIndex(content)
+    declarations = index.declarations()
+    component = index.function("Home")
+
+    if "AI_TOOLS" not in declarations or "VIRAL_APPS" not in declarations:
+        print("AI_TOOLS / VIRAL_APPS already inside the component")
+    elif component is None:
+        print("Warning: Could not find Home component")
+    else:
+        marker = index.comment("// Topluluk AI karakterlerini getir", within=component.body)
+        if marker is None:
             print("Warning: Could not find TRPC query marker")
-            new_content += rest_of_component
-    
-    # Now replace all language conditionals with t() calls
-    replacements = [
-        ('{language === "tr" ? "YENİ NESİL AI ARAÇLARI" : "NEXT-GEN AI TOOLS"}', 't("home.hero.badge")'),
-        ('{language === "tr" ? (\n                    <>Hayal Et, <span className="text-[#CCFF00]">AI Üretsin</span></>\n                  ) : (\n                    <>Imagine, <span className="text-[#CCFF00]">AI Creates</span></>\n                  )}', 't("home.hero.title")'),
-        ('{language === "tr"\n                    ? "Profesyonel görseller, videolar ve AI karakterler oluşturun. Saniyeler içinde."\n                    : "Create professional images, videos and AI characters. In seconds."}', 't("home.hero.subtitle")'),
-    ]
-    
-    for old, new in replacements:
-        new_content = new_content.replace(old, new)
-    
-    # Handle the hero title specially with JSX
-    new_content = new_content.replace(
-        't("home.hero.title")',
-        'language === "tr" ? (\n                    <>Hayal Et, <span className="text-[#CCFF00]">AI Üretsin</span></>\n                  ) : (\n                    <>Imagine, <span className="text-[#CCFF00]">AI Creates</span></>\n                  )'
-    )
-    
-    with open("client/src/pages/Home.tsx", "w", encoding="utf-8") as f:
-        f.write(new_content)
-    
-    print("Home.tsx fixed!")
-
-def fix_aiinfluencer():
+        else:
+            patches = PatchSet(content)
+            patches.replace(
+                declarations["AI_TOOLS"].leading,
+                index.line_start(marker.start),
+                HOME_COMPONENT_HEAD,
+            )
+            content = patches.apply()
+
+    content = apply_table(content, "Home", "fix_home")
+
+    return content
+
+
+def fix_aiinfluencer(content):
     # AiInfluencer is already reverted, we just need to add translations properly
-    with open("client/src/pages/AiInfluencer.tsx", "r", encoding="utf-8") as f:
-        content = f.read()
-    
+    index = SpanIndex(content)
+    patches = PatchSet(content)
+
     # Add import
-    if 'import { useLanguage } from "@/contexts/LanguageContext";' not in content:
-        content = content.replace(
-            'import { useState, useRef, useEffect } from "react";',
-            'import { useState, useRef, useEffect } from "react";\nimport { useLanguage } from "@/contexts/LanguageContext";'
+    modules = dict(index.imports())
+    if LANGUAGE_MODULE not in modules and "react" in modules:
+        patches.insert(
+            modules["react"].end,
+            f'\nimport {{ useLanguage }} from "{LANGUAGE_MODULE}";',
         )
-    
+
     # Add hook inside component
-    content = content.replace(
-        '  const { user } = useAuth();',
-        '  const { user } = useAuth();\n  const { t } = useLanguage();'
-    )
-    
-    # Replace Turkish strings with t() calls
-    replacements = [
-        ('"Kredi bilgisi alınamadı, lütfen sayfayı yenileyin."', 't("aiInfluencer.errors.creditsNotLoaded")'),
-        ('"Karakterler yüklenemedi, lütfen sayfayı yenileyin."', 't("aiInfluencer.errors.charactersNotLoaded")'),
-        ('"Karakter silindi"', 't("aiInfluencer.success.characterDeleted")'),
-        ('"Karakter silinemedi"', 't("aiInfluencer.errors.characterDeleteFailed")'),
-        ('`Prompt üretildi: ${data.location}`', 't("aiInfluencer.success.promptGenerated", { location: data.location })'),
-        ('"Oturumunuz sona ermiş. Lütfen sayfayı yenileyin veya tekrar giriş yapın."', 't("aiInfluencer.errors.sessionExpired")'),
-        ('"Prompt üretilemedi"', 't("aiInfluencer.errors.promptFailed")'),
-        ('data.isPublic ? "Karakter herkese açık yapıldı" : "Karakter gizli yapıldı"', 'data.isPublic ? t("aiInfluencer.success.characterPublic") : t("aiInfluencer.success.characterPrivate")'),
-        ('"Paylaşım durumu değiştirilemedi"', 't("aiInfluencer.errors.shareStatusFailed")'),
-        ('"Lütfen bir görsel dosyası seçin"', 't("aiInfluencer.errors.selectImageFile")'),
-    ]
-    
-    for old, new in replacements:
-        content = content.replace(old, new)
-    
-    with open("client/src/pages/AiInfluencer.tsx", "w", encoding="utf-8") as f:
-        f.write(content)
-    
-    print("AiInfluencer.tsx fixed!")
+    component = index.function("AiInfluencer")
+    if component is not None and index.find_name("useLanguage", within=component.body) is None:
+        hook = index.find_statement("const { user } = useAuth();", within=component.body)
+        if hook is not None:
+            patches.insert(hook.end, "\n  const { t } = useLanguage();")
+
+    content = patches.apply()
+
+    content = apply_table(content, "AiInfluencer", "fix_aiinfluencer")
+
+    return content
+
+
+CODEMODS = {
+    "client/src/pages/Home.tsx": fix_home,
+    "client/src/pages/AiInfluencer.tsx": fix_aiinfluencer,
+}
+
 
 if __name__ == "__main__":
-    fix_home()
-    fix_aiinfluencer()
-    print("\n✅ Both files fixed successfully!")
+    apply_codemods(CODEMODS)
@@ -6,42 +6,23 @@ This script will:
 2. Add t hook in component
 3. Move all constant arrays inside component (after hook declarations)
 4. Replace all Turkish strings with t() calls
+
+The page is tokenized once (tsx_spans.SpanIndex) and every structural edit
+is a span patch, applied together in a single pass before the string table.
+Steps that are already done are skipped, so re-running is harmless.
 """
 
-import re
-
-def fix_logogenerator():
-    with open("client/src/pages/LogoGenerator.tsx", "r", encoding="utf-8") as f:
-        content = f.read()
-    
-    # Step 1: Add useLanguage import after other imports
-    if 'useLanguage' not in content:
-        content = content.replace(
-            'import { trpc } from "@/lib/trpc";',
-            'import { trpc } from "@/lib/trpc";\nimport { useLanguage } from "@/contexts/LanguageContext";'
-        )
-    
-    # Step 2: Find where component starts
-    component_start = content.find("export default function LogoGenerator() {")
-    component_end = len(content)
-    
-    # Extract before component and after component
-    before_component = content[:component_start]
-    component_body = content[component_start:component_end]
-    
-    # Step 3: Add t hook after other hooks in component
-    # Find the line with useLocation hook
-    component_body = component_body.replace(
-        '  const [, navigate] = useLocation();',
-        '  const [, navigate] = useLocation();\n  const { t } = useLanguage();'
-    )
-    
-    # Step 4: Move INDUSTRIES array definition to inside component (after hooks)
-    # Find where state declarations start
-    state_start = component_body.find('  // Form state')
-    
-    # Insert arrays before form state
-    arrays_code = '''
+from codemod_tables import apply_table
+from codemod_io import apply_codemods
+from tsx_spans import PatchSet, SpanIndex
+
+LANGUAGE_MODULE = "@/contexts/LanguageContext"
+
+# Top-level arrays that need t() and therefore move into the component
+MOVED_ARRAYS = ("INDUSTRIES", "LOGO_STYLES", "COLOR_PALETTES", "ICON_TYPES", "RESOLUTIONS")
+
+# Their replacement, inserted before the form state
+ARRAYS_CODE = '''
   // Sektör seçenekleri
   const INDUSTRIES = [
     { value: "technology", label: t("logo.industry.technology"), icon: "💻", keywords: "modern, dijital, yenilikçi" },
@@ -116,75 +97,55 @@ def fix_logogenerator():
   ];
 
 '''
-    
-    # Insert arrays before form state
-    if state_start != -1:
-        component_body = component_body[:state_start] + arrays_code + component_body[state_start:]
-    
-    # Step 5: Remove old array definitions from before component
-    # Find and remove INDUSTRIES definition
-    industries_start = before_component.find("// Sektör seçenekleri\nconst INDUSTRIES")
-    if industries_start != -1:
-        # Find the end of INDUSTRIES array
-        industries_end = before_component.find("];", industries_start) + 2
-        # Find LOGO_STYLES start
-        logo_styles_start = before_component.find("\n// Logo stilleri", industries_end)
-        # Remove everything from INDUSTRIES to LOGO_STYLES
-        if logo_styles_start != -1:
-            before_component = before_component[:industries_start] + before_component[logo_styles_start+1:]
-    
-    # Remove LOGO_STYLES
-    logo_styles_start = before_component.find("// Logo stilleri\nconst LOGO_STYLES")
-    if logo_styles_start != -1:
-        color_start = before_component.find("\n// Renk paletleri", logo_styles_start)
-        if color_start != -1:
-            before_component = before_component[:logo_styles_start] + before_component[color_start+1:]
-    
-    # Remove COLOR_PALETTES
-    color_start = before_component.find("// Renk paletleri\nconst COLOR_PALETTES")
-    if color_start != -1:
-        icon_start = before_component.find("\n// İkon tipleri", color_start)
-        if icon_start != -1:
-            before_component = before_component[:color_start] + before_component[icon_start+1:]
-    
-    # Remove ICON_TYPES
-    icon_start = before_component.find("// İkon tipleri\nconst ICON_TYPES")
-    if icon_start != -1:
-        res_start = before_component.find("\n// Çözünürlük seçenekleri", icon_start)
-        if res_start != -1:
-            before_component = before_component[:icon_start] + before_component[res_start+1:]
-    
-    # Remove RESOLUTIONS
-    res_start = before_component.find("// Çözünürlük seçenekleri\nconst RESOLUTIONS")
-    if res_start != -1:
-        export_start = before_component.find("\nexport default function", res_start)
-        if export_start != -1:
-            before_component = before_component[:res_start] + before_component[export_start+1:]
-    
-    # Combine everything
-    new_content = before_component.rstrip() + "\n\n" + component_body
-    
-    # Step 6: Replace Turkish UI strings with t() calls
-    replacements = [
-        ('Logo Oluşturucu', 't("logo.title")'),
-        ('Profesyonel marka logosu tasarlayın', 't("logo.subtitle")'),
-        ('Yükleniyor...', 't("logo.loading")'),
-        ('"Marka Adı *"', 't("logo.companyName") + " *"'),
-        ('"Sektör *"', 't("logo.industry") + " *"'),
-        ('"Logo Stili *"', 't("logo.style") + " *"'),
-        ('"Renk Paleti *"', 't("logo.colors") + " *"'),
-        ('"İkon Tipi *"', 't("logo.iconType.title") + " *"'),
-        ('logo başarıyla oluşturuldu!', 't("logo.success.generated", { count: results.length.toString() })'),
-        ('"Logo indirildi!"', 't("logo.success.downloaded")'),
-    ]
-    
-    for old, new in replacements:
-        new_content = new_content.replace(old, new)
-    
-    with open("client/src/pages/LogoGenerator.tsx", "w", encoding="utf-8") as f:
-        f.write(new_content)
-    
-    print("✅ LogoGenerator.tsx refactored successfully!")
+
+
+def fix_logogenerator(content):
+    index = SpanIndex(content)
+    patches = PatchSet(content)
+
+    component = index.function("LogoGenerator")
+    if component is None:
+        print("Warning: LogoGenerator component not found")
+        return content
+    body = component.body
+
+    # Step 1: Add useLanguage import after the trpc import
+    modules = dict(index.imports())
+    if LANGUAGE_MODULE not in modules and "@/lib/trpc" in modules:
+        patches.insert(
+            modules["@/lib/trpc"].end,
+            f'\nimport {{ useLanguage }} from "{LANGUAGE_MODULE}";',
+        )
+
+    # Step 2: Add t hook after the useLocation hook
+    if index.find_name("useLanguage", within=body) is None:
+        hook = index.find_statement("const [, navigate] = useLocation();", within=body)
+        if hook is not None:
+            patches.insert(hook.end, "\n  const { t } = useLanguage();")
+
+    # Step 3: Move the arrays into the component, before the form state
+    declarations = index.declarations()
+    moved = [declarations[name] for name in MOVED_ARRAYS if name in declarations]
+    if moved:
+        form_state = index.comment("// Form state", within=body)
+        if form_state is None:
+            print("Warning: Could not find form state marker")
+        else:
+            patches.insert(index.line_start(form_state.start), ARRAYS_CODE)
+            for declaration in moved:
+                patches.delete(index.removal(declaration))
+
+    new_content = patches.apply()
+
+    new_content = apply_table(new_content, "LogoGenerator", "fix_logogenerator")
+
+    return new_content
+
+
+CODEMODS = {
+    "client/src/pages/LogoGenerator.tsx": fix_logogenerator,
+}
+
 
 if __name__ == "__main__":
-    fix_logogenerator()
+    apply_codemods(CODEMODS)
@@ -3,12 +3,11 @@
 Refactor remaining pages to use i18n translation keys
 """
 
-def refactor_verify_email():
-    file_path = "client/src/pages/VerifyEmailPage.tsx"
-    
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
+from codemod_tables import apply_table
+from codemod_io import apply_codemods
+
+
+def refactor_verify_email(content):
     # Add import if not present
     if 'import { useLanguage } from "@/contexts/LanguageContext";' not in content:
         content = content.replace(
@@ -26,36 +25,11 @@ def refactor_verify_email():
                 content = '\n'.join(lines)
                 break
     
-    replacements = [
-        ('"Email doğrulandı! Giriş sayfasına yönlendiriliyorsunuz..."', 't("verifyEmail.success.emailVerified")'),
-        ('"Lütfen email adresinize gönderilen doğrulama kodunu girin"', 't("verifyEmail.info.enterCode")'),
-        ('"Doğrulama kontrolü başarısız"', 't("verifyEmail.errors.verificationCheckFailed")'),
-        ('"Lütfen 6 haneli doğrulama kodunu girin"', 't("verifyEmail.errors.enterSixDigitCode")'),
-        ('"Doğrulama kodu hatalı"', 't("verifyEmail.errors.invalidCode")'),
-        ('"Doğrulama başarısız. Lütfen tekrar deneyin."', 't("verifyEmail.errors.verificationFailed")'),
-        ('"Doğrulama kodu yeniden gönderildi!"', 't("verifyEmail.success.codeResent")'),
-        ('"Kod gönderilemedi"', 't("verifyEmail.errors.codeNotSent")'),
-        ('"Kod gönderilemedi. Lütfen daha sonra tekrar deneyin."', 't("verifyEmail.errors.codeSendRetry")'),
-        ('"Email adresinizi girin ve doğrulama durumunu kontrol edin"', 't("verifyEmail.enterEmailCheck")'),
-        ('"Email adresinize gönderilen 6 haneli kodu girin"', 't("verifyEmail.enterSixDigitCode")'),
-        ('"Doğrulama Durumunu Kontrol Et"', 't("verifyEmail.checkStatus")'),
-        ('"Kodu Doğrula"', 't("verifyEmail.verifyCode")'),
-    ]
-    
-    for old, new in replacements:
-        content = content.replace(old, new)
-    
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    content = apply_table(content, "VerifyEmailPage", "refactor_verify_email")
     
-    print("VerifyEmailPage.tsx refactored successfully!")
+    return content
 
-def refactor_skin_enhancement():
-    file_path = "client/src/pages/SkinEnhancement.tsx"
-    
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
+def refactor_skin_enhancement(content):
     if 'import { useLanguage } from "@/contexts/LanguageContext";' not in content:
         content = content.replace(
             'import { useState, useRef } from "react";',
@@ -68,32 +42,11 @@ def refactor_skin_enhancement():
             '  const { user, isAuthenticated } = useAuth();\n  const { t } = useLanguage();'
         )
     
-    replacements = [
-        ('"Cilt iyileştirme tamamlandı!"', 't("skinEnhancement.success.completed")'),
-        ('"Geçmişten silindi"', 't("skinEnhancement.success.deletedFromHistory")'),
-        ('"Lütfen bir görsel dosyası seçin"', 't("skinEnhancement.errors.selectImageFile")'),
-        ('"Dosya boyutu 10MB\'dan küçük olmalıdır"', 't("skinEnhancement.errors.fileSizeLimit")'),
-        ('"Lütfen giriş yapın"', 't("skinEnhancement.errors.pleaseLogin")'),
-        ('"Görsel yüklenemedi"', 't("skinEnhancement.errors.imageUploadFailed")'),
-        ('"Görsel yüklenirken bir hata oluştu"', 't("skinEnhancement.errors.uploadError")'),
-        ('"Görsel indirildi"', 't("skinEnhancement.success.imageDownloaded")'),
-        ('"İndirme başarısız"', 't("skinEnhancement.errors.downloadFailed")'),
-    ]
-    
-    for old, new in replacements:
-        content = content.replace(old, new)
+    content = apply_table(content, "SkinEnhancement", "refactor_skin_enhancement")
     
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(content)
-    
-    print("SkinEnhancement.tsx refactored successfully!")
+    return content
 
-def refactor_community_characters():
-    file_path = "client/src/pages/CommunityCharacters.tsx"
-    
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
+def refactor_community_characters(content):
     if 'import { useLanguage } from "@/contexts/LanguageContext";' not in content:
         content = content.replace(
             'import { useState } from "react";',
@@ -108,26 +61,11 @@ def refactor_community_characters():
                 content = '\n'.join(lines)
                 break
     
-    replacements = [
-        ('placeholder="Karakter veya kullanıcı ara..."', 'placeholder={t("communityCharacters.searchPlaceholder")}'),
-        ('"Aramanızla eşleşen karakter bulunamadı."', 't("communityCharacters.noResultsFound")'),
-        ('"Henüz paylaşılan karakter yok."', 't("communityCharacters.noCharactersYet")'),
-    ]
-    
-    for old, new in replacements:
-        content = content.replace(old, new)
-    
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    content = apply_table(content, "CommunityCharacters", "refactor_community_characters")
     
-    print("CommunityCharacters.tsx refactored successfully!")
+    return content
 
-def refactor_blog():
-    file_path = "client/src/pages/Blog.tsx"
-    
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
+def refactor_blog(content):
     if 'import { useLanguage } from "@/contexts/LanguageContext";' not in content:
         content = content.replace(
             'import { useState } from "react";',
@@ -140,24 +78,18 @@ def refactor_blog():
             '  const { t } = useLanguage();\n  const [searchQuery, setSearchQuery] = useState("");'
         )
     
-    replacements = [
-        ('const [selectedCategory, setSelectedCategory] = useState("Tümü");', 'const [selectedCategory, setSelectedCategory] = useState(t("blog.allCategories"));'),
-        ('category: selectedCategory === "Tümü"', 'category: selectedCategory === t("blog.allCategories")'),
-        ('const categoryList = categories || ["Tümü"];', 'const categoryList = categories || [t("blog.allCategories")];'),
-        ('placeholder="Blog yazısı ara..."', 'placeholder={t("blog.searchPlaceholder")}'),
-    ]
+    content = apply_table(content, "Blog", "refactor_blog")
     
-    for old, new in replacements:
-        content = content.replace(old, new)
-    
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(content)
-    
-    print("Blog.tsx refactored successfully!")
+    return content
+
+
+CODEMODS = {
+    "client/src/pages/VerifyEmailPage.tsx": refactor_verify_email,
+    "client/src/pages/SkinEnhancement.tsx": refactor_skin_enhancement,
+    "client/src/pages/CommunityCharacters.tsx": refactor_community_characters,
+    "client/src/pages/Blog.tsx": refactor_blog,
+}
+
 
 if __name__ == "__main__":
-    refactor_verify_email()
-    refactor_skin_enhancement()
-    refactor_community_characters()
-    refactor_blog()
-    print("\n✅ All remaining pages refactored successfully!")
+    apply_codemods(CODEMODS)
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Run every refactor_*.py / fix_*.py codemod across client/src/pages in parallel
+
+Scripts are discovered in this directory and grouped by the pages listed in
+their CODEMODS mapping. Each page is handled by one worker process: it is read
+once, passed through every codemod that targets it (refactor_* scripts before
+fix_* scripts, alphabetically within each group) and written back atomically.
+Wall time is bounded by the slowest page instead of the sum of all pages.
+
+Pages whose output is byte-identical to their input are not written, so a
+no-op run does not touch mtimes or wake up Vite's file watcher. Every run
+records, per page, the hash of the page it left behind and a hash of the rules
+that produced it (script sources, the page's replacement table and the engine)
+in .codemod_cache/. With --incremental, pages whose content and rules both
+match the manifest are skipped without being read (an unchanged mtime and size
+short-circuit hashing), so iterating on one table only reprocesses its page.
+
+With --dry-run nothing is written and the manifest is left alone: each page's
+unified diff, built from the edit spans the codemods report (codemod_diff),
+is streamed to stdout in page order, and progress plus a summary of the
+replacement patterns that matched nothing go to stderr:
+
+    python3 scripts/run_codemods.py --dry-run > i18n.diff
+
+Usage:
+    python3 scripts/run_codemods.py                      # all scripts, all pages
+    python3 scripts/run_codemods.py --jobs 4
+    python3 scripts/run_codemods.py --incremental        # skip unchanged pages
+    python3 scripts/run_codemods.py --dry-run            # review as a diff
+    python3 scripts/run_codemods.py --script refactor_motion
+    python3 scripts/run_codemods.py client/src/pages/Home.tsx
+"""
+
+import argparse
+import contextlib
+import glob
+import hashlib
+import importlib
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from codemod_diff import print_miss_summary, track_edits, write_unified_diff
+from codemod_io import REPO_ROOT, read_page, write_page
+from codemod_tables import CACHE_DIR, table_path
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPT_PATTERNS = ("refactor_*.py", "fix_*.py")
+SHARED_MODULES = (
+    "codemod_diff.py",
+    "codemod_engine.py",
+    "codemod_io.py",
+    "codemod_tables.py",
+    "tsx_lexer.py",
+    "tsx_spans.py",
+)
+MANIFEST_VERSION = 1
+
+
+def discover_scripts(directory=SCRIPTS_DIR):
+    """Module names of all codemod scripts, in the order they must run."""
+    names = []
+    for pattern in SCRIPT_PATTERNS:
+        for path in sorted(glob.glob(os.path.join(directory, pattern))):
+            names.append(os.path.splitext(os.path.basename(path))[0])
+    return names
+
+
+def plan_pages(script_names):
+    """Map each target page to the ordered list of scripts that rewrite it."""
+    pages = {}
+    for name in script_names:
+        module = importlib.import_module(name)
+        for page in getattr(module, "CODEMODS", {}):
+            pages.setdefault(page, []).append(name)
+    return pages
+
+
+def content_hash(content):
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def rules_hash(page, script_names):
+    """Hash of everything that decides how a page is rewritten."""
+    digest = hashlib.sha256()
+    paths = [os.path.join(SCRIPTS_DIR, name) for name in SHARED_MODULES]
+    paths += [os.path.join(SCRIPTS_DIR, name + ".py") for name in script_names]
+    paths.append(table_path(os.path.splitext(os.path.basename(page))[0]))
+    for path in paths:
+        digest.update(os.path.basename(path).encode("utf-8") + b"\0")
+        try:
+            with open(path, "rb") as f:
+                digest.update(f.read())
+        except FileNotFoundError:
+            digest.update(b"<missing>")
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def manifest_path(root):
+    key = hashlib.sha256(os.path.realpath(root).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(CACHE_DIR, f"manifest-{key}.json")
+
+
+def load_manifest(root):
+    try:
+        with open(manifest_path(root), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest.get("pages", {})
+
+
+def save_manifest(root, entries):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    manifest = {"version": MANIFEST_VERSION, "pages": dict(sorted(entries.items()))}
+    write_page(manifest_path(root), json.dumps(manifest, indent=2) + "\n")
+
+
+def page_entry(path, content, rules):
+    stat = os.stat(path)
+    return {
+        "hash": content_hash(content),
+        "rules": rules,
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+    }
+
+
+def is_up_to_date(entry, path, rules):
+    """True if the page and its rules are what the last run left behind."""
+    if not entry or entry.get("rules") != rules:
+        return False
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return False
+    if stat.st_mtime_ns == entry.get("mtime_ns") and stat.st_size == entry.get("size"):
+        return True
+    return content_hash(read_page(path)) == entry.get("hash")
+
+
+def rewrite_page(root, page, script_names, rules):
+    """Worker: read a page once, apply its codemods in order, write it back if it changed."""
+    started = time.perf_counter()
+    output = io.StringIO()
+    path = os.path.join(root, page)
+    with contextlib.redirect_stdout(output):
+        content = original = read_page(path)
+        for name in script_names:
+            transform = importlib.import_module(name).CODEMODS[page]
+            content = transform(content)
+        changed = content != original
+        if changed:
+            write_page(path, content)
+    entry = page_entry(path, content, rules)
+    return page, changed, entry, output.getvalue(), time.perf_counter() - started
+
+
+def preview_page(root, page, script_names):
+    """Worker: apply a page's codemods in memory and return its unified diff."""
+    started = time.perf_counter()
+    output = io.StringIO()
+    diff = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        content = original = read_page(os.path.join(root, page))
+        with track_edits(original) as log:
+            for name in script_names:
+                content = importlib.import_module(name).CODEMODS[page](content)
+        changed = write_unified_diff(diff, page, original, log.finish(content))
+    return page, changed, diff.getvalue(), log.misses, output.getvalue(), time.perf_counter() - started
+
+
+def pending_pages(pages, root, manifest, incremental, log=sys.stdout):
+    """Rules hash of every page that has to be processed."""
+    pending = {}
+    for page, names in sorted(pages.items()):
+        rules = rules_hash(page, names)
+        if incremental and is_up_to_date(manifest.get(page), os.path.join(root, page), rules):
+            print(f"{os.path.basename(page)} skipped (up to date)", file=log)
+            continue
+        pending[page] = rules
+    return pending
+
+
+def preview(pages, root=REPO_ROOT, jobs=None, incremental=False, stream=None):
+    """Stream every planned page's diff in page order. Returns the failure count."""
+    stream = stream or sys.stdout
+    failures = 0
+    misses = []
+    pending = pending_pages(pages, root, load_manifest(root), incremental, log=sys.stderr)
+    if not pending:
+        return 0
+    with ProcessPoolExecutor(max_workers=min(jobs or os.cpu_count() or 1, len(pending))) as pool:
+        futures = [(page, pool.submit(preview_page, root, page, pages[page])) for page in pending]
+        # Workers run in parallel; diffs are written in page order as soon as
+        # each page and the pages before it are done.
+        for page, future in futures:
+            try:
+                _, changed, diff, page_misses, output, elapsed = future.result()
+            except Exception as exc:
+                failures += 1
+                print(f"❌ {page}: {exc}", file=sys.stderr)
+                continue
+            stream.write(diff)
+            stream.flush()
+            misses.extend(page_misses)
+            status = "would change" if changed else "unchanged"
+            print(
+                f"{os.path.basename(page)} {status} ({elapsed * 1000:.0f} ms, {', '.join(pages[page])})",
+                file=sys.stderr,
+            )
+            if output.strip():
+                print(output.rstrip(), file=sys.stderr)
+    print_miss_summary(misses, sys.stderr)
+    return failures
+
+
+def run(pages, root=REPO_ROOT, jobs=None, incremental=False):
+    """Rewrite all planned pages on a process pool. Returns the failure count."""
+    failures = 0
+    manifest = load_manifest(root)
+    pending = pending_pages(pages, root, manifest, incremental)
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=min(jobs or os.cpu_count() or 1, len(pending))) as pool:
+            futures = {
+                pool.submit(rewrite_page, root, page, pages[page], rules): page
+                for page, rules in pending.items()
+            }
+            for future in as_completed(futures):
+                page = futures[future]
+                try:
+                    _, changed, entry, output, elapsed = future.result()
+                except Exception as exc:
+                    failures += 1
+                    manifest.pop(page, None)
+                    print(f"❌ {page}: {exc}")
+                    continue
+                manifest[page] = entry
+                status = "refactored" if changed else "unchanged"
+                print(f"{os.path.basename(page)} {status} ({elapsed * 1000:.0f} ms, {', '.join(pages[page])})")
+                if output.strip():
+                    print(output.rstrip())
+        save_manifest(root, manifest)
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run all i18n codemods in parallel")
+    parser.add_argument("pages", nargs="*", help="only rewrite these pages (repo-relative)")
+    parser.add_argument("--script", action="append", help="only run these scripts (module name)")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--root", default=REPO_ROOT, help="repository root containing client/src/pages")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="skip pages whose content and rules are unchanged since the last run",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="write nothing; stream a unified diff to stdout and a summary to stderr",
+    )
+    args = parser.parse_args(argv)
+
+    names = discover_scripts()
+    if args.script:
+        wanted = {os.path.splitext(os.path.basename(s))[0] for s in args.script}
+        names = [name for name in names if name in wanted]
+    pages = plan_pages(names)
+    if args.pages:
+        wanted = {os.path.normpath(p) for p in args.pages}
+        pages = {page: s for page, s in pages.items() if os.path.normpath(page) in wanted}
+    if not pages:
+        print("No codemods matched.")
+        return 1
+
+    started = time.perf_counter()
+    process = preview if args.dry_run else run
+    failures = process(pages, root=args.root, jobs=args.jobs, incremental=args.incremental)
+    elapsed = time.perf_counter() - started
+    print(
+        f"\n{'✅' if not failures else '⚠️'} {len(pages) - failures}/{len(pages)} pages processed in {elapsed:.2f}s",
+        file=sys.stderr if args.dry_run else sys.stdout,
+    )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,10 +9,19 @@ const __dirname = dirname(__filename);
 
 config({ path: join(__dirname, "..", ".env") });
 
+// scripts/build_blog_bundles.py ile blog-articles.json'dan üretilir
+const bundleDir = join(__dirname, "..", "content", "blog");
 const articles = JSON.parse(
-  readFileSync(join(__dirname, "..", "blog-articles.json"), "utf-8")
+  readFileSync(join(bundleDir, "index.json"), "utf-8")
 );
 
+// Yazının gövdesi yalnızca eklenecekse okunur
+function readContent(slug) {
+  return JSON.parse(
+    readFileSync(join(bundleDir, "articles", `${slug}.json`), "utf-8")
+  ).content;
+}
+
 // Cover image mapping
 const coverImages = {
   "ai-gorsel-olusturma-rehberi-2024": "/blog-covers/yapay-zeka-fotograf.jpg",
@@ -32,14 +41,6 @@ const coverImages = {
   "coklu-aci-fotograf-teknolojisi": "/blog-covers/fotograf-teknikleri.jpg",
 };
 
-// Calculate read time based on content length
-function calculateReadTime(content) {
-  const wordsPerMinute = 200;
-  const wordCount = content.split(/\s+/).length;
-  const minutes = Math.ceil(wordCount / wordsPerMinute);
-  return `${minutes} dk`;
-}
-
 async function seedBlogArticles() {
   const connection = await mysql.createConnection(process.env.DATABASE_URL);
 
@@ -60,8 +61,9 @@ async function seedBlogArticles() {
 
       const coverImage =
         coverImages[article.slug] || "/blog-covers/ai-influencer-nedir.jpg";
-      const readTime = calculateReadTime(article.content);
-      const category = article.category || "Genel";
+      // Okuma süresi index'te hazır (dakikada 200 kelime)
+      const readTime = `${article.readingMinutes} dk`;
+      const category = article.category;
 
       // Insert article - matching actual table structure
       await connection.execute(
@@ -71,7 +73,7 @@ async function seedBlogArticles() {
           article.title,
           article.slug,
           article.excerpt, // description field
-          article.content,
+          readContent(article.slug),
           coverImage,
           category,
           "NanoInfluencer",
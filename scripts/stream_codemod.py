@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Apply a replacement table to files too large to load whole
+
+The page codemods read each .tsx file into memory and pass copies of it from
+rule to rule, which is fine for pages but not for generated assets such as
+client/public/animations/loading.json or drizzle/meta/*_snapshot.json. This
+tool runs one rule set from codemod_tables/ over such files in bounded
+windows: the input is mmap'd and decoded a window at a time, every stage of
+the compiled ReplacementEngine rewrites the stream as it passes through, and
+the output is written to a temporary file that replaces the original only if
+some byte changed. Peak memory grows with the window and the match density
+inside it, not with the size of the file, and the result is identical to applying the table to the
+whole file at once. Line endings are kept as they are in the file.
+
+Usage:
+    python3 scripts/stream_codemod.py <table> <ruleset> client/public/animations/loading.json
+    python3 scripts/stream_codemod.py <table> <ruleset> drizzle/meta/*_snapshot.json --window 4M
+    python3 scripts/stream_codemod.py <table> <ruleset> big.json --dry-run   # count matches only
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from codemod_engine import print_misses
+from codemod_io import WINDOW, read_chunks, rewrite_streaming
+from codemod_tables import load_engine
+
+UNITS = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+
+
+def parse_size(text):
+    """Parse a byte count such as 65536, 64K or 4M."""
+    text = text.strip().upper().rstrip("B")
+    unit = UNITS.get(text[-1:], 1)
+    if unit != 1:
+        text = text[:-1]
+    try:
+        size = int(text) * unit
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid size: {text!r}") from None
+    if size <= 0:
+        raise argparse.ArgumentTypeError("window must be positive")
+    return size
+
+
+def process(path, engine, window, dry_run):
+    """Run the engine over one file; returns (changed, hits)."""
+    hits = [0] * len(engine)
+    if dry_run:
+        for _ in engine.apply_chunks(read_chunks(path, window), hits):
+            pass
+        changed = any(hits)
+    else:
+        changed = rewrite_streaming(
+            path, lambda chunks: engine.apply_chunks(chunks, hits), window
+        )
+    return changed, hits
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stream a codemod rule table over large files")
+    parser.add_argument("table", help="table name in codemod_tables/ (without .json)")
+    parser.add_argument("ruleset", help="rule set inside the table")
+    parser.add_argument("paths", nargs="+", help="files to rewrite")
+    parser.add_argument(
+        "--window",
+        type=parse_size,
+        default=WINDOW,
+        help=f"bytes decoded per step, e.g. 256K or 4M (default: {WINDOW >> 20}M)",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="count matches, write nothing")
+    args = parser.parse_args(argv)
+
+    try:
+        engine = load_engine(args.table, args.ruleset)
+    except (OSError, KeyError, ValueError) as exc:
+        print(f"❌ {exc}", file=sys.stderr)
+        return 1
+
+    failures = 0
+    for path in args.paths:
+        started = time.perf_counter()
+        try:
+            changed, hits = process(path, engine, args.window, args.dry_run)
+        except (OSError, UnicodeDecodeError) as exc:
+            failures += 1
+            print(f"❌ {path}: {exc}")
+            continue
+        elapsed = time.perf_counter() - started
+        size = os.path.getsize(path) / (1 << 20)
+        if args.dry_run:
+            status = "would change" if changed else "unchanged"
+        else:
+            status = "rewritten" if changed else "unchanged"
+        print(f"{path} {status} ({size:.1f} MiB, {elapsed:.2f}s)")
+        print_misses(engine.rules, hits, os.path.basename(path))
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
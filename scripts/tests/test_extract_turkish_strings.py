@@ -0,0 +1,75 @@
+"""
+Generated extraction tables must only rewrite their own candidate spans.
+
+Each table is applied with ReplacementEngine, like apply_table() does, and the
+output is re-lexed: no t() call may end up inside a string, template literal
+or comment, where it would be text instead of code.
+
+Usage:
+    python3 -m pytest scripts/tests
+"""
+
+import os
+
+import pytest
+
+from codemod_engine import ReplacementEngine
+from codemod_io import read_page
+from codemod_tables import parse_rules
+from extract_turkish_strings import CLIENT_SRC, KeyAllocator, build_table, discover_files, propose
+from translations_index import load_index
+from tsx_lexer import tokenize
+
+LITERAL_KINDS = frozenset(("string", "template", "comment", "jsx_string", "regex"))
+
+PAGE = """import { useLanguage } from "@/contexts/LanguageContext";
+
+export default function Download() {
+  const { t } = useLanguage();
+  const fail = (err: string) => toast.error(`İndirme hatası: ${err}`);
+  // Çözünürlük seçenekleri
+  return (
+    <div>
+      <Label>Çözünürlük</Label>
+      <Button onClick={fail}>İndir</Button>
+      <span>Kredi</span>
+      <p>Fotoğraf oluştur: Kredi</p>
+    </div>
+  );
+}
+"""
+
+
+def calls_in_literals(source):
+    return sum(
+        source[token.start:token.end].count('t("')
+        for token in tokenize(source)
+        if token.kind in LITERAL_KINDS
+    )
+
+
+def apply_extracted(rel_path, source, allocator):
+    table = build_table(rel_path, source, propose(rel_path, source, allocator))
+    entries = table["rulesets"]["extracted"]
+    output, _ = ReplacementEngine(parse_rules(entries)).apply(source)
+    return output, [entry for entry in entries if isinstance(entry, str)]
+
+
+def test_rules_never_rewrite_literals_or_comments():
+    output, comments = apply_extracted("pages/Download.tsx", PAGE, KeyAllocator(load_index()))
+
+    assert calls_in_literals(output) == 0
+    assert "// Çözünürlük seçenekleri" in output
+    assert "<span>Kredi</span>" in output
+    manual = [comment for comment in comments if comment.startswith("# manual")]
+    # "Kredi" also occurs in the key of the longer "Fotoğraf oluştur: Kredi" rule
+    assert any("'Kredi'" in comment for comment in manual)
+    assert any("'Çözünürlük'" in comment for comment in manual)
+
+
+@pytest.mark.parametrize("rel_path", [rel_path for _, rel_path in discover_files([])])
+def test_client_tables_keep_insertions_in_code(rel_path):
+    source = read_page(os.path.join(CLIENT_SRC, rel_path))
+    output, _ = apply_extracted(rel_path, source, KeyAllocator(load_index()))
+
+    assert calls_in_literals(output) <= calls_in_literals(source)
@@ -0,0 +1,184 @@
+"""
+Indexed view of client/src/i18n/translations.ts for the Python tooling.
+
+translations.ts is one big object literal of `"key": { tr: "...", en: "..." }`
+entries. load_index() parses it once with tsx_lexer into a key-sorted
+TranslationIndex and caches the result in .codemod_cache/translations/, split
+into one shard per top-level namespace ("logo", "motion", ...). The cache is
+invalidated by the source file's mtime and size, and callers that only care
+about a few namespaces load only those shards:
+
+    index = load_index()                            # every key
+    index = load_index(prefixes=["logo.industry."])  # only the "logo" shard
+    index.get("nav.home").en                        # 'Home'
+    [e.key for e in index.prefix("logo.industry.")]
+    index.keys_for_text("Galeri")                   # ['nav.gallery']
+
+Entries carry the 1-based line of their definition so reports can point at
+translations.ts:line.
+"""
+
+import bisect
+import hashlib
+import os
+import pickle
+from collections import namedtuple
+
+from codemod_io import REPO_ROOT, read_page, write_page
+from codemod_tables import CACHE_DIR
+from tsx_lexer import LineIndex, tokenize
+
+TRANSLATIONS_FILE = os.path.join(REPO_ROOT, "client", "src", "i18n", "translations.ts")
+INDEX_VERSION = 1
+
+Entry = namedtuple("Entry", "key tr en line")
+
+
+def namespace_of(key):
+    return key.split(".", 1)[0]
+
+
+class TranslationIndex:
+    """Key-sorted translation entries with exact and prefix lookup."""
+
+    def __init__(self, entries, duplicates=None, namespaces=None):
+        entries = sorted(entries)
+        self.keys = [entry.key for entry in entries]
+        self.entries = entries
+        # {key: [line, ...]} for keys defined more than once (the last one wins)
+        self.duplicates = duplicates or {}
+        # Namespaces present in this index; None means all of them.
+        self.namespaces = namespaces
+        self._by_text = None
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def get(self, key):
+        i = bisect.bisect_left(self.keys, key)
+        if i < len(self.keys) and self.keys[i] == key:
+            return self.entries[i]
+        return None
+
+    def prefix(self, prefix):
+        """Entries whose key starts with prefix, in key order."""
+        lo = bisect.bisect_left(self.keys, prefix)
+        hi = bisect.bisect_left(self.keys, prefix + "\U0010ffff")
+        return self.entries[lo:hi]
+
+    def keys_for_text(self, text, language="tr"):
+        """Keys whose value in language is exactly text, in definition order."""
+        if self._by_text is None:
+            self._by_text = {}
+        by_text = self._by_text.get(language)
+        if by_text is None:
+            by_text = self._by_text[language] = {}
+            for entry in sorted(self.entries, key=lambda e: e.line):
+                by_text.setdefault(getattr(entry, language), []).append(entry.key)
+        return by_text.get(text, [])
+
+
+def parse_translations(source):
+    """Parse translations.ts source into (entries, duplicates)."""
+    lines = LineIndex(source)
+    tokens = [tok for tok in tokenize(source) if tok.kind != "comment"]
+    found = {}
+    duplicates = {}
+    i = 0
+    while i + 2 < len(tokens):
+        key, colon, brace = tokens[i], tokens[i + 1], tokens[i + 2]
+        if key.kind == "string" and colon.value == ":" and brace.value == "{":
+            values = {}
+            i += 3
+            while i + 2 < len(tokens) and tokens[i].value != "}":
+                name, sep, value = tokens[i], tokens[i + 1], tokens[i + 2]
+                if name.kind == "name" and sep.value == ":" and value.kind == "string":
+                    values[name.value] = value.value
+                    i += 3
+                else:
+                    i += 1
+            line = lines.line(key.start)
+            if key.value in found:
+                duplicates.setdefault(key.value, [found[key.value].line]).append(line)
+            found[key.value] = Entry(key.value, values.get("tr"), values.get("en"), line)
+        i += 1
+    return list(found.values()), duplicates
+
+
+def _cache_dir(path):
+    key = hashlib.sha256(os.path.realpath(path).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(CACHE_DIR, "translations", key)
+
+
+def _shard_file(directory, namespace):
+    return os.path.join(directory, "ns-" + hashlib.sha1(namespace.encode("utf-8")).hexdigest()[:12] + ".pickle")
+
+
+def _source_stamp(path):
+    stat = os.stat(path)
+    return (INDEX_VERSION, stat.st_mtime_ns, stat.st_size)
+
+
+def _read_pickle(path):
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        return None
+
+
+def build_cache(path=TRANSLATIONS_FILE):
+    """Parse translations.ts and rewrite its cache shards. Returns the full index."""
+    stamp = _source_stamp(path)
+    entries, duplicates = parse_translations(read_page(path))
+    shards = {}
+    for entry in entries:
+        shards.setdefault(namespace_of(entry.key), []).append(tuple(entry))
+
+    directory = _cache_dir(path)
+    os.makedirs(directory, exist_ok=True)
+    for namespace, rows in shards.items():
+        write_page(_shard_file(directory, namespace), pickle.dumps(rows, protocol=pickle.HIGHEST_PROTOCOL))
+    manifest = {"stamp": stamp, "namespaces": sorted(shards), "duplicates": duplicates}
+    write_page(os.path.join(directory, "manifest.pickle"), pickle.dumps(manifest, protocol=pickle.HIGHEST_PROTOCOL))
+    return TranslationIndex(entries, duplicates)
+
+
+def load_index(prefixes=None, path=TRANSLATIONS_FILE):
+    """
+    Return a TranslationIndex for translations.ts, from the cache when fresh.
+
+    prefixes limits loading to the namespaces those key prefixes fall in;
+    lookups outside them simply miss.
+    """
+    directory = _cache_dir(path)
+    manifest = _read_pickle(os.path.join(directory, "manifest.pickle"))
+    if manifest is None or manifest.get("stamp") != _source_stamp(path):
+        index = build_cache(path)
+        if prefixes is None:
+            return index
+        wanted = {namespace_of(prefix) for prefix in prefixes}
+        entries = [entry for entry in index if namespace_of(entry.key) in wanted]
+        return TranslationIndex(entries, index.duplicates, wanted)
+
+    if prefixes is None:
+        wanted = manifest["namespaces"]
+    else:
+        wanted = sorted({namespace_of(prefix) for prefix in prefixes} & set(manifest["namespaces"]))
+    entries = []
+    for namespace in wanted:
+        rows = _read_pickle(_shard_file(directory, namespace))
+        if rows is None:
+            # A shard went missing or is corrupt: rebuild everything once.
+            os.unlink(os.path.join(directory, "manifest.pickle"))
+            return load_index(prefixes, path)
+        entries.extend(Entry(*row) for row in rows)
+    return TranslationIndex(
+        entries, manifest["duplicates"], None if prefixes is None else set(wanted)
+    )
@@ -0,0 +1,262 @@
+"""
+Streaming, JSX-aware tokenizer for the client's .tsx sources.
+
+tokenize(source) walks a file once and yields Token(kind, start, end, value)
+tuples lazily; whitespace is dropped, everything else (comments included) is
+reported with its exact character span so callers can patch the source
+without re-searching it. Each step is a single anchored regex match for the
+current lexer mode, so the cost is linear in the file size no matter how many
+strings a caller is interested in.
+
+Modes are kept on a stack: plain TypeScript, a JSX tag (<Button size="lg">),
+JSX children (text between tags), and template literal text. Braces push a
+TypeScript frame that pops itself on its matching "}", which is how
+{expression} containers and ${...} substitutions nest.
+
+Token kinds:
+
+    name, number, punct, comment, regex   TypeScript tokens
+    string          '...' / "..." literal; value is the decoded text
+    template        raw text chunk of a `...` literal (between substitutions)
+    jsx_open        "<" or "</" starting a tag; value is the tag name
+    jsx_attr        attribute name inside a tag
+    jsx_string      quoted attribute value; value is the text between quotes
+    jsx_end         ">" or "/>" closing a tag
+    jsx_text        text between tags, whitespace included
+    jsx_expr_open   "{" opening a JSX expression container
+    jsx_expr_close  "}" closing it
+
+Template literals are delimited by punct tokens "`" and "${" / "}" around
+their substitutions.
+
+The usual TypeScript ambiguities are resolved from the previous token: "<"
+only opens a tag where an expression may start (after "(", "=", "return",
+"&&", ...), so generics like useState<string>() stay punctuation, and "/" is
+a regex only where a division cannot appear.
+"""
+
+import bisect
+import re
+from collections import namedtuple
+
+Token = namedtuple("Token", "kind start end value")
+
+_JS = re.compile(
+    r"""
+    (?P<ws>\s+)
+  | (?P<comment>//[^\n]*|/\*.*?\*/)
+  | (?P<string>"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*')
+  | (?P<name>[A-Za-z_$][\w$]*)
+  | (?P<number>(?:0[xXbBoO])?[\d_]*\.?[\d_]+(?:[eE][-+]?\d+)?n?)
+  | (?P<punct>\$\{|=>|\?\?=?|\?\.(?!\d)|\.\.\.|&&=?|\|\|=?|\*\*=?|[=!]==?|<<=?|>>>?=?|[-+*/%&|^<>]=?|\+\+|--|[{}()\[\];,:?.~!@#`])
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+_REGEX = re.compile(r"/(?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[a-z]*")
+_TAG = re.compile(
+    r"""
+    (?P<ws>\s+)
+  | (?P<name>[A-Za-z_$][\w$.:-]*)
+  | (?P<string>"[^"]*"|'[^']*')
+  | (?P<end>/?>)
+  | (?P<brace>\{)
+  | (?P<other>.)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+_TEXT = re.compile(r"[^<{]+")
+_TEMPLATE = re.compile(r"(?:[^`\\$]|\\.|\$(?!\{))+", re.DOTALL)
+_TAG_NAME = re.compile(r"[A-Za-z_$][\w$.:-]*")
+_ESCAPE = re.compile(r"\\(u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|\r\n|[\s\S])")
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f", "v": "\v", "0": "\0"}
+
+# Tokens after which an expression (and therefore JSX or a regex) may start.
+_EXPRESSION_PUNCT = frozenset(
+    "( [ { , ; : ? = => ! ~ + - * / % & | ^ < > && || ?? == != === !== <= >= "
+    "+= -= *= /= %= &= |= ^= &&= ||= ??= ... ${".split()
+)
+_EXPRESSION_KEYWORDS = frozenset(
+    "return case default do else in of typeof void delete yield await throw new".split()
+)
+
+JS, TAG, CHILDREN, TEMPLATE = "js", "tag", "children", "template"
+
+
+def _unescape_char(match):
+    seq = match.group(1)
+    if seq[0] == "u":
+        return chr(int(seq[2:-1] if seq[1] == "{" else seq[1:], 16))
+    if seq[0] == "x":
+        return chr(int(seq[1:], 16))
+    if seq in ("\n", "\r\n"):
+        return ""
+    return _ESCAPES.get(seq, seq)
+
+
+def unescape(body):
+    """Decode the escapes of a string literal body (without its quotes)."""
+    return _ESCAPE.sub(_unescape_char, body) if "\\" in body else body
+
+
+def _expression_may_start(prev):
+    if prev is None:
+        return True
+    kind, value = prev
+    if kind == "punct":
+        return value in _EXPRESSION_PUNCT
+    return kind == "name" and value in _EXPRESSION_KEYWORDS
+
+
+def tokenize(source):
+    """Yield the tokens of a .tsx source in order."""
+    pos = 0
+    end = len(source)
+    # Frames are [mode, depth]: brace depth for TypeScript frames, and for
+    # tags whether it is a closing tag.
+    stack = [[JS, 0]]
+    prev = None
+
+    while pos < end:
+        frame = stack[-1]
+        mode = frame[0]
+
+        if mode == JS:
+            char = source[pos]
+            if char == "<" and _expression_may_start(prev) and pos + 1 < end:
+                nxt = source[pos + 1]
+                if nxt == ">" or nxt.isalpha() or nxt == "_":
+                    name = _TAG_NAME.match(source, pos + 1)
+                    stack.append([TAG, False])
+                    yield Token("jsx_open", pos, pos + 1, name.group() if name else "")
+                    pos += 1
+                    continue
+            if char == "/" and _expression_may_start(prev):
+                m = _REGEX.match(source, pos)
+                if m and not source.startswith(("//", "/*"), pos):
+                    yield Token("regex", pos, m.end(), m.group())
+                    prev = ("regex", m.group())
+                    pos = m.end()
+                    continue
+            m = _JS.match(source, pos)
+            if m is None:
+                yield Token("punct", pos, pos + 1, char)
+                prev = ("punct", char)
+                pos += 1
+                continue
+            kind = m.lastgroup
+            text = m.group()
+            start, pos = pos, m.end()
+            if kind == "ws":
+                continue
+            if kind == "comment":
+                yield Token(kind, start, pos, text)
+                continue
+            if kind == "string":
+                yield Token(kind, start, pos, unescape(text[1:-1]))
+                prev = (kind, text)
+                continue
+            if kind == "punct":
+                if text in ("{", "${"):
+                    frame[1] += 1
+                elif text == "}":
+                    if frame[1] == 0 and len(stack) > 1:
+                        stack.pop()
+                        outer = stack[-1][0]
+                        if outer == TEMPLATE:
+                            yield Token("punct", start, pos, text)
+                        else:
+                            yield Token("jsx_expr_close", start, pos, text)
+                        prev = ("name", "}")
+                        continue
+                    frame[1] -= 1
+                elif text == "`":
+                    stack.append([TEMPLATE, 0])
+            yield Token(kind, start, pos, text)
+            prev = (kind, text)
+            continue
+
+        if mode == TEMPLATE:
+            if source.startswith("`", pos):
+                stack.pop()
+                yield Token("punct", pos, pos + 1, "`")
+                prev = ("string", "`")
+                pos += 1
+            elif source.startswith("${", pos):
+                stack.append([JS, 0])
+                yield Token("punct", pos, pos + 2, "${")
+                prev = ("punct", "${")
+                pos += 2
+            else:
+                m = _TEMPLATE.match(source, pos)
+                if m is None:  # lone backslash at end of file
+                    yield Token("template", pos, end, source[pos:])
+                    break
+                yield Token("template", pos, m.end(), m.group())
+                pos = m.end()
+            continue
+
+        if mode == CHILDREN:
+            char = source[pos]
+            if char == "{":
+                stack.append([JS, 0])
+                yield Token("jsx_expr_open", pos, pos + 1, char)
+                prev = ("punct", "{")
+                pos += 1
+            elif char == "<":
+                closing = source.startswith("</", pos)
+                width = 2 if closing else 1
+                name = _TAG_NAME.match(source, pos + width)
+                stack.append([TAG, closing])
+                yield Token("jsx_open", pos, pos + width, name.group() if name else "")
+                pos += width
+            else:
+                m = _TEXT.match(source, pos)
+                yield Token("jsx_text", pos, m.end(), m.group())
+                pos = m.end()
+            continue
+
+        # TAG mode
+        m = _TAG.match(source, pos)
+        kind = m.lastgroup
+        start, pos = pos, m.end()
+        if kind == "ws":
+            continue
+        if kind == "name":
+            # The first name is the tag name already reported by jsx_open.
+            if source[start - 1] not in "</":
+                yield Token("jsx_attr", start, pos, m.group())
+        elif kind == "string":
+            yield Token("jsx_string", start, pos, m.group()[1:-1])
+        elif kind == "brace":
+            stack.append([JS, 0])
+            yield Token("jsx_expr_open", start, pos, "{")
+            prev = ("punct", "{")
+        elif kind == "end":
+            closing = frame[1]
+            stack.pop()
+            yield Token("jsx_end", start, pos, m.group())
+            if closing:
+                # "</div>" also closes the children of the matching "<div>".
+                if stack[-1][0] == CHILDREN:
+                    stack.pop()
+            elif m.group() == ">":
+                stack.append([CHILDREN, 0])
+            if stack[-1][0] == JS:
+                prev = ("name", "jsx")
+        else:
+            yield Token("punct", start, pos, m.group())
+
+
+class LineIndex:
+    """Map character offsets to 1-based (line, column) pairs."""
+
+    def __init__(self, source):
+        self.starts = [0]
+        self.starts.extend(m.end() for m in re.finditer("\n", source))
+
+    def line(self, offset):
+        return bisect.bisect_right(self.starts, offset)
+
+    def position(self, offset):
+        line = self.line(offset)
+        return line, offset - self.starts[line - 1] + 1
@@ -0,0 +1,326 @@
+"""
+Span index and one-pass patching for the TSX codemods.
+
+The fix_*.py scripts used to locate code with content.find(...) and rebuild
+the page with slice/concat for every edit, re-searching and copying the whole
+file each time. SpanIndex tokenizes a page once with tsx_lexer and answers
+structural queries with exact character spans:
+
+    index = SpanIndex(source)
+    index.declarations()["INDUSTRIES"]    top-level const/let/var
+    index.function("LogoGenerator")       function and its body
+    index.find_statement("const { user } = useAuth();", within=body)
+    index.comment("// Form state", within=body)
+    index.imports()                       [(module, Span), ...]
+    index.strings(), index.jsx_texts()    literal / JSX text tokens
+
+Edits are collected in a PatchSet and applied together, so a rewrite costs
+one pass over the file however many edits it makes:
+
+    patches = PatchSet(source)
+    patches.delete(index.removal(index.declarations()["RESOLUTIONS"]))
+    patches.insert(statement.end, "\\n  const { t } = useLanguage();")
+    content = patches.apply()
+"""
+
+import bisect
+from collections import namedtuple
+
+from codemod_diff import record
+from tsx_lexer import tokenize
+
+Span = namedtuple("Span", "start end")
+# leading is where the comment block directly above the declaration starts
+Declaration = namedtuple("Declaration", "name start end leading")
+# body is the span between the function's braces
+Function = namedtuple("Function", "name start end body")
+
+_OPENERS = frozenset(("(", "[", "{", "${"))
+_CLOSERS = frozenset((")", "]", "}"))
+_DECLARATION_KEYWORDS = frozenset(("const", "let", "var"))
+_STRING_KINDS = frozenset(("string", "jsx_string", "template"))
+# Names that put a "{" in expression position (destructuring, import lists)
+_NOT_BLOCK = frozenset(
+    "import export const let var return yield await typeof case in of new".split()
+)
+_CONTINUATIONS = frozenset(("else", "catch", "finally"))
+
+
+def _is_opener(token):
+    if token.kind == "punct":
+        return token.value in _OPENERS
+    return token.kind == "jsx_expr_open"
+
+
+def _is_closer(token):
+    if token.kind == "punct":
+        return token.value in _CLOSERS
+    return token.kind == "jsx_expr_close"
+
+
+class SpanIndex:
+    """Token spans of one .tsx source, with bracket nesting resolved."""
+
+    def __init__(self, source):
+        self.source = source
+        self.tokens = list(tokenize(source))
+        self.starts = [token.start for token in self.tokens]
+        # Nesting depth of every token and the index of its matching bracket
+        self.depth = [0] * len(self.tokens)
+        self.partner = [None] * len(self.tokens)
+        stack = []
+        for i, token in enumerate(self.tokens):
+            if _is_closer(token) and stack:
+                opener = stack.pop()
+                self.partner[i] = opener
+                self.partner[opener] = i
+                self.depth[i] = len(stack)
+                continue
+            self.depth[i] = len(stack)
+            if _is_opener(token):
+                stack.append(i)
+        self._declarations = None
+
+    # -- helpers ---------------------------------------------------------
+
+    def _range(self, within):
+        """Token indexes inside a span (the whole file when within is None)."""
+        if within is None:
+            return range(len(self.tokens))
+        return range(
+            bisect.bisect_left(self.starts, within.start),
+            bisect.bisect_left(self.starts, within.end),
+        )
+
+    def _is(self, i, kind, value):
+        if i >= len(self.tokens):
+            return False
+        token = self.tokens[i]
+        return token.kind == kind and token.value == value
+
+    def _next_start(self, i):
+        """Start of the token after index i (end of file when there is none)."""
+        return self.starts[i + 1] if i + 1 < len(self.tokens) else len(self.source)
+
+    def _leading_comments(self, i):
+        """Start of the comment lines directly above token i."""
+        start = self.tokens[i].start
+        j = i - 1
+        while j >= 0 and self.tokens[j].kind == "comment":
+            gap = self.source[self.tokens[j].end : start]
+            if gap.strip() or gap.count("\n") > 1:
+                break
+            start = self.tokens[j].start
+            j -= 1
+        return start
+
+    def _closes_block(self, i):
+        """Whether token i is a "}" ending a block statement."""
+        opener = self.partner[i]
+        if not self._is(i, "punct", "}") or opener is None or opener == 0:
+            return False
+        following = self.tokens[i + 1] if i + 1 < len(self.tokens) else None
+        if following is not None and (
+            (following.kind == "name" and following.value in _CONTINUATIONS)
+            or self._is(i + 1, "punct", ";")
+        ):
+            return False
+        before = self.tokens[opener - 1]
+        if before.kind == "punct":
+            return before.value == ")"
+        return before.kind == "name" and before.value not in _NOT_BLOCK
+
+    def line_start(self, offset):
+        return self.source.rfind("\n", 0, offset) + 1
+
+    # -- queries ---------------------------------------------------------
+
+    def declarations(self):
+        """Top-level `const NAME = ...;` declarations (also let/var), by name."""
+        if self._declarations is not None:
+            return self._declarations
+        found = {}
+        tokens = self.tokens
+        i = 0
+        while i < len(tokens):
+            token = tokens[i]
+            if (
+                self.depth[i] == 0
+                and token.kind == "name"
+                and token.value in _DECLARATION_KEYWORDS
+                and i + 1 < len(tokens)
+                and tokens[i + 1].kind == "name"
+            ):
+                first = i - 1 if i > 0 and self._is(i - 1, "name", "export") else i
+                end = i + 2
+                while end < len(tokens) and not (
+                    self.depth[end] == 0 and self._is(end, "punct", ";")
+                ):
+                    end += 1
+                if end == len(tokens):
+                    break
+                name = tokens[i + 1].value
+                found[name] = Declaration(
+                    name,
+                    tokens[first].start,
+                    tokens[end].end,
+                    self._leading_comments(first),
+                )
+                i = end
+            i += 1
+        self._declarations = found
+        return found
+
+    def removal(self, declaration):
+        """Span deleting a declaration, its comments and the blank lines after."""
+        last = bisect.bisect_left(self.starts, declaration.end) - 1
+        return Span(declaration.leading, self._next_start(last))
+
+    def function(self, name):
+        """The top-level `function name(...) {...}` (export default included)."""
+        tokens = self.tokens
+        for i in range(len(tokens) - 1):
+            if not (
+                self.depth[i] == 0
+                and self._is(i, "name", "function")
+                and self._is(i + 1, "name", name)
+            ):
+                continue
+            first = i
+            while first > 0 and tokens[first - 1].kind == "name" and tokens[
+                first - 1
+            ].value in ("export", "default", "async"):
+                first -= 1
+            params = i + 2
+            if not self._is(params, "punct", "(") or self.partner[params] is None:
+                return None
+            brace = self.partner[params] + 1
+            while brace < len(tokens) and not (
+                self.depth[brace] == 0 and self._is(brace, "punct", "{")
+            ):
+                brace += 1
+            close = self.partner[brace] if brace < len(tokens) else None
+            if close is None:
+                return None
+            return Function(
+                name,
+                tokens[first].start,
+                tokens[close].end,
+                Span(tokens[brace].end, tokens[close].start),
+            )
+        return None
+
+    def statements(self, within=None):
+        """Spans of the statements directly inside a span (or the file).
+
+        A statement ends at a ";" at the span's own nesting level, or at the
+        "}" closing a block (function, if/else, class, ...). Comments between
+        statements are not part of them.
+        """
+        indexes = self._range(within)
+        if not indexes:
+            return
+        level = self.depth[indexes[0]]
+        start = None
+        for i in indexes:
+            token = self.tokens[i]
+            if self.depth[i] != level:
+                continue
+            if start is None:
+                if token.kind == "comment" or self._is(i, "punct", ";"):
+                    continue
+                start = token.start
+            if self._is(i, "punct", ";") or self._closes_block(i):
+                yield Span(start, token.end)
+                start = None
+        if start is not None:
+            yield Span(start, self.tokens[indexes[-1]].end)
+
+    def find_statement(self, text, within=None):
+        """First statement whose source is exactly text, or None."""
+        for span in self.statements(within):
+            if self.source[span.start : span.end] == text:
+                return span
+        return None
+
+    def imports(self):
+        """(module, Span) of every top-level import statement."""
+        result = []
+        for span in self.statements():
+            i = bisect.bisect_left(self.starts, span.start)
+            if not self._is(i, "name", "import"):
+                continue
+            module = None
+            for j in self._range(span):
+                if self.tokens[j].kind == "string":
+                    module = self.tokens[j].value
+            result.append((module, span))
+        return result
+
+    def comment(self, text, within=None):
+        """First comment token whose text is exactly text, or None."""
+        for i in self._range(within):
+            token = self.tokens[i]
+            if token.kind == "comment" and token.value == text:
+                return token
+        return None
+
+    def find_name(self, name, within=None):
+        """First identifier token called name, or None."""
+        for i in self._range(within):
+            token = self.tokens[i]
+            if token.kind == "name" and token.value == name:
+                return token
+        return None
+
+    def strings(self, within=None):
+        """String literal, JSX attribute string and template text tokens."""
+        for i in self._range(within):
+            if self.tokens[i].kind in _STRING_KINDS:
+                yield self.tokens[i]
+
+    def jsx_texts(self, within=None):
+        """JSX text nodes that contain more than whitespace."""
+        for i in self._range(within):
+            token = self.tokens[i]
+            if token.kind == "jsx_text" and token.value.strip():
+                yield token
+
+
+class PatchSet:
+    """Span edits against one source, applied together in a single pass.
+
+    Patches may not overlap; insertions at the same offset keep the order in
+    which they were added.
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self.patches = []
+
+    def __len__(self):
+        return len(self.patches)
+
+    def replace(self, start, end, text):
+        self.patches.append((start, end, len(self.patches), text))
+
+    def insert(self, offset, text):
+        self.replace(offset, offset, text)
+
+    def delete(self, span):
+        self.replace(span.start, span.end, "")
+
+    def apply(self):
+        spans = [(start, end, text) for start, end, _, text in sorted(self.patches)]
+        parts = []
+        pos = 0
+        for start, end, text in spans:
+            if start < pos:
+                raise ValueError(f"Overlapping patches at offset {start}")
+            parts.append(self.source[pos:start])
+            parts.append(text)
+            pos = end
+        parts.append(self.source[pos:])
+        result = "".join(parts)
+        record(self.source, spans, result)
+        return result
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Watch client/src and report new hardcoded Turkish strings as pages are saved
+
+A long-running companion to extract_turkish_strings.py for pages that keep
+growing after the refactor scripts ran (VideoGenerate.tsx, Gallery.tsx, ...).
+On start every .tsx file under client/src is scanned once and kept in memory
+(source plus its Turkish string candidates), together with the translations
+index. After that, each save only rescans the file that changed, compares it
+with the copy in memory and prints the strings that are new since the last
+save, with the t() call the extractor would use:
+
+    14:02:11 pages/Gallery.tsx: 1 new untranslated string (4 ms)
+      pages/Gallery.tsx:812  "Favorilere eklendi" -> t("gallery.success.favorilereEklendi")  [new key]
+
+With --apply the page's rule tables (codemod_tables/<Page>.json and, if
+generated, codemod_tables/extracted/<path>.json) are re-applied to the lines
+that changed and the page is written back; rules whose patterns do not occur
+in the edited lines cost nothing. The full codemod scripts are not re-run:
+they assume a page that has not been refactored yet.
+
+Changes to translations.ts reload the index. Events come from inotify on
+Linux (via ctypes, no extra packages); elsewhere, or with --poll, the tree is
+polled with os.stat().
+
+Usage:
+    python3 scripts/watch_i18n.py                  # report only
+    python3 scripts/watch_i18n.py --apply          # also re-apply rule tables
+    python3 scripts/watch_i18n.py --poll 0.5       # stat polling every 0.5 s
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import json
+import os
+import select
+import struct
+import sys
+import time
+from collections import Counter, namedtuple
+
+from codemod_diff import common_prefix, common_suffix
+from codemod_io import read_page, write_page
+from codemod_tables import extracted_table_name, load_engine, table_path
+from extract_turkish_strings import (
+    CLIENT_SRC,
+    EXCLUDED_DIRS,
+    KeyAllocator,
+    discover_files,
+    propose,
+    scan_candidates,
+)
+from translations_index import TRANSLATIONS_FILE, load_index
+
+PageState = namedtuple("PageState", "source candidates")
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+INOTIFY_EVENT = struct.Struct("iIII")
+
+# Editors save several times in quick succession (write, rename, chmod)
+DEBOUNCE = 0.03
+
+
+class InotifyWatcher:
+    """Recursive inotify watch on a directory tree (Linux only)."""
+
+    MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_MOVED_FROM | IN_CREATE | IN_DELETE
+
+    def __init__(self, root):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self.fd = libc.inotify_init1(os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.directories = {}
+        self._watch_tree(root)
+
+    def _watch_tree(self, root):
+        for directory, _, _ in os.walk(root):
+            wd = self._add_watch(self.fd, os.fsencode(directory), self.MASK)
+            if wd >= 0:
+                self.directories[wd] = directory
+
+    def wait(self):
+        """Block until something changes; return the changed file paths."""
+        changed = set()
+        select.select([self.fd], [], [])
+        while True:
+            data = os.read(self.fd, 64 * 1024)
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, size = INOTIFY_EVENT.unpack_from(data, offset)
+                name = data[offset + INOTIFY_EVENT.size : offset + INOTIFY_EVENT.size + size]
+                offset += INOTIFY_EVENT.size + size
+                if mask & IN_Q_OVERFLOW:
+                    print("inotify queue overflowed; some saves may have been missed", file=sys.stderr)
+                    continue
+                directory = self.directories.get(wd)
+                if directory is None:
+                    continue
+                if mask & IN_IGNORED:
+                    del self.directories[wd]
+                    continue
+                path = os.path.join(directory, os.fsdecode(name.rstrip(b"\0")))
+                if mask & IN_ISDIR:
+                    if mask & (IN_CREATE | IN_MOVED_TO):
+                        self._watch_tree(path)
+                    continue
+                changed.add(path)
+            if not select.select([self.fd], [], [], DEBOUNCE)[0]:
+                return changed
+
+
+class PollingWatcher:
+    """Portable fallback: compare (mtime, size) of every file at an interval."""
+
+    def __init__(self, root, interval):
+        self.root = root
+        self.interval = interval
+        self.snapshot = self._scan()
+
+    def _scan(self):
+        snapshot = {}
+        for directory, _, files in os.walk(self.root):
+            for name in files:
+                path = os.path.join(directory, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def wait(self):
+        while True:
+            time.sleep(self.interval)
+            snapshot = self._scan()
+            changed = {
+                path
+                for path in snapshot.keys() | self.snapshot.keys()
+                if snapshot.get(path) != self.snapshot.get(path)
+            }
+            self.snapshot = snapshot
+            if changed:
+                return changed
+
+
+def new_candidates(before, after):
+    """Indexes of candidates in after whose text was not in before (by count)."""
+    remaining = Counter(candidate.text for candidate in before)
+    fresh = []
+    for i, candidate in enumerate(after):
+        if remaining[candidate.text]:
+            remaining[candidate.text] -= 1
+        else:
+            fresh.append(i)
+    return fresh
+
+
+def table_names(rel_path):
+    """Rule tables that target a client/src file, if any exist."""
+    names = [os.path.splitext(os.path.basename(rel_path))[0]]
+    names.append(extracted_table_name(rel_path))
+    return [name for name in names if os.path.exists(table_path(name))]
+
+
+def changed_lines(before, after):
+    """[start, end) of the whole lines of after that differ from before."""
+    prefix = common_prefix(before, after)
+    suffix = common_suffix(before, after, min(len(before), len(after)) - prefix)
+    start = after.rfind("\n", 0, prefix) + 1
+    newline = after.find("\n", len(after) - suffix)
+    return start, len(after) if newline == -1 else newline + 1
+
+
+class Watcher:
+    def __init__(self, apply=False):
+        self.apply = apply
+        self.index = load_index()
+        self.pages = {}
+
+    def load(self):
+        started = time.perf_counter()
+        for path, _ in discover_files([]):
+            source = read_page(path)
+            self.pages[path] = PageState(source, list(scan_candidates(source)))
+        elapsed = time.perf_counter() - started
+        strings = sum(len(page.candidates) for page in self.pages.values())
+        print(
+            f"Watching {len(self.pages)} pages, {strings} untranslated strings, "
+            f"{len(self.index)} keys ({elapsed:.2f}s)"
+        )
+
+    def reapply(self, path, rel_path, before, source):
+        """Re-apply the page's rule tables to the lines changed since before."""
+        names = table_names(rel_path)
+        if not names:
+            return source
+        start, end = changed_lines(before, source)
+        window = source[start:end]
+        applied = 0
+        for name in names:
+            with open(table_path(name), "r", encoding="utf-8") as f:
+                rulesets = json.load(f)["rulesets"]
+            for ruleset in rulesets:
+                window, hits = load_engine(name, ruleset).apply(window)
+                applied += sum(hits)
+        if not applied:
+            return source
+        source = source[:start] + window + source[end:]
+        write_page(path, source)
+        first = source.count("\n", 0, start) + 1
+        print(f"  re-applied {applied} replacements from {', '.join(names)} at line {first}")
+        return source
+
+    def update(self, path):
+        rel_path = os.path.relpath(path, CLIENT_SRC).replace(os.sep, "/")
+        started = time.perf_counter()
+        try:
+            source = read_page(path)
+        except FileNotFoundError:
+            if self.pages.pop(path, None) is not None:
+                print(f"{time.strftime('%H:%M:%S')} {rel_path}: removed")
+            return
+        previous = self.pages.get(path)
+        if previous is not None and previous.source == source:
+            return  # touched, or our own --apply write
+        if self.apply and previous is not None:
+            source = self.reapply(path, rel_path, previous.source, source)
+
+        candidates = list(scan_candidates(source))
+        self.pages[path] = PageState(source, candidates)
+        fresh = new_candidates(previous.candidates if previous else [], candidates)
+        elapsed = (time.perf_counter() - started) * 1000
+        stamp = time.strftime("%H:%M:%S")
+        if not fresh:
+            print(f"{stamp} {rel_path}: no new untranslated strings ({elapsed:.0f} ms)")
+            return
+        proposals = propose(rel_path, source, KeyAllocator(self.index), candidates)
+        noun = "string" if len(fresh) == 1 else "strings"
+        print(f"{stamp} {rel_path}: {len(fresh)} new untranslated {noun} ({elapsed:.0f} ms)")
+        for i in fresh:
+            proposal = proposals[i]
+            status = "existing key" if proposal.key in self.index else "new key"
+            where = "module scope, needs manual work" if proposal.module_scope else status
+            text = json.dumps(proposal.text, ensure_ascii=False)
+            print(f"  {rel_path}:{proposal.line}  {text} -> {proposal.new}  [{where}]")
+
+    def handle(self, paths):
+        for path in sorted(paths):
+            if os.path.abspath(path) == TRANSLATIONS_FILE:
+                if os.path.exists(path):
+                    self.index = load_index()
+                    print(f"{time.strftime('%H:%M:%S')} translations.ts reloaded ({len(self.index)} keys)")
+                continue
+            rel_path = os.path.relpath(path, CLIENT_SRC).replace(os.sep, "/")
+            if path.endswith(".tsx") and not rel_path.startswith(EXCLUDED_DIRS):
+                self.update(path)
+
+
+def make_watcher(root, poll):
+    if poll is None and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(root)
+        except (OSError, AttributeError) as exc:
+            print(f"inotify unavailable ({exc}); polling instead", file=sys.stderr)
+    return PollingWatcher(root, poll or 0.5)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report new hardcoded Turkish strings on save")
+    parser.add_argument("--apply", action="store_true", help="re-apply the page's rule tables to edited lines")
+    parser.add_argument("--poll", type=float, default=None, metavar="SECONDS", help="poll instead of using inotify")
+    args = parser.parse_args(argv)
+
+    watcher = Watcher(apply=args.apply)
+    events = make_watcher(CLIENT_SRC, args.poll)
+    watcher.load()
+    try:
+        while True:
+            watcher.handle(events.wait())
+            sys.stdout.flush()
+    except KeyboardInterrupt:
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,13 +2,26 @@
 import type { CreateExpressContextOptions } from "@trpc/server/adapters/express";
 import type { User } from "../../drizzle/schema";
 import { authenticateRequest } from "./auth";
+import type { ErrorLanguage } from "../utils/errorTranslations";
 
 export type TrpcContext = {
   req: CreateExpressContextOptions["req"];
   res: CreateExpressContextOptions["res"];
   user: User | null;
+  // Kullanıcıya dönen hata mesajlarının dili
+  language: ErrorLanguage;
 };
 
+// İstemci seçili arayüz dilini X-Language başlığıyla gönderir; başlık yoksa
+// (eski istemci, harici çağrı) Accept-Language'a bakılır
+function requestLanguage(
+  req: CreateExpressContextOptions["req"]
+): ErrorLanguage {
+  const header = req.headers["x-language"] ?? req.headers["accept-language"];
+  const value = Array.isArray(header) ? header[0] : header;
+  return value?.trim().toLowerCase().startsWith("en") ? "en" : "tr";
+}
+
 export async function createContext(
   opts: CreateExpressContextOptions
 ): Promise<TrpcContext> {
@@ -30,5 +43,6 @@ export async function createContext(
     req: opts.req,
     res: opts.res,
     user,
+    language: requestLanguage(opts.req),
   };
 }
@@ -6,6 +6,8 @@ export const ENV = {
   ownerOpenId: process.env.OWNER_OPEN_ID ?? "",
   isProduction: process.env.NODE_ENV === "production",
   kieAiApiKey: process.env.KIE_AI_API_KEY ?? "",
+  // Public URL of /api/kie/callback; video tasks report completion there
+  kieCallbackUrl: process.env.KIE_CALLBACK_URL ?? "",
   clerkSecretKey: process.env.CLERK_SECRET_KEY ?? "",
   clerkPublishableKey: process.env.VITE_CLERK_PUBLISHABLE_KEY ?? "",
   forgeApiKey: process.env.FORGE_API_KEY ?? "",
@@ -22,6 +24,11 @@ export const ENV = {
   googleAuthEnabled:
     process.env.GOOGLE_AUTH_ENABLED !== "false" &&
     process.env.GOOGLE_AUTH_ENABLED !== "0", // Default: true
+  // Background jobs: set to "false" on web instances when a separate
+  // worker process (ecosystem.config.cjs) claims the jobQueue
+  jobWorkerEnabled:
+    process.env.JOB_WORKER_ENABLED !== "false" &&
+    process.env.JOB_WORKER_ENABLED !== "0", // Default: true
   // Audio AI providers
   minimaxApiKey: process.env.MINIMAX_API_KEY ?? "",
   elevenlabsApiKey: process.env.ELEVENLABS_API_KEY ?? "",
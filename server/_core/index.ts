@@ -17,8 +17,14 @@ import { createContext } from "./context";
 import { serveStatic, setupVite } from "./vite";
 import { storagePut } from "../storage";
 import { nanoid } from "nanoid";
-import { initializeTelegramBot, startTelegramBot } from "../telegramBot";
+import {
+  initializeTelegramBot,
+  startTelegramBot,
+  stopTelegramBot,
+} from "../telegramBot";
 import { startVideoStatusUpdater } from "../videoStatusUpdater";
+import { startJobWorker } from "../jobWorker";
+import { registerShutdownHandlers } from "./shutdown";
 // @ts-ignore - busboy doesn't have TypeScript definitions
 import busboy from "busboy";
 
@@ -54,6 +60,10 @@ async function startServer() {
   app.use(express.json({ limit: "250mb" }));
   app.use(express.urlencoded({ limit: "250mb", extended: true }));
 
+  // Kie.ai video callback'leri (KIE_CALLBACK_URL ayarlıysa kullanılır)
+  const kieCallbackRouter = (await import("../routes/kieCallback")).default;
+  app.use(kieCallbackRouter);
+
   // Static file serving for local uploads
   app.use("/uploads", express.static(path.join(process.cwd(), "uploads")));
 
@@ -432,6 +442,13 @@ async function startServer() {
 
   // Start video status updater background job
   startVideoStatusUpdater();
+
+  // Claim queued generation jobs (no-op when JOB_WORKER_ENABLED=false)
+  startJobWorker();
+
+  // Stop the bot, let claimed jobs finish and write buffered model stats
+  // before PM2 stops or reloads the process
+  registerShutdownHandlers([stopTelegramBot]);
 }
 
 startServer().catch(console.error);
@@ -0,0 +1,63 @@
+import { describe, it, expect, vi } from "vitest";
+
+const { calls } = vi.hoisted(() => ({ calls: [] as string[] }));
+
+vi.mock("../jobWorker", () => ({
+  stopJobWorker: vi.fn(async () => {
+    calls.push("stopJobWorker");
+  }),
+}));
+
+vi.mock("../db", () => ({
+  flushAiModelStats: vi.fn(async () => {
+    calls.push("flushAiModelStats");
+  }),
+  pendingAiModelStatsCount: () => 0,
+}));
+
+import { registerShutdownHandlers } from "./shutdown";
+
+describe("registerShutdownHandlers", () => {
+  it("stops, flushes and exits once, logging repeated signals", async () => {
+    const listeners = new Map<string, () => void>();
+    vi.spyOn(process, "on").mockImplementation(((
+      signal: string,
+      listener: () => void
+    ) => {
+      listeners.set(signal, listener);
+      return process;
+    }) as typeof process.on);
+    const exit = vi
+      .spyOn(process, "exit")
+      .mockImplementation((() => calls.push("exit")) as never);
+    const warn = vi.spyOn(console, "warn").mockImplementation(() => {});
+    vi.spyOn(console, "log").mockImplementation(() => {});
+    const error = vi.spyOn(console, "error").mockImplementation(() => {});
+
+    registerShutdownHandlers([
+      () => {
+        throw new Error("bot already stopped");
+      },
+      signal => calls.push(`step:${signal}`),
+    ]);
+    listeners.get("SIGTERM")!();
+    listeners.get("SIGINT")!();
+    await vi.waitFor(() => expect(exit).toHaveBeenCalled());
+
+    expect(calls).toEqual([
+      "step:SIGTERM",
+      "stopJobWorker",
+      "flushAiModelStats",
+      "exit",
+    ]);
+    expect(exit).toHaveBeenCalledTimes(1);
+    expect(error).toHaveBeenCalledWith(
+      "[Shutdown] Shutdown step failed:",
+      expect.any(Error)
+    );
+    expect(warn).toHaveBeenCalledWith(
+      "[Shutdown] SIGINT received again, still shutting down"
+    );
+    vi.restoreAllMocks();
+  });
+});
@@ -0,0 +1,54 @@
+// Graceful shutdown shared by the web server and the standalone worker
+//
+// PM2 stop/reload sırasında SIGINT veya SIGTERM gelir. Tek bir handler
+// sırayla ek adımları çalıştırır, çalışan işlerin bitmesini bekler, buffer'daki
+// model istatistiklerini yazar ve ancak ondan sonra çıkar. Kapanış sürerken
+// gelen ikinci sinyal yalnızca loglanır; Node'un varsayılan handler'ı süreci
+// flush'ın ortasında öldürmez.
+import { stopJobWorker } from "../jobWorker";
+import { flushAiModelStats, pendingAiModelStatsCount } from "../db";
+
+type ShutdownStep = (signal: NodeJS.Signals) => unknown;
+
+let shuttingDown = false;
+
+async function runStep(name: string, step: () => unknown) {
+  try {
+    await step();
+  } catch (error) {
+    console.error(`[Shutdown] ${name} failed:`, error);
+  }
+}
+
+async function shutdown(signal: NodeJS.Signals, steps: ShutdownStep[]) {
+  if (shuttingDown) {
+    console.warn(`[Shutdown] ${signal} received again, still shutting down`);
+    return;
+  }
+  shuttingDown = true;
+  console.log(`[Shutdown] ${signal} received, shutting down`);
+
+  for (const step of steps) {
+    await runStep(step.name || "Shutdown step", () => step(signal));
+  }
+  await runStep("Stopping the job worker", () => stopJobWorker());
+  await runStep("Flushing model stats", flushAiModelStats);
+
+  const unwritten = pendingAiModelStatsCount();
+  if (unwritten > 0) {
+    console.error(
+      `[Shutdown] Buffered stats for ${unwritten} model(s) could not be written and are lost`
+    );
+  }
+  process.exit(0);
+}
+
+/**
+ * Handle SIGINT/SIGTERM with one shutdown routine. `steps` run first, in
+ * order, e.g. to stop services only this process started.
+ */
+export function registerShutdownHandlers(steps: ShutdownStep[] = []) {
+  for (const signal of ["SIGINT", "SIGTERM"] as const) {
+    process.on(signal, () => void shutdown(signal, steps));
+  }
+}
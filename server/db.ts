@@ -15,23 +15,34 @@ import {
   favorites,
   InsertFavorite,
   aiModelConfig,
+  aiModelRenderTimeBuckets,
   siteSettings,
   featurePricing,
   generatedAudio,
   generatedMusic,
 } from "../drizzle/schema";
 import { ENV } from "./_core/env";
+import { TtlLruCache } from "./utils/ttlLruCache";
+import {
+  renderTimeBucket,
+  renderTimeQuantile,
+} from "./utils/renderTimeHistogram";
 
 let _db: ReturnType<typeof drizzle> | null = null;
 const SETTINGS_CACHE_TTL_MS = 60_000;
-const signupBonusCache = {
-  value: 25,
-  expiresAt: 0,
-};
-const featurePricingCache = new Map<
-  string,
-  { credits: number; expiresAt: number }
->();
+// Settings, pricing and model config rows; small tables, read on every request
+const settingsCache = new TtlLruCache<unknown>({
+  maxEntries: 500,
+  ttlMs: SETTINGS_CACHE_TTL_MS,
+});
+// Admin changes bump this systemSettings row; every instance compares it at
+// most once per SETTINGS_VERSION_CHECK_MS and drops its cache when it moved
+const SETTINGS_VERSION_KEY = "settings_cache_version";
+const SETTINGS_VERSION_CHECK_MS = 5_000;
+// undefined until the first check; null while the row does not exist yet
+let settingsVersion: string | null | undefined;
+let settingsVersionCheckedAt = 0;
+let settingsVersionCheck: Promise<void> | null = null;
 
 function normalizeEmail(email: string): string {
   return email.trim().toLowerCase();
@@ -59,41 +70,127 @@ export async function getDb() {
   return _db;
 }
 
+async function syncSettingsVersion(db: NonNullable<typeof _db>) {
+  if (Date.now() - settingsVersionCheckedAt < SETTINGS_VERSION_CHECK_MS) {
+    return;
+  }
+  if (!settingsVersionCheck) {
+    settingsVersionCheck = (async () => {
+      try {
+        const [row] = await db
+          .select({ value: systemSettings.value })
+          .from(systemSettings)
+          .where(eq(systemSettings.key, SETTINGS_VERSION_KEY))
+          .limit(1);
+        const version = row?.value ?? null;
+        if (settingsVersion !== undefined && version !== settingsVersion) {
+          settingsCache.clear();
+        }
+        settingsVersion = version;
+      } catch (error) {
+        console.error("[Database] Failed to check settings version:", error);
+      } finally {
+        settingsVersionCheckedAt = Date.now();
+        settingsVersionCheck = null;
+      }
+    })();
+  }
+  await settingsVersionCheck;
+}
+
 /**
- * Get the signup bonus credits from site settings
- * Returns the configured value or 25 as default
+ * Read a settings-like value through the shared cache. Falls back to the last
+ * cached value (even if expired) or `fallback` when the database is down.
  */
-export async function getSignupBonusCredits(): Promise<number> {
-  if (signupBonusCache.expiresAt > Date.now()) {
-    return signupBonusCache.value;
+async function cachedSetting<T>(
+  key: string,
+  load: (db: NonNullable<typeof _db>) => Promise<T>,
+  fallback: T
+): Promise<T> {
+  const db = await getDb();
+  if (!db) return (settingsCache.peek(key) as T | undefined) ?? fallback;
+
+  await syncSettingsVersion(db);
+  try {
+    return (await settingsCache.get(key, () => load(db))) as T;
+  } catch (error) {
+    console.error(`[Database] Failed to load ${key}:`, error);
+    return (settingsCache.peek(key) as T | undefined) ?? fallback;
   }
+}
+
+/**
+ * Drop cached settings here and tell the other instances to do the same.
+ * Call after writing siteSettings, systemSettings, featurePricing or
+ * aiModelConfig.
+ */
+export async function publishSettingsChange(): Promise<void> {
+  settingsCache.clear();
 
   const db = await getDb();
-  if (!db) return signupBonusCache.value; // Default fallback
+  if (!db) return;
 
   try {
-    const result = await db
-      .select({ value: siteSettings.value })
-      .from(siteSettings)
-      .where(eq(siteSettings.key, "signup_bonus_credits"))
-      .limit(1);
-
-    if (result.length > 0 && result[0].value) {
-      const credits = parseInt(result[0].value, 10);
-      if (!isNaN(credits) && credits >= 0) {
-        signupBonusCache.value = credits;
-        signupBonusCache.expiresAt = Date.now() + SETTINGS_CACHE_TTL_MS;
-        return credits;
-      }
-    }
-    signupBonusCache.expiresAt = Date.now() + SETTINGS_CACHE_TTL_MS;
-    return signupBonusCache.value;
+    await db
+      .insert(systemSettings)
+      .values({
+        key: SETTINGS_VERSION_KEY,
+        value: "1",
+        description: "Bumped on admin settings changes to refresh caches",
+      })
+      .onDuplicateKeyUpdate({
+        set: { value: sql`CAST(${systemSettings.value} AS UNSIGNED) + 1` },
+      });
   } catch (error) {
-    console.error("[Database] Failed to get signup bonus credits:", error);
-    return signupBonusCache.value;
+    console.error("[Database] Failed to publish settings change:", error);
   }
 }
 
+export function getSettingsCacheStats() {
+  return { ...settingsCache.stats(), version: settingsVersion ?? null };
+}
+
+/**
+ * All siteSettings rows keyed by setting key (one cached query)
+ */
+export async function getSiteSettings(): Promise<
+  Map<string, { value: string | null; isPublic: number | null }>
+> {
+  return cachedSetting(
+    "site_settings",
+    async db => {
+      const rows = await db
+        .select({
+          key: siteSettings.key,
+          value: siteSettings.value,
+          isPublic: siteSettings.isPublic,
+        })
+        .from(siteSettings);
+      return new Map(
+        rows.map(row => [
+          row.key,
+          { value: row.value, isPublic: row.isPublic },
+        ])
+      );
+    },
+    new Map()
+  );
+}
+
+export async function getSiteSetting(key: string): Promise<string | null> {
+  return (await getSiteSettings()).get(key)?.value ?? null;
+}
+
+/**
+ * Get the signup bonus credits from site settings
+ * Returns the configured value or 25 as default
+ */
+export async function getSignupBonusCredits(): Promise<number> {
+  const value = await getSiteSetting("signup_bonus_credits");
+  const credits = parseInt(value ?? "", 10);
+  return !isNaN(credits) && credits >= 0 ? credits : 25;
+}
+
 /**
  * Get feature pricing by feature key from database
  * Returns the configured credit cost or default fallback
@@ -102,43 +199,24 @@ export async function getFeaturePricingByKey(
   featureKey: string,
   defaultValue: number = 50
 ): Promise<number> {
-  const cached = featurePricingCache.get(featureKey);
-  if (cached && cached.expiresAt > Date.now()) {
-    return cached.credits;
-  }
-
-  const db = await getDb();
-  if (!db) return cached?.credits ?? defaultValue; // Default fallback
-
-  try {
-    const result = await db
-      .select({
-        credits: featurePricing.credits,
-        isActive: featurePricing.isActive,
-      })
-      .from(featurePricing)
-      .where(eq(featurePricing.featureKey, featureKey))
-      .limit(1);
+  return cachedSetting(
+    `feature_pricing:${featureKey}`,
+    async db => {
+      const result = await db
+        .select({
+          credits: featurePricing.credits,
+          isActive: featurePricing.isActive,
+        })
+        .from(featurePricing)
+        .where(eq(featurePricing.featureKey, featureKey))
+        .limit(1);
 
-    if (result.length > 0 && result[0].isActive) {
-      featurePricingCache.set(featureKey, {
-        credits: result[0].credits,
-        expiresAt: Date.now() + SETTINGS_CACHE_TTL_MS,
-      });
-      return result[0].credits;
-    }
-    featurePricingCache.set(featureKey, {
-      credits: defaultValue,
-      expiresAt: Date.now() + SETTINGS_CACHE_TTL_MS,
-    });
-    return defaultValue; // Default fallback
-  } catch (error) {
-    console.error(
-      `[Database] Failed to get feature pricing for ${featureKey}:`,
-      error
-    );
-    return cached?.credits ?? defaultValue; // Default fallback
-  }
+      return result.length > 0 && result[0].isActive
+        ? result[0].credits
+        : defaultValue;
+    },
+    defaultValue
+  );
 }
 
 export async function upsertUser(user: InsertUser): Promise<void> {
@@ -1051,20 +1129,18 @@ export async function getCreditTransactions(
  * Get system setting
  */
 export async function getSystemSetting(key: string): Promise<string | null> {
-  const db = await getDb();
-  if (!db) return null;
-
-  try {
-    const result = await db
-      .select({ value: systemSettings.value })
-      .from(systemSettings)
-      .where(eq(systemSettings.key, key))
-      .limit(1);
-    return result.length > 0 ? result[0].value : null;
-  } catch (error) {
-    console.error("[Database] Failed to get system setting:", error);
-    return null;
-  }
+  return cachedSetting(
+    `system_setting:${key}`,
+    async db => {
+      const result = await db
+        .select({ value: systemSettings.value })
+        .from(systemSettings)
+        .where(eq(systemSettings.key, key))
+        .limit(1);
+      return result.length > 0 ? result[0].value : null;
+    },
+    null
+  );
 }
 
 // User Prompt Templates
@@ -1135,6 +1211,7 @@ export async function updateSystemSetting(
       await db.insert(systemSettings).values({ key, value, description });
     }
 
+    await publishSettingsChange();
     return true;
   } catch (error) {
     console.error("[Database] Failed to update system setting:", error);
@@ -2436,8 +2513,62 @@ export async function getVideoFavorites(userId: number, limit: number = 50) {
   }
 }
 
+// ─── AI Model Stats ───────────────────────────────────────────────────────────
+
+// Üretim sonuçları süreç içinde model bazında toplanır ve periyodik olarak
+// upsert ile yazılır. Aritmetik SQL'de yapıldığı için aynı modeli güncelleyen
+// süreçler birbirinin sayaçlarını ezmez; satır yoksa upsert onu oluşturur.
+const MODEL_STATS_FLUSH_INTERVAL = 10 * 1000;
+
+type ModelStatsDelta = {
+  requests: number;
+  successes: number;
+  failures: number;
+  // Süresi bilinen başarılı üretimler
+  renderTimeSumMs: number;
+  renderTimeCount: number;
+  costUsd: number;
+  // Maliyeti verilmeyen başarılı üretimler, SQL'de costPerRequest ile çarpılır
+  defaultCostRequests: number;
+  // renderTimeBucket -> üretim sayısı
+  renderTimeBuckets: Map<number, number>;
+};
+
+let pendingModelStats = new Map<string, ModelStatsDelta>();
+let modelStatsFlushTimer: NodeJS.Timeout | null = null;
+let modelStatsFlush: Promise<void> | null = null;
+
+function scheduleModelStatsFlush() {
+  if (modelStatsFlushTimer) return;
+  modelStatsFlushTimer = setTimeout(() => {
+    modelStatsFlushTimer = null;
+    void flushAiModelStats();
+  }, MODEL_STATS_FLUSH_INTERVAL);
+  // Script'lerin kapanmasını engellemesin
+  modelStatsFlushTimer.unref();
+}
+
+function pendingModelStatsFor(modelKey: string): ModelStatsDelta {
+  let delta = pendingModelStats.get(modelKey);
+  if (!delta) {
+    delta = {
+      requests: 0,
+      successes: 0,
+      failures: 0,
+      renderTimeSumMs: 0,
+      renderTimeCount: 0,
+      costUsd: 0,
+      defaultCostRequests: 0,
+      renderTimeBuckets: new Map(),
+    };
+    pendingModelStats.set(modelKey, delta);
+  }
+  return delta;
+}
+
 /**
- * Update AI Model Stats
+ * Record the outcome of a generation. Stats are buffered per model and
+ * written by flushAiModelStats() within MODEL_STATS_FLUSH_INTERVAL.
  */
 export async function updateAiModelStats(
   modelKey: string,
@@ -2445,102 +2576,203 @@ export async function updateAiModelStats(
   renderTimeMs?: number,
   costUsd?: number
 ) {
+  const delta = pendingModelStatsFor(modelKey);
+  delta.requests++;
+  if (success) {
+    delta.successes++;
+  } else {
+    delta.failures++;
+  }
+
+  if (success && renderTimeMs) {
+    delta.renderTimeSumMs += renderTimeMs;
+    delta.renderTimeCount++;
+    const bucket = renderTimeBucket(renderTimeMs);
+    delta.renderTimeBuckets.set(
+      bucket,
+      (delta.renderTimeBuckets.get(bucket) ?? 0) + 1
+    );
+  }
+
+  if (costUsd !== undefined) {
+    delta.costUsd += costUsd;
+  } else if (success) {
+    delta.defaultCostRequests++;
+  }
+
+  scheduleModelStatsFlush();
+}
+
+function modelStatsUpsert(modelKey: string, delta: ModelStatsDelta) {
+  // Config'de olmayan modeller için stub satır
+  const modelName = modelKey.replace(/[_-]/g, " ").toUpperCase();
+  const modelType = /video|veo|kling|grok|sora/.test(modelKey)
+    ? "video"
+    : "image";
+  const avgRenderTimeMs =
+    delta.renderTimeCount > 0
+      ? Math.round(delta.renderTimeSumMs / delta.renderTimeCount)
+      : 0;
+
+  // MySQL atamaları soldan sağa uygular: ortalama, successfulRequests
+  // artırılmadan önce eski değerle ağırlıklandırılmalı
+  return sql`
+    INSERT INTO ${aiModelConfig} (
+      modelKey, modelName, modelType, provider, totalRequests,
+      successfulRequests, failedRequests, avgRenderTimeMs, totalCostUsd
+    )
+    VALUES (
+      ${modelKey}, ${modelName}, ${modelType}, 'system', ${delta.requests},
+      ${delta.successes}, ${delta.failures}, ${avgRenderTimeMs},
+      ${delta.costUsd}
+    )
+    ON DUPLICATE KEY UPDATE
+      avgRenderTimeMs = IF(
+        ${delta.renderTimeCount} > 0,
+        ROUND(
+          (COALESCE(avgRenderTimeMs, 0) * successfulRequests
+            + ${delta.renderTimeSumMs})
+            / (successfulRequests + ${delta.successes})
+        ),
+        avgRenderTimeMs
+      ),
+      totalCostUsd = COALESCE(totalCostUsd, 0) + ${delta.costUsd}
+        + COALESCE(costPerRequest, 0) * ${delta.defaultCostRequests},
+      totalRequests = totalRequests + ${delta.requests},
+      successfulRequests = successfulRequests + ${delta.successes},
+      failedRequests = failedRequests + ${delta.failures}
+  `;
+}
+
+async function writePendingModelStats() {
+  if (pendingModelStats.size === 0) return;
   const db = await getDb();
   if (!db) return;
 
+  const batch = pendingModelStats;
+  pendingModelStats = new Map();
+
+  const bucketRows: Array<{
+    modelKey: string;
+    bucket: number;
+    sampleCount: number;
+  }> = [];
+  batch.forEach((delta, modelKey) => {
+    delta.renderTimeBuckets.forEach((sampleCount, bucket) => {
+      bucketRows.push({ modelKey, bucket, sampleCount });
+    });
+  });
+
   try {
-    const { aiModelConfig } = await import("../drizzle/schema");
+    await db.transaction(async tx => {
+      for (const [modelKey, delta] of Array.from(batch)) {
+        await tx.execute(modelStatsUpsert(modelKey, delta));
+      }
+      if (bucketRows.length > 0) {
+        await tx
+          .insert(aiModelRenderTimeBuckets)
+          .values(bucketRows)
+          .onDuplicateKeyUpdate({
+            set: {
+              sampleCount: sql`${aiModelRenderTimeBuckets.sampleCount} + VALUES(${aiModelRenderTimeBuckets.sampleCount})`,
+            },
+          });
+      }
+    });
+  } catch (error) {
+    console.error("[Database] Failed to flush AI model stats:", error);
+    // Transaction geri alındı; sayımlar bir sonraki flush'ta tekrar denenir
+    batch.forEach((delta, modelKey) => {
+      const pending = pendingModelStatsFor(modelKey);
+      pending.requests += delta.requests;
+      pending.successes += delta.successes;
+      pending.failures += delta.failures;
+      pending.renderTimeSumMs += delta.renderTimeSumMs;
+      pending.renderTimeCount += delta.renderTimeCount;
+      pending.costUsd += delta.costUsd;
+      pending.defaultCostRequests += delta.defaultCostRequests;
+      delta.renderTimeBuckets.forEach((count, bucket) => {
+        pending.renderTimeBuckets.set(
+          bucket,
+          (pending.renderTimeBuckets.get(bucket) ?? 0) + count
+        );
+      });
+    });
+    scheduleModelStatsFlush();
+  }
+}
 
-    // Normalize model key if needed (e.g. replace dashes with underscores for consistency if that's the convention)
-    // For now we'll assume keys are consistent.
+/**
+ * Write buffered model stats now, e.g. before the process exits. Flushes
+ * run one at a time so a retry never races the batch it is retrying.
+ */
+export function flushAiModelStats(): Promise<void> {
+  const flush = (modelStatsFlush ?? Promise.resolve()).then(
+    writePendingModelStats
+  );
+  modelStatsFlush = flush;
+  return flush.finally(() => {
+    if (modelStatsFlush === flush) modelStatsFlush = null;
+  });
+}
 
-    // Check if model exists
-    const model = await db
-      .select()
-      .from(aiModelConfig)
-      .where(eq(aiModelConfig.modelKey, modelKey))
-      .limit(1);
+/** Number of models whose buffered stats are not written yet */
+export function pendingAiModelStatsCount(): number {
+  return pendingModelStats.size;
+}
 
-    if (model.length === 0) {
-      // If model doesn't exist in config, we could optionally create it or just ignore
-      // For proper stats we should probably ensure it exists.
-      // Let's create a stub if it doesn't exist
-      await db.insert(aiModelConfig).values({
-        modelKey,
-        modelName: modelKey.replace(/_/g, " ").replace(/-/g, " ").toUpperCase(),
-        modelType:
-          modelKey.includes("video") ||
-          modelKey.includes("veo") ||
-          modelKey.includes("kling") ||
-          modelKey.includes("grok") ||
-          modelKey.includes("sora")
-            ? "video"
-            : "image",
-        provider: "system",
-        totalRequests: 1,
-        successfulRequests: success ? 1 : 0,
-        failedRequests: success ? 0 : 1,
-        avgRenderTimeMs: success && renderTimeMs ? renderTimeMs : 0,
-        totalCostUsd: costUsd ? String(costUsd) : "0",
-      });
-      return;
-    }
+type ModelRenderPercentiles = {
+  p50RenderTimeMs: number | null;
+  p95RenderTimeMs: number | null;
+  renderTimeSamples: number;
+};
 
-    const currentReqs = model[0].totalRequests || 0;
-    const currentSuccess = model[0].successfulRequests || 0;
-    const currentFailed = model[0].failedRequests || 0;
-    const currentAvgTime = model[0].avgRenderTimeMs || 0;
-    const currentTotalCost = Number(model[0].totalCostUsd || 0);
-    const costPerRequest = Number(model[0].costPerRequest || 0);
-
-    const newReqs = currentReqs + 1;
-    const newSuccess = success ? currentSuccess + 1 : currentSuccess;
-    const newFailed = success ? currentFailed : currentFailed + 1;
-
-    // Calculate new average render time
-    let newAvgTime = currentAvgTime;
-    if (renderTimeMs && success) {
-      // Avoid division by zero
-      const validSuccessCount = newSuccess > 0 ? newSuccess : 1;
-      // Weighted average: ((old_avg * old_success) + new_time) / new_success
-      newAvgTime = Math.round(
-        (currentAvgTime * currentSuccess + renderTimeMs) / validSuccessCount
-      );
-    }
+/**
+ * p50/p95 render time per model key, read from the render time histogram
+ */
+export async function getAiModelRenderPercentiles(): Promise<
+  Record<string, ModelRenderPercentiles>
+> {
+  const db = await getDb();
+  if (!db) return {};
 
-    const actualCost =
-      costUsd !== undefined ? costUsd : success ? costPerRequest : 0;
-    const newTotalCost = currentTotalCost + actualCost;
+  try {
+    const rows = await db.select().from(aiModelRenderTimeBuckets);
+    const byModel = new Map<string, Array<[number, number]>>();
+    for (const row of rows) {
+      const counts = byModel.get(row.modelKey) ?? [];
+      counts.push([row.bucket, row.sampleCount]);
+      byModel.set(row.modelKey, counts);
+    }
 
-    await db
-      .update(aiModelConfig)
-      .set({
-        totalRequests: newReqs,
-        successfulRequests: newSuccess,
-        failedRequests: newFailed,
-        avgRenderTimeMs: newAvgTime,
-        totalCostUsd: String(newTotalCost),
-      })
-      .where(eq(aiModelConfig.modelKey, modelKey));
+    const percentiles: Record<string, ModelRenderPercentiles> = {};
+    byModel.forEach((counts, modelKey) => {
+      percentiles[modelKey] = {
+        p50RenderTimeMs: renderTimeQuantile(counts, 0.5),
+        p95RenderTimeMs: renderTimeQuantile(counts, 0.95),
+        renderTimeSamples: counts.reduce((sum, [, count]) => sum + count, 0),
+      };
+    });
+    return percentiles;
   } catch (error) {
-    console.error("[Database] Failed to update AI model stats:", error);
+    console.error("[Database] Failed to get render percentiles:", error);
+    return {};
   }
 }
 
 export async function getAiModelConfig(modelKey: string) {
-  const db = await getDb();
-  if (!db) return null;
-  try {
-    const { aiModelConfig } = await import("../drizzle/schema");
-    const [model] = await db
-      .select()
-      .from(aiModelConfig)
-      .where(eq(aiModelConfig.modelKey, modelKey))
-      .limit(1);
-    return model ?? null;
-  } catch {
-    return null;
-  }
+  return cachedSetting(
+    `ai_model:${modelKey}`,
+    async db => {
+      const [model] = await db
+        .select()
+        .from(aiModelConfig)
+        .where(eq(aiModelConfig.modelKey, modelKey))
+        .limit(1);
+      return model ?? null;
+    },
+    null
+  );
 }
 
 // ─── Audio Generation ─────────────────────────────────────────────────────────
@@ -0,0 +1,207 @@
+import { describe, it, expect, vi, beforeEach, afterEach } from "vitest";
+
+// Sorgu koşullarını yorumlamayan basit bir drizzle sahtesi: kilitli select
+// kuyruktaki ilk `limit` işi, kilitsiz limitli select lease'i dolmuş işleri
+// döner, update'ler kaydedilir.
+const { fakeDb, queued, stale, updates } = vi.hoisted(() => {
+  const queued: Array<Record<string, unknown>> = [];
+  const stale: Array<Record<string, unknown>> = [];
+  const updates: Array<Record<string, unknown>> = [];
+  let claimed: Array<Record<string, unknown>> = [];
+
+  function query(kind: "select" | "update", fields?: unknown) {
+    let limit = Infinity;
+    let locked = false;
+    let values: Record<string, unknown> = {};
+    const chain = {
+      from: () => chain,
+      where: () => chain,
+      orderBy: () => chain,
+      limit: (n: number) => ((limit = n), chain),
+      for: () => ((locked = true), chain),
+      set: (v: Record<string, unknown>) => ((values = v), chain),
+      then(resolve: (value: unknown) => void) {
+        if (kind === "update") {
+          updates.push(values);
+          if (values.status === "processing") {
+            claimed.forEach(job => (job.attempts = Number(job.attempts) + 1));
+          }
+          resolve([{ affectedRows: 1 }]);
+        } else if (locked) {
+          claimed = queued.splice(0, limit);
+          resolve(claimed.map(job => ({ id: job.id })));
+        } else if (limit !== Infinity) {
+          resolve(stale.splice(0, limit));
+        } else {
+          resolve(fields ? [] : claimed);
+        }
+      },
+    };
+    return chain;
+  }
+
+  const fakeDb = {
+    select: (fields?: unknown) => query("select", fields),
+    update: () => query("update"),
+    insert: () => ({ values: async () => [{ insertId: 1 }] }),
+    transaction: async (fn: (tx: unknown) => unknown) => fn(fakeDb),
+  };
+  return { fakeDb, queued, stale, updates };
+});
+
+vi.mock("./db", () => ({
+  getDb: vi.fn().mockResolvedValue(fakeDb),
+}));
+
+import {
+  registerJobHandler,
+  startJobWorker,
+  stopJobWorker,
+  getJobWorkerStats,
+} from "./jobWorker";
+
+function queuedJob(id: number) {
+  return {
+    id,
+    userId: 1,
+    jobType: "product_promo",
+    relatedId: id,
+    status: "queued",
+    attempts: 0,
+    maxAttempts: 3,
+    lastError: null,
+  };
+}
+
+describe("jobWorker", () => {
+  const run = vi.fn();
+
+  beforeEach(() => {
+    vi.useFakeTimers();
+    queued.length = 0;
+    stale.length = 0;
+    updates.length = 0;
+    run.mockReset();
+    registerJobHandler("product_promo", { concurrency: 2, run });
+  });
+
+  afterEach(async () => {
+    await stopJobWorker();
+    vi.useRealTimers();
+  });
+
+  it("recovers expired leases before claiming", async () => {
+    startJobWorker();
+    await vi.advanceTimersByTimeAsync(0);
+    expect(updates[0]).toMatchObject({
+      workerId: null,
+      lastError: "Worker lease expired",
+    });
+  });
+
+  it("fails exhausted stale jobs and runs their cleanup hook", async () => {
+    const onExhausted = vi.fn().mockResolvedValue(undefined);
+    registerJobHandler("product_promo", { concurrency: 2, run, onExhausted });
+    stale.push({ ...queuedJob(7), status: "processing", attempts: 3 });
+
+    startJobWorker();
+    await vi.advanceTimersByTimeAsync(0);
+    expect(updates[0]).toMatchObject({
+      status: "failed",
+      workerId: null,
+      lastError: "Worker lease expired",
+    });
+    expect(updates[0].completedAt).toBeDefined();
+    expect(onExhausted).toHaveBeenCalledWith(
+      expect.objectContaining({ id: 7 }),
+      "Worker lease expired"
+    );
+  });
+
+  it("claims no more jobs than the handler's concurrency", async () => {
+    const finishers: Array<() => void> = [];
+    run.mockImplementation(
+      () => new Promise<void>(resolve => finishers.push(resolve))
+    );
+    for (let id = 1; id <= 3; id++) queued.push(queuedJob(id));
+
+    startJobWorker();
+    await vi.advanceTimersByTimeAsync(0);
+    expect(run).toHaveBeenCalledTimes(2);
+    expect(getJobWorkerStats().running).toEqual({ product_promo: 2 });
+
+    await vi.advanceTimersByTimeAsync(2000);
+    expect(run).toHaveBeenCalledTimes(2);
+
+    finishers.shift()!();
+    await vi.advanceTimersByTimeAsync(0);
+    expect(run).toHaveBeenCalledTimes(3);
+    expect(updates).toContainEqual(
+      expect.objectContaining({ status: "completed" })
+    );
+    finishers.splice(0).forEach(finish => finish());
+    await vi.advanceTimersByTimeAsync(0);
+  });
+
+  it("waits for running jobs when stopped", async () => {
+    const finishers: Array<() => void> = [];
+    run.mockImplementation(
+      () => new Promise<void>(resolve => finishers.push(resolve))
+    );
+    queued.push(queuedJob(1), queuedJob(2), queuedJob(3));
+
+    startJobWorker();
+    await vi.advanceTimersByTimeAsync(0);
+    let stopped = false;
+    const stopping = stopJobWorker().then(() => (stopped = true));
+    await vi.advanceTimersByTimeAsync(0);
+    expect(stopped).toBe(false);
+
+    finishers.splice(0).forEach(finish => finish());
+    await vi.advanceTimersByTimeAsync(0);
+    await stopping;
+    // Durdurulduktan sonra kuyruktaki iş alınmaz
+    expect(run).toHaveBeenCalledTimes(2);
+    expect(getJobWorkerStats().active).toBe(false);
+  });
+
+  it("requeues a failed job while it has attempts left", async () => {
+    run.mockRejectedValue(new Error("Kie unavailable"));
+    queued.push(queuedJob(1));
+
+    startJobWorker();
+    await vi.advanceTimersByTimeAsync(0);
+    expect(updates).toContainEqual(
+      expect.objectContaining({
+        status: "queued",
+        workerId: null,
+        lastError: "Kie unavailable",
+      })
+    );
+  });
+
+  it("marks the job failed after its last attempt", async () => {
+    run.mockRejectedValue(new Error("Kie unavailable"));
+    queued.push({ ...queuedJob(1), attempts: 2 });
+
+    startJobWorker();
+    await vi.advanceTimersByTimeAsync(0);
+    expect(updates).toContainEqual(
+      expect.objectContaining({ status: "failed", lastError: "Kie unavailable" })
+    );
+  });
+
+  it("runs the cleanup hook when the last attempt fails", async () => {
+    const onExhausted = vi.fn().mockResolvedValue(undefined);
+    registerJobHandler("product_promo", { concurrency: 2, run, onExhausted });
+    run.mockRejectedValue(new Error("Kie unavailable"));
+    queued.push({ ...queuedJob(1), attempts: 2 });
+
+    startJobWorker();
+    await vi.advanceTimersByTimeAsync(0);
+    expect(onExhausted).toHaveBeenCalledWith(
+      expect.objectContaining({ id: 1 }),
+      "Kie unavailable"
+    );
+  });
+});
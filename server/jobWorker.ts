@@ -0,0 +1,453 @@
+// Job Worker - Durable background jobs on top of the jobQueue table
+//
+// tRPC handler'ları uzun süren üretim işlerini enqueueJob() ile kuyruğa yazar
+// ve hemen döner. Her süreç (web ya da PM2 üzerindeki ayrı worker) kayıtlı iş
+// tipleri için boş slot kadar işi SELECT ... FOR UPDATE SKIP LOCKED ile
+// kilitleyerek alır; böylece birden fazla instance aynı işi almaz. Çalışan
+// işler düzenli heartbeat yazar, heartbeat'i kesilen işler başka bir worker
+// tarafından yeniden kuyruğa alınır.
+import os from "os";
+import { and, asc, desc, eq, gte, inArray, lt, sql } from "drizzle-orm";
+import { jobQueue } from "../drizzle/schema";
+import { getDb } from "./db";
+import { ENV } from "./_core/env";
+
+export type QueuedJob = typeof jobQueue.$inferSelect;
+export type JobType = QueuedJob["jobType"];
+type Db = NonNullable<Awaited<ReturnType<typeof getDb>>>;
+
+export interface JobHandler {
+  // Bu süreçte aynı anda çalışabilecek iş sayısı
+  concurrency: number;
+  run(job: QueuedJob): Promise<void>;
+  // İş tüm denemelerini tükettiğinde bir kez çağrılır; run() hiç bitmemiş
+  // olabilir (worker'lar çökmüş olabilir), tuttuğu kaynakları burada bırakır
+  onExhausted?(job: QueuedJob, error: string): Promise<void>;
+}
+
+const POLL_INTERVAL = 2000;
+const HEARTBEAT_INTERVAL = 15 * 1000;
+const RECOVERY_INTERVAL = 60 * 1000;
+// Bu süre boyunca heartbeat yazmayan işin worker'ı ölmüş kabul edilir
+const LEASE_TIMEOUT_SECONDS = 90;
+const RECOVERY_BATCH = 100;
+// Kapanışta çalışan işlerin bitmesi için beklenen en uzun süre; PM2'nin
+// kill_timeout değerinden kısa tutulmalı
+const STOP_TIMEOUT = 25 * 1000;
+
+const workerId = `${os.hostname()}:${process.pid}`;
+const handlers = new Map<JobType, JobHandler>();
+// jobId -> jobType, bu süreçte çalışan işler
+const running = new Map<number, JobType>();
+const runningJobs = new Set<Promise<void>>();
+
+let pollTimer: NodeJS.Timeout | null = null;
+let heartbeatTimer: NodeJS.Timeout | null = null;
+let recoveryTimer: NodeJS.Timeout | null = null;
+let polling = false;
+let pollAgain = false;
+
+const stats = {
+  claimed: 0,
+  completed: 0,
+  failed: 0,
+  retried: 0,
+  recovered: 0,
+  lostLeases: 0,
+};
+
+/**
+ * Register the handler of a job type. Jobs of types without a handler stay
+ * queued until a process that knows them picks them up.
+ */
+export function registerJobHandler(jobType: JobType, handler: JobHandler) {
+  handlers.set(jobType, handler);
+}
+
+/**
+ * Queue a job and return its id
+ */
+export async function enqueueJob(job: {
+  userId: number;
+  jobType: JobType;
+  relatedId?: number;
+  priority?: number;
+  maxAttempts?: number;
+  modelKey?: string;
+  estimatedDurationMs?: number;
+}): Promise<number> {
+  const db = await getDb();
+  if (!db) {
+    throw new Error("Database connection failed");
+  }
+
+  const [result] = await db.insert(jobQueue).values(job);
+
+  // Aynı süreç işi alabiliyorsa bir sonraki turu bekleme
+  if (pollTimer && handlers.has(job.jobType)) {
+    void pollJobs();
+  }
+  return result.insertId;
+}
+
+function runningCount(jobType: JobType): number {
+  let count = 0;
+  running.forEach(type => {
+    if (type === jobType) count++;
+  });
+  return count;
+}
+
+async function claimJobs(jobType: JobType, limit: number) {
+  const db = await getDb();
+  if (!db) return [];
+
+  return db.transaction(async tx => {
+    const rows = await tx
+      .select({ id: jobQueue.id })
+      .from(jobQueue)
+      .where(
+        and(eq(jobQueue.status, "queued"), eq(jobQueue.jobType, jobType))
+      )
+      .orderBy(
+        desc(jobQueue.priority),
+        asc(jobQueue.queuedAt),
+        asc(jobQueue.id)
+      )
+      .limit(limit)
+      .for("update", { skipLocked: true });
+    if (rows.length === 0) return [];
+
+    const ids = rows.map(row => row.id);
+    await tx
+      .update(jobQueue)
+      .set({
+        status: "processing",
+        workerId,
+        startedAt: sql`NOW()`,
+        heartbeatAt: sql`NOW()`,
+        attempts: sql`${jobQueue.attempts} + 1`,
+      })
+      .where(inArray(jobQueue.id, ids));
+
+    return tx.select().from(jobQueue).where(inArray(jobQueue.id, ids));
+  });
+}
+
+// Lease başka worker'a geçtiyse (ya da iş iptal edildiyse) sonucu yazmayız
+function ownedBy(jobId: number) {
+  return and(
+    eq(jobQueue.id, jobId),
+    eq(jobQueue.workerId, workerId),
+    eq(jobQueue.status, "processing")
+  );
+}
+
+async function finishJob(job: QueuedJob, startedAt: number, error?: unknown) {
+  const db = await getDb();
+  if (!db) return;
+
+  const failed = error !== undefined;
+  const retry = failed && job.attempts < job.maxAttempts;
+  const status = !failed ? "completed" : retry ? "queued" : "failed";
+  const lastError = failed
+    ? error instanceof Error
+      ? error.message
+      : String(error)
+    : undefined;
+
+  try {
+    const [result] = await db
+      .update(jobQueue)
+      .set({
+        status,
+        workerId: retry ? null : workerId,
+        completedAt: retry ? null : sql`NOW()`,
+        actualDurationMs: Date.now() - startedAt,
+        ...(failed && { lastError }),
+      })
+      .where(ownedBy(job.id));
+
+    if (result.affectedRows === 0) {
+      stats.lostLeases++;
+      console.warn(
+        `[Job Worker] Job ${job.id} is no longer owned by ${workerId}, result dropped`
+      );
+      return;
+    }
+
+    if (!failed) stats.completed++;
+    else if (retry) stats.retried++;
+    else {
+      stats.failed++;
+      await notifyExhausted(job, lastError!);
+    }
+  } catch (dbError) {
+    // Lease süresi dolunca iş yeniden kuyruğa alınır
+    console.error(`[Job Worker] Failed to record job ${job.id}:`, dbError);
+  }
+}
+
+function runJob(job: QueuedJob, handler: JobHandler) {
+  const startedAt = Date.now();
+  running.set(job.id, job.jobType);
+  console.log(
+    `[Job Worker] Running ${job.jobType} job ${job.id} (attempt ${job.attempts}/${job.maxAttempts})`
+  );
+
+  const done = handler
+    .run(job)
+    .then(
+      () => finishJob(job, startedAt),
+      error => {
+        console.error(`[Job Worker] Job ${job.id} failed:`, error);
+        return finishJob(job, startedAt, error ?? "Unknown error");
+      }
+    )
+    .finally(() => {
+      running.delete(job.id);
+      runningJobs.delete(done);
+      void pollJobs();
+    });
+  runningJobs.add(done);
+}
+
+async function pollJobs() {
+  // Durdurulan worker yeni iş almaz
+  if (!pollTimer) return;
+  // Aynı anda tek claim turu; arada gelen istekler bir tur daha tetikler
+  if (polling) {
+    pollAgain = true;
+    return;
+  }
+  polling = true;
+
+  try {
+    for (const [jobType, handler] of Array.from(handlers)) {
+      const free = handler.concurrency - runningCount(jobType);
+      if (free <= 0) continue;
+
+      const jobs = await claimJobs(jobType, free);
+      stats.claimed += jobs.length;
+      for (const job of jobs) {
+        runJob(job, handler);
+      }
+    }
+  } catch (error) {
+    console.error("[Job Worker] Error claiming jobs:", error);
+  } finally {
+    polling = false;
+    if (pollAgain) {
+      pollAgain = false;
+      void pollJobs();
+    }
+  }
+}
+
+async function sendHeartbeats() {
+  if (running.size === 0) return;
+  const db = await getDb();
+  if (!db) return;
+
+  try {
+    await db
+      .update(jobQueue)
+      .set({ heartbeatAt: sql`NOW()` })
+      .where(
+        and(
+          inArray(jobQueue.id, Array.from(running.keys())),
+          eq(jobQueue.workerId, workerId),
+          eq(jobQueue.status, "processing")
+        )
+      );
+  } catch (error) {
+    console.error("[Job Worker] Error sending heartbeats:", error);
+  }
+}
+
+async function notifyExhausted(job: QueuedJob, error: string) {
+  const handler = handlers.get(job.jobType);
+  if (!handler?.onExhausted) return;
+  try {
+    await handler.onExhausted(job, error);
+  } catch (hookError) {
+    console.error(
+      `[Job Worker] onExhausted failed for job ${job.id}:`,
+      hookError
+    );
+  }
+}
+
+function leaseExpired() {
+  return and(
+    eq(jobQueue.status, "processing"),
+    lt(
+      jobQueue.heartbeatAt,
+      sql`NOW() - INTERVAL ${LEASE_TIMEOUT_SECONDS} SECOND`
+    )
+  );
+}
+
+/**
+ * Mark stale jobs without attempts left as failed and let their handler
+ * clean up. Only job types registered here are taken, so the hook always
+ * runs; each row is failed with its own fenced update, so when several
+ * workers recover at once only one of them runs it.
+ */
+async function failExhaustedJobs(db: Db) {
+  const jobTypes = Array.from(handlers.keys());
+  if (jobTypes.length === 0) return;
+
+  const jobs = await db
+    .select()
+    .from(jobQueue)
+    .where(
+      and(
+        leaseExpired(),
+        gte(jobQueue.attempts, jobQueue.maxAttempts),
+        inArray(jobQueue.jobType, jobTypes)
+      )
+    )
+    .limit(RECOVERY_BATCH);
+
+  for (const job of jobs) {
+    const [result] = await db
+      .update(jobQueue)
+      .set({
+        status: "failed",
+        workerId: null,
+        completedAt: sql`NOW()`,
+        lastError: "Worker lease expired",
+      })
+      .where(and(eq(jobQueue.id, job.id), leaseExpired()));
+    if (result.affectedRows === 0) continue;
+
+    stats.recovered++;
+    stats.failed++;
+    console.log(
+      `[Job Worker] Job ${job.id} failed after ${job.attempts} attempts with expired leases`
+    );
+    await notifyExhausted(job, "Worker lease expired");
+  }
+}
+
+/**
+ * Requeue jobs whose worker stopped sending heartbeats. Jobs that already
+ * used all their attempts are marked failed instead.
+ */
+async function recoverStaleJobs() {
+  const db = await getDb();
+  if (!db) return;
+
+  try {
+    await failExhaustedJobs(db);
+
+    const [result] = await db
+      .update(jobQueue)
+      .set({
+        status: "queued",
+        workerId: null,
+        lastError: "Worker lease expired",
+      })
+      .where(and(leaseExpired(), lt(jobQueue.attempts, jobQueue.maxAttempts)));
+
+    if (result.affectedRows > 0) {
+      stats.recovered += result.affectedRows;
+      console.log(
+        `[Job Worker] Recovered ${result.affectedRows} jobs with expired leases`
+      );
+      void pollJobs();
+    }
+  } catch (error) {
+    console.error("[Job Worker] Error recovering stale jobs:", error);
+  }
+}
+
+/**
+ * Start claiming jobs in this process
+ */
+export function startJobWorker() {
+  if (!ENV.jobWorkerEnabled) {
+    console.log("[Job Worker] Disabled in this process (JOB_WORKER_ENABLED)");
+    return;
+  }
+  if (pollTimer) {
+    console.log("[Job Worker] Already running");
+    return;
+  }
+
+  console.log(
+    `[Job Worker] Starting ${workerId} for: ${Array.from(handlers.keys()).join(", ")}`
+  );
+  pollTimer = setInterval(pollJobs, POLL_INTERVAL);
+  heartbeatTimer = setInterval(sendHeartbeats, HEARTBEAT_INTERVAL);
+  recoveryTimer = setInterval(recoverStaleJobs, RECOVERY_INTERVAL);
+
+  void recoverStaleJobs().then(pollJobs);
+}
+
+/**
+ * Resolve once no job is running, or with false after `timeoutMs`
+ */
+function waitForRunningJobs(timeoutMs: number): Promise<boolean> {
+  return new Promise(resolve => {
+    const timer = setTimeout(() => resolve(false), timeoutMs);
+    const check = () => {
+      if (runningJobs.size === 0) {
+        clearTimeout(timer);
+        resolve(true);
+        return;
+      }
+      void Promise.allSettled(Array.from(runningJobs)).then(check);
+    };
+    check();
+  });
+}
+
+/**
+ * Stop claiming new jobs and wait for running ones to finish. Jobs still
+ * running after the timeout keep their lease until the process exits;
+ * after that it expires and another worker picks them up.
+ */
+export async function stopJobWorker(timeoutMs = STOP_TIMEOUT) {
+  for (const timer of [pollTimer, recoveryTimer]) {
+    if (timer) clearInterval(timer);
+  }
+  pollTimer = null;
+  recoveryTimer = null;
+
+  if (runningJobs.size > 0) {
+    console.log(
+      `[Job Worker] Waiting for ${runningJobs.size} running job(s) to finish`
+    );
+    if (!(await waitForRunningJobs(timeoutMs))) {
+      console.warn(
+        `[Job Worker] ${runningJobs.size} job(s) still running after ${timeoutMs}ms, leaving them to lease recovery`
+      );
+    }
+  }
+
+  // Heartbeat beklerken de sürer, yoksa bekleyen işlerin lease'i dolar
+  if (heartbeatTimer) clearInterval(heartbeatTimer);
+  heartbeatTimer = null;
+  console.log("[Job Worker] Stopped");
+}
+
+export function getJobWorkerStats() {
+  const runningByType: Record<string, number> = {};
+  running.forEach(type => {
+    runningByType[type] = (runningByType[type] ?? 0) + 1;
+  });
+  const concurrency: Record<string, number> = {};
+  handlers.forEach((handler, type) => {
+    concurrency[type] = handler.concurrency;
+  });
+
+  return {
+    workerId,
+    active: pollTimer !== null,
+    running: runningByType,
+    concurrency,
+    ...stats,
+  };
+}
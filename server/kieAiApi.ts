@@ -1,8 +1,10 @@
+import { ENV } from "./_core/env";
 import {
   getApiMessage,
   isKieInProgressState,
   makeKieRequest,
 } from "./kie/client";
+import type { TaskSource } from "./taskPoller";
 
 // Video model types
 export type VideoModel =
@@ -843,7 +845,7 @@ export async function generateVideo(
     sound,
     quality,
     characterOrientation,
-    callBackUrl,
+    callBackUrl = ENV.kieCallbackUrl || undefined,
   } = params;
 
   let response: KieAiResponse;
@@ -2110,6 +2112,44 @@ export async function getGenericImageStatus(
   return { status: "pending" };
 }
 
+type ImageStatus = Awaited<ReturnType<typeof getGenericImageStatus>>;
+
+// Durum fonksiyonunu paylaşılan poller kaynağına çevirir. Başarısız görev
+// sonuç olarak döner; sorgu hatası yalnızca son denemede kalırsa raporlanır.
+function imageTaskSource(
+  name: string,
+  getStatus: (taskId: string) => Promise<ImageStatus>
+): TaskSource<{ imageUrl: string | null; error: string | null }> {
+  return {
+    name,
+    async check(taskId) {
+      const status = await getStatus(taskId);
+      if (status.status === "completed" && status.imageUrl) {
+        return {
+          state: "done",
+          value: { imageUrl: status.imageUrl, error: null },
+        };
+      }
+      if (status.status === "failed") {
+        return {
+          state: "done",
+          value: { imageUrl: null, error: status.error || "Bilinmeyen hata" },
+        };
+      }
+      return { state: "pending", error: null };
+    },
+  };
+}
+
+export const seedreamImageTaskSource = imageTaskSource(
+  "seedream",
+  getSeedreamImageStatus
+);
+
+export const genericImageTaskSource = imageTaskSource("kie-image", taskId =>
+  getGenericImageStatus(taskId)
+);
+
 // ============ SPECIALIZED MODEL FUNCTIONS ============
 
 // Flux 2 Pro - Image-to-Image
@@ -1,5 +1,9 @@
 import { uploadToKieFromUrl } from "./kieFileUpload";
-import { translateApiError } from "./utils/errorTranslations";
+import {
+  translateApiError,
+  type ErrorLanguage,
+} from "./utils/errorTranslations";
+import { waitForTask, type TaskSource } from "./taskPoller";
 
 const API_BASE_URL = "https://api.kie.ai/api/v1";
 
@@ -244,142 +248,160 @@ export async function getTaskStatus(
   }
 }
 
+type PollResult = { imageUrl: string | null; error: string | null };
+// failMsg: sağlayıcının ham hata mesajı; her bekleyen kendi dilinde çevirir
+type TaskOutcome = PollResult & { failMsg?: string };
+
 /**
- * Poll for task completion and extract image URL with detailed error information
+ * Extract the image URL from a finished task's resultJson
  */
-export async function pollTaskCompletionWithError(
-  taskId: string,
-  maxAttempts: number = 600,
-  delayMs: number = 2000
-): Promise<{ imageUrl: string | null; error: string | null }> {
-  let lastError: string | null = null;
+function extractImageResult(
+  data: NonNullable<TaskStatusResponse["data"]>
+): PollResult {
+  if (!data.resultJson) {
+    console.warn("[Nano Banana API] Task completed but no resultJson found");
+    return { imageUrl: null, error: "Sonuç bulunamadı" };
+  }
+
+  try {
+    // resultJson bazen string bazen object olabiliyor
+    let result: Record<string, unknown>;
+    if (typeof data.resultJson === "string") {
+      result = JSON.parse(data.resultJson);
+    } else {
+      result = data.resultJson as Record<string, unknown>;
+    }
+
+    // resultUrls veya images array'ini kontrol et
+    const imageUrls = (result.resultUrls ||
+      result.images ||
+      result.output ||
+      result.result) as string[];
+    if (imageUrls && Array.isArray(imageUrls) && imageUrls.length > 0) {
+      const imageUrl = imageUrls[0];
+      console.log(
+        "[Nano Banana API] Task completed successfully, image URL:",
+        imageUrl
+      );
+      return { imageUrl, error: null };
+    }
 
-  for (let attempt = 0; attempt < maxAttempts; attempt++) {
+    // Tek bir URL olarak dönebilir
+    const singleUrl = (result.url ||
+      result.imageUrl ||
+      result.output_url) as string;
+    if (singleUrl && typeof singleUrl === "string") {
+      console.log(
+        "[Nano Banana API] Task completed successfully, single image URL:",
+        singleUrl
+      );
+      return { imageUrl: singleUrl, error: null };
+    }
+
+    console.warn(
+      "[Nano Banana API] Task completed but no image URLs found in resultJson"
+    );
+    console.warn(
+      "[Nano Banana API] resultJson parsed content:",
+      JSON.stringify(result)
+    );
+    return { imageUrl: null, error: "Sonuç bulunamadı" };
+  } catch (parseError) {
+    console.error("[Nano Banana API] Failed to parse resultJson:", parseError);
+    console.error("[Nano Banana API] resultJson content:", data.resultJson);
+    console.error(
+      "[Nano Banana API] resultJson type:",
+      typeof data.resultJson
+    );
+    return { imageUrl: null, error: "Sonuç işlenemedi" };
+  }
+}
+
+/**
+ * Shared poller source for /jobs/recordInfo tasks
+ */
+export const nanoBananaTaskSource: TaskSource<TaskOutcome> = {
+  name: "nano-banana",
+  async check(taskId) {
     try {
       const status = await getTaskStatus(taskId);
 
       if (!status) {
-        lastError = "Görev durumu alınamadı";
-        console.warn(
-          `[Nano Banana API] Attempt ${attempt + 1}/${maxAttempts}: ${lastError}`
-        );
-      } else if (status.code === 200 && status.data) {
-        const taskState = status.data.state;
-        console.log(
-          `[Nano Banana API] Task state (attempt ${attempt + 1}/${maxAttempts}): ${taskState}`
-        );
+        const error = "Görev durumu alınamadı";
+        console.warn(`[Nano Banana API] ${taskId}: ${error}`);
+        return { state: "pending", error };
+      }
 
-        if (taskState === "success") {
-          // Parse resultJson to get image URLs
-          if (status.data.resultJson) {
-            try {
-              // resultJson bazen string bazen object olabiliyor
-              let result: Record<string, unknown>;
-              if (typeof status.data.resultJson === "string") {
-                result = JSON.parse(status.data.resultJson);
-              } else {
-                result = status.data.resultJson as Record<string, unknown>;
-              }
-
-              // resultUrls veya images array'ini kontrol et
-              const imageUrls = (result.resultUrls ||
-                result.images ||
-                result.output ||
-                result.result) as string[];
-              if (
-                imageUrls &&
-                Array.isArray(imageUrls) &&
-                imageUrls.length > 0
-              ) {
-                const imageUrl = imageUrls[0];
-                console.log(
-                  "[Nano Banana API] Task completed successfully, image URL:",
-                  imageUrl
-                );
-                return { imageUrl, error: null };
-              }
-
-              // Tek bir URL olarak dönebilir
-              const singleUrl = (result.url ||
-                result.imageUrl ||
-                result.output_url) as string;
-              if (singleUrl && typeof singleUrl === "string") {
-                console.log(
-                  "[Nano Banana API] Task completed successfully, single image URL:",
-                  singleUrl
-                );
-                return { imageUrl: singleUrl, error: null };
-              }
-
-              console.warn(
-                "[Nano Banana API] Task completed but no image URLs found in resultJson"
-              );
-              console.warn(
-                "[Nano Banana API] resultJson parsed content:",
-                JSON.stringify(result)
-              );
-              lastError = "Sonuç bulunamadı";
-            } catch (parseError) {
-              console.error(
-                "[Nano Banana API] Failed to parse resultJson:",
-                parseError
-              );
-              console.error(
-                "[Nano Banana API] resultJson content:",
-                status.data.resultJson
-              );
-              console.error(
-                "[Nano Banana API] resultJson type:",
-                typeof status.data.resultJson
-              );
-              lastError = "Sonuç işlenemedi";
-            }
-          } else {
-            console.warn(
-              "[Nano Banana API] Task completed but no resultJson found"
-            );
-            lastError = "Sonuç bulunamadı";
-          }
-          return { imageUrl: null, error: lastError };
-        }
+      if (status.code !== 200 || !status.data) {
+        const error = `API_ERROR - ${status.message || "Bilinmeyen hata"}`;
+        console.warn(`[Nano Banana API] API error: ${error}`);
+        return { state: "pending", error };
+      }
 
-        if (taskState === "fail") {
-          // Get detailed error message from API
-          const rawError =
-            status.data.failMsg || "Görsel üretimi başarısız oldu";
+      const taskState = status.data.state;
+      const completedAt =
+        typeof status.data.completeTime === "number"
+          ? status.data.completeTime
+          : undefined;
 
-          // Türkçe'ye çevir
-          const translatedError = translateApiError(rawError);
-          lastError = `API_ERROR - ${translatedError}`;
+      if (taskState === "success") {
+        return {
+          state: "done",
+          value: extractImageResult(status.data),
+          completedAt,
+        };
+      }
 
-          console.error(
-            `[Nano Banana API] Task failed. Raw error: ${rawError}, Translated: ${translatedError}`
-          );
-          return { imageUrl: null, error: lastError };
-        }
+      if (taskState === "fail") {
+        // Get detailed error message from API
+        const failMsg = status.data.failMsg || "Görsel üretimi başarısız oldu";
+        console.error(`[Nano Banana API] Task failed. Raw error: ${failMsg}`);
+        return {
+          state: "done",
+          value: { imageUrl: null, error: null, failMsg },
+          completedAt,
+        };
+      }
 
-        if (
-          taskState === "waiting" ||
-          taskState === "queuing" ||
-          taskState === "generating"
-        ) {
-          lastError = null;
-          console.log(
-            `[Nano Banana API] Task still processing... (${taskState})`
-          );
-        }
-      } else {
-        lastError = `API_ERROR - ${status?.message || "Bilinmeyen hata"}`;
-        console.warn(`[Nano Banana API] API error: ${lastError}`);
+      if (
+        taskState === "waiting" ||
+        taskState === "queuing" ||
+        taskState === "generating"
+      ) {
+        return { state: "pending", error: null };
       }
+      return { state: "pending" };
     } catch (error) {
-      lastError = `NETWORK_ERROR - ${error instanceof Error ? error.message : "Bilinmeyen hata"}`;
-      console.warn(`[Nano Banana API] Polling error: ${lastError}`);
+      const message = `NETWORK_ERROR - ${error instanceof Error ? error.message : "Bilinmeyen hata"}`;
+      console.warn(`[Nano Banana API] Polling error: ${message}`);
+      return { state: "pending", error: message };
     }
+  },
+};
 
-    if (attempt < maxAttempts - 1) {
-      await new Promise(resolve => setTimeout(resolve, delayMs));
+/**
+ * Poll for task completion and extract image URL with detailed error information
+ */
+export async function pollTaskCompletionWithError(
+  taskId: string,
+  maxAttempts: number = 600,
+  delayMs: number = 2000,
+  language: ErrorLanguage = "tr"
+): Promise<PollResult> {
+  const result = await waitForTask(nanoBananaTaskSource, taskId, {
+    intervalMs: delayMs,
+    timeoutMs: maxAttempts * delayMs,
+  });
+  if (result.status === "done") {
+    const { failMsg, ...pollResult } = result.value;
+    if (failMsg === undefined) {
+      return pollResult;
     }
+    // Aynı görevi bekleyenler farklı dillerde olabilir, çeviri burada yapılır
+    return {
+      imageUrl: null,
+      error: `API_ERROR - ${translateApiError(failMsg, undefined, language)}`,
+    };
   }
 
   console.error(
@@ -389,7 +411,7 @@ export async function pollTaskCompletionWithError(
   return {
     imageUrl: null,
     error:
-      lastError ||
+      result.lastError ||
       "TIMEOUT - Görsel üretimi zaman aşımına uğradı (maksimum bekleme süresi aşıldı)",
   };
 }
@@ -50,6 +50,7 @@ function createAdminContext(): TrpcContext {
     res: {
       clearCookie: () => {},
     } as TrpcContext["res"],
+    language: "tr",
   };
 
   return ctx;
@@ -50,6 +50,14 @@ import {
   type SQL,
 } from "drizzle-orm";
 import type { UnifiedVideoModelType } from "../kieAiApi";
+import {
+  getAiModelRenderPercentiles,
+  getSettingsCacheStats,
+  publishSettingsChange,
+} from "../db";
+import { getTaskPollerStats } from "../taskPoller";
+import { getJobWorkerStats } from "../jobWorker";
+import { getVideoStatusUpdaterStats } from "../videoStatusUpdater";
 import {
   logAdminActivity as logActivity,
   requireAdminDb,
@@ -66,6 +74,16 @@ const adminProcedure = protectedProcedure.use(({ ctx, next }) => {
   return next({ ctx });
 });
 
+// Mutations that write cached settings tables; other instances drop their
+// caches on the next version check
+const settingsProcedure = adminProcedure.use(async ({ next }) => {
+  const result = await next();
+  if (result.ok) {
+    await publishSettingsChange();
+  }
+  return result;
+});
+
 export const adminPanelRouter = router({
   // ============ DASHBOARD STATS ============
 
@@ -161,10 +179,12 @@ export const adminPanelRouter = router({
           isActive: aiModelConfig.isActive,
         })
         .from(aiModelConfig);
+      const renderPercentiles = await getAiModelRenderPercentiles();
 
       // Calculate error rates
       const modelStatsWithErrorRate = modelStats.map(m => ({
         ...m,
+        ...renderPercentiles[m.modelKey],
         errorRate:
           m.totalRequests > 0
             ? (((m.failedRequests || 0) / m.totalRequests) * 100).toFixed(2)
@@ -455,7 +475,7 @@ export const adminPanelRouter = router({
         .orderBy(asc(siteSettings.category), asc(siteSettings.key));
     }),
 
-  updateSiteSetting: adminProcedure
+  updateSiteSetting: settingsProcedure
     .input(
       z.object({
         key: z.string(),
@@ -489,7 +509,7 @@ export const adminPanelRouter = router({
       return { success: true };
     }),
 
-  createSiteSetting: adminProcedure
+  createSiteSetting: settingsProcedure
     .input(
       z.object({
         key: z.string(),
@@ -853,7 +873,7 @@ export const adminPanelRouter = router({
       .orderBy(asc(featurePricing.category), asc(featurePricing.featureKey));
   }),
 
-  initializeFeaturePricing: adminProcedure.mutation(async ({ ctx }) => {
+  initializeFeaturePricing: settingsProcedure.mutation(async ({ ctx }) => {
     const db = await requireAdminDb();
 
     const defaultPricing = [
@@ -1074,7 +1094,7 @@ export const adminPanelRouter = router({
     return { success: true, inserted, updated };
   }),
 
-  updateFeaturePricing: adminProcedure
+  updateFeaturePricing: settingsProcedure
     .input(
       z.object({
         id: z.number(),
@@ -1111,7 +1131,7 @@ export const adminPanelRouter = router({
       return { success: true };
     }),
 
-  createFeaturePricing: adminProcedure
+  createFeaturePricing: settingsProcedure
     .input(
       z.object({
         featureKey: z.string(),
@@ -1164,7 +1184,7 @@ export const adminPanelRouter = router({
       return { success: true, id: result.id };
     }),
 
-  deleteFeaturePricing: adminProcedure
+  deleteFeaturePricing: settingsProcedure
     .input(z.object({ id: z.number() }))
     .mutation(async ({ ctx, input }) => {
       const db = await requireAdminDb();
@@ -2471,13 +2491,20 @@ export const adminPanelRouter = router({
   getAiModels: adminProcedure.query(async () => {
     const db = await requireAdminDb();
 
-    return await db
-      .select()
-      .from(aiModelConfig)
-      .orderBy(asc(aiModelConfig.modelName));
+    const [models, renderPercentiles] = await Promise.all([
+      db.select().from(aiModelConfig).orderBy(asc(aiModelConfig.modelName)),
+      getAiModelRenderPercentiles(),
+    ]);
+    return models.map(model => ({
+      ...model,
+      p50RenderTimeMs: null,
+      p95RenderTimeMs: null,
+      renderTimeSamples: 0,
+      ...renderPercentiles[model.modelKey],
+    }));
   }),
 
-  initializeAiModels: adminProcedure.mutation(async ({ ctx }) => {
+  initializeAiModels: settingsProcedure.mutation(async ({ ctx }) => {
     const db = await requireAdminDb();
 
     const defaultModels = [
@@ -2855,7 +2882,7 @@ export const adminPanelRouter = router({
     return { success: true, inserted, updated };
   }),
 
-  createAiModel: adminProcedure
+  createAiModel: settingsProcedure
     .input(
       z.object({
         modelKey: z.string(),
@@ -2921,7 +2948,7 @@ export const adminPanelRouter = router({
       return { success: true, id: result.insertId };
     }),
 
-  updateAiModel: adminProcedure
+  updateAiModel: settingsProcedure
     .input(
       z.object({
         id: z.number(),
@@ -2969,7 +2996,7 @@ export const adminPanelRouter = router({
       return { success: true };
     }),
 
-  toggleAiModel: adminProcedure
+  toggleAiModel: settingsProcedure
     .input(z.object({ id: z.number(), isActive: z.boolean() }))
     .mutation(async ({ ctx, input }) => {
       const db = await requireAdminDb();
@@ -3235,9 +3262,19 @@ export const adminPanelRouter = router({
       })
       .from(jobQueue);
 
-    return stats;
+    // Worker sayaçları yalnızca bu sürece aittir
+    return { ...stats, worker: getJobWorkerStats() };
   }),
 
+  // Üretim sonucu bekleyen görevler ve sağlayıcı sorgu metrikleri
+  getPollerStats: adminProcedure.query(() => ({
+    taskPoller: getTaskPollerStats(),
+    videoStatusUpdater: getVideoStatusUpdaterStats(),
+  })),
+
+  // Bu sürecin ayar/fiyat önbelleği isabet oranı
+  getSettingsCacheStats: adminProcedure.query(() => getSettingsCacheStats()),
+
   cancelJob: adminProcedure
     .input(z.object({ id: z.number() }))
     .mutation(async ({ ctx, input }) => {
@@ -3993,7 +4030,7 @@ export const adminPanelRouter = router({
     }
   }),
 
-  updateAiInfluencerSettings: adminProcedure
+  updateAiInfluencerSettings: settingsProcedure
     .input(
       z.object({
         nanoBananaPricing: z.object({
@@ -92,6 +92,7 @@ function createUserContext(): TrpcContext {
     res: {
       clearCookie: () => {},
     } as TrpcContext["res"],
+    language: "tr",
   };
 
   return ctx;
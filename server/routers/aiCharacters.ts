@@ -27,6 +27,7 @@ import {
   pollTaskCompletionWithError,
 } from "../nanoBananaApi";
 import { storagePut } from "../storage";
+import type { ErrorLanguage } from "../utils/errorTranslations";
 import { nanoid } from "nanoid";
 import { notifyCreditSpending, notifyGenerationFailure } from "../telegramBot";
 import { createNotification } from "./notification";
@@ -56,7 +57,8 @@ async function processAiCharacterImageInBackground(
   characterImageUrl: string,
   resolution: string,
   aspectRatio: string,
-  creditsNeeded: number
+  creditsNeeded: number,
+  language: ErrorLanguage = "tr"
 ) {
   try {
     console.log(
@@ -67,7 +69,12 @@ async function processAiCharacterImageInBackground(
     await updateGeneratedImageStatus(galleryImageId, "processing");
 
     // Poll for completion with error details
-    const pollResult = await pollTaskCompletionWithError(taskId);
+    const pollResult = await pollTaskCompletionWithError(
+      taskId,
+      undefined,
+      undefined,
+      language
+    );
     const imageUrl = pollResult.imageUrl;
     const errorDetails = pollResult.error;
 
@@ -252,7 +259,8 @@ async function processTemporaryAiCharacterImageInBackground(
   prompt: string,
   resolution: string,
   aspectRatio: string,
-  creditsNeeded: number
+  creditsNeeded: number,
+  language: ErrorLanguage = "tr"
 ) {
   try {
     console.log(
@@ -263,7 +271,12 @@ async function processTemporaryAiCharacterImageInBackground(
     await updateGeneratedImageStatus(galleryImageId, "processing");
 
     // Poll for completion with error details
-    const pollResult = await pollTaskCompletionWithError(taskId);
+    const pollResult = await pollTaskCompletionWithError(
+      taskId,
+      undefined,
+      undefined,
+      language
+    );
     const imageUrl = pollResult.imageUrl;
     const errorDetails = pollResult.error;
 
@@ -673,7 +686,8 @@ export const aiCharactersRouter = router({
           character.characterImageUrl,
           input.resolution,
           input.aspectRatio,
-          creditsNeeded
+          creditsNeeded,
+          ctx.language
         ).catch(console.error);
 
         // Return immediately
@@ -880,7 +894,8 @@ export const aiCharactersRouter = router({
           input.prompt,
           input.resolution,
           input.aspectRatio,
-          creditsNeeded
+          creditsNeeded,
+          ctx.language
         ).catch(console.error);
 
         // Return immediately
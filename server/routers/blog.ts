@@ -43,6 +43,23 @@ function generateSlug(title: string): string {
   );
 }
 
+// Liste sorguları içeriği taşımaz; yazının gövdesi getBySlug ile gelir
+const listColumns = {
+  id: blogPosts.id,
+  title: blogPosts.title,
+  slug: blogPosts.slug,
+  description: blogPosts.description,
+  coverImage: blogPosts.coverImage,
+  category: blogPosts.category,
+  author: blogPosts.author,
+  readTime: blogPosts.readTime,
+  status: blogPosts.status,
+  viewCount: blogPosts.viewCount,
+  createdAt: blogPosts.createdAt,
+  updatedAt: blogPosts.updatedAt,
+  publishedAt: blogPosts.publishedAt,
+};
+
 export const blogRouter = router({
   // Public: List published blog posts
   list: publicProcedure
@@ -71,7 +88,7 @@ export const blogRouter = router({
       }
 
       const posts = await db
-        .select()
+        .select(listColumns)
         .from(blogPosts)
         .where(and(...conditions))
         .orderBy(desc(blogPosts.publishedAt))
@@ -17,11 +17,15 @@ import {
   createGenerationTask,
   pollTaskCompletionWithError,
 } from "../nanoBananaApi";
-import { translateApiError } from "../utils/errorTranslations";
+import {
+  translateApiError,
+  type ErrorLanguage,
+} from "../utils/errorTranslations";
+import { waitForTask } from "../taskPoller";
 import {
   generateSeedreamImage,
   generateSeedreamEditImage,
-  getSeedreamImageStatus,
+  seedreamImageTaskSource,
   SeedreamAspectRatio,
   SeedreamQuality,
   generateFlux2ProImage,
@@ -44,7 +48,7 @@ import {
   generateNanoBananaEdit,
   generateIdeogramCharacterEdit,
   generateIdeogramCharacterRemix,
-  getGenericImageStatus,
+  genericImageTaskSource,
   calculateImageModelCreditCost,
 } from "../kieAiApi";
 import { storagePut } from "../storage";
@@ -236,7 +240,8 @@ async function processImageInBackground(
   resolution: string,
   aspectRatio: string,
   creditsNeeded: number,
-  aiModel: AIModel = "nano-banana-pro"
+  aiModel: AIModel = "nano-banana-pro",
+  language: ErrorLanguage = "tr"
 ) {
   const startTime = Date.now();
   try {
@@ -253,18 +258,17 @@ async function processImageInBackground(
 
     if (aiModel === "seedream" || aiModel === "seedream-edit") {
       // Seedream polling
-      const maxAttempts = 60; // 5 dakika
-      for (let i = 0; i < maxAttempts; i++) {
-        const status = await getSeedreamImageStatus(taskId);
-        if (status.status === "completed" && status.imageUrl) {
-          imageUrl = status.imageUrl;
-          break;
-        } else if (status.status === "failed") {
-          errorDetails = status.error || "Bilinmeyen hata";
+      const result = await waitForTask(seedreamImageTaskSource, taskId, {
+        intervalMs: 5000,
+        timeoutMs: 5 * 60 * 1000,
+      });
+      if (result.status === "done") {
+        ({ imageUrl, error: errorDetails } = result.value);
+        if (errorDetails) {
           console.error(`[Background] Seedream failed: ${errorDetails}`);
-          break;
         }
-        await new Promise(resolve => setTimeout(resolve, 5000)); // 5 saniye bekle
+      } else {
+        errorDetails = result.lastError;
       }
     } else if (
       [
@@ -292,33 +296,26 @@ async function processImageInBackground(
       ].includes(aiModel)
     ) {
       // New Kie.ai models polling
-      const maxAttempts = 60;
-      for (let i = 0; i < maxAttempts; i++) {
-        try {
-          const status = await getGenericImageStatus(taskId);
-          if (status.status === "completed" && status.imageUrl) {
-            imageUrl = status.imageUrl;
-            break;
-          } else if (status.status === "failed") {
-            errorDetails = status.error || "Bilinmeyen hata";
-            console.error(`[Background] ${aiModel} failed: ${errorDetails}`);
-            break;
-          }
-        } catch (pollError) {
-          console.warn(`[Background] Polling error for ${taskId}:`, pollError);
-          // Don't break loop immediately, retry
-          if (i === maxAttempts - 1) {
-            errorDetails =
-              pollError instanceof Error
-                ? pollError.message
-                : "Durum kontrol hatası";
-          }
+      const result = await waitForTask(genericImageTaskSource, taskId, {
+        intervalMs: 5000,
+        timeoutMs: 5 * 60 * 1000,
+      });
+      if (result.status === "done") {
+        ({ imageUrl, error: errorDetails } = result.value);
+        if (errorDetails) {
+          console.error(`[Background] ${aiModel} failed: ${errorDetails}`);
         }
-        await new Promise(resolve => setTimeout(resolve, 5000));
+      } else {
+        errorDetails = result.lastError;
       }
     } else {
       // Nano Banana Pro veya Qwen polling (ikisi de aynı API'yi kullanıyor)
-      const pollResult = await pollTaskCompletionWithError(taskId);
+      const pollResult = await pollTaskCompletionWithError(
+        taskId,
+        undefined,
+        undefined,
+        language
+      );
       imageUrl = pollResult.imageUrl;
       errorDetails = pollResult.error;
     }
@@ -891,9 +888,11 @@ export const generationRouter = router({
               `Görsel oluşturma başarısız - ${input.resolution}`
             );
 
-            // Hata mesajını Türkçe'ye çevir
+            // Hata mesajını kullanıcının diline çevir
             const translatedError = translateApiError(
-              taskResponse.error || "API hatası oluştu"
+              taskResponse.error || "API hatası oluştu",
+              undefined,
+              ctx.language
             );
             throw new TRPCError({
               code: "INTERNAL_SERVER_ERROR",
@@ -939,7 +938,8 @@ export const generationRouter = router({
           input.resolution,
           input.aspectRatio,
           creditsNeeded,
-          aiModel
+          aiModel,
+          ctx.language
         ).catch(console.error);
 
         // Return immediately
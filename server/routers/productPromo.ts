@@ -2,12 +2,14 @@
 import { z } from "zod";
 import { router, protectedProcedure, publicProcedure } from "../_core/trpc";
 import { TRPCError } from "@trpc/server";
-import { getDb } from "../db";
+import { getDb, refundCredits } from "../db";
 import { productPromoVideos, users } from "../../drizzle/schema";
-import { eq, desc } from "drizzle-orm";
+import { and, eq, desc, inArray } from "drizzle-orm";
 import { generateVideo, getVideoStatus } from "../kieAiApi";
 import { notifyCreditSpending, notifyGenerationFailure } from "../telegramBot";
 import { storagePut } from "../storage";
+import { waitForTask, type TaskSource } from "../taskPoller";
+import { enqueueJob, registerJobHandler } from "../jobWorker";
 
 // Stil preset tanımları
 const STYLE_PRESETS = {
@@ -87,13 +89,39 @@ function generatePrompt(
   return prompt;
 }
 
-// Video işleme (background)
+// Promo videoları Veo3 ile üretilir; durum paylaşılan poller üzerinden izlenir
+const promoVideoTaskSource: TaskSource<{
+  videoUrl: string | null;
+  error: string | null;
+}> = {
+  name: "product-promo",
+  async check(taskId) {
+    const status = await getVideoStatus(taskId, "veo3");
+    if (status.status === "completed" && status.videoUrl) {
+      return {
+        state: "done",
+        value: { videoUrl: status.videoUrl, error: null },
+      };
+    }
+    if (status.status === "failed") {
+      return {
+        state: "done",
+        value: { videoUrl: null, error: status.error || null },
+      };
+    }
+    return { state: "pending", error: null };
+  },
+};
+
+// Video işleme (background). taskId verilirse mevcut Kie görevini beklemeye
+// devam eder (worker yeniden başlatıldıktan sonra devralınan işler).
 async function processPromoVideo(
   videoId: number,
   productImageUrl: string,
   prompt: string,
   userId: number,
-  userEmail: string
+  userEmail: string,
+  existingTaskId?: string | null
 ) {
   console.log(
     `[Product Promo] Starting video generation for videoId=${videoId}`
@@ -106,91 +134,81 @@ async function processPromoVideo(
   }
 
   try {
-    // Update status to processing
-    await db
-      .update(productPromoVideos)
-      .set({ status: "processing" })
-      .where(eq(productPromoVideos.id, videoId));
+    let taskId = existingTaskId;
+    if (!taskId) {
+      // Update status to processing
+      await db
+        .update(productPromoVideos)
+        .set({ status: "processing" })
+        .where(eq(productPromoVideos.id, videoId));
 
-    // Generate video using Kie AI (Veo 3.1 Fast for image-to-video)
-    const videoResult = await generateVideo({
-      modelType: "veo3",
-      generationType: "image-to-video",
-      prompt,
-      imageUrl: productImageUrl,
-      aspectRatio: "9:16", // Vertical for social media
-      quality: "fast", // Veo 3.1 Fast mode
-    });
+      // Generate video using Kie AI (Veo 3.1 Fast for image-to-video)
+      const videoResult = await generateVideo({
+        modelType: "veo3",
+        generationType: "image-to-video",
+        prompt,
+        imageUrl: productImageUrl,
+        aspectRatio: "9:16", // Vertical for social media
+        quality: "fast", // Veo 3.1 Fast mode
+      });
+
+      if (!videoResult.taskId) {
+        throw new Error("Video generation failed - no task ID");
+      }
+      taskId = videoResult.taskId;
 
-    if (!videoResult.taskId) {
-      throw new Error("Video generation failed - no task ID");
+      // Update with task ID
+      await db
+        .update(productPromoVideos)
+        .set({ taskId })
+        .where(eq(productPromoVideos.id, videoId));
     }
 
-    // Update with task ID
-    await db
-      .update(productPromoVideos)
-      .set({ taskId: videoResult.taskId })
-      .where(eq(productPromoVideos.id, videoId));
+    // Poll for completion - 30 minutes max (Kie AI can be slow under load)
+    const result = await waitForTask(promoVideoTaskSource, taskId, {
+      intervalMs: 5000,
+      timeoutMs: 30 * 60 * 1000,
+      firstCheckAfterMs: 5000,
+    });
 
-    // Poll for completion
-    const maxAttempts = 360; // 30 minutes max (Kie AI can be slow under load)
-    let attempts = 0;
+    if (result.status === "timeout") {
+      console.error(
+        `[Product Promo] Video generation timed out for videoId=${videoId}`
+      );
+      throw new Error("Video generation timed out");
+    }
 
-    while (attempts < maxAttempts) {
-      console.log(
-        `[Product Promo] Polling for videoId=${videoId}, taskId=${videoResult.taskId}, attempt=${attempts + 1}/${maxAttempts}`
+    const { videoUrl, error } = result.value;
+    if (!videoUrl) {
+      console.error(
+        `[Product Promo] Video generation failed for videoId=${videoId}: ${error}`
       );
-      await new Promise(resolve => setTimeout(resolve, 5000)); // 5 second intervals
-
-      const status = await getVideoStatus(videoResult.taskId, "veo3");
-
-      if (status.status === "completed" && status.videoUrl) {
-        console.log(
-          `[Product Promo] Video completed in ${attempts + 1} attempts, for videoId=${videoId}`
-        );
-        // Download and save to S3
-        const videoResponse = await fetch(status.videoUrl);
-        const videoBuffer = Buffer.from(await videoResponse.arrayBuffer());
-
-        const timestamp = Date.now();
-        const randomSuffix = Math.random().toString(36).substring(2, 8);
-        const s3Key = `product-promo/${userId}/${videoId}-${timestamp}-${randomSuffix}.mp4`;
-
-        const { url: s3Url } = await storagePut(
-          s3Key,
-          videoBuffer,
-          "video/mp4"
-        );
-
-        // Update as completed
-        await db
-          .update(productPromoVideos)
-          .set({
-            status: "completed",
-            generatedVideoUrl: s3Url,
-            duration: 8, // Default duration
-            completedAt: new Date(),
-          })
-          .where(eq(productPromoVideos.id, videoId));
-
-        console.log(`[Product Promo] Video saved to S3 and DB: ${s3Url}`);
-        return;
-      }
+      throw new Error(error || "Video generation failed");
+    }
 
-      if (status.status === "failed") {
-        console.error(
-          `[Product Promo] Video generation failed for videoId=${videoId}: ${status.error}`
-        );
-        throw new Error(status.error || "Video generation failed");
-      }
+    console.log(`[Product Promo] Video completed for videoId=${videoId}`);
+    // Download and save to S3
+    const videoResponse = await fetch(videoUrl);
+    const videoBuffer = Buffer.from(await videoResponse.arrayBuffer());
 
-      attempts++;
-    }
+    const timestamp = Date.now();
+    const randomSuffix = Math.random().toString(36).substring(2, 8);
+    const s3Key = `product-promo/${userId}/${videoId}-${timestamp}-${randomSuffix}.mp4`;
 
-    console.error(
-      `[Product Promo] Video generation timed out after ${maxAttempts} attempts for videoId=${videoId}`
-    );
-    throw new Error("Video generation timed out");
+    const { url: s3Url } = await storagePut(s3Key, videoBuffer, "video/mp4");
+
+    // Update as completed
+    await db
+      .update(productPromoVideos)
+      .set({
+        status: "completed",
+        generatedVideoUrl: s3Url,
+        duration: 8, // Default duration
+        completedAt: new Date(),
+      })
+      .where(eq(productPromoVideos.id, videoId));
+
+    console.log(`[Product Promo] Video saved to S3 and DB: ${s3Url}`);
   } catch (error) {
     console.error(`[Product Promo] Error:`, error);
 
@@ -212,6 +230,75 @@ async function processPromoVideo(
   }
 }
 
+// Kuyruktan gelen işi video kaydına göre başlatır ya da devam ettirir.
+// Başarısızlık videonun kendi kaydına yazıldığı için iş tekrar denenmez.
+registerJobHandler("product_promo", {
+  concurrency: 4,
+  async run(job) {
+    const db = await getDb();
+    if (!db) throw new Error("Database connection failed");
+
+    const [video] = await db
+      .select()
+      .from(productPromoVideos)
+      .where(eq(productPromoVideos.id, job.relatedId!));
+    if (!video || video.status === "completed" || video.status === "failed") {
+      return;
+    }
+
+    const [owner] = await db
+      .select({ email: users.email })
+      .from(users)
+      .where(eq(users.id, video.userId));
+
+    await processPromoVideo(
+      video.id,
+      video.productImageUrl,
+      video.prompt,
+      video.userId,
+      owner?.email || "",
+      video.status === "processing" ? video.taskId : null
+    );
+  },
+  // Worker'lar iş bitmeden tekrar tekrar çöktüyse video hâlâ işleniyor
+  // görünür: başarısız işaretle ve krediyi iade et
+  async onExhausted(job, error) {
+    const db = await getDb();
+    if (!db) throw new Error("Database connection failed");
+
+    const [video] = await db
+      .select()
+      .from(productPromoVideos)
+      .where(eq(productPromoVideos.id, job.relatedId!));
+    if (!video) return;
+
+    // Koşullu güncelleme: video bu arada sonuçlandıysa iade yapılmaz
+    const [result] = await db
+      .update(productPromoVideos)
+      .set({
+        status: "failed",
+        errorMessage: error,
+        completedAt: new Date(),
+      })
+      .where(
+        and(
+          eq(productPromoVideos.id, video.id),
+          inArray(productPromoVideos.status, ["pending", "processing"])
+        )
+      );
+    if (result.affectedRows === 0) return;
+
+    await refundCredits(
+      video.userId,
+      video.creditsCost,
+      `Ürün tanıtım videosu başarısız - #${video.id}`
+    );
+    console.log(
+      `[Product Promo] Video ${video.id} failed after job ${job.id} ran out of attempts, ${video.creditsCost} credits refunded`
+    );
+  },
+});
+
 export const productPromoRouter = router({
   // Get style presets
   getStylePresets: publicProcedure.query(() => {
@@ -248,7 +335,6 @@ export const productPromoRouter = router({
         });
 
       const userId = ctx.user.id;
-      const userEmail = ctx.user.email || "";
       const styleConfig = STYLE_PRESETS[input.stylePreset];
       const creditsNeeded = styleConfig.credits;
 
@@ -288,14 +374,13 @@ export const productPromoRouter = router({
 
       const videoId = result.insertId;
 
-      // Start background processing
-      processPromoVideo(
-        videoId,
-        input.productImageUrl,
-        prompt,
+      // Queue background processing
+      await enqueueJob({
         userId,
-        userEmail
-      );
+        jobType: "product_promo",
+        relatedId: videoId,
+        modelKey: "veo3",
+      });
 
       // Notify credit spending
       await notifyCreditSpending({
@@ -404,17 +489,16 @@ export const productPromoRouter = router({
       // Reset status
       await db
         .update(productPromoVideos)
-        .set({ status: "pending", errorMessage: null })
+        .set({ status: "pending", errorMessage: null, taskId: null })
         .where(eq(productPromoVideos.id, input.videoId));
 
       // Restart processing
-      processPromoVideo(
-        video.id,
-        video.productImageUrl,
-        video.prompt,
-        ctx.user.id,
-        ctx.user.email || ""
-      );
+      await enqueueJob({
+        userId: ctx.user.id,
+        jobType: "product_promo",
+        relatedId: video.id,
+        modelKey: "veo3",
+      });
 
       return { success: true };
     }),
@@ -14,6 +14,7 @@ vi.mock("../db", () => ({
     update: vi.fn().mockReturnThis(),
     set: vi.fn().mockReturnThis(),
   }),
+  getSiteSetting: vi.fn().mockResolvedValue(null),
 }));
 
 describe("Referral Router", () => {
@@ -1,13 +1,8 @@
 // @ts-nocheck
 import { z } from "zod";
 import { router, protectedProcedure, publicProcedure } from "../_core/trpc";
-import { getDb } from "../db";
-import {
-  users,
-  referrals,
-  creditTransactions,
-  siteSettings,
-} from "../../drizzle/schema";
+import { getDb, getSiteSetting } from "../db";
+import { users, referrals, creditTransactions } from "../../drizzle/schema";
 import { eq, and, count, sum } from "drizzle-orm";
 import { TRPCError } from "@trpc/server";
 import { nanoid } from "nanoid";
@@ -23,15 +18,8 @@ const DEFAULT_REFERRED_BONUS = 20;
 
 // Helper function to check if referral system is enabled
 async function isReferralSystemEnabled(): Promise<boolean> {
-  const db = await getDb();
-  if (!db) return true; // Default to enabled if db not available
-
-  const [setting] = await db
-    .select({ value: siteSettings.value })
-    .from(siteSettings)
-    .where(eq(siteSettings.key, "referral_system_enabled"));
-
-  return setting?.value !== "false";
+  // Default to enabled if the setting (or db) is not available
+  return (await getSiteSetting("referral_system_enabled")) !== "false";
 }
 
 // Helper function to get bonus amounts from settings
@@ -39,28 +27,16 @@ async function getBonusAmounts(): Promise<{
   referrer: number;
   referred: number;
 }> {
-  const db = await getDb();
-  if (!db)
-    return {
-      referrer: DEFAULT_REFERRER_BONUS,
-      referred: DEFAULT_REFERRED_BONUS,
-    };
-
-  const settings = await db
-    .select({ key: siteSettings.key, value: siteSettings.value })
-    .from(siteSettings)
-    .where(eq(siteSettings.key, "referral_bonus_referrer"));
-
-  const referredSettings = await db
-    .select({ value: siteSettings.value })
-    .from(siteSettings)
-    .where(eq(siteSettings.key, "referral_bonus_referred"));
+  const [referrerValue, referredValue] = await Promise.all([
+    getSiteSetting("referral_bonus_referrer"),
+    getSiteSetting("referral_bonus_referred"),
+  ]);
 
-  const referrerBonus = settings[0]?.value
-    ? parseInt(settings[0].value)
+  const referrerBonus = referrerValue
+    ? parseInt(referrerValue)
     : DEFAULT_REFERRER_BONUS;
-  const referredBonus = referredSettings[0]?.value
-    ? parseInt(referredSettings[0].value)
+  const referredBonus = referredValue
+    ? parseInt(referredValue)
     : DEFAULT_REFERRED_BONUS;
 
   return {
@@ -5,6 +5,7 @@ import { TRPCError } from "@trpc/server";
 import { getDb } from "../db";
 import { seoSettings, globalSeoConfig } from "../../drizzle/schema";
 import { eq, desc } from "drizzle-orm";
+import { getBlogSeo } from "../utils/blogSeo";
 
 // Admin check middleware
 const adminProcedure = protectedProcedure.use(({ ctx, next }) => {
@@ -54,6 +55,18 @@ export const seoRouter = router({
       return page || null;
     }),
 
+  // Get precomputed SEO meta for a seeded blog article (content/blog/seo)
+  getBlogMeta: publicProcedure
+    .input(
+      z.object({
+        slug: z.string(),
+        language: z.enum(["tr", "en"]).default("tr"),
+      })
+    )
+    .query(async ({ input }) => {
+      return getBlogSeo(input.slug, input.language);
+    }),
+
   // Create page SEO settings
   createPage: adminProcedure
     .input(
@@ -4,9 +4,8 @@
  * Allows fetching public settings like maintenance mode
  */
 import { router, publicProcedure } from "../_core/trpc";
-import { getDb } from "../db";
+import { getDb, getSiteSettings } from "../db";
 import {
-  siteSettings,
   viralAppsConfig,
   aiModelConfig,
   creditPackages,
@@ -78,13 +77,10 @@ export const settingsRouter = router({
         "packages_validity_text",
       ];
 
-      const settings = await db
-        .select({
-          key: siteSettings.key,
-          value: siteSettings.value,
-          isPublic: siteSettings.isPublic,
-        })
-        .from(siteSettings);
+      const settings = Array.from(await getSiteSettings(), ([key, row]) => ({
+        key,
+        ...row,
+      }));
 
       // Return explicitly public settings + backward-compatible whitelist
       return settings
@@ -322,15 +318,11 @@ export const settingsRouter = router({
     }
 
     try {
-      const settings = await db.select().from(siteSettings);
-
-      const packageSettings = settings.reduce(
-        (acc, setting) => {
-          acc[setting.key] = setting.value;
-          return acc;
-        },
-        {} as Record<string, string>
-      );
+      const settings = await getSiteSettings();
+      const packageSettings: Record<string, string> = {};
+      settings.forEach((setting, key) => {
+        packageSettings[key] = setting.value;
+      });
 
       // Only return messages if enabled and text is not empty
       const bonusEnabled = packageSettings["packages_bonus_message"] === "true";
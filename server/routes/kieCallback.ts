@@ -0,0 +1,79 @@
+/**
+ * Kie.ai video callback handler
+ * Üretim bittiğinde Kie.ai callBackUrl'e bildirim gönderir; video durum
+ * zamanlayıcısı bu görevi sırasını beklemeden sorgular
+ */
+import { Router, Request, Response } from "express";
+import crypto from "crypto";
+import { ENV } from "../_core/env";
+import { wakeVideoTask } from "../videoStatusUpdater";
+
+const router = Router();
+
+export const KIE_CALLBACK_PATH = "/api/kie/callback";
+
+// KIE_CALLBACK_URL içindeki ?token=... değeri. Kie.ai callback'i aynı URL'e
+// yaptığı için token her istekte geri gelir.
+function configuredToken(): string | null {
+  if (!ENV.kieCallbackUrl) return null;
+  try {
+    return new URL(ENV.kieCallbackUrl).searchParams.get("token") || null;
+  } catch {
+    return null;
+  }
+}
+
+const CALLBACK_TOKEN = configuredToken();
+if (ENV.kieCallbackUrl && !CALLBACK_TOKEN) {
+  console.warn(
+    "[Kie Callback] KIE_CALLBACK_URL has no ?token=..., callbacks will be rejected"
+  );
+}
+
+function isAuthorized(req: Request): boolean {
+  const token = req.query.token;
+  if (!CALLBACK_TOKEN || typeof token !== "string") return false;
+  const given = Buffer.from(token);
+  const expected = Buffer.from(CALLBACK_TOKEN);
+  return (
+    given.length === expected.length && crypto.timingSafeEqual(given, expected)
+  );
+}
+
+// Modellere göre taskId farklı yerlerde gelebilir
+function extractTaskId(body: unknown): string | null {
+  if (!body || typeof body !== "object") return null;
+  const payload = body as {
+    taskId?: unknown;
+    task_id?: unknown;
+    data?: { taskId?: unknown; task_id?: unknown };
+  };
+  const taskId =
+    payload.data?.taskId ??
+    payload.data?.task_id ??
+    payload.taskId ??
+    payload.task_id;
+  return typeof taskId === "string" && taskId ? taskId : null;
+}
+
+/**
+ * POST /api/kie/callback?token=...
+ * Callback içeriğine güvenilmez: sonuç getVideoStatus ile doğrulanır.
+ * Token'sız istekler reddedilir; geçerli istekler de zamanlayıcıda görev
+ * başına ve keşif için hız sınırına tabidir.
+ */
+router.post(KIE_CALLBACK_PATH, (req: Request, res: Response) => {
+  if (!isAuthorized(req)) {
+    return res.status(401).json({ error: "Unauthorized" });
+  }
+
+  const taskId = extractTaskId(req.body);
+  if (!taskId) {
+    return res.status(400).json({ error: "taskId missing" });
+  }
+
+  wakeVideoTask(taskId);
+  return res.json({ received: true });
+});
+
+export default router;
@@ -0,0 +1,148 @@
+import { describe, it, expect, vi, beforeEach, afterEach } from "vitest";
+import {
+  waitForTask,
+  getTaskPollerStats,
+  type TaskCheck,
+  type TaskSource,
+} from "./taskPoller";
+
+function scriptedSource(
+  name: string,
+  steps: Array<TaskCheck<string> | Error>
+): TaskSource<string> & { check: ReturnType<typeof vi.fn> } {
+  let index = 0;
+  return {
+    name,
+    check: vi.fn(async () => {
+      const step = steps[Math.min(index++, steps.length - 1)];
+      if (step instanceof Error) throw step;
+      return step;
+    }),
+  };
+}
+
+describe("taskPoller", () => {
+  beforeEach(() => {
+    vi.useFakeTimers();
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  it("shares one status check between waiters of the same task", async () => {
+    const source = scriptedSource("dedupe", [
+      { state: "pending" },
+      { state: "pending" },
+      { state: "done", value: "https://example.com/a.png" },
+    ]);
+    const options = { intervalMs: 2000, timeoutMs: 60000 };
+
+    const first = waitForTask(source, "task-1", options);
+    const second = waitForTask(source, "task-1", options);
+    await vi.advanceTimersByTimeAsync(0);
+    expect(source.check).toHaveBeenCalledTimes(1);
+    expect(getTaskPollerStats().waiters).toBe(2);
+
+    await vi.advanceTimersByTimeAsync(4000);
+    expect(source.check).toHaveBeenCalledTimes(3);
+    const expected = { status: "done", value: "https://example.com/a.png" };
+    expect(await first).toEqual(expected);
+    expect(await second).toEqual(expected);
+    expect(getTaskPollerStats().tasks).toBe(0);
+  });
+
+  it("reports the last provider error on timeout", async () => {
+    const source = scriptedSource("flaky", [
+      { state: "pending", error: "API_ERROR - busy" },
+      { state: "pending" },
+      new Error("socket hang up"),
+    ]);
+
+    const result = waitForTask(source, "task-2", {
+      intervalMs: 1000,
+      timeoutMs: 5000,
+    });
+    await vi.advanceTimersByTimeAsync(1000);
+    expect(source.check).toHaveBeenCalledTimes(2);
+
+    await vi.advanceTimersByTimeAsync(5000);
+    expect(await result).toEqual({
+      status: "timeout",
+      lastError: "socket hang up",
+    });
+    const stats = getTaskPollerStats().sources.flaky as {
+      errors: number;
+      timedOut: number;
+    };
+    expect(stats.timedOut).toBe(1);
+    expect(stats.errors).toBeGreaterThan(0);
+  });
+
+  it("clears a transient error once the provider answers again", async () => {
+    const source = scriptedSource("recovers", [
+      { state: "pending", error: "Görev durumu alınamadı" },
+      { state: "pending", error: null },
+    ]);
+
+    const result = waitForTask(source, "task-3", {
+      intervalMs: 1000,
+      timeoutMs: 3000,
+    });
+    await vi.advanceTimersByTimeAsync(4000);
+    expect(await result).toEqual({ status: "timeout", lastError: null });
+  });
+
+  it("groups due tasks into one batch request", async () => {
+    const checkBatch = vi.fn(async (taskIds: string[]) => {
+      return new Map(
+        taskIds.map(id => [
+          id,
+          { state: "done", value: id, completedAt: Date.now() - 500 } as const,
+        ])
+      );
+    });
+    const source: TaskSource<string> = {
+      name: "batched",
+      check: vi.fn(),
+      checkBatch,
+    };
+    const options = { intervalMs: 1000, timeoutMs: 10000 };
+
+    const results = Promise.all(
+      ["a", "b", "c"].map(id => waitForTask(source, id, options))
+    );
+    await vi.advanceTimersByTimeAsync(0);
+    expect(checkBatch).toHaveBeenCalledTimes(1);
+    expect([...checkBatch.mock.calls[0][0]].sort()).toEqual(["a", "b", "c"]);
+    expect((await results).map(r => r.status)).toEqual([
+      "done",
+      "done",
+      "done",
+    ]);
+
+    const stats = getTaskPollerStats().sources.batched as {
+      batches: number;
+      timeToDetect: { count: number; p50Ms: number };
+    };
+    expect(stats.batches).toBe(1);
+    expect(stats.timeToDetect.count).toBe(3);
+    expect(stats.timeToDetect.p50Ms).toBe(500);
+  });
+
+  it("delays the first check when asked to", async () => {
+    const source = scriptedSource("delayed", [
+      { state: "done", value: "ok" },
+    ]);
+
+    const result = waitForTask(source, "task-4", {
+      intervalMs: 5000,
+      timeoutMs: 60000,
+      firstCheckAfterMs: 5000,
+    });
+    await vi.advanceTimersByTimeAsync(4000);
+    expect(source.check).not.toHaveBeenCalled();
+    await vi.advanceTimersByTimeAsync(1000);
+    expect(await result).toEqual({ status: "done", value: "ok" });
+  });
+});
@@ -0,0 +1,350 @@
+// Task Poller - Shared completion polling for provider tasks
+//
+// Router'lar üretim sonucunu kendi for/setTimeout döngüleriyle beklemek
+// yerine waitForTask() çağırır. Tüm bekleyen görevler tek bir zamanlayıcı
+// üzerinden, sıradaki kontrol zamanına göre (min-heap) sorgulanır; aynı göreve
+// birden fazla bekleyen varsa tek sorgu yapılır, sağlayıcı izin veriyorsa
+// sorgular toplu gönderilir.
+import { MinHeap } from "./utils/minHeap";
+
+const TICK_MS = 1000;
+// Aynı anda sağlayıcılara gidebilecek durum sorgusu sayısı
+const MAX_CONCURRENT_CHECKS = 16;
+// Süre metrikleri için tutulan son örnek sayısı
+const SAMPLE_SIZE = 256;
+
+export type TaskCheck<T> =
+  | {
+      state: "pending";
+      // Geçici hata; null önceki hatayı temizler, undefined olduğu gibi bırakır
+      error?: string | null;
+    }
+  | {
+      state: "done";
+      value: T;
+      // Sağlayıcının bildirdiği tamamlanma zamanı (ms), fark etme gecikmesi için
+      completedAt?: number;
+    };
+
+export interface TaskSource<T> {
+  // Metrik etiketi ve görev anahtarının parçası (örn. "nano-banana")
+  name: string;
+  check(taskId: string): Promise<TaskCheck<T>>;
+  // Sağlayıcı toplu durum sorgusunu destekliyorsa
+  checkBatch?(taskIds: string[]): Promise<Map<string, TaskCheck<T>>>;
+  batchSize?: number;
+}
+
+export interface WaitOptions {
+  intervalMs: number;
+  timeoutMs: number;
+  // İlk sorgudan önce beklenecek süre (varsayılan: hemen)
+  firstCheckAfterMs?: number;
+}
+
+export type TaskResult<T> =
+  | { status: "done"; value: T }
+  | { status: "timeout"; lastError: string | null };
+
+interface Waiter<T> {
+  deadline: number;
+  intervalMs: number;
+  resolve: (result: TaskResult<T>) => void;
+}
+
+interface PolledTask<T> {
+  key: string;
+  taskId: string;
+  source: TaskSource<T>;
+  waiters: Waiter<T>[];
+  registeredAt: number;
+  nextCheckAt: number;
+  lastError: string | null;
+  checking: boolean;
+}
+
+class Samples {
+  private values: number[] = [];
+  private next = 0;
+  count = 0;
+
+  add(value: number): void {
+    if (this.values.length < SAMPLE_SIZE) {
+      this.values.push(value);
+    } else {
+      this.values[this.next] = value;
+      this.next = (this.next + 1) % SAMPLE_SIZE;
+    }
+    this.count++;
+  }
+
+  summary() {
+    if (this.values.length === 0) {
+      return { count: 0, p50Ms: null, p95Ms: null, maxMs: null };
+    }
+    const sorted = [...this.values].sort((a, b) => a - b);
+    const at = (q: number) =>
+      sorted[Math.min(sorted.length - 1, Math.floor(q * sorted.length))];
+    return {
+      count: this.count,
+      p50Ms: at(0.5),
+      p95Ms: at(0.95),
+      maxMs: sorted[sorted.length - 1],
+    };
+  }
+}
+
+interface SourceMetrics {
+  checks: number;
+  batches: number;
+  errors: number;
+  completed: number;
+  timedOut: number;
+  // Kayıttan sonuca kadar geçen süre
+  timeToResult: Samples;
+  // Sağlayıcının tamamlamasından bizim fark etmemize kadar geçen süre
+  timeToDetect: Samples;
+}
+
+// Farklı sonuç tipleri aynı tabloda tutulur; tipler waitForTask'ta eşleşir
+type AnyTask = PolledTask<any>;
+
+const tasks = new Map<string, AnyTask>();
+const schedule = new MinHeap<AnyTask>();
+const metrics = new Map<string, SourceMetrics>();
+let activeChecks = 0;
+let tickId: NodeJS.Timeout | null = null;
+
+function metricsFor(name: string): SourceMetrics {
+  let entry = metrics.get(name);
+  if (!entry) {
+    entry = {
+      checks: 0,
+      batches: 0,
+      errors: 0,
+      completed: 0,
+      timedOut: 0,
+      timeToResult: new Samples(),
+      timeToDetect: new Samples(),
+    };
+    metrics.set(name, entry);
+  }
+  return entry;
+}
+
+function scheduleCheck(task: AnyTask, at: number): void {
+  task.nextCheckAt = at;
+  schedule.push(at, task);
+}
+
+function startTicking(): void {
+  if (tickId) return;
+  tickId = setInterval(tick, TICK_MS);
+}
+
+function stopTickingIfIdle(): void {
+  if (tickId && tasks.size === 0) {
+    clearInterval(tickId);
+    tickId = null;
+    schedule.clear();
+  }
+}
+
+function finish(task: AnyTask, check: TaskCheck<unknown>): void {
+  if (check.state !== "done") return;
+  const now = Date.now();
+  const stats = metricsFor(task.source.name);
+  stats.completed++;
+  stats.timeToResult.add(now - task.registeredAt);
+  if (check.completedAt && check.completedAt <= now) {
+    stats.timeToDetect.add(now - check.completedAt);
+  }
+  tasks.delete(task.key);
+  for (const waiter of task.waiters) {
+    waiter.resolve({ status: "done", value: check.value });
+  }
+  task.waiters = [];
+}
+
+function applyCheck(task: AnyTask, check: TaskCheck<unknown>): void {
+  // Sorgu sürerken tüm bekleyenler zaman aşımına uğramış olabilir
+  if (tasks.get(task.key) !== task) return;
+  if (check.state === "done") {
+    finish(task, check);
+    return;
+  }
+  if (check.error !== undefined) {
+    task.lastError = check.error;
+  }
+  const interval = Math.min(...task.waiters.map(w => w.intervalMs));
+  scheduleCheck(task, Date.now() + interval);
+}
+
+function failCheck(task: AnyTask, error: unknown): void {
+  metricsFor(task.source.name).errors++;
+  applyCheck(task, {
+    state: "pending",
+    error: error instanceof Error ? error.message : "Durum kontrol hatası",
+  });
+}
+
+function expireWaiters(now: number): void {
+  for (const task of Array.from(tasks.values())) {
+    const expired = task.waiters.filter(w => w.deadline <= now);
+    if (expired.length === 0) continue;
+    task.waiters = task.waiters.filter(w => w.deadline > now);
+    metricsFor(task.source.name).timedOut += expired.length;
+    for (const waiter of expired) {
+      waiter.resolve({ status: "timeout", lastError: task.lastError });
+    }
+    if (task.waiters.length === 0) {
+      tasks.delete(task.key);
+    }
+  }
+}
+
+function runCheck(task: AnyTask): void {
+  activeChecks++;
+  task.checking = true;
+  metricsFor(task.source.name).checks++;
+  task.source
+    .check(task.taskId)
+    .then(
+      check => applyCheck(task, check),
+      error => failCheck(task, error)
+    )
+    .finally(() => {
+      task.checking = false;
+      activeChecks--;
+      stopTickingIfIdle();
+    });
+}
+
+function runBatch(source: TaskSource<any>, batch: AnyTask[]): void {
+  activeChecks++;
+  const stats = metricsFor(source.name);
+  stats.batches++;
+  stats.checks += batch.length;
+  for (const task of batch) task.checking = true;
+  source.checkBatch!(batch.map(task => task.taskId))
+    .then(
+      results => {
+        for (const task of batch) {
+          applyCheck(task, results.get(task.taskId) ?? { state: "pending" });
+        }
+      },
+      error => {
+        for (const task of batch) failCheck(task, error);
+      }
+    )
+    .finally(() => {
+      for (const task of batch) task.checking = false;
+      activeChecks--;
+      stopTickingIfIdle();
+    });
+}
+
+function tick(): void {
+  const now = Date.now();
+  expireWaiters(now);
+
+  const batches = new Map<TaskSource<any>, AnyTask[]>();
+  while (activeChecks < MAX_CONCURRENT_CHECKS) {
+    const next = schedule.peekKey();
+    if (next === undefined || next > now) break;
+    const { key, value: task } = schedule.pop()!;
+    if (
+      task.checking ||
+      task.nextCheckAt !== key ||
+      tasks.get(task.key) !== task
+    ) {
+      continue;
+    }
+    if (!task.source.checkBatch) {
+      runCheck(task);
+      continue;
+    }
+    const batch = batches.get(task.source) ?? [];
+    batch.push(task);
+    batches.set(task.source, batch);
+    if (batch.length >= (task.source.batchSize ?? 50)) {
+      runBatch(task.source, batch);
+      batches.delete(task.source);
+    }
+  }
+  batches.forEach((batch, source) => runBatch(source, batch));
+
+  stopTickingIfIdle();
+}
+
+/**
+ * Görev tamamlanana ya da timeoutMs dolana kadar bekler. Sağlayıcı hatası
+ * görevi sonlandırmaz; son geçici hata timeout sonucunda döner.
+ */
+export function waitForTask<T>(
+  source: TaskSource<T>,
+  taskId: string,
+  options: WaitOptions
+): Promise<TaskResult<T>> {
+  return new Promise(resolve => {
+    const now = Date.now();
+    const key = `${source.name}:${taskId}`;
+    const waiter: Waiter<T> = {
+      deadline: now + options.timeoutMs,
+      intervalMs: options.intervalMs,
+      resolve,
+    };
+
+    let task = tasks.get(key) as PolledTask<T> | undefined;
+    if (task) {
+      task.waiters.push(waiter);
+      return;
+    }
+
+    task = {
+      key,
+      taskId,
+      source,
+      waiters: [waiter],
+      registeredAt: now,
+      nextCheckAt: now,
+      lastError: null,
+      checking: false,
+    };
+    tasks.set(key, task);
+    scheduleCheck(task, now + (options.firstCheckAfterMs ?? 0));
+    startTicking();
+    // İlk sorgu için bir sonraki tick'i beklemeye gerek yok
+    if (!options.firstCheckAfterMs) {
+      setImmediate(tick);
+    }
+  });
+}
+
+export function getTaskPollerStats() {
+  const inFlight: Record<string, number> = {};
+  let waiters = 0;
+  for (const task of Array.from(tasks.values())) {
+    inFlight[task.source.name] = (inFlight[task.source.name] ?? 0) + 1;
+    waiters += task.waiters.length;
+  }
+  const sources: Record<string, unknown> = {};
+  metrics.forEach((stats, name) => {
+    sources[name] = {
+      inFlight: inFlight[name] ?? 0,
+      checks: stats.checks,
+      batches: stats.batches,
+      errors: stats.errors,
+      completed: stats.completed,
+      timedOut: stats.timedOut,
+      timeToResult: stats.timeToResult.summary(),
+      timeToDetect: stats.timeToDetect.summary(),
+    };
+  });
+  return {
+    tasks: tasks.size,
+    waiters,
+    activeChecks,
+    sources,
+  };
+}
@@ -1039,6 +1039,16 @@ export async function notifyGenerationFailure(data: {
   return await sendAdminNotification(message);
 }
 
+/**
+ * Stop polling; called from the process shutdown routine
+ */
+export function stopTelegramBot(reason: string) {
+  if (!bot || !isBotStarted) return;
+  bot.stop(reason);
+  isBotStarted = false;
+  console.log("[Telegram Bot] Bot stopped");
+}
+
 export async function startTelegramBot(maxRetries: number = 3) {
   if (!bot) {
     console.warn("[Telegram Bot] Cannot start - bot not initialized");
@@ -1065,10 +1075,6 @@ export async function startTelegramBot(maxRetries: number = 3) {
 
       isBotStarted = true;
       console.log("[Telegram Bot] Bot started successfully");
-
-      // Enable graceful stop
-      process.once("SIGINT", () => bot.stop("SIGINT"));
-      process.once("SIGTERM", () => bot.stop("SIGTERM"));
       return; // Success, exit function
     } catch (error: any) {
       lastError = error;
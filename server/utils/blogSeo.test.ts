@@ -0,0 +1,25 @@
+import { describe, it, expect } from "vitest";
+import { getBlogSeo } from "./blogSeo";
+
+const SLUG = "ai-gorsel-olusturma-rehberi-2024";
+
+describe("getBlogSeo", () => {
+  it("returns the precomputed meta of a seeded article", async () => {
+    const seo = await getBlogSeo(SLUG);
+    expect(seo?.ogType).toBe("article");
+    expect(seo?.ogLocale).toBe("tr_TR");
+    expect(seo?.canonicalUrl).toBe(`https://nanoinf.com/blog/${SLUG}`);
+    expect(seo!.metaTitle.length).toBeLessThanOrEqual(70);
+    expect(seo!.metaDescription.length).toBeLessThanOrEqual(160);
+    expect(JSON.parse(seo!.structuredData)["@type"]).toBe("BlogPosting");
+  });
+
+  it("reads the bundle of the requested language", async () => {
+    expect((await getBlogSeo(SLUG, "en"))?.ogLocale).toBe("en_US");
+  });
+
+  it("returns null for unknown slugs", async () => {
+    expect(await getBlogSeo("no-such-article")).toBeNull();
+    expect(await getBlogSeo("constructor")).toBeNull();
+  });
+});
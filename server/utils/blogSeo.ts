@@ -0,0 +1,61 @@
+import fs from "fs/promises";
+import path from "path";
+
+// scripts/build_blog_bundles.py tarafından blog-articles.json'dan üretilir
+const SEO_DIR = path.join(process.cwd(), "content", "blog", "seo");
+
+export type BlogSeoLanguage = "tr" | "en";
+
+// seoSettings sütun adlarıyla aynı alanlar, SeoHead doğrudan kullanabilir
+export interface BlogSeoEntry {
+  metaTitle: string;
+  metaDescription: string;
+  metaKeywords: string | null;
+  canonicalUrl: string;
+  ogTitle: string;
+  ogDescription: string;
+  ogType: "article";
+  ogLocale: string;
+  robotsIndex: boolean;
+  robotsFollow: boolean;
+  structuredData: string;
+  // SeoHead bu alanları da okur; paketlerde yoksa og/global değerlere düşer
+  ogImage?: null;
+  twitterTitle?: null;
+  twitterDescription?: null;
+  twitterImage?: null;
+}
+
+type BlogSeoBundle = Record<string, BlogSeoEntry>;
+
+// Her dilin paketi ilk istekte bir kez okunur; aynı anda gelen istekler
+// aynı Promise'i paylaşır
+const bundles = new Map<BlogSeoLanguage, Promise<BlogSeoBundle>>();
+
+async function readBundle(language: BlogSeoLanguage): Promise<BlogSeoBundle> {
+  try {
+    const text = await fs.readFile(
+      path.join(SEO_DIR, `${language}.json`),
+      "utf-8"
+    );
+    return JSON.parse(text) as BlogSeoBundle;
+  } catch (error) {
+    console.error(`[BlogSeo] ${language} paketi okunamadı:`, error);
+    return {};
+  }
+}
+
+export async function getBlogSeo(
+  slug: string,
+  language: BlogSeoLanguage = "tr"
+): Promise<BlogSeoEntry | null> {
+  let bundle = bundles.get(language);
+  if (!bundle) {
+    bundle = readBundle(language);
+    bundles.set(language, bundle);
+  }
+  const entries = await bundle;
+  return Object.prototype.hasOwnProperty.call(entries, slug)
+    ? entries[slug]
+    : null;
+}
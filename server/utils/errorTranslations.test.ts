@@ -0,0 +1,54 @@
+import { describe, it, expect } from "vitest";
+import { translations } from "../../client/src/i18n/translations";
+import { translateApiError } from "./errorTranslations";
+
+describe("translateApiError", () => {
+  it("uses the first matching rule in table order", () => {
+    // Matches both the NSFW and the timeout rules; NSFW comes first
+    expect(translateApiError("timed out: nsfw filter")).toBe(
+      translations["apiErrors.nsfw"].tr
+    );
+  });
+
+  it("answers in the requested language", () => {
+    expect(translateApiError("rate limit exceeded", undefined, "en")).toBe(
+      translations["apiErrors.rateLimit"].en
+    );
+    expect(translateApiError("rate limit exceeded")).toBe(
+      translations["apiErrors.rateLimit"].tr
+    );
+  });
+
+  it("fills placeholders from the provider message", () => {
+    expect(translateApiError("503 Service Unavailable", undefined, "en")).toBe(
+      "🔧 Server error (503)! Please wait a few minutes and try again."
+    );
+    expect(translateApiError("Upload limit 50MB")).toBe(
+      "📦 Dosya boyutu çok büyük! Maksimum 50MB olmalıdır."
+    );
+  });
+
+  it("strips error type prefixes", () => {
+    expect(translateApiError("API_ERROR - insufficient credits")).toBe(
+      translations["apiErrors.insufficientCredits"].tr
+    );
+  });
+
+  it("passes short unmatched messages through", () => {
+    expect(translateApiError("Your prompt was flagged")).toBe(
+      "⚠️ Your prompt was flagged"
+    );
+    expect(translateApiError("x".repeat(150), undefined, "en")).toBe(
+      translations["apiErrors.generic"].en
+    );
+    expect(translateApiError("")).toBe(translations["apiErrors.unknown"].tr);
+  });
+
+  it("returns the same result for a cached message", () => {
+    const first = translateApiError("model is busy", undefined, "en");
+    expect(translateApiError("model is busy", undefined, "en")).toBe(first);
+    expect(translateApiError("model is busy")).toBe(
+      translations["apiErrors.modelBusy"].tr
+    );
+  });
+});
@@ -1,294 +1,304 @@
+import { interpolate } from "../../client/src/i18n/interpolate";
+import { translations } from "../../client/src/i18n/translations";
+
 /**
- * Kie.ai API'sinden gelen hata mesajlarını Türkçe'ye çeviren yardımcı fonksiyonlar
+ * Kie.ai API'sinden gelen hata mesajlarını kullanıcının diline çeviren
+ * yardımcı fonksiyonlar.
+ *
+ * Mesajlar istemciyle aynı translations.ts tablosundan ("apiErrors.*")
+ * gelir. Kurallar sırayla denenir ve ilk eşleşen kazanır. Sağlayıcılar aynı
+ * hata metnini tekrar tekrar döndürdüğü için son çeviriler küçük bir LRU
+ * önbellekte tutulur.
  */
 
+export type ErrorLanguage = "tr" | "en";
+
 interface ErrorTranslation {
   pattern: RegExp;
-  translate: (match: RegExpMatchArray | null) => string;
+  key: string;
+  params?: (match: RegExpMatchArray) => Record<string, string>;
 }
 
 const errorTranslations: ErrorTranslation[] = [
   // Kie.ai Specific Errors
   {
     pattern: /recordInfo is null|record.*not.*found|task.*not.*found/i,
-    translate: () =>
-      "API görev bilgisi alınamadı. Bu teknik bir hatadır, lütfen tekrar deneyin.",
+    key: "apiErrors.recordNotFound",
   },
   {
     pattern: /model.*not.*available|model.*maintenance|model.*disabled/i,
-    translate: () =>
-      "Seçili model şu anda bakımda. Lütfen farklı bir model seçin.",
+    key: "apiErrors.modelMaintenance",
   },
   {
     pattern: /aspect.*ratio.*not.*support|invalid.*aspect.*ratio/i,
-    translate: () =>
-      "Seçili en-boy oranı bu model için desteklenmiyor. Lütfen farklı bir oran seçin.",
+    key: "apiErrors.aspectRatioUnsupported",
   },
   {
     pattern: /resolution.*not.*support|invalid.*resolution/i,
-    translate: () =>
-      "Seçili çözünürlük bu model için desteklenmiyor. Lütfen farklı bir kalite seçin.",
+    key: "apiErrors.resolutionUnsupported",
   },
   {
     pattern: /duration.*not.*support|invalid.*duration/i,
-    translate: () =>
-      "Seçili video süresi desteklenmiyor. Lütfen farklı bir süre seçin.",
+    key: "apiErrors.durationUnsupported",
   },
   {
     pattern: /quality.*not.*support|invalid.*quality/i,
-    translate: () =>
-      "Seçili kalite seviyesi desteklenmiyor. Lütfen farklı bir kalite seçin.",
+    key: "apiErrors.qualityUnsupported",
   },
   {
     pattern: /image.*required|reference.*image.*required/i,
-    translate: () => "Bu mod için referans görsel yüklemeniz gerekiyor.",
+    key: "apiErrors.referenceImageRequired",
   },
   {
     pattern: /model.*busy|queue.*full|too.*many.*request/i,
-    translate: () =>
-      "Model şu anda yoğun. Lütfen birkaç dakika bekleyip tekrar deneyin.",
+    key: "apiErrors.modelBusy",
   },
 
   // NSFW & Content Policy Errors
   {
     pattern: /nsfw|sexual|nude|explicit content|adult content/i,
-    translate: () =>
-      "⛔ İçerik Politikası İhlali: NSFW (Uygunsuz İçerik) tespit edildi. Lütfen promptunuzu değiştirin.",
+    key: "apiErrors.nsfw",
   },
   {
     pattern: /violence|violent|blood|gore/i,
-    translate: () =>
-      "⛔ İçerik Politikası İhlali: Şiddet içeriği tespit edildi. Lütfen promptunuzu değiştirin.",
+    key: "apiErrors.violence",
   },
   {
     pattern: /content policy|policy violation|inappropriate|banned.*word/i,
-    translate: () =>
-      "⛔ İçerik Politikası İhlali: Bu içerik topluluk kurallarına aykırı. Lütfen farklı bir prompt deneyin.",
+    key: "apiErrors.contentPolicy",
   },
   {
     pattern: /prompt.*unsafe|unsafe.*content|sensitive.*content/i,
-    translate: () =>
-      "⚠️ Promptunuz güvenli olmayan içerik tespit edildi. Lütfen daha uygun bir açıklama kullanın.",
+    key: "apiErrors.unsafePrompt",
   },
 
   // Timeout Errors
   {
     pattern: /timeout|timed out|time.*out|took too long|exceeded.*time/i,
-    translate: () =>
-      "⏱️ İşlem zaman aşımına uğradı. Servis yoğun olabilir, lütfen tekrar deneyin.",
+    key: "apiErrors.timeout",
   },
   {
     pattern: /generation.*timeout|processing.*timeout/i,
-    translate: () =>
-      "⏱️ Üretim süreci çok uzun sürdü. Lütfen daha basit bir prompt ile tekrar deneyin.",
+    key: "apiErrors.generationTimeout",
   },
 
   // Rate Limit & Quota Errors
   {
     pattern: /rate limit|quota.*exceed|limit.*exceed|too many requests/i,
-    translate: () =>
-      "🚫 API limiti aşıldı. Lütfen 2-3 dakika bekleyip tekrar deneyin.",
+    key: "apiErrors.rateLimit",
   },
   {
     pattern: /daily.*limit|hourly.*limit|minute.*limit/i,
-    translate: () =>
-      "📊 Günlük kullanım limitinize ulaştınız. Yarın tekrar deneyin veya premium'a geçin.",
+    key: "apiErrors.usageLimit",
   },
 
   // File Size & Format Errors
   {
     pattern:
       /file.*too large|size.*exceed|file.*big|maximum.*size|20MB|30MB|50MB/i,
-    translate: match => {
-      const size = match?.[0].match(/(\d+)MB/)?.[1] || "20";
-      return `📦 Dosya boyutu çok büyük! Maksimum ${size}MB olmalıdır.`;
-    },
+    key: "apiErrors.fileTooLarge",
+    params: match => ({ size: match[0].match(/(\d+)MB/)?.[1] || "20" }),
   },
   {
     pattern: /invalid.*format|unsupported.*format|format.*not.*support/i,
-    translate: () =>
-      "📄 Desteklenmeyen dosya formatı! Lütfen JPEG, PNG, WebP (görsel) veya MP4, MOV (video) kullanın.",
+    key: "apiErrors.unsupportedFormat",
   },
   {
     pattern:
       /image.*unavailable|media.*unavailable|cannot.*access.*image|url.*invalid/i,
-    translate: () =>
-      "🖼️ Görsele erişilemiyor. URL geçersiz olabilir veya görsel silinmiş olabilir.",
+    key: "apiErrors.imageUnavailable",
   },
   {
     pattern: /corrupted.*file|damaged.*file|cannot.*read.*file/i,
-    translate: () =>
-      "💔 Dosya bozuk veya okunamıyor. Lütfen farklı bir dosya yükleyin.",
+    key: "apiErrors.corruptedFile",
   },
 
   // Resolution & Quality Errors
   {
     pattern: /resolution.*too.*low|image.*too.*small|minimum.*resolution/i,
-    translate: () =>
-      "📐 Görsel çözünürlüğü çok düşük! Minimum 512x512 piksel gereklidir.",
+    key: "apiErrors.resolutionTooLow",
   },
   {
     pattern: /resolution.*too.*high|image.*too.*large|maximum.*resolution/i,
-    translate: () =>
-      "📏 Görsel çözünürlüğü çok yüksek! Lütfen daha küçük bir görsel kullanın.",
+    key: "apiErrors.resolutionTooHigh",
   },
 
   // API Key & Auth Errors
   {
     pattern:
       /api.*key.*invalid|api.*key.*expired|unauthorized|authentication.*fail/i,
-    translate: () =>
-      "🔑 API kimlik doğrulama hatası! Bu bir sistem sorunudur, lütfen yöneticiye bildirin.",
+    key: "apiErrors.authFailed",
   },
   {
     pattern: /permission.*denied|access.*denied|forbidden/i,
-    translate: () =>
-      "🚷 Erişim reddedildi. Bu özelliği kullanma yetkiniz olmayabilir.",
+    key: "apiErrors.accessDenied",
   },
 
   // Server & Network Errors
   {
     pattern: /server.*error|internal.*error|500|502|503|504/i,
-    translate: match => {
-      const code = match?.[0].match(/50[0-9]/)?.[0];
-      return `🔧 Sunucu hatası${code ? ` (${code})` : ""}! Lütfen birkaç dakika bekleyip tekrar deneyin.`;
+    key: "apiErrors.serverError",
+    params: match => {
+      const code = match[0].match(/50[0-9]/)?.[0];
+      return { code: code ? ` (${code})` : "" };
     },
   },
   {
     pattern: /service.*unavailable|maintenance.*mode|temporarily.*unavailable/i,
-    translate: () =>
-      "⚙️ Servis geçici olarak kullanılamıyor (bakım modu). Lütfen daha sonra tekrar deneyin.",
+    key: "apiErrors.serviceUnavailable",
   },
   {
     pattern:
       /network.*error|connection.*fail|cannot.*connect|ECONNREFUSED|ETIMEDOUT/i,
-    translate: () =>
-      "🌐 Ağ bağlantı hatası! İnternet bağlantınızı kontrol edin.",
+    key: "apiErrors.networkError",
   },
 
   // Task Creation & Processing Errors
   {
     pattern: /task.*creation.*fail|cannot.*create.*task|failed.*to.*start/i,
-    translate: () =>
-      "❌ İşlem başlatılamadı! Lütfen ayarlarınızı kontrol edip tekrar deneyin.",
+    key: "apiErrors.taskStartFailed",
   },
   {
     pattern: /task.*fail|generation.*fail|processing.*fail/i,
-    translate: () =>
-      "⚠️ İşlem başarısız oldu! Lütfen farklı ayarlarla veya farklı bir prompt ile tekrar deneyin.",
+    key: "apiErrors.taskFailed",
   },
   {
     pattern: /task.*cancelled|generation.*cancelled/i,
-    translate: () => "🚫 İşlem iptal edildi veya zaman aşımına uğradı.",
+    key: "apiErrors.taskCancelled",
   },
 
   // Prompt Errors
   {
     pattern:
       /prompt.*too.*long|text.*too.*long|maximum.*character|exceed.*5000/i,
-    translate: match => {
-      const limit = match?.[0].match(/(\d+)/)?.[1] || "2000";
-      return `📝 Prompt çok uzun! Maksimum ${limit} karakter olmalıdır.`;
-    },
+    key: "apiErrors.promptTooLong",
+    params: match => ({ limit: match[0].match(/(\d+)/)?.[1] || "2000" }),
   },
   {
     pattern: /prompt.*empty|prompt.*required|missing.*prompt/i,
-    translate: () => "✍️ Prompt boş olamaz! Lütfen ne istediğinizi açıklayın.",
+    key: "apiErrors.promptEmpty",
   },
   {
     pattern: /prompt.*invalid|malformed.*prompt/i,
-    translate: () =>
-      "❓ Geçersiz prompt formatı! Lütfen düzgün bir açıklama girin.",
+    key: "apiErrors.promptInvalid",
   },
 
   // Video Specific Errors
   {
     pattern: /video.*too.*long|duration.*exceed|maximum.*duration/i,
-    translate: match => {
-      const duration =
-        match?.[0].match(/(\d+)\s*(?:second|saniye|s)/)?.[1] || "30";
-      return `⏰ Video süresi çok uzun! Maksimum ${duration} saniye olmalıdır.`;
-    },
+    key: "apiErrors.videoTooLong",
+    params: match => ({
+      duration: match[0].match(/(\d+)\s*(?:second|saniye|s)/)?.[1] || "30",
+    }),
   },
   {
     pattern: /video.*resolution.*low|video.*quality.*low/i,
-    translate: () =>
-      "📹 Video çözünürlüğü çok düşük! Minimum 720x720 piksel gereklidir.",
+    key: "apiErrors.videoResolutionLow",
   },
   {
     pattern: /codec.*not.*support|video.*format.*not.*support/i,
-    translate: () =>
-      "🎬 Video formatı desteklenmiyor! Lütfen MP4, MOV veya WebM kullanın.",
+    key: "apiErrors.videoFormatUnsupported",
   },
   {
     pattern: /audio.*not.*support|audio.*codec.*fail/i,
-    translate: () => "🔊 Ses formatı desteklenmiyor veya ses işlenemedi.",
+    key: "apiErrors.audioUnsupported",
   },
   {
     pattern: /frame.*rate.*invalid|fps.*invalid/i,
-    translate: () =>
-      "🎞️ Geçersiz kare hızı! Video 24-60 FPS arasında olmalıdır.",
+    key: "apiErrors.frameRateInvalid",
   },
 
   // Credit & Payment Errors
   {
     pattern: /insufficient.*credit|not.*enough.*credit|balance.*low/i,
-    translate: () => "💳 Yetersiz kredi! Lütfen kredi paketlerine göz atın.",
+    key: "apiErrors.insufficientCredits",
   },
   {
     pattern: /payment.*required|subscription.*required/i,
-    translate: () =>
-      "💰 Bu özellik için ödeme gereklidir. Lütfen premium'a geçin.",
+    key: "apiErrors.paymentRequired",
   },
 
   // Model-Specific Errors
   {
     pattern: /flux.*not.*available|flux.*error/i,
-    translate: () =>
-      "⚡ Flux modeli şu anda kullanılamıyor. Lütfen farklı bir model seçin.",
+    key: "apiErrors.fluxUnavailable",
   },
   {
     pattern: /seedream.*not.*available|seedream.*error/i,
-    translate: () =>
-      "🌱 Seedream modeli şu anda kullanılamıyor. Lütfen farklı bir model seçin.",
+    key: "apiErrors.seedreamUnavailable",
   },
   {
     pattern: /kling.*not.*available|kling.*error/i,
-    translate: () =>
-      "🎥 Kling modeli şu anda kullanılamıyor. Lütfen farklı bir model seçin.",
+    key: "apiErrors.klingUnavailable",
   },
   {
     pattern: /veo.*not.*available|veo.*error/i,
-    translate: () =>
-      "🎬 Veo modeli şu anda kullanılamıyor. Lütfen farklı bir model seçin.",
-  },
-
-  // Generic Fallback
-  {
-    pattern: /.*/,
-    translate: match => {
-      // Eğer orijinal mesaj kısaysa ve anlamlıysa, başına emoji ekle
-      const msg = match?.[0] || "";
-      if (msg.length < 100 && !msg.includes("error") && !msg.includes("fail")) {
-        return `⚠️ ${msg}`;
-      }
-      return "❌ Bir hata oluştu. Lütfen tekrar deneyin veya destek ekibiyle iletişime geçin.";
-    },
+    key: "apiErrors.veoUnavailable",
   },
 ];
 
+// Eğer orijinal mesaj kısaysa ve anlamlıysa, başına emoji ekleyerek göster
+function fallbackMessage(message: string, language: ErrorLanguage): string {
+  const firstLine = message.match(/.*/)?.[0] || "";
+  if (
+    firstLine.length < 100 &&
+    !firstLine.includes("error") &&
+    !firstLine.includes("fail")
+  ) {
+    return translateKey("apiErrors.passthrough", language, {
+      message: firstLine,
+    });
+  }
+  return translateKey("apiErrors.generic", language);
+}
+
+function translateKey(
+  key: string,
+  language: ErrorLanguage,
+  params?: Record<string, string>
+): string {
+  const text = translations[key]?.[language] ?? key;
+  return params ? interpolate(text, params) : text;
+}
+
+function findTranslation(
+  message: string
+): [ErrorTranslation, RegExpMatchArray] | null {
+  for (const translation of errorTranslations) {
+    const match = message.match(translation.pattern);
+    if (match) {
+      return [translation, match];
+    }
+  }
+  return null;
+}
+
+const CACHE_SIZE = 500;
+// language + "\0" + raw message -> translation, least recently used first
+const translationCache = new Map<string, string>();
+
 /**
- * API'den gelen hata mesajını Türkçe'ye çevirir
+ * API'den gelen hata mesajını kullanıcının diline çevirir
  * @param errorMessage API'den gelen orijinal hata mesajı
  * @param errorType Hata tipi (opsiyonel: API_ERROR, TIMEOUT, CONTENT_POLICY vb.)
- * @returns Türkçe hata mesajı
+ * @param language Yanıt dili (varsayılan: Türkçe)
+ * @returns Çevrilmiş hata mesajı
  */
 export function translateApiError(
   errorMessage: string,
-  errorType?: string
+  errorType?: string,
+  language: ErrorLanguage = "tr"
 ): string {
   if (!errorMessage) {
-    return "Bilinmeyen bir hata oluştu.";
+    return translateKey("apiErrors.unknown", language);
+  }
+
+  const cacheKey = `${language}\0${errorMessage}`;
+  const cached = translationCache.get(cacheKey);
+  if (cached !== undefined) {
+    translationCache.delete(cacheKey);
+    translationCache.set(cacheKey, cached);
+    return cached;
   }
 
   // Eğer error type prefix varsa, temizle
@@ -298,15 +308,16 @@ export function translateApiError(
   );
 
   // En uygun çeviriyi bul
-  for (const translation of errorTranslations) {
-    const match = cleanMessage.match(translation.pattern);
-    if (match) {
-      return translation.translate(match);
-    }
-  }
+  const found = findTranslation(cleanMessage);
+  const translated = found
+    ? translateKey(found[0].key, language, found[0].params?.(found[1]))
+    : fallbackMessage(cleanMessage, language);
 
-  // Fallback
-  return cleanMessage || "Bir hata oluştu. Lütfen tekrar deneyin.";
+  if (translationCache.size >= CACHE_SIZE) {
+    translationCache.delete(translationCache.keys().next().value!);
+  }
+  translationCache.set(cacheKey, translated);
+  return translated;
 }
 
 /**
@@ -0,0 +1,56 @@
+/**
+ * Binary min-heap ordered by a numeric key (e.g. the next time a task is due)
+ */
+export class MinHeap<T> {
+  private items: { key: number; value: T }[] = [];
+
+  get size(): number {
+    return this.items.length;
+  }
+
+  push(key: number, value: T): void {
+    const items = this.items;
+    items.push({ key, value });
+    let index = items.length - 1;
+    while (index > 0) {
+      const parent = (index - 1) >> 1;
+      if (items[parent].key <= key) break;
+      [items[parent], items[index]] = [items[index], items[parent]];
+      index = parent;
+    }
+  }
+
+  /** Smallest key without removing it, or undefined if empty */
+  peekKey(): number | undefined {
+    return this.items[0]?.key;
+  }
+
+  pop(): { key: number; value: T } | undefined {
+    const items = this.items;
+    const top = items[0];
+    const last = items.pop();
+    if (!top || !last || items.length === 0) return top;
+
+    items[0] = last;
+    let index = 0;
+    for (;;) {
+      const left = index * 2 + 1;
+      const right = left + 1;
+      let smallest = index;
+      if (left < items.length && items[left].key < items[smallest].key) {
+        smallest = left;
+      }
+      if (right < items.length && items[right].key < items[smallest].key) {
+        smallest = right;
+      }
+      if (smallest === index) break;
+      [items[smallest], items[index]] = [items[index], items[smallest]];
+      index = smallest;
+    }
+    return top;
+  }
+
+  clear(): void {
+    this.items = [];
+  }
+}
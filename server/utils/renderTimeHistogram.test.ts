@@ -0,0 +1,42 @@
+import { describe, it, expect } from "vitest";
+import {
+  renderTimeBucket,
+  renderTimeBucketValue,
+  renderTimeQuantile,
+} from "./renderTimeHistogram";
+
+function histogram(samples: number[]) {
+  const counts = new Map<number, number>();
+  for (const ms of samples) {
+    const bucket = renderTimeBucket(ms);
+    counts.set(bucket, (counts.get(bucket) ?? 0) + 1);
+  }
+  return counts;
+}
+
+describe("renderTimeHistogram", () => {
+  it("maps a duration back to within 5% of itself", () => {
+    for (const ms of [1, 250, 1234, 45_000, 3_600_000]) {
+      const value = renderTimeBucketValue(renderTimeBucket(ms));
+      expect(Math.abs(value - ms) / ms).toBeLessThanOrEqual(0.05);
+    }
+  });
+
+  it("reads p50 and p95 from bucket counts", () => {
+    const samples = Array.from({ length: 100 }, (_, i) => (i + 1) * 1000);
+    const counts = histogram(samples);
+
+    expect(renderTimeQuantile(counts, 0.5)).toBeCloseTo(50_000, -4);
+    expect(renderTimeQuantile(counts, 0.95)).toBeCloseTo(95_000, -4);
+  });
+
+  it("is not dragged by outliers the way a mean is", () => {
+    const counts = histogram([...Array(19).fill(10_000), 600_000]);
+    expect(renderTimeQuantile(counts, 0.5)).toBeCloseTo(10_000, -3);
+  });
+
+  it("returns null without samples", () => {
+    expect(renderTimeQuantile([], 0.5)).toBeNull();
+    expect(renderTimeQuantile([[10, 0]], 0.95)).toBeNull();
+  });
+});
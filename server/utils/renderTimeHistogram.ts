@@ -0,0 +1,41 @@
+/**
+ * Log-bucketed render time histogram. Bucket `b` holds durations in
+ * (GAMMA^(b-1), GAMMA^b] ms, so any percentile read back from the counts is
+ * within ~5% of the true value while an hour-long range needs only ~160
+ * buckets. Counts from different processes merge by plain addition, which is
+ * what lets them live in an `ON DUPLICATE KEY UPDATE sampleCount + n` table.
+ */
+const GAMMA = 1.1;
+const LOG_GAMMA = Math.log(GAMMA);
+
+export function renderTimeBucket(renderTimeMs: number): number {
+  const ms = Math.max(renderTimeMs, 1);
+  return Math.max(0, Math.ceil(Math.log(ms) / LOG_GAMMA));
+}
+
+/** Representative duration of a bucket, minimizing the relative error */
+export function renderTimeBucketValue(bucket: number): number {
+  return Math.round((2 * Math.pow(GAMMA, bucket)) / (GAMMA + 1));
+}
+
+/**
+ * Read a quantile (0..1) back from bucket counts, or null without samples
+ */
+export function renderTimeQuantile(
+  counts: Iterable<[bucket: number, count: number]>,
+  quantile: number
+): number | null {
+  const sorted = Array.from(counts)
+    .filter(([, count]) => count > 0)
+    .sort((a, b) => a[0] - b[0]);
+  const total = sorted.reduce((sum, [, count]) => sum + count, 0);
+  if (total === 0) return null;
+
+  const rank = quantile * (total - 1);
+  let seen = 0;
+  for (const [bucket, count] of sorted) {
+    seen += count;
+    if (seen > rank) return renderTimeBucketValue(bucket);
+  }
+  return renderTimeBucketValue(sorted[sorted.length - 1][0]);
+}
@@ -0,0 +1,70 @@
+import { describe, it, expect, vi, beforeEach, afterEach } from "vitest";
+import { TtlLruCache } from "./ttlLruCache";
+
+describe("TtlLruCache", () => {
+  beforeEach(() => {
+    vi.useFakeTimers();
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  it("serves hits until the entry expires", async () => {
+    const cache = new TtlLruCache<number>({ maxEntries: 10, ttlMs: 1000 });
+    const load = vi.fn().mockResolvedValueOnce(1).mockResolvedValueOnce(2);
+
+    expect(await cache.get("a", load)).toBe(1);
+    vi.advanceTimersByTime(999);
+    expect(await cache.get("a", load)).toBe(1);
+    vi.advanceTimersByTime(1);
+    expect(await cache.get("a", load)).toBe(2);
+    expect(cache.stats()).toMatchObject({ hits: 1, misses: 2 });
+  });
+
+  it("evicts the least recently used key", async () => {
+    const cache = new TtlLruCache<string>({ maxEntries: 2, ttlMs: 60000 });
+    await cache.get("a", async () => "a");
+    await cache.get("b", async () => "b");
+    await cache.get("a", async () => "unused"); // a is now most recent
+    await cache.get("c", async () => "c");
+
+    expect(cache.peek("a")).toBe("a");
+    expect(cache.peek("b")).toBeUndefined();
+    expect(cache.stats().evictions).toBe(1);
+  });
+
+  it("shares one load between concurrent misses", async () => {
+    const cache = new TtlLruCache<number>({ maxEntries: 10, ttlMs: 60000 });
+    let resolve!: (value: number) => void;
+    const load = vi.fn(() => new Promise<number>(r => (resolve = r)));
+
+    const results = Promise.all([cache.get("k", load), cache.get("k", load)]);
+    resolve(42);
+    expect(await results).toEqual([42, 42]);
+    expect(load).toHaveBeenCalledTimes(1);
+    expect(cache.stats().coalesced).toBe(1);
+  });
+
+  it("does not store a load that was in flight during clear()", async () => {
+    const cache = new TtlLruCache<string>({ maxEntries: 10, ttlMs: 60000 });
+    let resolve!: (value: string) => void;
+    const pending = cache.get("k", () => new Promise(r => (resolve = r)));
+
+    cache.clear();
+    resolve("old");
+    expect(await pending).toBe("old");
+    expect(cache.peek("k")).toBeUndefined();
+  });
+
+  it("keeps expired values available to peek for fallbacks", async () => {
+    const cache = new TtlLruCache<number>({ maxEntries: 10, ttlMs: 1000 });
+    await cache.get("k", async () => 7);
+    vi.advanceTimersByTime(5000);
+
+    await expect(
+      cache.get("k", () => Promise.reject(new Error("db down")))
+    ).rejects.toThrow("db down");
+    expect(cache.peek("k")).toBe(7);
+  });
+});
@@ -0,0 +1,84 @@
+/**
+ * Size-bounded cache with per-entry TTL, least-recently-used eviction and a
+ * single in-flight load per key (concurrent misses share one loader call)
+ */
+export class TtlLruCache<V> {
+  // Map keeps insertion order; a hit re-inserts the key so the first key is
+  // always the least recently used one
+  private entries = new Map<string, { value: V; expiresAt: number }>();
+  private inFlight = new Map<string, Promise<V>>();
+  // Bumped by clear() so loads started before it do not store stale values
+  private generation = 0;
+  private counters = { hits: 0, misses: 0, coalesced: 0, evictions: 0 };
+
+  constructor(
+    private readonly options: { maxEntries: number; ttlMs: number }
+  ) {}
+
+  async get(key: string, load: () => Promise<V>): Promise<V> {
+    const entry = this.entries.get(key);
+    if (entry && entry.expiresAt > Date.now()) {
+      this.counters.hits++;
+      this.entries.delete(key);
+      this.entries.set(key, entry);
+      return entry.value;
+    }
+
+    this.counters.misses++;
+    const pending = this.inFlight.get(key);
+    if (pending) {
+      this.counters.coalesced++;
+      return pending;
+    }
+
+    const generation = this.generation;
+    const promise = load()
+      .then(value => {
+        if (generation === this.generation) {
+          this.set(key, value);
+        }
+        return value;
+      })
+      .finally(() => {
+        if (this.inFlight.get(key) === promise) {
+          this.inFlight.delete(key);
+        }
+      });
+    this.inFlight.set(key, promise);
+    return promise;
+  }
+
+  /** Last stored value even if expired, e.g. as a fallback when a load fails */
+  peek(key: string): V | undefined {
+    return this.entries.get(key)?.value;
+  }
+
+  set(key: string, value: V): void {
+    this.entries.delete(key);
+    this.entries.set(key, {
+      value,
+      expiresAt: Date.now() + this.options.ttlMs,
+    });
+    while (this.entries.size > this.options.maxEntries) {
+      const oldest = this.entries.keys().next().value as string;
+      this.entries.delete(oldest);
+      this.counters.evictions++;
+    }
+  }
+
+  clear(): void {
+    this.entries.clear();
+    this.inFlight.clear();
+    this.generation++;
+  }
+
+  stats() {
+    const lookups = this.counters.hits + this.counters.misses;
+    return {
+      ...this.counters,
+      size: this.entries.size,
+      maxEntries: this.options.maxEntries,
+      hitRate: lookups > 0 ? this.counters.hits / lookups : null,
+    };
+  }
+}
@@ -0,0 +1,167 @@
+import { describe, it, expect, vi, beforeEach, afterEach } from "vitest";
+
+const { pendingRows } = vi.hoisted(() => ({
+  pendingRows: [] as Array<Record<string, unknown>>,
+}));
+
+vi.mock("./db", () => ({
+  getDb: vi.fn().mockResolvedValue({
+    select: vi.fn().mockReturnThis(),
+    from: vi.fn().mockReturnThis(),
+    where: vi.fn().mockReturnThis(),
+    limit: vi.fn(async () => [...pendingRows]),
+  }),
+  updateVideoGenerationStatus: vi.fn().mockResolvedValue(undefined),
+  refundCredits: vi.fn().mockResolvedValue(undefined),
+}));
+
+vi.mock("./kieAiApi", () => ({
+  getVideoStatus: vi.fn(),
+}));
+
+vi.mock("./routers/notification", () => ({
+  createNotification: vi.fn().mockResolvedValue(undefined),
+}));
+
+vi.mock("./_core/videoMetadata", () => ({
+  getVideoDuration: vi.fn().mockResolvedValue(null),
+}));
+
+import { getVideoStatus } from "./kieAiApi";
+import { getDb } from "./db";
+import {
+  startVideoStatusUpdater,
+  stopVideoStatusUpdater,
+  wakeVideoTask,
+  getVideoStatusUpdaterStats,
+} from "./videoStatusUpdater";
+
+const statusMock = vi.mocked(getVideoStatus);
+
+function pendingVideo(id: number, model = "veo3") {
+  return {
+    id,
+    taskId: `task-${id}`,
+    model,
+    userId: 1,
+    creditsCost: 50,
+    status: "processing",
+  };
+}
+
+describe("videoStatusUpdater scheduler", () => {
+  beforeEach(() => {
+    vi.useFakeTimers();
+    pendingRows.length = 0;
+    statusMock.mockReset();
+    statusMock.mockResolvedValue({ status: "processing" });
+  });
+
+  afterEach(() => {
+    stopVideoStatusUpdater();
+    vi.useRealTimers();
+  });
+
+  it("waits for the model's expected duration before the first check", async () => {
+    startVideoStatusUpdater();
+    await vi.advanceTimersByTimeAsync(0);
+
+    pendingRows.push(pendingVideo(1));
+    await vi.advanceTimersByTimeAsync(30000); // discovery
+    expect(getVideoStatusUpdaterStats().tracked).toBe(1);
+    expect(statusMock).not.toHaveBeenCalled();
+
+    // veo3 prior: 90s, first check at 70% of it
+    await vi.advanceTimersByTimeAsync(62000);
+    expect(statusMock).not.toHaveBeenCalled();
+    await vi.advanceTimersByTimeAsync(1000);
+    expect(statusMock).toHaveBeenCalledTimes(1);
+  });
+
+  it("backs off between checks without exceeding the old interval", async () => {
+    pendingRows.push(pendingVideo(1));
+    startVideoStatusUpdater();
+    await vi.advanceTimersByTimeAsync(0);
+    expect(statusMock).toHaveBeenCalledTimes(1);
+
+    // Sunucu açılışında bulunan video beklenen süreden sonra sayılır:
+    // 10s, 20s, 30s, 30s...
+    const calls = [];
+    for (const step of [10000, 20000, 30000, 30000, 30000]) {
+      await vi.advanceTimersByTimeAsync(step);
+      calls.push(statusMock.mock.calls.length);
+    }
+    expect(calls).toEqual([2, 3, 4, 5, 6]);
+  });
+
+  it("runs at most five checks at a time", async () => {
+    const resolvers: Array<() => void> = [];
+    statusMock.mockImplementation(
+      () =>
+        new Promise(resolve => {
+          resolvers.push(() => resolve({ status: "completed" }));
+        })
+    );
+    for (let id = 1; id <= 8; id++) pendingRows.push(pendingVideo(id));
+
+    startVideoStatusUpdater();
+    await vi.advanceTimersByTimeAsync(0);
+    expect(statusMock).toHaveBeenCalledTimes(5);
+
+    resolvers.splice(0).forEach(resolve => resolve());
+    await vi.advanceTimersByTimeAsync(0);
+    expect(statusMock).toHaveBeenCalledTimes(8);
+    resolvers.splice(0).forEach(resolve => resolve());
+    await vi.advanceTimersByTimeAsync(0);
+  });
+
+  it("checks a task right away when its callback arrives", async () => {
+    startVideoStatusUpdater();
+    await vi.advanceTimersByTimeAsync(0);
+    pendingRows.push(pendingVideo(1, "sora2"));
+    await vi.advanceTimersByTimeAsync(30000);
+    expect(statusMock).not.toHaveBeenCalled();
+
+    statusMock.mockResolvedValue({
+      status: "completed",
+      videoUrl: "https://example.com/video.mp4",
+    });
+    wakeVideoTask("task-1");
+    await vi.advanceTimersByTimeAsync(0);
+    expect(statusMock).toHaveBeenCalledTimes(1);
+    expect(getVideoStatusUpdaterStats().tracked).toBe(0);
+  });
+
+  it("checks a task at most once per wake interval however often it is woken", async () => {
+    startVideoStatusUpdater();
+    await vi.advanceTimersByTimeAsync(0);
+    pendingRows.push(pendingVideo(1, "sora2"));
+    await vi.advanceTimersByTimeAsync(30000);
+
+    wakeVideoTask("task-1");
+    await vi.advanceTimersByTimeAsync(0);
+    expect(statusMock).toHaveBeenCalledTimes(1);
+
+    for (let i = 0; i < 20; i++) wakeVideoTask("task-1");
+    await vi.advanceTimersByTimeAsync(4999);
+    expect(statusMock).toHaveBeenCalledTimes(1);
+    await vi.advanceTimersByTimeAsync(1);
+    expect(statusMock).toHaveBeenCalledTimes(2);
+  });
+
+  it("throttles discovery triggered by unknown task ids", async () => {
+    const db = await getDb();
+    startVideoStatusUpdater();
+    await vi.advanceTimersByTimeAsync(0);
+    const queries = vi.mocked(db.limit).mock.calls.length;
+
+    for (let i = 0; i < 50; i++) wakeVideoTask(`unknown-${i}`);
+    await vi.advanceTimersByTimeAsync(0);
+    expect(vi.mocked(db.limit).mock.calls.length).toBe(queries + 1);
+
+    await vi.advanceTimersByTimeAsync(10000);
+    wakeVideoTask("unknown-again");
+    await vi.advanceTimersByTimeAsync(0);
+    expect(vi.mocked(db.limit).mock.calls.length).toBe(queries + 2);
+  });
+});
@@ -1,11 +1,12 @@
 // Video Status Updater - Background job to check and update video statuses
 import { getDb } from "./db";
 import { videoGenerations } from "../drizzle/schema";
-import { eq, inArray, and, or } from "drizzle-orm";
+import { eq, inArray, and, or, isNotNull } from "drizzle-orm";
 import { getVideoStatus, type UnifiedVideoModelType } from "./kieAiApi";
 import * as db from "./db";
 import { createNotification } from "./routers/notification";
 import { getVideoDuration } from "./_core/videoMetadata";
+import { MinHeap } from "./utils/minHeap";
 
 /**
  * Motion Control için kredi iadesi kontrolü
@@ -78,8 +79,46 @@ async function checkAndRefundMotionControlCredits(
   }
 }
 
-const CHECK_INTERVAL = 30000; // 30 seconds
+// Yeni ve sonuçlanmamış videoları veritabanından toplama aralığı
+const DISCOVERY_INTERVAL = 30000; // 30 seconds
+// Aynı anda Kie.ai'ye gidebilecek durum sorgusu sayısı
 const MAX_CONCURRENT_CHECKS = 5;
+const MAX_TRACKED_VIDEOS = 500;
+
+// Beklenen süreye ulaşan bir video önce sık, sonra giderek seyrek sorgulanır.
+// Üst sınır eski sabit aralıkla aynı olduğundan tamamlanmanın fark edilmesi
+// gecikmez; çok uzun süren işler daha seyrek sorgulanır.
+const MIN_RECHECK_DELAY = 10000;
+const MAX_RECHECK_DELAY = 30000;
+const STALE_AFTER = 20 * 60 * 1000;
+const STALE_RECHECK_DELAY = 120000;
+// İlk sorgu beklenen sürenin bu oranında yapılır
+const FIRST_CHECK_RATIO = 0.7;
+// Tekrarlanan callback'ler bir görevi bu aralıktan sık sorgulatmaz, bilinmeyen
+// taskId'ler de keşif sorgusunu bu aralıktan sık tetiklemez
+const WAKE_MIN_INTERVAL = 5000;
+const WAKE_DISCOVERY_INTERVAL = 10000;
+
+// Modellerin tipik üretim süreleri (ms); tamamlanan videolarla güncellenir
+const DEFAULT_EXPECTED_DURATION = 120000;
+const EXPECTED_DURATION_PRIORS: Record<string, number> = {
+  veo3: 90000,
+  veo3_fast: 90000,
+  sora2: 180000,
+  kling: 120000,
+  "kling-motion": 180000,
+  grok: 60000,
+  "wan-22": 120000,
+  "wan-25": 120000,
+  "wan-26": 120000,
+  hailuo: 120000,
+  "seedance-lite": 90000,
+  "seedance-pro": 90000,
+  "seedance-15-pro": 90000,
+  runway: 90000,
+  "runway-pro": 120000,
+};
+const PRIOR_WEIGHT = 0.8;
 
 interface PendingVideo {
   id: number;
@@ -90,11 +129,13 @@ interface PendingVideo {
   status: string;
   duration?: number;
   quality?: string;
+  createdAt: string;
 }
 
-async function getPendingVideos(): Promise<PendingVideo[]> {
+// Veritabanına ulaşılamazsa null döner (bekleyen video yok demek değildir)
+async function getPendingVideos(): Promise<PendingVideo[] | null> {
   const dbConn = await getDb();
-  if (!dbConn) return [];
+  if (!dbConn) return null;
 
   try {
     const videos = await dbConn
@@ -107,24 +148,34 @@ async function getPendingVideos(): Promise<PendingVideo[]> {
         status: videoGenerations.status,
         duration: videoGenerations.duration,
         quality: videoGenerations.quality,
+        createdAt: videoGenerations.createdAt,
       })
       .from(videoGenerations)
       .where(
-        or(
-          eq(videoGenerations.status, "pending"),
-          eq(videoGenerations.status, "processing")
+        and(
+          or(
+            eq(videoGenerations.status, "pending"),
+            eq(videoGenerations.status, "processing")
+          ),
+          isNotNull(videoGenerations.taskId)
         )
       )
-      .limit(MAX_CONCURRENT_CHECKS);
+      .limit(MAX_TRACKED_VIDEOS);
 
-    return videos.filter(v => v.taskId) as PendingVideo[];
+    return videos as PendingVideo[];
   } catch (error) {
     console.error("[VideoStatusUpdater] Error fetching pending videos:", error);
-    return [];
+    return null;
   }
 }
 
-async function updateVideoStatus(video: PendingVideo): Promise<void> {
+/**
+ * Videonun durumunu sağlayıcıdan sorgular ve değiştiyse kaydeder.
+ * Gözlenen durumu, hata olursa null döner.
+ */
+async function updateVideoStatus(
+  video: PendingVideo
+): Promise<PendingVideo["status"] | null> {
   try {
     const modelType = video.model as UnifiedVideoModelType;
     const status = await getVideoStatus(video.taskId, modelType);
@@ -239,27 +290,246 @@ async function updateVideoStatus(video: PendingVideo): Promise<void> {
         });
       }
     }
+    return status.status;
   } catch (error) {
     console.error(
       `[VideoStatusUpdater] Error updating video ${video.id}:`,
       error
     );
+    return null;
   }
 }
 
-async function checkAllPendingVideos(): Promise<void> {
-  const pendingVideos = await getPendingVideos();
+interface TrackedVideo {
+  video: PendingVideo;
+  // Videonun oluşturulduğu an (en fazla bir keşif aralığı geriye alınır)
+  startedAt: number;
+  // Sunucu açılışında zaten bekleyen videoların süresi bilinmez
+  timed: boolean;
+  nextCheckAt: number;
+  // Beklenen süre geçtikten sonra yapılan sorgu sayısı
+  attempts: number;
+  inFlight: boolean;
+  // Sorgu sürerken callback geldiyse sonuç eski olabilir, WAKE_MIN_INTERVAL
+  // dolunca tekrar sorgula
+  woken: boolean;
+  lastCheckedAt: number;
+}
 
-  if (pendingVideos.length === 0) {
-    return;
+const tracked = new Map<string, TrackedVideo>();
+// Aynı video birden fazla kez bulunabilir; nextCheckAt ile eşleşmeyen
+// kayıtlar eskidir ve atlanır
+const schedule = new MinHeap<TrackedVideo>();
+const expectedDurations = new Map<string, number>();
+let activeChecks = 0;
+let running = false;
+let timerId: NodeJS.Timeout | null = null;
+let timerAt = Infinity;
+
+function expectedDuration(model: string): number {
+  return (
+    expectedDurations.get(model) ??
+    EXPECTED_DURATION_PRIORS[model] ??
+    DEFAULT_EXPECTED_DURATION
+  );
+}
+
+function recordCompletion(entry: TrackedVideo): void {
+  if (!entry.timed) return;
+  const observed = Date.now() - entry.startedAt;
+  const prior = expectedDuration(entry.video.model);
+  expectedDurations.set(
+    entry.video.model,
+    Math.round(prior * PRIOR_WEIGHT + observed * (1 - PRIOR_WEIGHT))
+  );
+}
+
+function nextDelay(entry: TrackedVideo, now: number): number {
+  const expectedAt =
+    entry.startedAt + expectedDuration(entry.video.model) * FIRST_CHECK_RATIO;
+  if (now < expectedAt) {
+    return expectedAt - now;
   }
+  const cap =
+    now - entry.startedAt > STALE_AFTER
+      ? STALE_RECHECK_DELAY
+      : MAX_RECHECK_DELAY;
+  const delay = Math.min(MIN_RECHECK_DELAY * 2 ** entry.attempts, cap);
+  entry.attempts++;
+  return delay;
+}
 
-  console.log(
-    `[VideoStatusUpdater] Checking ${pendingVideos.length} pending videos...`
+function scheduleCheck(entry: TrackedVideo, at: number): void {
+  entry.nextCheckAt = at;
+  schedule.push(at, entry);
+  armTimer();
+}
+
+function armTimer(): void {
+  // Havuz doluyken biten her sorgu runDueChecks'i zaten çağırır
+  if (!running || activeChecks >= MAX_CONCURRENT_CHECKS) return;
+  const next = schedule.peekKey();
+  if (next === undefined || next >= timerAt) return;
+  if (timerId) clearTimeout(timerId);
+  timerAt = next;
+  timerId = setTimeout(
+    () => {
+      timerId = null;
+      timerAt = Infinity;
+      runDueChecks();
+    },
+    Math.max(0, next - Date.now())
   );
+}
+
+function runDueChecks(): void {
+  const now = Date.now();
+  while (activeChecks < MAX_CONCURRENT_CHECKS) {
+    const next = schedule.peekKey();
+    if (next === undefined || next > now) break;
+    const { key, value: entry } = schedule.pop()!;
+    if (
+      entry.inFlight ||
+      entry.nextCheckAt !== key ||
+      tracked.get(entry.video.taskId) !== entry
+    ) {
+      continue;
+    }
+    activeChecks++;
+    entry.inFlight = true;
+    entry.lastCheckedAt = now;
+    checkVideo(entry).finally(() => {
+      entry.inFlight = false;
+      activeChecks--;
+      runDueChecks();
+    });
+  }
+  armTimer();
+}
+
+async function checkVideo(entry: TrackedVideo): Promise<void> {
+  const status = await updateVideoStatus(entry.video);
+  if (status === "completed" || status === "failed") {
+    if (status === "completed") recordCompletion(entry);
+    tracked.delete(entry.video.taskId);
+    return;
+  }
+  if (status) {
+    entry.video.status = status;
+  }
+  if (running && tracked.get(entry.video.taskId) === entry) {
+    const now = Date.now();
+    const delay = entry.woken
+      ? Math.max(0, entry.lastCheckedAt + WAKE_MIN_INTERVAL - now)
+      : nextDelay(entry, now);
+    entry.woken = false;
+    scheduleCheck(entry, now + delay);
+  }
+}
+
+// Keşif en fazla DISCOVERY_INTERVAL gecikir; veritabanı saat dilimi farklı
+// olsa bile oluşturulma zamanı bu aralığın dışına taşmaz
+function createdAt(video: PendingVideo, now: number): number {
+  const created = new Date(video.createdAt).getTime();
+  if (Number.isNaN(created)) return now;
+  return Math.min(now, Math.max(created, now - DISCOVERY_INTERVAL));
+}
+
+/**
+ * Bekleyen videoları veritabanından toplar: yenileri takvime ekler, başka
+ * yerde sonuçlanmış olanları takipten çıkarır.
+ */
+async function discoverPendingVideos(initial = false): Promise<void> {
+  const pendingVideos = await getPendingVideos();
+  if (!pendingVideos) return;
+  const now = Date.now();
+  const pendingIds = new Set<string>();
+  let added = 0;
+
+  for (const video of pendingVideos) {
+    pendingIds.add(video.taskId);
+    if (tracked.has(video.taskId)) continue;
+    const entry: TrackedVideo = {
+      video,
+      // Açılışta bekleyenler beklenen süreyi doldurmuş sayılır
+      startedAt: initial
+        ? now - expectedDuration(video.model)
+        : createdAt(video, now),
+      timed: !initial,
+      nextCheckAt: now,
+      attempts: 0,
+      inFlight: false,
+      woken: false,
+      lastCheckedAt: 0,
+    };
+    tracked.set(video.taskId, entry);
+    // Açılışta bekleyenler hemen, yeniler beklenen süreye göre sorgulanır
+    scheduleCheck(entry, initial ? now : now + nextDelay(entry, now));
+    added++;
+  }
+
+  // Sorgu sınırına takılmadıysa, listede olmayanlar artık beklemiyordur
+  if (pendingVideos.length < MAX_TRACKED_VIDEOS) {
+    for (const [taskId, entry] of Array.from(tracked)) {
+      if (!pendingIds.has(taskId) && !entry.inFlight) {
+        tracked.delete(taskId);
+      }
+    }
+  }
+
+  if (added > 0) {
+    console.log(
+      `[VideoStatusUpdater] Tracking ${added} new pending videos (${tracked.size} total)`
+    );
+  }
+  runDueChecks();
+}
+
+let discoveryPending = false;
+let lastWakeDiscoveryAt = 0;
+
+function requestDiscovery(): void {
+  if (discoveryPending || !running) return;
+  discoveryPending = true;
+  discoverPendingVideos()
+    .catch(console.error)
+    .finally(() => {
+      discoveryPending = false;
+    });
+}
+
+/**
+ * Sağlayıcı callback'i geldiğinde videoyu sırasını beklemeden sorgular.
+ * Durum yine getVideoStatus ile doğrulanır; callback içeriğine güvenilmez.
+ */
+export function wakeVideoTask(taskId: string): void {
+  if (!running) return;
+  const now = Date.now();
+  const entry = tracked.get(taskId);
+  if (!entry) {
+    // Henüz keşfedilmemiş yeni bir video olabilir
+    if (now - lastWakeDiscoveryAt < WAKE_DISCOVERY_INTERVAL) return;
+    lastWakeDiscoveryAt = now;
+    requestDiscovery();
+    return;
+  }
+  if (entry.inFlight) {
+    entry.woken = true;
+    return;
+  }
+  // Daha önceye planlanmış bir sorgu varsa heap'e yeni kayıt eklenmez
+  const at = Math.max(now, entry.lastCheckedAt + WAKE_MIN_INTERVAL);
+  if (at < entry.nextCheckAt) {
+    scheduleCheck(entry, at);
+  }
+}
 
-  // Process videos in parallel (with limit)
-  await Promise.all(pendingVideos.map(updateVideoStatus));
+export function getVideoStatusUpdaterStats() {
+  return {
+    tracked: tracked.size,
+    activeChecks,
+    expectedDurations: Object.fromEntries(expectedDurations),
+  };
 }
 
 let intervalId: NodeJS.Timeout | null = null;
@@ -271,22 +541,30 @@ export function startVideoStatusUpdater(): void {
   }
 
   console.log(
-    `[VideoStatusUpdater] Starting background job (interval: ${CHECK_INTERVAL / 1000}s)`
+    `[VideoStatusUpdater] Starting background job (discovery: ${DISCOVERY_INTERVAL / 1000}s, max ${MAX_CONCURRENT_CHECKS} concurrent checks)`
   );
+  running = true;
 
-  // Run immediately on start
-  checkAllPendingVideos().catch(console.error);
+  // Açılışta bekleyen videoları hemen sorgula
+  discoverPendingVideos(true).catch(console.error);
 
-  // Then run periodically
+  // Then discover new videos periodically
   intervalId = setInterval(() => {
-    checkAllPendingVideos().catch(console.error);
-  }, CHECK_INTERVAL);
+    discoverPendingVideos().catch(console.error);
+  }, DISCOVERY_INTERVAL);
 }
 
 export function stopVideoStatusUpdater(): void {
   if (intervalId) {
     clearInterval(intervalId);
     intervalId = null;
+    running = false;
+    if (timerId) clearTimeout(timerId);
+    timerId = null;
+    timerAt = Infinity;
+    schedule.clear();
+    tracked.clear();
+    lastWakeDiscoveryAt = 0;
     console.log("[VideoStatusUpdater] Stopped");
   }
 }
@@ -0,0 +1,17 @@
+// Standalone job worker - runs queued generation jobs outside the web server
+//
+// PM2 ecosystem dosyasında web sürecinden ayrı ölçeklenir (dist/worker.js).
+// İş tipleri handler'larını kendi modüllerinde kaydeder; burada yalnızca
+// import edilmeleri yeterli.
+import "dotenv/config";
+import dns from "dns";
+import "./routers/productPromo";
+import { startJobWorker } from "./jobWorker";
+import { registerShutdownHandlers } from "./_core/shutdown";
+
+dns.setDefaultResultOrder("ipv4first");
+
+startJobWorker();
+
+// Süre içinde bitmeyen işlerin lease süresi dolunca başka worker devralır
+registerShutdownHandlers();
@@ -14,6 +14,13 @@ export default defineConfig({
   },
   test: {
     environment: "node",
-    include: ["server/**/*.test.ts", "server/**/*.spec.ts"],
+    include: [
+      "server/**/*.test.ts",
+      "server/**/*.spec.ts",
+      "client/src/**/*.test.ts",
+    ],
+    benchmark: {
+      include: ["client/src/**/*.bench.ts", "server/**/*.bench.ts"],
+    },
   },
 });